@@ -230,8 +230,9 @@ async def get_sleeper_prospects(
         List of SleeperProspectResponse objects ordered by sleeper score
     """
     try:
-        # Check cache first
-        cache_key = f"sleeper_prospects:{confidence_threshold}:{consensus_ranking_gap}:{limit}"
+        # Check cache first; the key changes whenever predictions or prospects do
+        version = DiscoveryService.version_tag(await DiscoveryService.data_version(db))
+        cache_key = f"sleeper_prospects:{version}:{confidence_threshold}:{consensus_ranking_gap}:{limit}"
         cached_result = await cache_manager.get(cache_key)
         if cached_result:
             return cached_result
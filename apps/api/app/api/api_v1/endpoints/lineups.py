@@ -4,8 +4,8 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
-from app.api.deps import get_current_user
-from app.db.models import User
+from app.api.deps import get_current_principal
+from app.core.principal_cache import Principal
 from app.models.lineup import (
     UserLineupCreate,
     UserLineupUpdate,
@@ -34,11 +34,11 @@ router = APIRouter()
 )
 async def create_lineup(
     lineup_data: UserLineupCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> UserLineupResponse:
     """Create a new lineup"""
-    lineup = await LineupService.create_lineup(db, current_user.email, lineup_data)
+    lineup = await LineupService.create_lineup(db, current_user.id, lineup_data)
 
     return UserLineupResponse(
         id=lineup.id,
@@ -63,11 +63,11 @@ async def create_lineup(
 async def get_user_lineups(
     skip: int = Query(0, ge=0, description="Number of lineups to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of lineups to return"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> UserLineupListResponse:
     """Get all lineups for the current user"""
-    lineups, total = await LineupService.get_user_lineups(db, current_user.email, skip, limit)
+    lineups, total = await LineupService.get_user_lineups(db, current_user.id, skip, limit)
 
     lineup_responses = [
         UserLineupResponse(
@@ -99,11 +99,11 @@ async def get_user_lineups(
 )
 async def get_lineup(
     lineup_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> UserLineupDetailResponse:
     """Get a lineup by ID with full prospect details"""
-    lineup = await LineupService.get_lineup_by_id(db, lineup_id, current_user.email, include_prospects=True)
+    lineup = await LineupService.get_lineup_by_id(db, lineup_id, current_user.id, include_prospects=True)
 
     # Build prospect responses with details
     prospect_responses = []
@@ -146,11 +146,11 @@ async def get_lineup(
 async def update_lineup(
     lineup_id: int,
     update_data: UserLineupUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> UserLineupResponse:
     """Update a lineup"""
-    lineup = await LineupService.update_lineup(db, lineup_id, current_user.email, update_data)
+    lineup = await LineupService.update_lineup(db, lineup_id, current_user.id, update_data)
 
     return UserLineupResponse(
         id=lineup.id,
@@ -173,11 +173,11 @@ async def update_lineup(
 )
 async def delete_lineup(
     lineup_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a lineup"""
-    await LineupService.delete_lineup(db, lineup_id, current_user.email)
+    await LineupService.delete_lineup(db, lineup_id, current_user.id)
     return None
 
 
@@ -193,12 +193,12 @@ async def delete_lineup(
 async def add_prospect_to_lineup(
     lineup_id: int,
     prospect_data: LineupProspectCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> LineupProspectResponse:
     """Add a prospect to a lineup"""
     lineup_prospect = await LineupService.add_prospect_to_lineup(
-        db, lineup_id, current_user.email, prospect_data
+        db, lineup_id, current_user.id, prospect_data
     )
 
     # Load prospect details
@@ -229,12 +229,12 @@ async def update_lineup_prospect(
     lineup_id: int,
     prospect_id: int,
     update_data: LineupProspectUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> LineupProspectResponse:
     """Update a prospect in a lineup"""
     lineup_prospect = await LineupService.update_lineup_prospect(
-        db, lineup_id, prospect_id, current_user.email, update_data
+        db, lineup_id, prospect_id, current_user.id, update_data
     )
 
     # Load prospect details
@@ -264,12 +264,12 @@ async def update_lineup_prospect(
 async def remove_prospect_from_lineup(
     lineup_id: int,
     prospect_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """Remove a prospect from a lineup"""
     await LineupService.remove_prospect_from_lineup(
-        db, lineup_id, prospect_id, current_user.email
+        db, lineup_id, prospect_id, current_user.id
     )
     return None
 
@@ -285,7 +285,7 @@ async def remove_prospect_from_lineup(
 async def bulk_add_prospects(
     lineup_id: int,
     bulk_request: BulkAddProspectsRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> BulkAddProspectsResponse:
     """Bulk add prospects to a lineup"""
@@ -297,7 +297,7 @@ async def bulk_add_prospects(
         try:
             prospect_data = LineupProspectCreate(prospect_id=prospect_id)
             await LineupService.add_prospect_to_lineup(
-                db, lineup_id, current_user.email, prospect_data
+                db, lineup_id, current_user.id, prospect_data
             )
             added_count += 1
         except HTTPException as e:
@@ -327,10 +327,10 @@ async def bulk_add_prospects(
 )
 async def sync_fantrax_lineup(
     sync_request: FantraxSyncRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> FantraxSyncResponse:
     """Sync a Fantrax league to a lineup"""
     return await LineupService.sync_fantrax_lineup(
-        db, current_user.email, sync_request
+        db, current_user.id, sync_request
     )
@@ -16,8 +16,9 @@ from sqlalchemy.orm import Session
 
 from app.db.database import get_db
 from ....core.cache_manager import CacheManager
+from ....core.config import settings
 from ....core.auth import get_current_user
-from ....core.rate_limiting import RateLimiter
+from ....core.rate_limiting import RateLimiter, default_tier_limits
 from ....models.user import User
 from ....schemas.ml_predictions import (
     PredictionRequest,
@@ -35,10 +36,13 @@ from ....services.pipeline_monitoring import PipelineMonitor
 
 router = APIRouter()
 
-# Rate limiter for prediction endpoints
+# Rate limiter for prediction endpoints (shared across workers via Redis)
 prediction_limiter = RateLimiter(
     requests_per_minute=10,
-    identifier="ml_predictions"
+    identifier="ml_predictions",
+    tier_limits=default_tier_limits(),
+    max_lease=settings.ML_RATE_LIMIT_MAX_LEASE,
+    lease_fraction=settings.ML_RATE_LIMIT_LEASE_FRACTION
 )
 
 
@@ -134,14 +138,16 @@ async def predict_prospect_success(
     Generate real-time ML prediction for individual prospect success.
 
     **Performance Requirement:** <500ms response time
-    **Rate Limit:** 10 requests per minute per user
+    **Rate Limit:** 10/60 requests per minute per user (free/premium)
     """
     start_time = time.time()
     cache_hit = False
 
     try:
         # Apply rate limiting
-        await prediction_limiter.check_rate_limit(current_user.id)
+        await prediction_limiter.check_rate_limit(
+            current_user.id, getattr(current_user, "subscription_tier", None)
+        )
 
         # Get model version
         model_version = request.model_version or await model_server.get_current_version()
@@ -264,6 +270,13 @@ async def batch_predict_prospects(
         for i in range(0, len(request.prospect_ids), request.chunk_size):
             chunk = request.prospect_ids[i:i + request.chunk_size]
 
+            # One MGET for the whole chunk instead of a GET per prospect
+            cached_predictions = {}
+            if not request.include_explanations:
+                cached_predictions = await cache_manager.get_many_predictions(
+                    chunk, model_version
+                )
+
             # Process chunk concurrently
             chunk_tasks = []
             for prospect_id in chunk:
@@ -272,6 +285,7 @@ async def batch_predict_prospects(
                         prospect_id=prospect_id,
                         model_version=model_version,
                         include_explanation=request.include_explanations,
+                        cached_prediction=cached_predictions.get(prospect_id),
                         db=db,
                         model_server=model_server,
                         cache_manager=cache_manager,
@@ -285,6 +299,7 @@ async def batch_predict_prospects(
             chunk_results = await asyncio.gather(*chunk_tasks, return_exceptions=True)
 
             # Process results
+            new_predictions = {}
             for j, result in enumerate(chunk_results):
                 prospect_id = chunk[j]
                 if isinstance(result, Exception):
@@ -292,6 +307,11 @@ async def batch_predict_prospects(
                 else:
                     predictions.append(result)
                     processed_count += 1
+                    if not result.cache_hit:
+                        new_predictions[prospect_id] = result.dict(exclude={"cache_hit"})
+
+            # Write fresh predictions back in one pipelined batch
+            await cache_manager.set_many_predictions(new_predictions, model_version)
 
         processing_time = time.time() - start_time
 
@@ -334,15 +354,16 @@ async def _process_single_prediction(
     model_server: ModelServer,
     cache_manager: CacheManager,
     confidence_scorer: ConfidenceScorer,
-    feature_extractor: ProspectFeatureExtractor
+    feature_extractor: ProspectFeatureExtractor,
+    cached_prediction: Optional[Dict[str, Any]] = None
 ) -> PredictionResponse:
-    """Process a single prediction for batch processing."""
-
-    # Check cache first
-    cached_prediction = await cache_manager.get_cached_prediction(
-        prospect_id, model_version
-    )
+    """
+    Process a single prediction for batch processing.
 
+    The caller prefetches cached predictions for the whole chunk and writes
+    fresh results back in one batch, so this function does no cache I/O for
+    the prediction itself.
+    """
     if cached_prediction and not include_explanation:
         return PredictionResponse(**cached_prediction, cache_hit=True)
 
@@ -378,13 +399,6 @@ async def _process_single_prediction(
         cache_hit=False
     )
 
-    # Cache result
-    await cache_manager.cache_prediction(
-        prospect_id=prospect_id,
-        model_version=model_version,
-        prediction_data=response.dict(exclude={"cache_hit"})
-    )
-
     return response
 
 
@@ -521,19 +535,21 @@ async def get_prospect_outlook(
     """
     Generate AI-powered prospect outlook with personalized narrative.
 
-    **Rate Limit:** 10 requests per minute per user
+    **Rate Limit:** 10/60 requests per minute per user (free/premium)
     **Response Time:** <500ms (cached) or <2s (generated)
     """
     try:
         # Apply rate limiting
-        await prediction_limiter.check_rate_limit(current_user.id)
+        await prediction_limiter.check_rate_limit(
+            current_user.id, getattr(current_user, "subscription_tier", None)
+        )
 
-        # Check for cached narrative first
-        cached_narrative = await cache_manager.get_cached_narrative(
-            prospect_id=prospect_id,
-            model_version="v1.0",
-            user_id=current_user.id,
-            template_version="v1.0"
+        from ....services.narrative_generation_service import narrative_service
+
+        # Check for a cached narrative first: the user's own, else the pre-warmed default
+        model_versions = await narrative_service.latest_model_versions(db, [prospect_id])
+        cached_narrative, = await narrative_service.get_cached_outlooks(
+            [prospect_id], model_versions, user_id=current_user.id
         )
 
         if cached_narrative:
@@ -573,7 +589,6 @@ async def get_prospect_outlook(
         user_prefs = await cache_manager.get_cached_user_preferences(current_user.id)
 
         # Generate personalized narrative
-        from ....services.narrative_generation_service import narrative_service
         narrative = await narrative_service.generate_prospect_outlook(
             prospect=prospect,
             prediction_data=prediction_response,
@@ -600,7 +615,7 @@ async def get_prospect_outlook(
             "user_id": current_user.id,
             "generated_at": datetime.utcnow().isoformat(),
             "template_version": "v1.0",
-            "model_version": "v1.0",
+            "model_version": prediction_response.model_version,
             "cached": False
         }
 
@@ -646,16 +661,15 @@ async def generate_batch_outlooks(
         outlooks = []
         failed_prospects = []
 
-        for prospect_id in prospect_ids:
-            try:
-                # Get cached narrative or generate new one
-                cached_narrative = await cache_manager.get_cached_narrative(
-                    prospect_id=prospect_id,
-                    model_version="v1.0",
-                    user_id=current_user.id,
-                    template_version="v1.0"
-                )
+        # One query for model versions and one MGET for every cached narrative
+        from ....services.narrative_generation_service import narrative_service
+        model_versions = await narrative_service.latest_model_versions(db, prospect_ids)
+        cached_narratives = await narrative_service.get_cached_outlooks(
+            prospect_ids, model_versions, user_id=current_user.id
+        )
 
+        for prospect_id, cached_narrative in zip(prospect_ids, cached_narratives):
+            try:
                 if cached_narrative:
                     outlooks.append({
                         "prospect_id": prospect_id,
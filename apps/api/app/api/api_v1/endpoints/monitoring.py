@@ -12,6 +12,7 @@ from app.services.pipeline_monitoring import (
 from app.services.compliance_scheduler import compliance_scheduler
 from app.services.compliance_attribution import ComplianceAuditor
 from app.core.circuit_breaker import circuit_breaker_registry
+from app.core.request_timing import get_stage_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +76,20 @@ async def get_circuit_breaker_status():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/request-timings", response_model=Dict[str, Any])
+async def get_request_timings():
+    """Get per-stage request latency histograms (rate limit, auth, handler, serialization)."""
+    try:
+        return {
+            "status": "success",
+            "data": get_stage_metrics(),
+            "message": "Request stage timings retrieved successfully"
+        }
+    except Exception as e:
+        logger.error(f"Error retrieving request timings: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/circuit-breakers/{breaker_name}/reset", response_model=Dict[str, Any])
 async def reset_circuit_breaker(breaker_name: str):
     """Manually reset a specific circuit breaker."""
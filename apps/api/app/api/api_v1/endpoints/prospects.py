@@ -6,12 +6,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 import json
 import logging
-import io
 from datetime import datetime
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_principal
+from app.core.principal_cache import Principal
 from app.db.database import get_db
-from app.db.models import Prospect, ProspectStats, ScoutingGrades, MLPrediction, User
+from app.db.models import Prospect, ProspectStats, ScoutingGrades, MLPrediction
 from app.services.dynasty_ranking_service import DynastyRankingService
 from app.services.prospect_search_service import ProspectSearchService
 from app.services.prospect_stats_service import ProspectStatsService
@@ -93,7 +93,7 @@ async def get_prospect_rankings(
     sort_order: str = Query("asc", regex="^(asc|desc)$", description="Sort order"),
 
     # Dependencies
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> ProspectRankingsPage:
     """
@@ -115,18 +115,7 @@ async def get_prospect_rankings(
         page_size = 50
 
     # Check user subscription tier to determine prospect limit
-    from app.api.deps import check_subscription_feature
-    from sqlalchemy import select
-
-    # Get user from database to check subscription tier
-    stmt = select(User).where(User.email == current_user.email)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-
-    if not user:
-        user_tier = "free"
-    else:
-        user_tier = user.subscription_tier or "free"
+    user_tier = current_user.subscription_tier or "free"
 
     # Determine prospect limit based on tier
     if limit is None:
@@ -356,7 +345,7 @@ async def get_prospect_rankings(
 async def prospect_autocomplete(
     q: str = Query(..., min_length=1, max_length=50, description="Search prefix"),
     limit: int = Query(5, ge=1, le=10, description="Maximum suggestions"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> List[ProspectSearchSuggestion]:
     """
@@ -380,7 +369,7 @@ async def prospect_autocomplete(
 # @limiter.limit("100/minute")
 async def get_prospect(
     prospect_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> ProspectRankingResponse:
     """
@@ -484,7 +473,7 @@ async def get_prospect_profile(
     include_predictions: bool = True,
     include_comparisons: bool = True,
     include_scouting: bool = True,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -642,7 +631,7 @@ async def get_prospect_stats_history(
     level: Optional[str] = None,
     season: Optional[int] = None,
     limit: Optional[int] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -668,7 +657,7 @@ async def get_prospect_comparisons(
     prospect_id: int,
     limit: int = Query(5, ge=1, le=10),
     include_historical: bool = Query(True),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -691,7 +680,7 @@ async def get_prospect_comparisons(
 # @limiter.limit("100/minute")
 async def get_prospect_organizational_context(
     prospect_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -712,7 +701,7 @@ async def get_prospect_organizational_context(
 # @limiter.limit("100/minute")
 async def get_prospect_injury_history(
     prospect_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -741,7 +730,7 @@ async def compare_prospects(
     include_stats: bool = Query(True, description="Include statistical comparison"),
     include_predictions: bool = Query(True, description="Include ML prediction comparison"),
     include_analogs: bool = Query(True, description="Include historical analog comparison"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -896,7 +885,7 @@ async def compare_prospects(
 async def get_comparison_analogs(
     prospect_ids: str = Query(..., description="Comma-separated prospect IDs"),
     limit: int = Query(3, ge=1, le=5, description="Number of analogs per prospect"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -941,7 +930,7 @@ async def get_comparison_analogs(
 async def export_comparison(
     prospect_ids: str,
     format: str = Query(..., regex="^(pdf|csv)$", description="Export format: 'pdf' or 'csv'"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -1163,6 +1152,7 @@ def _generate_statistical_comparison(prospects_data: List[Dict[str, Any]]) -> Di
     return comparison
 
 
+@router.get("/export")
 @router.get("/export/csv")
 # @limiter.limit("10/hour")
 async def export_prospects_csv(
@@ -1175,49 +1165,36 @@ async def export_prospects_csv(
     age_min: Optional[int] = Query(None, ge=16, le=50, description="Minimum age"),
     age_max: Optional[int] = Query(None, ge=16, le=50, description="Maximum age"),
     search: Optional[str] = Query(None, min_length=2, description="Search query"),
+    format: str = Query("csv", regex="^(csv|parquet)$", description="Export format: 'csv' or 'parquet'"),
 
     # Dependencies
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Export filtered prospect rankings to CSV format.
+    Export filtered prospect rankings to CSV or Parquet.
+
+    The full ranked pool is streamed in batches, so the first bytes are sent
+    while later batches are still being queried.
 
     Premium users only. Limited to 10 exports per hour.
     """
     from app.services.export_service import ExportService
+    from app.services.prospect_export_stream import ProspectExportStream
     from fastapi.responses import StreamingResponse
 
     # Validate premium access
     ExportService.validate_export_access(current_user)
 
-    # Get prospects using same logic as main endpoint but without pagination
-    query = select(Prospect).options(
-        selectinload(Prospect.stats),
-        selectinload(Prospect.scouting_grades)
-    )
-
-    # Apply search filter
-    if search:
-        search_prospects = await ProspectSearchService.search_prospects(db, search, limit=500)
-        if search_prospects:
-            prospect_ids = [p.id for p in search_prospects]
-            query = query.where(Prospect.id.in_(prospect_ids))
-        else:
-            # No matches - return empty CSV
-            csv_content = ExportService.generate_csv([])
-            return StreamingResponse(
-                io.StringIO(csv_content),
-                media_type="text/csv",
-                headers={
-                    "Content-Disposition": f"attachment; filename={ExportService.generate_filename()}"
-                }
-            )
-
     # Apply filters
     filters = []
     filter_dict = {}
 
+    if search:
+        search_prospects = await ProspectSearchService.search_prospects(db, search, limit=500)
+        # No matches yields an empty export
+        filters.append(Prospect.id.in_([p.id for p in search_prospects]))
+
     if position:
         filters.append(Prospect.position.in_(position))
         filter_dict['position'] = position
@@ -1242,105 +1219,21 @@ async def export_prospects_csv(
     if age_max is not None:
         filters.append(Prospect.age <= age_max)
 
-    if filters:
-        query = query.where(and_(*filters))
-
-    # Execute query
-    result = await db.execute(query)
-    prospects = result.scalars().all()
-
-    # Limit to top 500 for exports
-    if len(prospects) > 500:
-        prospects = prospects[:500]
-
-    # Get ML predictions
-    prospect_ids = [p.id for p in prospects]
-    ml_predictions_query = select(MLPrediction).where(
-        and_(
-            MLPrediction.prospect_id.in_(prospect_ids),
-            MLPrediction.prediction_type == 'success_rating'
-        )
-    )
-    ml_result = await db.execute(ml_predictions_query)
-    ml_predictions = {pred.prospect_id: pred for pred in ml_result.scalars().all()}
-
-    # Calculate scores and rank
-    prospects_with_scores = []
-
-    for prospect in prospects:
-        latest_stats = None
-        if prospect.stats:
-            latest_stats = max(prospect.stats, key=lambda s: s.date_recorded)
-
-        best_grade = None
-        if prospect.scouting_grades:
-            for source_priority in ['Fangraphs', 'MLB Pipeline', 'Baseball America']:
-                grades = [g for g in prospect.scouting_grades if g.source == source_priority]
-                if grades:
-                    best_grade = grades[0]
-                    break
-
-        ml_prediction = ml_predictions.get(prospect.id)
-
-        score_components = DynastyRankingService.calculate_dynasty_score(
-            prospect=prospect,
-            ml_prediction=ml_prediction,
-            latest_stats=latest_stats,
-            scouting_grade=best_grade
-        )
-
-        prospects_with_scores.append((prospect, score_components, latest_stats, best_grade))
+    batches = ProspectExportStream().batches(filters)
 
-    # Rank prospects
-    ranked_prospects = DynastyRankingService.rank_prospects(
-        [(p, s) for p, s, _, _ in prospects_with_scores]
-    )
-
-    # Build export data
-    export_data = []
-    for prospect, scores in ranked_prospects:
-        # Find stats and grade
-        orig_data = next((item for item in prospects_with_scores if item[0].id == prospect.id), None)
-        if orig_data:
-            _, _, latest_stats, best_grade = orig_data
-
-            prospect_dict = {
-                'dynasty_rank': scores['dynasty_rank'],
-                'name': prospect.name,
-                'position': prospect.position,
-                'organization': prospect.organization,
-                'level': prospect.level,
-                'age': prospect.age,
-                'eta_year': prospect.eta_year,
-                'dynasty_score': scores['total_score'],
-                'ml_score': scores['ml_score'],
-                'scouting_score': scores['scouting_score'],
-                'confidence_level': scores['confidence_level']
-            }
-
-            if latest_stats:
-                if prospect.position not in ['SP', 'RP']:
-                    prospect_dict['batting_avg'] = latest_stats.batting_avg
-                    prospect_dict['on_base_pct'] = latest_stats.on_base_pct
-                    prospect_dict['slugging_pct'] = latest_stats.slugging_pct
-                else:
-                    prospect_dict['era'] = latest_stats.era
-                    prospect_dict['whip'] = latest_stats.whip
-
-            if best_grade:
-                prospect_dict['overall_grade'] = best_grade.overall
-                prospect_dict['future_value'] = best_grade.future_value
-
-            export_data.append(prospect_dict)
-
-    # Generate CSV
-    csv_content = ExportService.generate_csv(export_data)
+    if format == "parquet":
+        ExportService.validate_parquet_support()
+        content = ExportService.stream_parquet(batches)
+        media_type = "application/vnd.apache.parquet"
+    else:
+        content = ExportService.stream_csv(batches)
+        media_type = "text/csv"
 
-    # Return as streaming response
+    filename = ExportService.generate_filename(filter_dict, extension=format)
     return StreamingResponse(
-        io.StringIO(csv_content),
-        media_type="text/csv",
+        content,
+        media_type=media_type,
         headers={
-            "Content-Disposition": f"attachment; filename={ExportService.generate_filename(filter_dict)}"
+            "Content-Disposition": f"attachment; filename={filename}"
         }
-    )
\ No newline at end of file
+    )
@@ -13,7 +13,8 @@ import re
 
 from app.db.database import get_db
 from app.db.models import User, Subscription, PaymentAuditLog
-from app.api.deps import get_current_user, get_current_user_optional, get_subscription_status
+from app.api.deps import get_current_user, get_current_principal_optional, get_subscription_status
+from app.core.principal_cache import Principal
 from app.services.subscription_service import SubscriptionService
 from sqlalchemy import select
 
@@ -86,7 +87,7 @@ async def create_checkout_session(
 
 @router.get("/status")
 async def get_subscription_status_endpoint(
-    current_user: Optional[User] = Depends(get_current_user_optional),
+    current_user: Optional[Principal] = Depends(get_current_principal_optional),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -115,18 +116,14 @@ async def get_subscription_status_endpoint(
             }
         }
 
-    # First, check the user's subscription_tier from the database
+    # First, check the user's subscription_tier (cached with the principal)
     # This handles manually-granted premium access (e.g., admin users)
-    stmt = select(User).where(User.email == current_user.email)
-    result = await db.execute(stmt)
-    user_db = result.scalar_one_or_none()
-
-    if user_db and user_db.subscription_tier == "premium":
+    if current_user.subscription_tier == "premium":
         # User has premium tier set in database (manual grant or active subscription)
         return {
             "status": "active",
             "tier": "premium",
-            "is_admin": user_db.is_admin,
+            "is_admin": current_user.is_admin,
             "features": {
                 "prospects_limit": 500,
                 "export_enabled": True,
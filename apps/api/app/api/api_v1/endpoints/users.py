@@ -6,6 +6,7 @@ from app.api.deps import get_current_user
 from app.db.models import User
 from app.db.database import get_db
 from app.core.security import get_password_hash, verify_password, is_password_complex
+from app.core.principal_cache import principal_cache
 from app.core.validation import validate_email_format, validate_password_input, validate_name_input
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -145,6 +146,7 @@ async def update_user_profile(
 
     await db.commit()
     await db.refresh(user)
+    await principal_cache.invalidate(email=user.email, user_id=user.id)
 
     # Parse preferences for response
     preferences = user.preferences
@@ -388,8 +390,10 @@ async def delete_user_account(
 
     # Delete user from database
     # Note: Cascading deletes should handle related records (sessions, etc.)
+    user_id, user_email = user.id, user.email
     await db.delete(user)
     await db.commit()
+    await principal_cache.invalidate(email=user_email, user_id=user_id)
 
     # In a real application, you would also:
     # - Remove user from all related tables (handled by cascade)
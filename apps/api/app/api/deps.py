@@ -5,6 +5,8 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.security import verify_token
+from app.core.principal_cache import Principal, principal_cache
+from app.core.request_timing import STAGE_AUTH, timed_stage
 from app.services.auth_service import get_user_by_email
 from app.models.user import UserLogin
 from app.db.database import get_db
@@ -20,20 +22,21 @@ async def get_current_user(
     db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get current user from JWT token"""
-    token = credentials.credentials
-    username = verify_token(token)
+    with timed_stage(STAGE_AUTH):
+        token = credentials.credentials
+        username = verify_token(token)
 
-    if not username:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        if not username:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
 
-    # Get the actual User model from database
-    stmt = select(User).where(User.email == username)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+        # Get the actual User model from database
+        stmt = select(User).where(User.email == username)
+        result = await db.execute(stmt)
+        user = result.scalar_one_or_none()
 
     if not user:
         raise HTTPException(
@@ -65,16 +68,17 @@ async def get_current_user_optional(
     if not credentials:
         return None
 
-    token = credentials.credentials
-    username = verify_token(token)
+    with timed_stage(STAGE_AUTH):
+        token = credentials.credentials
+        username = verify_token(token)
 
-    if not username:
-        return None
+        if not username:
+            return None
 
-    # Get the actual User model from database
-    stmt = select(User).where(User.email == username)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+        # Get the actual User model from database
+        stmt = select(User).where(User.email == username)
+        result = await db.execute(stmt)
+        user = result.scalar_one_or_none()
 
     if not user or not user.is_active:
         return None
@@ -82,8 +86,70 @@ async def get_current_user_optional(
     return user
 
 
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
+    """
+    Get the authenticated principal from the JWT token.
+
+    Resolved through the principal cache, so repeat requests usually skip
+    the user lookup. Use ``get_current_user`` instead when the handler
+    modifies the user or needs fields the principal does not carry.
+    """
+    with timed_stage(STAGE_AUTH):
+        username = verify_token(credentials.credentials)
+
+        if not username:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        principal = await principal_cache.get(username, db)
+
+    if not principal:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Inactive user",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return principal
+
+
+async def get_current_principal_optional(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_optional),
+    db: AsyncSession = Depends(get_db)
+) -> Optional[Principal]:
+    """Get the authenticated principal, or None if not authenticated"""
+    if not credentials:
+        return None
+
+    with timed_stage(STAGE_AUTH):
+        username = verify_token(credentials.credentials)
+
+        if not username:
+            return None
+
+        principal = await principal_cache.get(username, db)
+
+    if not principal or not principal.is_active:
+        return None
+
+    return principal
+
+
 async def get_subscription_status(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> Optional[Subscription]:
     """
@@ -149,7 +215,7 @@ def subscription_tier_required(tier: str):
         @wraps(func)
         async def wrapper(
             *args,
-            current_user: User = Depends(get_current_user),
+            current_user: Principal = Depends(get_current_principal),
             db: AsyncSession = Depends(get_db),
             **kwargs
         ):
@@ -172,7 +238,7 @@ def subscription_tier_required(tier: str):
 
 async def check_subscription_feature(
     feature: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ) -> bool:
     """
@@ -0,0 +1,108 @@
+"""Payload codec for Redis cache values.
+
+Values are serialized with orjson when it is installed (stdlib json
+otherwise) and, if ``zstandard`` is available, compressed with zstd once
+they exceed ``CACHE_COMPRESSION_MIN_BYTES``. Every encoded payload starts
+with a one-byte format marker so readers can tell the formats apart.
+Values written before the marker existed are plain JSON text and are still
+decoded.
+"""
+
+import json
+import logging
+from typing import Any
+
+from .config import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+# Format markers (never valid as the first byte of a JSON document)
+FORMAT_JSON = b"\x01"
+FORMAT_JSON_ZSTD = b"\x02"
+
+_ZSTD_LEVEL = 3
+
+_compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL) if zstandard else None
+_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize to JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                value,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            # Types orjson rejects (e.g. int subclasses it cannot pass through)
+            pass
+    return json.dumps(value).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_payload(value: Any) -> bytes:
+    """
+    Encode a JSON-serializable value for storage in Redis.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        Marker byte followed by JSON, zstd-compressed when large enough
+    """
+    raw = _dumps(value)
+    if (
+        _compressor is not None
+        and settings.CACHE_COMPRESSION_MIN_BYTES > 0
+        and len(raw) >= settings.CACHE_COMPRESSION_MIN_BYTES
+    ):
+        compressed = _compressor.compress(raw)
+        if len(compressed) < len(raw):
+            return FORMAT_JSON_ZSTD + compressed
+    return FORMAT_JSON + raw
+
+
+def decode_payload(data: bytes) -> Any:
+    """
+    Decode a value written by ``encode_payload`` or a legacy JSON string.
+
+    Args:
+        data: Raw bytes from Redis
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If the payload is compressed and zstandard is not installed
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    marker = data[:1]
+    if marker == FORMAT_JSON:
+        return _loads(data[1:])
+    if marker == FORMAT_JSON_ZSTD:
+        if _decompressor is None:
+            raise ValueError("zstd-compressed cache payload but zstandard is not installed")
+        return _loads(_decompressor.decompress(data[1:]))
+
+    # Legacy uncompressed JSON written before format markers
+    return _loads(data)
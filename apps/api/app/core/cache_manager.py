@@ -2,21 +2,47 @@
 
 Provides Redis-based caching for models, predictions, and feature data
 with configurable TTL and cache invalidation strategies.
+
+Predictions and narratives are invalidated with generation counters rather
+than by deleting keys. Each entry is stamped with the generations of its
+scopes (all predictions, a model version, a prospect, a template version)
+when it is written, and a read fetches the current generations in the same
+MGET as the entry. Invalidating a scope is a single INCR, after which every
+entry stamped with the old generation reads as a miss and ages out via TTL.
 """
 
+import asyncio
 import json
 import pickle
 import time
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 import logging
 
 import redis.asyncio as redis
 from redis.asyncio import ConnectionPool
 
+from .cache_codec import decode_payload, encode_payload
 from .config import settings
+from .metrics import histogram_registry
 
 logger = logging.getLogger(__name__)
 
+# Histogram name prefix for per-operation cache latency
+HISTOGRAM_PREFIX = "cache.op."
+
+# Generation counters live under this prefix and never expire, so they are
+# not evicted under volatile-* maxmemory policies.
+GENERATION_PREFIX = "cachegen:"
+
+# Generation stamp written in front of stamped payloads: b"G<g1>.<g2>|"
+STAMP_MARKER = b"G"
+STAMP_END = b"|"
+
+# How long a generation seen on a read may be reused to stamp a write
+GENERATION_MEMO_TTL = 60.0
+GENERATION_MEMO_MAX = 100000
+
 
 class CacheManager:
     """Redis-based cache manager for ML inference service."""
@@ -29,8 +55,190 @@ class CacheManager:
             "misses": 0,
             "sets": 0,
             "deletes": 0,
-            "errors": 0
+            "errors": 0,
+            "invalidations": 0,
+            "stale": 0
         }
+        # Generation key -> (last seen value, monotonic time seen)
+        self._generations: Dict[str, Tuple[int, float]] = {}
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    @contextmanager
+    def _timed(self, operation: str) -> Iterator[None]:
+        """Record the latency of a cache operation, successful or not."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            histogram_registry.observe(
+                f"{HISTOGRAM_PREFIX}{operation}",
+                (time.perf_counter() - start) * 1000
+            )
+
+    @staticmethod
+    def _prediction_key(prospect_id: int, model_version: str) -> str:
+        return f"prediction:{prospect_id}:{model_version}"
+
+    @staticmethod
+    def _features_key(prospect_id: Union[int, str]) -> str:
+        return f"features:{prospect_id}"
+
+    @staticmethod
+    def _prediction_scopes(prospect_id: int, model_version: str) -> Tuple[str, ...]:
+        return (
+            "predictions",
+            f"predictions:model:{model_version}",
+            f"predictions:prospect:{prospect_id}"
+        )
+
+    @staticmethod
+    def _narrative_scopes(prospect_id: int, template_version: str) -> Tuple[str, ...]:
+        return (
+            f"narratives:prospect:{prospect_id}",
+            f"narratives:template:{template_version}"
+        )
+
+    @staticmethod
+    def _generation_key(scope: str) -> str:
+        return f"{GENERATION_PREFIX}{scope}"
+
+    def _remember_generations(self, gen_keys: Sequence[str], values: Sequence[Any]) -> Dict[str, int]:
+        """Record generations read from Redis (missing counters are 0)."""
+        if len(self._generations) > GENERATION_MEMO_MAX:
+            self._generations.clear()
+
+        now = time.monotonic()
+        generations = {}
+        for gen_key, value in zip(gen_keys, values):
+            generation = int(value) if value else 0
+            generations[gen_key] = generation
+            self._generations[gen_key] = (generation, now)
+        return generations
+
+    async def _stamps(self, scopes: Sequence[Sequence[str]]) -> List[bytes]:
+        """
+        Build generation stamps for entries about to be written.
+
+        Stamps use the generation seen by the most recent read of each scope,
+        which is normally the read that missed just before this write. If an
+        invalidation lands in between, the entry carries the old generation
+        and reads as stale instead of being served. Generations not seen
+        recently are fetched with one MGET.
+        """
+        now = time.monotonic()
+        missing = []
+        for entry_scopes in scopes:
+            for scope in entry_scopes:
+                gen_key = self._generation_key(scope)
+                memo = self._generations.get(gen_key)
+                if memo is None or now - memo[1] > GENERATION_MEMO_TTL:
+                    missing.append(gen_key)
+
+        if missing:
+            missing = list(dict.fromkeys(missing))
+            self._remember_generations(missing, await self.redis_client.mget(missing))
+
+        return [
+            STAMP_MARKER
+            + ".".join(
+                str(self._generations[self._generation_key(scope)][0])
+                for scope in entry_scopes
+            ).encode("ascii")
+            + STAMP_END
+            for entry_scopes in scopes
+        ]
+
+    @staticmethod
+    def _split_stamp(data: bytes) -> Tuple[Optional[Tuple[int, ...]], bytes]:
+        """Separate a generation stamp from its payload (None if unstamped)."""
+        if not data.startswith(STAMP_MARKER):
+            return None, data
+        end = data.index(STAMP_END)
+        stamp = tuple(int(part) for part in data[1:end].split(b".")) if end > 1 else ()
+        return stamp, data[end + 1:]
+
+    async def _mget_decoded(
+        self,
+        operation: str,
+        keys: List[str],
+        scopes: Optional[Sequence[Sequence[str]]] = None
+    ) -> List[Optional[Any]]:
+        """
+        Fetch and decode several keys with one MGET.
+
+        When ``scopes`` is given, the current generation counters for every
+        entry are fetched in the same MGET and entries stamped with an older
+        generation are treated as misses. Unstamped entries (written before
+        generations existed) are valid until their scope is first invalidated.
+
+        Hits and misses are counted per key. Undecodable entries are
+        treated as misses.
+        """
+        gen_keys: List[str] = []
+        if scopes is not None:
+            gen_keys = list(dict.fromkeys(
+                self._generation_key(scope)
+                for entry_scopes in scopes
+                for scope in entry_scopes
+            ))
+
+        with self._timed(operation):
+            values = await self.redis_client.mget(keys + gen_keys)
+
+        generations = self._remember_generations(gen_keys, values[len(keys):]) if gen_keys else {}
+
+        decoded: List[Optional[Any]] = []
+        for index, (key, data) in enumerate(zip(keys, values)):
+            if not data:
+                decoded.append(None)
+                continue
+            try:
+                stamp, payload = self._split_stamp(data)
+                if scopes is not None:
+                    current = tuple(
+                        generations[self._generation_key(scope)] for scope in scopes[index]
+                    )
+                    if (stamp if stamp is not None else (0,) * len(current)) != current:
+                        self._metrics["stale"] += 1
+                        decoded.append(None)
+                        continue
+                decoded.append(decode_payload(payload))
+            except Exception as e:
+                logger.warning(f"Discarding undecodable cache entry {key}: {e}")
+                decoded.append(None)
+
+        hits = sum(1 for value in decoded if value is not None)
+        self._metrics["hits"] += hits
+        self._metrics["misses"] += len(decoded) - hits
+        return decoded
+
+    async def _setex_many(
+        self,
+        operation: str,
+        items: List[Tuple[str, bytes]],
+        ttl: int,
+        scopes: Optional[Sequence[Sequence[str]]] = None
+    ) -> int:
+        """
+        Write several encoded values in one pipelined round trip.
+
+        The pipeline is not transactional: entries are independent and a
+        MULTI/EXEC block would only add server-side work. When ``scopes`` is
+        given, each payload is prefixed with its generation stamp.
+
+        Returns:
+            Number of keys written
+        """
+        if not items:
+            return 0
+
+        with self._timed(operation):
+            stamps = await self._stamps(scopes) if scopes is not None else [b""] * len(items)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for (key, payload), stamp in zip(items, stamps):
+                    pipe.setex(key, ttl, stamp + payload)
+                await pipe.execute()
+        return len(items)
 
     async def initialize(self):
         """Initialize Redis connection pool and client."""
@@ -97,6 +305,10 @@ class CacheManager:
         return {
             **self._metrics,
             "hit_rate": hit_rate,
+            "latency": {
+                name[len(HISTOGRAM_PREFIX):]: snapshot
+                for name, snapshot in histogram_registry.snapshot(HISTOGRAM_PREFIX).items()
+            },
             "timestamp": time.time()
         }
 
@@ -145,14 +357,15 @@ class CacheManager:
     ):
         """Cache prediction result with 24-hour TTL."""
         try:
-            cache_key = f"prediction:{prospect_id}:{model_version}"
-            prediction_json = json.dumps(prediction_data)
-
-            await self.redis_client.setex(
-                cache_key,
-                ttl,
-                prediction_json
-            )
+            cache_key = self._prediction_key(prospect_id, model_version)
+
+            with self._timed("set_prediction"):
+                stamp, = await self._stamps([self._prediction_scopes(prospect_id, model_version)])
+                await self.redis_client.setex(
+                    cache_key,
+                    ttl,
+                    stamp + encode_payload(prediction_data)
+                )
             self._metrics["sets"] += 1
             logger.debug(f"Prediction cached: {cache_key}")
 
@@ -167,23 +380,90 @@ class CacheManager:
     ) -> Optional[Dict[str, Any]]:
         """Retrieve cached prediction result."""
         try:
-            cache_key = f"prediction:{prospect_id}:{model_version}"
-            data = await self.redis_client.get(cache_key)
-
-            if data:
-                self._metrics["hits"] += 1
-                logger.debug(f"Prediction cache hit: {cache_key}")
-                return json.loads(data.decode('utf-8'))
-            else:
-                self._metrics["misses"] += 1
-                logger.debug(f"Prediction cache miss: {cache_key}")
-                return None
+            cache_key = self._prediction_key(prospect_id, model_version)
+            prediction, = await self._mget_decoded(
+                "get_prediction",
+                [cache_key],
+                [self._prediction_scopes(prospect_id, model_version)]
+            )
+            logger.debug(f"Prediction cache {'hit' if prediction is not None else 'miss'}: {cache_key}")
+            return prediction
 
         except Exception as e:
             self._metrics["errors"] += 1
             logger.error(f"Failed to get cached prediction for prospect {prospect_id}: {e}")
             return None
 
+    async def get_many_predictions(
+        self,
+        prospect_ids: List[int],
+        model_version: str
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Retrieve cached predictions for several prospects with one MGET.
+
+        Args:
+            prospect_ids: Prospects to look up
+            model_version: Model version the predictions were made with
+
+        Returns:
+            Cached predictions keyed by prospect ID (misses are omitted)
+        """
+        if not prospect_ids:
+            return {}
+
+        try:
+            keys = [self._prediction_key(prospect_id, model_version) for prospect_id in prospect_ids]
+            values = await self._mget_decoded(
+                "get_many_predictions",
+                keys,
+                [self._prediction_scopes(prospect_id, model_version) for prospect_id in prospect_ids]
+            )
+            return {
+                prospect_id: value
+                for prospect_id, value in zip(prospect_ids, values)
+                if value is not None
+            }
+
+        except Exception as e:
+            self._metrics["errors"] += 1
+            logger.error(f"Failed to get cached predictions for {len(prospect_ids)} prospects: {e}")
+            return {}
+
+    async def set_many_predictions(
+        self,
+        predictions: Dict[int, Dict[str, Any]],
+        model_version: str,
+        ttl: int = 86400
+    ):
+        """
+        Cache several prediction results in one pipelined round trip.
+
+        Args:
+            predictions: Prediction data keyed by prospect ID
+            model_version: Model version the predictions were made with
+            ttl: Time to live in seconds
+        """
+        if not predictions:
+            return
+
+        try:
+            written = await self._setex_many(
+                "set_many_predictions",
+                [
+                    (self._prediction_key(prospect_id, model_version), encode_payload(data))
+                    for prospect_id, data in predictions.items()
+                ],
+                ttl,
+                [self._prediction_scopes(prospect_id, model_version) for prospect_id in predictions]
+            )
+            self._metrics["sets"] += written
+            logger.debug(f"Predictions cached: {written} entries for model {model_version}")
+
+        except Exception as e:
+            self._metrics["errors"] += 1
+            logger.error(f"Failed to cache predictions for {len(predictions)} prospects: {e}")
+
     # Feature caching methods
     async def cache_prospect_features(
         self,
@@ -193,14 +473,14 @@ class CacheManager:
     ):
         """Cache prospect features for reuse."""
         try:
-            cache_key = f"features:{prospect_id}"
-            features_json = json.dumps(features)
-
-            await self.redis_client.setex(
-                cache_key,
-                ttl,
-                features_json
-            )
+            cache_key = self._features_key(prospect_id)
+
+            with self._timed("set_features"):
+                await self.redis_client.setex(
+                    cache_key,
+                    ttl,
+                    encode_payload(features)
+                )
             self._metrics["sets"] += 1
             logger.debug(f"Features cached: {cache_key}")
 
@@ -211,13 +491,14 @@ class CacheManager:
     async def get_cached_features(self, prospect_id: int) -> Optional[Dict[str, Any]]:
         """Retrieve cached prospect features."""
         try:
-            cache_key = f"features:{prospect_id}"
-            data = await self.redis_client.get(cache_key)
+            cache_key = self._features_key(prospect_id)
+            with self._timed("get_features"):
+                data = await self.redis_client.get(cache_key)
 
             if data:
                 self._metrics["hits"] += 1
                 logger.debug(f"Features cache hit: {cache_key}")
-                return json.loads(data.decode('utf-8'))
+                return decode_payload(data)
             else:
                 self._metrics["misses"] += 1
                 logger.debug(f"Features cache miss: {cache_key}")
@@ -228,6 +509,36 @@ class CacheManager:
             logger.error(f"Failed to get cached features for prospect {prospect_id}: {e}")
             return None
 
+    async def get_many_features(
+        self,
+        prospect_ids: List[Union[int, str]]
+    ) -> Dict[Union[int, str], Dict[str, Any]]:
+        """
+        Retrieve cached features for several prospects (or feature keys) with one MGET.
+
+        Args:
+            prospect_ids: Prospect IDs or feature cache keys to look up
+
+        Returns:
+            Cached features keyed by the requested ID (misses are omitted)
+        """
+        if not prospect_ids:
+            return {}
+
+        try:
+            keys = [self._features_key(prospect_id) for prospect_id in prospect_ids]
+            values = await self._mget_decoded("get_many_features", keys)
+            return {
+                prospect_id: value
+                for prospect_id, value in zip(prospect_ids, values)
+                if value is not None
+            }
+
+        except Exception as e:
+            self._metrics["errors"] += 1
+            logger.error(f"Failed to get cached features for {len(prospect_ids)} prospects: {e}")
+            return {}
+
     # Cache invalidation methods
     async def invalidate_model_cache(self, model_key: str):
         """Invalidate cached model data."""
@@ -240,43 +551,118 @@ class CacheManager:
             self._metrics["errors"] += 1
             logger.error(f"Failed to invalidate model cache {model_key}: {e}")
 
+    async def _bump_generation(self, scope: str) -> int:
+        """Invalidate every entry stamped with ``scope`` by bumping its generation."""
+        gen_key = self._generation_key(scope)
+        with self._timed("invalidate"):
+            generation = int(await self.redis_client.incr(gen_key))
+        self._generations[gen_key] = (generation, time.monotonic())
+        self._metrics["invalidations"] += 1
+        return generation
+
     async def invalidate_prospect_predictions(self, prospect_id: int):
         """Invalidate all cached predictions for a prospect."""
         try:
-            # Find all prediction keys for this prospect
-            pattern = f"prediction:{prospect_id}:*"
-            keys = await self.redis_client.keys(pattern)
-
-            if keys:
-                await self.redis_client.delete(*keys)
-                self._metrics["deletes"] += len(keys)
-                logger.info(f"Invalidated {len(keys)} prediction caches for prospect {prospect_id}")
+            generation = await self._bump_generation(f"predictions:prospect:{prospect_id}")
+            logger.info(f"Invalidated prediction caches for prospect {prospect_id} (generation {generation})")
 
         except Exception as e:
             self._metrics["errors"] += 1
             logger.error(f"Failed to invalidate predictions for prospect {prospect_id}: {e}")
 
-    async def invalidate_all_predictions(self):
-        """Invalidate all cached predictions (use with model updates)."""
+    async def invalidate_model_predictions(self, model_version: str):
+        """Invalidate all cached predictions made with a model version."""
         try:
-            pattern = "prediction:*"
-            keys = await self.redis_client.keys(pattern)
+            generation = await self._bump_generation(f"predictions:model:{model_version}")
+            logger.info(f"Invalidated prediction caches for model {model_version} (generation {generation})")
+
+        except Exception as e:
+            self._metrics["errors"] += 1
+            logger.error(f"Failed to invalidate predictions for model {model_version}: {e}")
 
-            if keys:
-                # Delete in batches to avoid blocking
-                batch_size = 1000
-                for i in range(0, len(keys), batch_size):
-                    batch = keys[i:i + batch_size]
-                    await self.redis_client.delete(*batch)
+    async def invalidate_all_predictions(self, purge: bool = False):
+        """
+        Invalidate all cached predictions (use with model updates).
+
+        Args:
+            purge: Also reclaim the stale entries' memory with a background
+                SCAN + UNLINK instead of waiting for their TTL
+        """
+        try:
+            generation = await self._bump_generation("predictions")
+            logger.info(f"Invalidated all prediction caches (generation {generation})")
 
-                self._metrics["deletes"] += len(keys)
-                logger.info(f"Invalidated {len(keys)} prediction caches")
+            if purge:
+                self.purge_in_background("prediction:*")
 
         except Exception as e:
             self._metrics["errors"] += 1
             logger.error(f"Failed to invalidate all predictions: {e}")
 
+    async def purge_keys(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Delete keys matching ``pattern`` without blocking Redis.
+
+        Uses incremental SCAN rather than KEYS and UNLINK so memory is
+        reclaimed by a Redis background thread.
+
+        Args:
+            pattern: Glob-style key pattern
+            batch_size: SCAN count hint and UNLINK batch size
+
+        Returns:
+            Number of keys unlinked
+        """
+        removed = 0
+        batch: List[bytes] = []
+        async for key in self.redis_client.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                removed += await self.redis_client.unlink(*batch)
+                batch = []
+        if batch:
+            removed += await self.redis_client.unlink(*batch)
+
+        self._metrics["deletes"] += removed
+        logger.info(f"Purged {removed} cache keys matching {pattern}")
+        return removed
+
+    def purge_in_background(self, pattern: str) -> asyncio.Task:
+        """Run ``purge_keys`` as a background task and return it."""
+        task = asyncio.create_task(self.purge_keys(pattern))
+        self._background_tasks.add(task)
+
+        def _done(finished: asyncio.Task):
+            self._background_tasks.discard(finished)
+            if not finished.cancelled() and finished.exception():
+                self._metrics["errors"] += 1
+                logger.error(f"Background purge of {pattern} failed: {finished.exception()}")
+
+        task.add_done_callback(_done)
+        return task
+
     # Narrative caching methods
+    @staticmethod
+    def _narrative_key(
+        prospect_id: int,
+        model_version: str,
+        template_version: str,
+        user_id: Optional[int] = None
+    ) -> str:
+        """Composite narrative cache key including user context."""
+        user_suffix = f":{user_id}" if user_id else ":default"
+        return f"narrative:{prospect_id}:{model_version}:{template_version}{user_suffix}"
+
+    @staticmethod
+    def _encode_narrative(narrative_data: str, model_version: str, template_version: str) -> bytes:
+        """Serialize a narrative with its metadata."""
+        return encode_payload({
+            "narrative": narrative_data,
+            "template_version": template_version,
+            "model_version": model_version,
+            "cached_at": time.time()
+        })
+
     async def cache_narrative(
         self,
         prospect_id: int,
@@ -288,25 +674,15 @@ class CacheManager:
     ):
         """Cache generated narrative with 24-hour TTL."""
         try:
-            # Create composite cache key including user context
-            user_suffix = f":{user_id}" if user_id else ":default"
-            cache_key = f"narrative:{prospect_id}:{model_version}:{template_version}{user_suffix}"
-
-            # Store narrative with metadata
-            narrative_cache = {
-                "narrative": narrative_data,
-                "template_version": template_version,
-                "model_version": model_version,
-                "cached_at": time.time()
-            }
-
-            narrative_json = json.dumps(narrative_cache)
-
-            await self.redis_client.setex(
-                cache_key,
-                ttl,
-                narrative_json
-            )
+            cache_key = self._narrative_key(prospect_id, model_version, template_version, user_id)
+
+            with self._timed("set_narrative"):
+                stamp, = await self._stamps([self._narrative_scopes(prospect_id, template_version)])
+                await self.redis_client.setex(
+                    cache_key,
+                    ttl,
+                    stamp + self._encode_narrative(narrative_data, model_version, template_version)
+                )
             self._metrics["sets"] += 1
             logger.debug(f"Narrative cached: {cache_key}")
 
@@ -323,55 +699,121 @@ class CacheManager:
     ) -> Optional[str]:
         """Retrieve cached narrative."""
         try:
-            user_suffix = f":{user_id}" if user_id else ":default"
-            cache_key = f"narrative:{prospect_id}:{model_version}:{template_version}{user_suffix}"
-            data = await self.redis_client.get(cache_key)
+            cache_key = self._narrative_key(prospect_id, model_version, template_version, user_id)
+            cached, = await self._mget_decoded(
+                "get_narrative",
+                [cache_key],
+                [self._narrative_scopes(prospect_id, template_version)]
+            )
 
-            if data:
-                self._metrics["hits"] += 1
+            if cached is not None:
                 logger.debug(f"Narrative cache hit: {cache_key}")
-                narrative_cache = json.loads(data.decode('utf-8'))
-                return narrative_cache["narrative"]
-            else:
-                self._metrics["misses"] += 1
-                logger.debug(f"Narrative cache miss: {cache_key}")
-                return None
+                return cached["narrative"]
+            logger.debug(f"Narrative cache miss: {cache_key}")
+            return None
 
         except Exception as e:
             self._metrics["errors"] += 1
             logger.error(f"Failed to get cached narrative for prospect {prospect_id}: {e}")
             return None
 
+    async def get_many_narratives(
+        self,
+        requests: List[Tuple[int, str, Optional[int]]],
+        template_version: str = "v1.0"
+    ) -> List[Optional[str]]:
+        """
+        Retrieve several cached narratives with a single MGET.
+
+        Args:
+            requests: (prospect_id, model_version, user_id) per narrative
+            template_version: Template version shared by all narratives
+
+        Returns:
+            Narratives in request order, None for misses
+        """
+        if not requests:
+            return []
+
+        try:
+            keys = [
+                self._narrative_key(prospect_id, model_version, template_version, user_id)
+                for prospect_id, model_version, user_id in requests
+            ]
+            values = await self._mget_decoded(
+                "get_many_narratives",
+                keys,
+                [self._narrative_scopes(request[0], template_version) for request in requests]
+            )
+            return [value["narrative"] if value is not None else None for value in values]
+
+        except Exception as e:
+            self._metrics["errors"] += 1
+            logger.error(f"Failed to get cached narratives for {len(requests)} prospects: {e}")
+            return [None] * len(requests)
+
+    async def cache_many_narratives(
+        self,
+        entries: List[Tuple[int, str, Optional[int], str]],
+        template_version: str = "v1.0",
+        ttl: int = 86400  # 24 hours
+    ):
+        """
+        Cache several narratives in one pipelined round trip.
+
+        Args:
+            entries: (prospect_id, model_version, user_id, narrative) per narrative
+            template_version: Template version shared by all narratives
+            ttl: Time to live in seconds
+        """
+        if not entries:
+            return
+
+        try:
+            written = await self._setex_many(
+                "set_many_narratives",
+                [
+                    (
+                        self._narrative_key(prospect_id, model_version, template_version, user_id),
+                        self._encode_narrative(narrative_data, model_version, template_version)
+                    )
+                    for prospect_id, model_version, user_id, narrative_data in entries
+                ],
+                ttl,
+                [self._narrative_scopes(entry[0], template_version) for entry in entries]
+            )
+            self._metrics["sets"] += written
+            logger.debug(f"Narrative batch cached: {written} entries")
+
+        except Exception as e:
+            self._metrics["errors"] += 1
+            logger.error(f"Failed to cache narratives for {len(entries)} prospects: {e}")
+
     async def invalidate_prospect_narratives(self, prospect_id: int):
         """Invalidate all cached narratives for a prospect."""
         try:
-            pattern = f"narrative:{prospect_id}:*"
-            keys = await self.redis_client.keys(pattern)
-
-            if keys:
-                await self.redis_client.delete(*keys)
-                self._metrics["deletes"] += len(keys)
-                logger.info(f"Invalidated {len(keys)} narrative caches for prospect {prospect_id}")
+            generation = await self._bump_generation(f"narratives:prospect:{prospect_id}")
+            logger.info(f"Invalidated narrative caches for prospect {prospect_id} (generation {generation})")
 
         except Exception as e:
             self._metrics["errors"] += 1
             logger.error(f"Failed to invalidate narratives for prospect {prospect_id}: {e}")
 
-    async def invalidate_template_caches(self, template_version: str):
-        """Invalidate all narratives using a specific template version."""
-        try:
-            pattern = f"narrative:*:{template_version}:*"
-            keys = await self.redis_client.keys(pattern)
+    async def invalidate_template_caches(self, template_version: str, purge: bool = False):
+        """
+        Invalidate all narratives using a specific template version.
 
-            if keys:
-                # Delete in batches to avoid blocking
-                batch_size = 1000
-                for i in range(0, len(keys), batch_size):
-                    batch = keys[i:i + batch_size]
-                    await self.redis_client.delete(*batch)
+        Args:
+            template_version: Template version to invalidate
+            purge: Also reclaim the stale entries' memory with a background
+                SCAN + UNLINK instead of waiting for their TTL
+        """
+        try:
+            generation = await self._bump_generation(f"narratives:template:{template_version}")
+            logger.info(f"Invalidated narrative caches for template {template_version} (generation {generation})")
 
-                self._metrics["deletes"] += len(keys)
-                logger.info(f"Invalidated {len(keys)} narrative caches for template {template_version}")
+            if purge:
+                self.purge_in_background(f"narrative:*:{template_version}:*")
 
         except Exception as e:
             self._metrics["errors"] += 1
@@ -386,12 +828,10 @@ class CacheManager:
         """Cache user preferences for personalization."""
         try:
             cache_key = f"user_prefs:{user_id}"
-            prefs_json = json.dumps(preferences)
-
             await self.redis_client.setex(
                 cache_key,
                 ttl,
-                prefs_json
+                encode_payload(preferences)
             )
             self._metrics["sets"] += 1
             logger.debug(f"User preferences cached: {cache_key}")
@@ -409,7 +849,7 @@ class CacheManager:
             if data:
                 self._metrics["hits"] += 1
                 logger.debug(f"User preferences cache hit: {cache_key}")
-                return json.loads(data.decode('utf-8'))
+                return decode_payload(data)
             else:
                 self._metrics["misses"] += 1
                 logger.debug(f"User preferences cache miss: {cache_key}")
@@ -428,12 +868,10 @@ class CacheManager:
         """Cache list of popular prospects for warming."""
         try:
             cache_key = "popular_prospects"
-            prospects_json = json.dumps(prospect_ids)
-
             await self.redis_client.setex(
                 cache_key,
                 ttl,
-                prospects_json
+                encode_payload(prospect_ids)
             )
             self._metrics["sets"] += 1
             logger.debug(f"Popular prospects cached: {len(prospect_ids)} prospects")
@@ -450,7 +888,7 @@ class CacheManager:
 
             if data:
                 self._metrics["hits"] += 1
-                return json.loads(data.decode('utf-8'))
+                return decode_payload(data)
             else:
                 self._metrics["misses"] += 1
                 return []
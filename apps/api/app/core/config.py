@@ -77,11 +77,22 @@ class Settings(BaseSettings):
         values = info.data
         return f"postgresql+asyncpg://{values.get('POSTGRES_USER')}:{values.get('POSTGRES_PASSWORD')}@{values.get('POSTGRES_SERVER')}:{values.get('POSTGRES_PORT')}/{values.get('POSTGRES_DB')}"
 
+    # Batch script database runtime (app.db.script_runtime)
+    SCRIPT_DB_POOL_SIZE: int = 10  # async connections kept open per script
+    SCRIPT_DB_MAX_OVERFLOW: int = 10  # extra connections under burst
+    SCRIPT_DB_BATCH_SIZE: int = 1000  # rows per executemany batch
+    SCRIPT_DB_STATEMENT_CACHE_SIZE: int = 500  # asyncpg prepared statements per connection
+    SCRIPT_DB_THREADS: int = 4  # threads running blocking sync-ORM work
+
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_COMPRESSION_MIN_BYTES: int = 1024  # zstd-compress larger cache payloads (0 disables)
+    PRINCIPAL_CACHE_LOCAL_TTL: int = 30  # seconds an authenticated user record is reused in-process
+    PRINCIPAL_CACHE_REDIS_TTL: int = 300  # seconds it is shared across workers via Redis
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
 
     # JWT
     SECRET_KEY: str = "test"  # Must be set via environment variable - NEVER hardcode in production!
@@ -93,6 +104,25 @@ class Settings(BaseSettings):
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_WINDOW: int = 60  # seconds
 
+    # ML Prediction Rate Limiting (requests per minute by subscription tier)
+    ML_RATE_LIMIT_FREE: int = 10
+    ML_RATE_LIMIT_PREMIUM: int = 60
+    ML_RATE_LIMIT_MAX_LEASE: int = 5  # tokens a worker may take from Redis at once
+    ML_RATE_LIMIT_LEASE_FRACTION: float = 0.1  # share of the remaining tokens a lease may take
+
+    # Narrative cache pre-warming (nightly job)
+    NARRATIVE_PREWARM_TOP_N: int = 500
+    NARRATIVE_PREWARM_BATCH_SIZE: int = 100
+
+    # Email digest delivery
+    EMAIL_DIGEST_BATCH_SIZE: int = 100  # emails per provider batch request (Resend max 100)
+    EMAIL_DIGEST_CONCURRENCY: int = 4  # batch requests in flight
+    EMAIL_DIGEST_RENDER_WORKERS: int = 2  # template render processes (0 renders in-process)
+    EMAIL_DIGEST_DRY_RUN: bool = False  # send to the local stub provider instead of Resend
+
+    # Columnar ML feature store (Arrow files partitioned by as_of_year)
+    FEATURE_STORE_DIR: str = "data/feature_store"
+
     # Authentication Rate Limiting
     AUTH_RATE_LIMIT_ATTEMPTS: int = 5
     AUTH_RATE_LIMIT_WINDOW: int = 15 * 60  # 15 minutes in seconds
@@ -113,6 +143,14 @@ class Settings(BaseSettings):
     MLB_STATS_API_RATE_LIMIT: int = 1000  # requests per day
     MLB_STATS_API_REQUEST_DELAY: float = 0.1  # seconds between requests
 
+    # On-disk statsapi response cache (final games and past seasons never expire)
+    STATSAPI_CACHE_ENABLED: bool = True
+    STATSAPI_CACHE_PATH: str = "data/http_cache/statsapi.db"
+    STATSAPI_CACHE_MAX_AGE: int = 15 * 60  # seconds before a mutable response is revalidated
+
+    # In-process reference data (prospect id maps, park/league factors)
+    REFERENCE_DATA_REFRESH_SECONDS: int = 10 * 60  # seconds between change checks
+
     # Fangraphs Configuration
     FANGRAPHS_BASE_URL: str = "https://www.fangraphs.com"
     FANGRAPHS_RATE_LIMIT_CALLS: int = 1  # requests per period
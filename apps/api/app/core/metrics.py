@@ -0,0 +1,120 @@
+"""In-process latency histograms.
+
+Lightweight fixed-bucket histograms used by the middleware stack and the
+cache layer to report where time goes without an external metrics backend.
+Snapshots are exposed through the monitoring endpoints.
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Optional, Sequence
+
+
+# Bucket upper bounds in milliseconds (last bucket catches everything above)
+DEFAULT_BUCKETS_MS: Sequence[float] = (
+    0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles."""
+
+    def __init__(self, name: str, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.name = name
+        self.buckets_ms: List[float] = sorted(buckets_ms)
+        self._counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, duration_ms: float):
+        """Record a single observation in milliseconds."""
+        index = bisect.bisect_left(self.buckets_ms, duration_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum_ms += duration_ms
+            if duration_ms > self._max_ms:
+                self._max_ms = duration_ms
+
+    def percentile(self, quantile: float) -> float:
+        """Approximate a percentile from the bucket upper bounds."""
+        with self._lock:
+            if self._count == 0:
+                return 0.0
+            target = quantile * self._count
+            running = 0
+            for index, count in enumerate(self._counts):
+                running += count
+                if running >= target:
+                    if index < len(self.buckets_ms):
+                        return min(self.buckets_ms[index], self._max_ms)
+                    return self._max_ms
+            return self._max_ms
+
+    def reset(self):
+        """Clear all recorded observations."""
+        with self._lock:
+            self._counts = [0] * (len(self.buckets_ms) + 1)
+            self._count = 0
+            self._sum_ms = 0.0
+            self._max_ms = 0.0
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return a JSON-serializable view of the histogram."""
+        p50 = self.percentile(0.50)
+        p95 = self.percentile(0.95)
+        p99 = self.percentile(0.99)
+        with self._lock:
+            labels = [f"le_{bound:g}" for bound in self.buckets_ms] + ["le_inf"]
+            return {
+                "count": self._count,
+                "sum_ms": round(self._sum_ms, 3),
+                "avg_ms": round(self._sum_ms / self._count, 3) if self._count else 0.0,
+                "max_ms": round(self._max_ms, 3),
+                "p50_ms": p50,
+                "p95_ms": p95,
+                "p99_ms": p99,
+                "buckets": dict(zip(labels, self._counts)),
+            }
+
+
+class HistogramRegistry:
+    """Named collection of latency histograms."""
+
+    def __init__(self):
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, buckets_ms: Optional[Sequence[float]] = None) -> LatencyHistogram:
+        """Get or create the histogram registered under ``name``."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.get(name)
+                if histogram is None:
+                    histogram = LatencyHistogram(name, buckets_ms or DEFAULT_BUCKETS_MS)
+                    self._histograms[name] = histogram
+        return histogram
+
+    def observe(self, name: str, duration_ms: float):
+        """Record an observation on the named histogram."""
+        self.get(name).observe(duration_ms)
+
+    def snapshot(self, prefix: str = "") -> Dict[str, Dict[str, object]]:
+        """Snapshot all histograms whose name starts with ``prefix``."""
+        return {
+            name: histogram.snapshot()
+            for name, histogram in sorted(self._histograms.items())
+            if name.startswith(prefix)
+        }
+
+    def reset(self):
+        """Reset every registered histogram."""
+        for histogram in list(self._histograms.values()):
+            histogram.reset()
+
+
+# Global registry instance
+histogram_registry = HistogramRegistry()
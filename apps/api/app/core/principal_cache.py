@@ -0,0 +1,265 @@
+"""Authenticated-principal cache.
+
+Every authenticated request resolves the JWT subject (the user's email) to
+a user. Most handlers only need the id, tier and a few flags, so those are
+kept as a small immutable ``Principal`` in two layers:
+
+- an in-process LRU with a short TTL, which serves repeat requests from the
+  same user without any I/O, and
+- Redis (when configured), which shares records across workers and replicas
+  with a longer TTL.
+
+Writes that change a cached field (subscription tier, activation, profile
+flags) call ``principal_cache.invalidate``, which clears the local entry and
+the Redis record. Other processes may keep serving their local copy until
+its TTL runs out, so cross-process staleness is bounded by
+``PRINCIPAL_CACHE_LOCAL_TTL``.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache_codec import decode_payload, encode_payload
+from app.core.config import settings
+from app.core.rate_limiting import configured_redis_url
+from app.db.models import User
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "principal:"
+USER_ID_PREFIX = "principal:uid:"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Compact, immutable view of an authenticated user.
+
+    Attribute names match the ``User`` model, so read-only handlers can use
+    a principal wherever they used ``current_user.id``, ``.email`` or
+    ``.subscription_tier``.
+    """
+
+    id: int
+    email: str
+    subscription_tier: str = "free"
+    is_active: bool = True
+    is_admin: bool = False
+    fantrax_connected: bool = False
+    onboarding_completed: bool = False
+
+    @property
+    def is_premium(self) -> bool:
+        return self.subscription_tier == "premium"
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            subscription_tier=user.subscription_tier or "free",
+            is_active=bool(user.is_active),
+            is_admin=bool(user.is_admin),
+            fantrax_connected=bool(user.fantrax_connected),
+            onboarding_completed=bool(user.onboarding_completed),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Principal":
+        return cls(**{name: data[name] for name in cls.__dataclass_fields__ if name in data})
+
+
+class PrincipalCache:
+    """Two-level (process LRU + Redis) cache of principals keyed by token subject."""
+
+    def __init__(
+        self,
+        local_ttl: Optional[float] = None,
+        redis_ttl: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        redis_client=None
+    ):
+        self.local_ttl = settings.PRINCIPAL_CACHE_LOCAL_TTL if local_ttl is None else local_ttl
+        self.redis_ttl = settings.PRINCIPAL_CACHE_REDIS_TTL if redis_ttl is None else redis_ttl
+        self.max_entries = settings.PRINCIPAL_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self._redis = redis_client
+        self._redis_resolved = redis_client is not None
+        # email -> (principal, monotonic expiry)
+        self._local: "OrderedDict[str, Tuple[Principal, float]]" = OrderedDict()
+        self._emails_by_id: Dict[int, str] = {}
+        # Bumped on every invalidation so a load that raced one is not cached
+        self._epoch = 0
+        self._metrics = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "errors": 0
+        }
+
+    @property
+    def redis_client(self):
+        """Redis client when Redis is configured, otherwise None (local cache only)."""
+        if not self._redis_resolved:
+            self._redis_resolved = True
+            redis_url = configured_redis_url()
+            if redis_url:
+                try:
+                    import redis.asyncio as redis
+
+                    self._redis = redis.Redis.from_url(redis_url)
+                except Exception as e:
+                    logger.warning(f"Principal cache running without Redis: {e}")
+        return self._redis
+
+    @staticmethod
+    def _key(email: str) -> str:
+        return f"{KEY_PREFIX}{email}"
+
+    @staticmethod
+    def _id_key(user_id: int) -> str:
+        return f"{USER_ID_PREFIX}{user_id}"
+
+    def _get_local(self, email: str) -> Optional[Principal]:
+        entry = self._local.get(email)
+        if entry is None:
+            return None
+        principal, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._drop_local(email)
+            return None
+        self._local.move_to_end(email)
+        return principal
+
+    def _set_local(self, principal: Principal):
+        self._local[principal.email] = (principal, time.monotonic() + self.local_ttl)
+        self._local.move_to_end(principal.email)
+        self._emails_by_id[principal.id] = principal.email
+        while len(self._local) > self.max_entries:
+            self._drop_local(next(iter(self._local)))
+
+    def _drop_local(self, email: str):
+        entry = self._local.pop(email, None)
+        if entry is not None and self._emails_by_id.get(entry[0].id) == email:
+            del self._emails_by_id[entry[0].id]
+
+    async def _get_redis(self, email: str) -> Optional[Principal]:
+        client = self.redis_client
+        if client is None:
+            return None
+        try:
+            data = await client.get(self._key(email))
+            return Principal.from_dict(decode_payload(data)) if data else None
+        except Exception as e:
+            self._metrics["errors"] += 1
+            logger.warning(f"Principal cache read failed for {email}: {e}")
+            return None
+
+    async def _set_redis(self, principal: Principal):
+        client = self.redis_client
+        if client is None:
+            return
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.setex(self._key(principal.email), self.redis_ttl, encode_payload(principal.to_dict()))
+                pipe.setex(self._id_key(principal.id), self.redis_ttl, principal.email)
+                await pipe.execute()
+        except Exception as e:
+            self._metrics["errors"] += 1
+            logger.warning(f"Principal cache write failed for {principal.email}: {e}")
+
+    async def get(self, subject: str, db: AsyncSession) -> Optional[Principal]:
+        """
+        Resolve a token subject to a principal.
+
+        Args:
+            subject: JWT subject (user email)
+            db: Database session used on a cache miss
+
+        Returns:
+            Principal, or None if no such user exists
+        """
+        principal = self._get_local(subject)
+        if principal is not None:
+            self._metrics["local_hits"] += 1
+            return principal
+
+        epoch = self._epoch
+        principal = await self._get_redis(subject)
+        if principal is not None:
+            self._metrics["redis_hits"] += 1
+            if epoch == self._epoch:
+                self._set_local(principal)
+            return principal
+
+        self._metrics["misses"] += 1
+        result = await db.execute(select(User).where(User.email == subject))
+        user = result.scalar_one_or_none()
+        if user is None:
+            return None
+
+        principal = Principal.from_user(user)
+        if epoch == self._epoch:
+            self._set_local(principal)
+            await self._set_redis(principal)
+        return principal
+
+    async def invalidate(self, email: Optional[str] = None, user_id: Optional[int] = None):
+        """
+        Drop a user's cached principal after a write that changes it.
+
+        Either identifier is enough; the email for a user id is found from
+        the local index or the Redis id pointer.
+        """
+        self._epoch += 1
+        self._metrics["invalidations"] += 1
+
+        if email is None and user_id is not None:
+            email = self._emails_by_id.get(user_id)
+
+        client = self.redis_client
+        if client is not None:
+            try:
+                if email is None and user_id is not None:
+                    pointer = await client.get(self._id_key(user_id))
+                    if pointer:
+                        email = pointer.decode() if isinstance(pointer, bytes) else pointer
+                keys = [self._key(email)] if email else []
+                if user_id is not None:
+                    keys.append(self._id_key(user_id))
+                if keys:
+                    await client.delete(*keys)
+            except Exception as e:
+                self._metrics["errors"] += 1
+                logger.warning(f"Principal cache invalidation failed for {email or user_id}: {e}")
+
+        if email:
+            self._drop_local(email)
+
+    def clear_local(self):
+        """Drop every in-process entry (Redis records are left to expire)."""
+        self._epoch += 1
+        self._local.clear()
+        self._emails_by_id.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        lookups = self._metrics["local_hits"] + self._metrics["redis_hits"] + self._metrics["misses"]
+        hits = lookups - self._metrics["misses"]
+        return {
+            **self._metrics,
+            "local_entries": len(self._local),
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0
+        }
+
+
+# Global principal cache instance
+principal_cache = PrincipalCache()
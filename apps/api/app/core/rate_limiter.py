@@ -1,7 +1,6 @@
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 import redis.asyncio as redis
 from fastapi import Request
 from starlette.requests import Request as StarletteRequest
@@ -65,23 +64,13 @@ except Exception as e:
 
 
 def setup_rate_limiter(app):
-    """Setup rate limiter middleware and exception handlers"""
+    """Setup rate limiter state and exception handlers.
+
+    Default limits for undecorated routes (with healthcheck exemption) are
+    enforced by the pure-ASGI ``SecurityMiddleware``; decorated endpoints are
+    checked by their ``@limiter.limit()`` wrappers.
+    """
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-    # Add custom middleware to exempt healthcheck endpoints from rate limiting
-    @app.middleware("http")
-    async def rate_limit_with_healthcheck_exemption(request, call_next):
-        # Skip rate limiting for healthcheck endpoints
-        if is_healthcheck(request):
-            return await call_next(request)
-
-        # Apply rate limiting to all other requests
-        # Note: SlowAPIMiddleware processes the request through the limiter
-        response = await call_next(request)
-        return response
-
-    # Still add SlowAPIMiddleware for decorated endpoints using @limiter.limit()
-    app.add_middleware(SlowAPIMiddleware)
-
-    return app
\ No newline at end of file
+    return app
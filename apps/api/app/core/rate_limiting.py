@@ -1,43 +1,331 @@
-"""Rate limiting for ML prediction endpoints."""
+"""Rate limiting for ML prediction endpoints.
 
+Limits are enforced with a sliding-window counter (current and previous
+fixed windows, weighted by overlap) stored in Redis and updated atomically
+by a Lua script, so every uvicorn worker and replica shares the same view.
+Keys expire after two windows, so users that never come back cost nothing.
+
+By default every request takes exactly one token from the shared counter.
+Limiters can opt in to leasing (max_lease > 1 and lease_fraction > 0) to
+skip the Redis round trip for clearly under-limit users: the process takes
+a small batch of tokens and spends them locally until the lease runs out or
+the window rolls over. Leased tokens are counted against the limit up
+front, so workers can never collectively exceed it, but tokens leased by
+one worker are unavailable to the others for the rest of the window.
+
+The ML prediction limiter opts in with a bounded lease: at most
+ML_RATE_LIMIT_MAX_LEASE tokens, and never more than
+ML_RATE_LIMIT_LEASE_FRACTION of what the user has left. A worker therefore
+holds back only a few tokens, and users close to their limit still go
+through Redis one token at a time.
+"""
+
+import logging
+import math
 import time
-from typing import Dict, Optional
-import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
 from fastapi import HTTPException
 
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Atomic sliding-window check with token leasing.
+# KEYS[1] = current window counter, KEYS[2] = previous window counter
+# ARGV = limit, previous window weight, max lease, lease fraction, ttl (ms)
+SLIDING_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local weight = tonumber(ARGV[2])
+local max_lease = tonumber(ARGV[3])
+local lease_fraction = tonumber(ARGV[4])
+local ttl_ms = tonumber(ARGV[5])
+
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local available = math.floor(limit - (previous * weight) - current)
+
+if available < 1 then
+    return {0, 0}
+end
+
+local granted = math.floor(available * lease_fraction)
+if granted > max_lease then granted = max_lease end
+if granted < 1 then granted = 1 end
+
+redis.call('INCRBY', KEYS[1], granted)
+redis.call('PEXPIRE', KEYS[1], ttl_ms)
+return {granted, available - granted}
+"""
+
+
+@dataclass
+class _Lease:
+    """Tokens leased from the shared counter for one window."""
+
+    window_index: int
+    tokens: int
+
+
+class RateLimitBackend(ABC):
+    """Storage backend for sliding-window counters."""
+
+    @abstractmethod
+    async def acquire(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: int,
+        max_lease: int = 1,
+        lease_fraction: float = 0.0
+    ) -> Tuple[int, float]:
+        """
+        Try to take tokens for ``key``.
+
+        Returns:
+            Tuple of (tokens granted, seconds until the current window ends).
+            Zero tokens granted means the limit is exhausted.
+        """
+
+    @staticmethod
+    def _window(now: float, window_seconds: int) -> Tuple[int, float, float]:
+        """Window index, weight of the previous window and seconds until reset."""
+        window_index = int(now // window_seconds)
+        elapsed = now - window_index * window_seconds
+        weight = 1.0 - elapsed / window_seconds
+        return window_index, weight, window_seconds - elapsed
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Process-local backend with the same algorithm as the Redis backend.
+
+    Used in tests and as a fallback when Redis is not configured. All work
+    happens without awaiting, so it is atomic with respect to the event loop
+    and needs no lock.
+    """
+
+    def __init__(self, sweep_interval: int = 60):
+        self._counters: Dict[str, Tuple[int, float]] = {}  # key -> (count, expires_at)
+        self._sweep_interval = sweep_interval
+        self._last_sweep = time.monotonic()
+
+    def _get(self, key: str, now: float) -> int:
+        entry = self._counters.get(key)
+        if entry is None:
+            return 0
+        count, expires_at = entry
+        if expires_at <= now:
+            del self._counters[key]
+            return 0
+        return count
+
+    def _sweep(self, now: float):
+        """Drop expired counters so idle users do not accumulate."""
+        if now - self._last_sweep < self._sweep_interval:
+            return
+        self._last_sweep = now
+        expired = [k for k, (_, expires_at) in self._counters.items() if expires_at <= now]
+        for key in expired:
+            del self._counters[key]
+
+    async def acquire(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: int,
+        max_lease: int = 1,
+        lease_fraction: float = 0.0
+    ) -> Tuple[int, float]:
+        now = time.time()
+        monotonic_now = time.monotonic()
+        self._sweep(monotonic_now)
+
+        window_index, weight, reset_in = self._window(now, window_seconds)
+        current_key = f"{key}:{window_index}"
+        previous = self._get(f"{key}:{window_index - 1}", monotonic_now)
+        current = self._get(current_key, monotonic_now)
+
+        available = math.floor(limit - previous * weight - current)
+        if available < 1:
+            return 0, reset_in
+
+        granted = max(1, min(max_lease, math.floor(available * lease_fraction)))
+        self._counters[current_key] = (current + granted, monotonic_now + window_seconds * 2)
+        return granted, reset_in
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Redis backend using an atomic Lua sliding-window script."""
+
+    def __init__(self, redis_client, key_prefix: str = "ratelimit"):
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self._script = redis_client.register_script(SLIDING_WINDOW_LUA)
+
+    async def acquire(
+        self,
+        key: str,
+        limit: int,
+        window_seconds: int,
+        max_lease: int = 1,
+        lease_fraction: float = 0.0
+    ) -> Tuple[int, float]:
+        window_index, weight, reset_in = self._window(time.time(), window_seconds)
+
+        # Hash tag keeps both windows in the same cluster slot
+        base = f"{self.key_prefix}:{{{key}}}"
+        granted, _ = await self._script(
+            keys=[f"{base}:{window_index}", f"{base}:{window_index - 1}"],
+            args=[limit, weight, max_lease, lease_fraction, window_seconds * 2 * 1000],
+        )
+        return int(granted), reset_in
+
+
+_shared_backend: Optional[RateLimitBackend] = None
+
+
+def configured_redis_url() -> Optional[str]:
+    """Redis URL when Redis is explicitly configured (same rules as the slowapi limiter)."""
+    if settings.REDIS_URL and settings.REDIS_URL != "redis://localhost:6379/0":
+        return settings.REDIS_URL
+    if settings.REDIS_HOST != "localhost":
+        return f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
+    return None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """
+    Shared backend for all limiters in this process.
+
+    Uses Redis when it is configured, otherwise an in-memory backend that
+    only limits per process.
+    """
+    global _shared_backend
+    if _shared_backend is not None:
+        return _shared_backend
+
+    redis_url = configured_redis_url()
+    if redis_url:
+        try:
+            import redis.asyncio as redis
+
+            client = redis.Redis.from_url(redis_url, decode_responses=True)
+            _shared_backend = RedisRateLimitBackend(client)
+            return _shared_backend
+        except Exception as e:
+            logger.warning(f"Failed to initialize Redis rate limit backend: {e}. Using in-memory fallback.")
+
+    _shared_backend = InMemoryRateLimitBackend()
+    return _shared_backend
+
+
+def set_rate_limit_backend(backend: Optional[RateLimitBackend]):
+    """Override the shared backend (tests, or explicit wiring at startup)."""
+    global _shared_backend
+    _shared_backend = backend
+
+
+def default_tier_limits() -> Dict[str, int]:
+    """Per-tier requests per minute for ML prediction endpoints."""
+    return {
+        "free": settings.ML_RATE_LIMIT_FREE,
+        "premium": settings.ML_RATE_LIMIT_PREMIUM,
+    }
+
 
 class RateLimiter:
-    """Simple in-memory rate limiter for ML prediction endpoints."""
+    """Distributed sliding-window rate limiter for ML prediction endpoints."""
+
+    MAX_LEASES = 10000
 
-    def __init__(self, requests_per_minute: int, identifier: str = "default"):
+    def __init__(
+        self,
+        requests_per_minute: int,
+        identifier: str = "default",
+        tier_limits: Optional[Dict[str, int]] = None,
+        backend: Optional[RateLimitBackend] = None,
+        window_seconds: int = 60,
+        max_lease: int = 1,
+        lease_fraction: float = 0.0
+    ):
         self.requests_per_minute = requests_per_minute
         self.identifier = identifier
-        self.requests: Dict[str, list] = {}
-        self.lock = asyncio.Lock()
+        self.tier_limits = tier_limits or {}
+        self.window_seconds = window_seconds
+        self.max_lease = max_lease
+        self.lease_fraction = lease_fraction
+        self._backend = backend
+        self._leases: Dict[str, _Lease] = {}
+
+    @property
+    def backend(self) -> RateLimitBackend:
+        if self._backend is None:
+            self._backend = get_rate_limit_backend()
+        return self._backend
 
-    async def check_rate_limit(self, user_id: int):
+    def limit_for_tier(self, tier: Optional[str]) -> int:
+        """Requests per window for a subscription tier."""
+        if tier and tier in self.tier_limits:
+            return self.tier_limits[tier]
+        return self.requests_per_minute
+
+    def _prune_leases(self, window_index: int):
+        """Drop leases from past windows so idle users are not retained."""
+        stale = [k for k, lease in self._leases.items() if lease.window_index != window_index]
+        for key in stale:
+            del self._leases[key]
+
+    def _take_leased_token(self, user_key: str, window_index: int) -> bool:
+        lease = self._leases.get(user_key)
+        if lease is None:
+            return False
+        if lease.window_index != window_index or lease.tokens <= 0:
+            del self._leases[user_key]
+            return False
+        lease.tokens -= 1
+        return True
+
+    async def check_rate_limit(self, user_id: int, tier: Optional[str] = None):
         """Check if user has exceeded rate limit."""
-        async with self.lock:
-            current_time = time.time()
-            user_key = f"{self.identifier}_{user_id}"
-
-            # Initialize or clean old requests
-            if user_key not in self.requests:
-                self.requests[user_key] = []
-
-            # Remove requests older than 1 minute
-            self.requests[user_key] = [
-                req_time for req_time in self.requests[user_key]
-                if current_time - req_time < 60
-            ]
-
-            # Check if limit exceeded
-            if len(self.requests[user_key]) >= self.requests_per_minute:
-                raise HTTPException(
-                    status_code=429,
-                    detail=f"Rate limit exceeded: {self.requests_per_minute} requests per minute"
-                )
-
-            # Add current request
-            self.requests[user_key].append(current_time)
\ No newline at end of file
+        limit = self.limit_for_tier(tier)
+        user_key = f"{self.identifier}:{tier or 'default'}:{user_id}"
+        window_index = int(time.time() // self.window_seconds)
+
+        # Fast path: spend a locally leased token without touching Redis
+        if self._take_leased_token(user_key, window_index):
+            return
+
+        try:
+            granted, reset_in = await self.backend.acquire(
+                user_key,
+                limit,
+                self.window_seconds,
+                max_lease=self.max_lease,
+                lease_fraction=self.lease_fraction,
+            )
+        except Exception as e:
+            # Fail open: a cache outage should not take prediction endpoints down
+            logger.error(f"Rate limit backend error for {user_key}: {e}")
+            return
+
+        if granted < 1:
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded: {limit} requests per minute",
+                headers={"Retry-After": str(max(1, math.ceil(reset_in)))}
+            )
+
+        # Keep the extra tokens from this grant for the local fast path
+        if len(self._leases) > self.MAX_LEASES:
+            self._prune_leases(window_index)
+        if granted > 1:
+            self._leases[user_key] = _Lease(window_index=window_index, tokens=granted - 1)
+        else:
+            self._leases.pop(user_key, None)
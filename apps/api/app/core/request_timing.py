@@ -0,0 +1,110 @@
+"""Per-request stage timing.
+
+The security middleware installs a ``RequestTimer`` for each HTTP request.
+Code further down the stack (auth dependencies, response rendering) records
+its own stage through ``timed_stage`` so the middleware can report a
+breakdown in the ``Server-Timing`` header and the stage histograms.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from fastapi.responses import JSONResponse
+
+from app.core.metrics import histogram_registry
+
+
+# Stages reported for every request
+STAGE_RATE_LIMIT = "rate_limit"
+STAGE_AUTH = "auth"
+STAGE_HANDLER = "handler"
+STAGE_SERIALIZATION = "serialization"
+
+REQUEST_STAGES = (STAGE_RATE_LIMIT, STAGE_AUTH, STAGE_HANDLER, STAGE_SERIALIZATION)
+
+HISTOGRAM_PREFIX = "http.stage."
+
+
+class RequestTimer:
+    """Accumulates stage durations (in milliseconds) for one request."""
+
+    __slots__ = ("started_at", "stages")
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+
+    def add(self, stage: str, duration_ms: float):
+        """Add time to a stage (stages may be entered more than once)."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + duration_ms
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as part of ``stage``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, (time.perf_counter() - start) * 1000)
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the request entered the middleware."""
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def server_timing_header(self) -> str:
+        """Render stages as a ``Server-Timing`` header value."""
+        parts = [f"{name};dur={duration:.2f}" for name, duration in self.stages.items()]
+        parts.append(f"total;dur={self.elapsed_ms():.2f}")
+        return ", ".join(parts)
+
+    def record_histograms(self):
+        """Publish stage durations to the global histogram registry."""
+        for name, duration in self.stages.items():
+            histogram_registry.observe(f"{HISTOGRAM_PREFIX}{name}", duration)
+        histogram_registry.observe(f"{HISTOGRAM_PREFIX}total", self.elapsed_ms())
+
+
+_current_timer: ContextVar[Optional[RequestTimer]] = ContextVar(
+    "request_timer", default=None
+)
+
+
+def get_request_timer() -> Optional[RequestTimer]:
+    """Return the timer for the request being handled, if any."""
+    return _current_timer.get()
+
+
+def set_request_timer(timer: Optional[RequestTimer]):
+    """Bind ``timer`` to the current context and return the reset token."""
+    return _current_timer.set(timer)
+
+
+def reset_request_timer(token):
+    """Restore the previous timer binding."""
+    _current_timer.reset(token)
+
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[None]:
+    """Time a block against the current request; no-op outside a request."""
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+    with timer.stage(stage):
+        yield
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSONResponse that records body rendering as the serialization stage."""
+
+    def render(self, content: Any) -> bytes:
+        with timed_stage(STAGE_SERIALIZATION):
+            return super().render(content)
+
+
+def get_stage_metrics() -> Dict[str, Dict[str, object]]:
+    """Snapshot of the per-stage latency histograms."""
+    return histogram_registry.snapshot(HISTOGRAM_PREFIX)
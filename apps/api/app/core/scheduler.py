@@ -107,7 +107,8 @@ def start_scheduler() -> None:
         from app.jobs import (
             schedule_email_digests,
             schedule_analytics_aggregation,
-            schedule_churn_prediction
+            schedule_churn_prediction,
+            schedule_narrative_prewarm
         )
 
         logger.info("Scheduling background jobs...")
@@ -116,6 +117,7 @@ def start_scheduler() -> None:
         schedule_email_digests(scheduler)
         schedule_analytics_aggregation(scheduler)
         schedule_churn_prediction(scheduler)
+        schedule_narrative_prewarm(scheduler)
 
         # Start the scheduler
         scheduler.start()
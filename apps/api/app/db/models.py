@@ -1,7 +1,7 @@
 from datetime import datetime, date
 from typing import Optional
 from sqlalchemy import Boolean, DateTime, String, Integer, Text, ForeignKey, CheckConstraint, Float, Date, Index, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, synonym
 from sqlalchemy.dialects.postgresql import JSONB
 from app.db.database import Base
 
@@ -173,6 +173,8 @@ class ScoutingGrades(Base):
 
     # Overall grade
     overall: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Name the ranking and narrative services read the overall grade by
+    overall_grade = synonym("overall")
 
     # Hitting grades (for position players)
     hit: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -234,6 +236,8 @@ class MLPrediction(Base):
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+    # Name the comparison and profile endpoints order predictions by
+    generated_at = synonym("created_at")
 
     # Relationships
     prospect: Mapped["Prospect"] = relationship("Prospect")
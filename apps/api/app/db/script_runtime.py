@@ -0,0 +1,230 @@
+"""
+Database runtime for batch scripts.
+
+Collectors and feature jobs interleave network I/O with database I/O on one
+event loop. Calling the synchronous session from that loop stalls every
+in-flight request for the length of each query, so scripts get three tools
+instead:
+
+- an async engine and transactional session scope sized for bulk work
+  (a larger pool, paged executemany inserts, prepared statement caching);
+- helpers that run existing sync-ORM code on a small thread pool, each call
+  with its own Session, so the loop keeps running;
+- run_sharded, which feeds items to a fixed number of workers from a
+  shared queue while running items with the same key one at a time.
+
+@module script_runtime
+@since 1.0.0
+"""
+
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def create_script_engine(database_url: Optional[str] = None) -> AsyncEngine:
+    """
+    Async engine tuned for batch scripts.
+
+    @param database_url - Async database URL (default: SQLALCHEMY_DATABASE_URI)
+    @returns AsyncEngine with a script-sized pool and statement caching
+    """
+    url = database_url or str(settings.SQLALCHEMY_DATABASE_URI)
+    options: Dict[str, Any] = {
+        "future": True,
+        # Rows per multi-row INSERT when a statement is executed with a list of params
+        "insertmanyvalues_page_size": settings.SCRIPT_DB_BATCH_SIZE,
+    }
+    if not url.startswith("sqlite"):
+        options.update(
+            pool_size=settings.SCRIPT_DB_POOL_SIZE,
+            max_overflow=settings.SCRIPT_DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+        )
+    if "+asyncpg" in url:
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.SCRIPT_DB_STATEMENT_CACHE_SIZE
+        }
+    return create_async_engine(url, **options)
+
+
+async def execute_many(
+    connection,
+    statement,
+    rows: Sequence[Dict[str, Any]],
+    batch_size: Optional[int] = None
+) -> int:
+    """
+    Execute one statement for many parameter sets, in batches.
+
+    @param connection - AsyncConnection or AsyncSession
+    @param statement - Statement with named parameters
+    @param rows - Parameter dicts; all must have the same keys
+    @param batch_size - Rows per executemany call (default: SCRIPT_DB_BATCH_SIZE)
+    @returns Number of parameter sets executed
+    """
+    batch_size = batch_size or settings.SCRIPT_DB_BATCH_SIZE
+    for start in range(0, len(rows), batch_size):
+        await connection.execute(statement, list(rows[start:start + batch_size]))
+    return len(rows)
+
+
+class ScriptRuntime:
+    """
+    Async engine, session scope and blocking-work pool for one script run.
+
+    Use as an async context manager so the pool and threads are released
+    when the script finishes:
+
+        async with ScriptRuntime() as runtime:
+            async with runtime.session() as session:
+                await execute_many(session, insert, rows)
+            players = await runtime.run_in_sync_session(load_players, season)
+    """
+
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        sync_session_factory: Optional[Callable[[], Session]] = None,
+        threads: Optional[int] = None
+    ):
+        self.database_url = database_url
+        self._sync_session_factory = sync_session_factory
+        self._threads = threads or settings.SCRIPT_DB_THREADS
+        self._engine: Optional[AsyncEngine] = None
+        self._session_factory: Optional[async_sessionmaker] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self) -> "ScriptRuntime":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_script_engine(self.database_url)
+        return self._engine
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Session in a transaction: committed on success, rolled back on error."""
+        if self._session_factory is None:
+            self._session_factory = async_sessionmaker(
+                self.engine, class_=AsyncSession, expire_on_commit=False
+            )
+        async with self._session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except BaseException:
+                await session.rollback()
+                raise
+
+    async def run_blocking(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking callable on the runtime's thread pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._threads, thread_name_prefix="script-db"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def run_in_sync_session(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run sync-ORM code off the event loop with a Session of its own.
+
+        The session is committed if fn returns, rolled back if it raises,
+        and closed either way. Sessions are not thread-safe, so fn must not
+        keep it or hand it to other calls.
+
+        @param fn - Called as fn(session, *args, **kwargs)
+        @returns Whatever fn returns
+        """
+        return await self.run_blocking(self._call_in_session, fn, args, kwargs)
+
+    def _call_in_session(self, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        factory = self._sync_session_factory
+        if factory is None:
+            from app.db.database import SyncSessionLocal
+            factory = SyncSessionLocal
+        session = factory()
+        try:
+            result = fn(session, *args, **kwargs)
+            session.commit()
+            return result
+        except BaseException:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    async def close(self) -> None:
+        """Dispose the engine and stop the thread pool."""
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+            self._session_factory = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+async def run_sharded(
+    items: Iterable[Any],
+    worker: Callable[[Any], Awaitable[Any]],
+    shards: int,
+    key: Optional[Callable[[Any], Any]] = None
+) -> List[Any]:
+    """
+    Process items with a fixed number of concurrent workers.
+
+    Items are grouped by key and the groups go on one shared queue, in
+    order of first appearance. Each worker pulls the next group when it is
+    free and runs that group's items one at a time in input order. Items
+    sharing a key therefore never run concurrently, which keeps
+    check-then-insert writes for one player from racing each other, while
+    a slow key only holds up its own items.
+
+    A failing item does not stop its worker: the exception is logged and
+    stored in that item's result slot, as asyncio.gather does with
+    return_exceptions=True.
+
+    @param items - Work items
+    @param worker - Coroutine function called once per item
+    @param shards - Number of concurrent workers
+    @param key - Serialization key per item (default: every item runs independently)
+    @returns One result per item, in input order
+    """
+    items = list(items)
+    groups: Dict[Any, List[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(index if key is None else key(item), []).append(index)
+
+    queue = deque(groups.values())
+    results: List[Any] = [None] * len(items)
+
+    async def run_worker() -> None:
+        while queue:
+            for index in queue.popleft():
+                try:
+                    results[index] = await worker(items[index])
+                except Exception as e:
+                    logger.error(f"Shard worker failed on item {index}: {e}")
+                    results[index] = e
+
+    await asyncio.gather(*(run_worker() for _ in range(max(1, min(shards, len(groups))))))
+    return results
@@ -3,9 +3,11 @@
 from app.jobs.email_digest_job import schedule_email_digests
 from app.jobs.analytics_aggregation_job import schedule_analytics_aggregation
 from app.jobs.churn_prediction_job import schedule_churn_prediction
+from app.jobs.narrative_prewarm_job import schedule_narrative_prewarm
 
 __all__ = [
     'schedule_email_digests',
     'schedule_analytics_aggregation',
-    'schedule_churn_prediction'
+    'schedule_churn_prediction',
+    'schedule_narrative_prewarm'
 ]
@@ -13,7 +13,6 @@ import logging
 from datetime import datetime
 from typing import List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from app.core.database import get_db
 from app.services.churn_prediction_service import ChurnPredictionService
 from app.services.retention_campaign_service import RetentionCampaignService
@@ -40,7 +39,7 @@ class ChurnPredictionJob:
         """
         Execute daily churn prediction and engagement update job.
 
-        Iterates through all active users to:
+        Processes all active users in one set-based pass to:
         1. Update engagement metrics
         2. Calculate churn risk scores
         3. Identify at-risk users (risk >= 60)
@@ -49,9 +48,9 @@ class ChurnPredictionJob:
         @throws DatabaseError - If database connection fails
 
         @performance
-        - Execution time: ~10-30 minutes for 1000 users
-        - Database queries: 3-5 queries per user
-        - Rate limiting: Processes users sequentially
+        - Execution time: seconds for 100k users (excluding emails)
+        - Database queries: 3 grouped reads plus one upsert in total
+        - Rate limiting: Only retention emails are throttled
 
         @since 1.0.0
         """
@@ -67,67 +66,23 @@ class ChurnPredictionJob:
         try:
             # Get database session
             async for db in get_db():
-                from app.db.models import User
-
                 churn_service = ChurnPredictionService(db)
                 retention_service = RetentionCampaignService(db)
 
-                # Get all active users
-                stmt = select(User).where(User.is_active == True)
-                result = await db.execute(stmt)
-                users = result.scalars().all()
-
-                logger.info(f"Processing engagement metrics for {len(users)} active users")
-
-                # Track processing stats
-                success_count = 0
-                fail_count = 0
-                at_risk_users: List[Dict[str, Any]] = []
-
-                # Process each user
-                for user in users:
-                    try:
-                        # Update engagement metrics and calculate churn risk
-                        await churn_service.update_engagement_metrics(user.id)
-
-                        # Get updated metrics to check risk score
-                        from app.db.models import UserEngagementMetrics
-
-                        metrics_stmt = select(UserEngagementMetrics).where(
-                            UserEngagementMetrics.user_id == user.id
-                        )
-                        metrics_result = await db.execute(metrics_stmt)
-                        metrics = metrics_result.scalar_one_or_none()
-
-                        if metrics and metrics.churn_risk_score >= 60:
-                            at_risk_users.append({
-                                "user_id": user.id,
-                                "email": user.email,
-                                "full_name": user.full_name,
-                                "churn_risk_score": metrics.churn_risk_score
-                            })
+                # Recompute metrics and churn risk for all active users at once
+                summary = await churn_service.update_all_engagement_metrics(risk_threshold=60)
+                success_count = summary["users_updated"]
+                at_risk_users: List[Dict[str, Any]] = summary["at_risk_users"]
 
-                        success_count += 1
-
-                        # Small delay to prevent database overload
-                        await asyncio.sleep(0.05)  # 20 users per second
-
-                    except Exception as e:
-                        logger.error(f"Failed to update metrics for user {user.id}: {str(e)}")
-                        fail_count += 1
-                        continue
-
-                # Log processing results
-                logger.info(
-                    f"Engagement metrics updated: {success_count} succeeded, {fail_count} failed"
-                )
+                logger.info(f"Engagement metrics updated for {success_count} active users")
                 logger.info(f"Identified {len(at_risk_users)} at-risk users (risk >= 60)")
 
+                campaign_success = 0
+
                 # Trigger retention campaigns for at-risk users
                 if at_risk_users:
                     logger.info("Triggering retention campaigns for at-risk users")
 
-                    campaign_success = 0
                     campaign_fail = 0
 
                     for at_risk_user in at_risk_users:
@@ -10,10 +10,9 @@ This module handles scheduled email digest generation using APScheduler.
 import asyncio
 import logging
 from datetime import datetime
-from typing import List
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.services.email_digest_service import EmailDigestService
+from typing import Optional
+from app.db.database import get_db
+from app.services.email_digest_pipeline import DigestPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -29,135 +28,74 @@ class EmailDigestJob:
     @since 1.0.0
     """
 
-    def __init__(self):
-        """Initialize email digest job."""
+    def __init__(self, dry_run: Optional[bool] = None):
+        """
+        Initialize email digest job.
+
+        @param dry_run - Send to the local stub provider (defaults to settings)
+        """
         self.is_running = False
+        self.dry_run = dry_run
 
     async def run_weekly_digest(self) -> None:
         """
         Execute weekly email digest job.
 
-        Queries all users eligible for weekly digest, generates personalized
-        content, and sends emails via EmailDigestService.
+        Prefetches all users eligible for weekly digest, renders their
+        digests in a worker pool, and sends them in provider batches.
 
         @throws DatabaseError - If database connection fails
-        @throws EmailProviderError - If bulk email sending fails
 
         @performance
-        - Execution time: ~5-10 minutes for 1000 users
-        - Database queries: 1 query per user + 1 initial query
-        - Rate limiting: 10 emails per second max
+        - Database queries: 1 recipient query + 1 last_sent update
+        - Sending: batches of up to 100 emails, several requests in flight,
+          paced by the provider's rate-limit headers
 
         @since 1.0.0
         """
-        if self.is_running:
-            logger.warning("Weekly digest job already running, skipping")
-            return
-
-        self.is_running = True
-        start_time = datetime.utcnow()
-
-        logger.info("Starting weekly email digest job")
-
-        try:
-            # Get database session
-            async for db in get_db():
-                digest_service = EmailDigestService(db)
-
-                # Get users who need weekly digest
-                user_ids = await digest_service.get_users_for_digest(frequency="weekly")
-
-                logger.info(f"Processing digests for {len(user_ids)} users")
-
-                # Send digests with batch processing
-                success_count = 0
-                fail_count = 0
-
-                for user_id in user_ids:
-                    try:
-                        success = await digest_service.send_digest(user_id)
-                        if success:
-                            success_count += 1
-                        else:
-                            fail_count += 1
-
-                        # Rate limiting: small delay between emails
-                        await asyncio.sleep(0.1)  # 10 emails per second
-
-                    except Exception as e:
-                        logger.error(f"Failed to send digest for user {user_id}: {str(e)}")
-                        fail_count += 1
-                        continue
-
-                # Log results
-                duration = (datetime.utcnow() - start_time).total_seconds()
-                logger.info(
-                    f"Weekly digest job completed in {duration:.2f}s: "
-                    f"{success_count} sent, {fail_count} failed"
-                )
-
-                break  # Exit after first db session
-
-        except Exception as e:
-            logger.error(f"Weekly digest job failed: {str(e)}")
-            raise
-
-        finally:
-            self.is_running = False
+        await self._run_digest("weekly")
 
     async def run_daily_digest(self) -> None:
         """
         Execute daily email digest job.
 
-        Similar to weekly digest but for users with daily frequency preference.
+        Same pipeline as the weekly digest for users with daily frequency preference.
 
         @since 1.0.0
         """
+        await self._run_digest("daily")
+
+    async def _run_digest(self, frequency: str) -> None:
+        """
+        Run the digest pipeline for one frequency.
+
+        @param frequency - Digest frequency (daily, weekly)
+        """
+        label = frequency.capitalize()
         if self.is_running:
-            logger.warning("Daily digest job already running, skipping")
+            logger.warning(f"{label} digest job already running, skipping")
             return
 
         self.is_running = True
         start_time = datetime.utcnow()
 
-        logger.info("Starting daily email digest job")
+        logger.info(f"Starting {frequency} email digest job")
 
         try:
             async for db in get_db():
-                digest_service = EmailDigestService(db)
-
-                user_ids = await digest_service.get_users_for_digest(frequency="daily")
-
-                logger.info(f"Processing daily digests for {len(user_ids)} users")
-
-                success_count = 0
-                fail_count = 0
-
-                for user_id in user_ids:
-                    try:
-                        success = await digest_service.send_digest(user_id)
-                        if success:
-                            success_count += 1
-                        else:
-                            fail_count += 1
-
-                        await asyncio.sleep(0.1)
-
-                    except Exception as e:
-                        logger.error(f"Failed to send daily digest for user {user_id}: {str(e)}")
-                        fail_count += 1
-                        continue
+                pipeline = DigestPipeline(db, dry_run=self.dry_run)
+                report = await pipeline.run(frequency)
 
                 duration = (datetime.utcnow() - start_time).total_seconds()
                 logger.info(
-                    f"Daily digest job completed in {duration:.2f}s: "
-                    f"{success_count} sent, {fail_count} failed"
+                    f"{label} digest job completed in {duration:.2f}s: "
+                    f"{len(report.sent_user_ids)} sent, {len(report.failed_user_ids)} failed"
                 )
 
-                break
+                break  # Exit after first db session
 
         except Exception as e:
-            logger.error(f"Daily digest job failed: {str(e)}")
+            logger.error(f"{label} digest job failed: {str(e)}")
             raise
 
         finally:
@@ -0,0 +1,170 @@
+"""
+Background job for pre-warming the narrative cache.
+
+This module renders default (non-personalized) outlooks for the top-N
+prospects overnight so the first requests of the day are cache hits.
+
+@module narrative_prewarm_job
+@since 1.0.0
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.database import get_db
+from app.ml.narrative_templates import template_engine
+from app.services.narrative_generation_service import (
+    latest_success_predictions,
+    narrative_service
+)
+
+logger = logging.getLogger(__name__)
+
+
+class NarrativePrewarmJob:
+    """
+    Background job that renders outlooks for the top-N prospects.
+
+    Prospects are ranked by their latest success rating prediction and
+    rendered through the batch narrative pipeline, so already-cached
+    outlooks are skipped and new ones are written back in pipelined batches.
+
+    @class NarrativePrewarmJob
+    @since 1.0.0
+    """
+
+    def __init__(self):
+        """Initialize narrative pre-warm job."""
+        self.is_running = False
+
+    async def run_nightly_prewarm(
+        self,
+        top_n: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> None:
+        """
+        Execute nightly narrative cache pre-warm.
+
+        @param top_n - Number of prospects to warm (defaults to settings)
+        @param batch_size - Prospects per MGET/render/SET batch (defaults to settings)
+
+        @performance
+        - Database queries: 1 ranking query
+        - Redis round trips: 2 per batch (MGET + pipelined SET)
+
+        @since 1.0.0
+        """
+        if self.is_running:
+            logger.warning("Narrative pre-warm job already running, skipping")
+            return
+
+        top_n = top_n or settings.NARRATIVE_PREWARM_TOP_N
+        batch_size = batch_size or settings.NARRATIVE_PREWARM_BATCH_SIZE
+
+        self.is_running = True
+        start_time = datetime.utcnow()
+
+        logger.info(f"Starting narrative pre-warm for top {top_n} prospects")
+
+        try:
+            # Compile all templates once instead of on first use per template
+            template_engine.precompile()
+
+            ranked: List[Tuple[Any, SimpleNamespace]] = []
+            async for db in get_db():
+                ranked = await self._get_top_prospects(db, top_n)
+                break
+
+            warmed = 0
+            for i in range(0, len(ranked), batch_size):
+                batch = ranked[i:i + batch_size]
+                prospects = [prospect for prospect, _ in batch]
+                predictions = [prediction for _, prediction in batch]
+
+                await narrative_service.generate_batch_outlooks(prospects, predictions)
+                warmed += len(batch)
+
+                # Yield to the event loop between batches
+                await asyncio.sleep(0)
+
+            duration = (datetime.utcnow() - start_time).total_seconds()
+            logger.info(
+                f"Narrative pre-warm completed in {duration:.2f}s: {warmed} prospects warmed"
+            )
+
+        except Exception as e:
+            logger.error(f"Narrative pre-warm job failed: {str(e)}")
+            raise
+
+        finally:
+            self.is_running = False
+
+    async def _get_top_prospects(self, db, top_n: int) -> List[Tuple[Any, SimpleNamespace]]:
+        """
+        Load the top-N prospects with their latest success rating prediction.
+
+        @param db - Async database session
+        @param top_n - Number of prospects to return
+        @returns List of (prospect, prediction data) pairs, best first
+        """
+        from app.db.models import MLPrediction, Prospect
+
+        latest = latest_success_predictions()
+
+        stmt = (
+            select(Prospect, MLPrediction)
+            .join(latest, latest.c.prospect_id == Prospect.id)
+            .join(MLPrediction, MLPrediction.id == latest.c.prediction_id)
+            .order_by(MLPrediction.prediction_value.desc())
+            .limit(top_n)
+        )
+        result = await db.execute(stmt)
+
+        return [
+            (prospect, self._prediction_data(prediction))
+            for prospect, prediction in result.all()
+        ]
+
+    @staticmethod
+    def _prediction_data(prediction) -> SimpleNamespace:
+        """Adapt a stored prediction row to the shape the narrative service reads."""
+        return SimpleNamespace(
+            success_probability=prediction.prediction_value,
+            confidence_level=(
+                prediction.confidence_score
+                if prediction.confidence_score is not None else 0.5
+            ),
+            model_version=prediction.model_version,
+            feature_importance={}
+        )
+
+
+# Global job instance
+narrative_prewarm_job = NarrativePrewarmJob()
+
+
+def schedule_narrative_prewarm(scheduler) -> None:
+    """
+    Schedule narrative cache pre-warm job with APScheduler.
+
+    @param scheduler - APScheduler instance
+    @since 1.0.0
+    """
+    # Nightly pre-warm - Every day at 4:00 AM UTC, after churn and analytics jobs
+    scheduler.add_job(
+        func=lambda: asyncio.create_task(narrative_prewarm_job.run_nightly_prewarm()),
+        trigger='cron',
+        hour=4,
+        minute=0,
+        id='nightly_narrative_prewarm',
+        name='Nightly Narrative Cache Pre-warm',
+        replace_existing=True
+    )
+
+    logger.info("Narrative pre-warm job scheduled successfully")
@@ -10,6 +10,7 @@ import sys
 from app.api.api_v1.api import api_router
 from app.core.config import settings
 from app.core.rate_limiter import setup_rate_limiter
+from app.core.request_timing import TimedJSONResponse
 from app.middleware.security_middleware import add_security_middleware
 from app.services.hype_scheduler import start_hype_scheduler, stop_hype_scheduler
 from app.db.database import AsyncSessionLocal
@@ -62,6 +63,7 @@ For support, please contact: support@afinewinedynasty.com
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=TimedJSONResponse,
     terms_of_service="https://afinewinedynasty.com/terms",
     contact={
         "name": "A Fine Wine Dynasty Support",
@@ -92,10 +94,11 @@ logger.info(f"   Processed cors_origins: {cors_origins}")
 logger.info(f"   Total origins: {len(cors_origins)}")
 
 # MIDDLEWARE ORDER (applied in reverse, so last added = first executed):
-# 1. Security middleware FIRST (includes TrustedHost for Railway domains)
+# 1. Security middleware FIRST (TrustedHost for Railway domains, then a single
+#    pure-ASGI layer for size limits, rate limiting, headers and stage timing)
 app = add_security_middleware(app)
 
-# 2. CORS middleware (after host validation, before rate limiting)
+# 2. CORS middleware (outermost, so rate-limit and error responses carry CORS headers)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
@@ -105,7 +108,7 @@ app.add_middleware(
     expose_headers=["X-Total-Count"],
 )
 
-# 3. Rate limiting LAST (after CORS, with healthcheck exemption)
+# 3. Rate limiter state and exception handlers (enforced by the security middleware)
 app = setup_rate_limiter(app)
 
 # CORS Exception Handlers - ensure CORS headers on error responses
@@ -1,10 +1,22 @@
-from fastapi import HTTPException, Request, status
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from slowapi.middleware import _find_route_handler, _should_exempt, async_check_limits
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.core.config import settings
+from app.core.rate_limiter import is_healthcheck
+from app.core.request_timing import (
+    RequestTimer,
+    STAGE_AUTH,
+    STAGE_HANDLER,
+    STAGE_RATE_LIMIT,
+    STAGE_SERIALIZATION,
+    reset_request_timer,
+    set_request_timer,
+)
 import logging
+import time
 
 
 # Configure logging for security events
@@ -12,81 +24,196 @@ security_logger = logging.getLogger("security")
 security_logger.setLevel(logging.INFO)
 
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware to limit request body size"""
+SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"content-security-policy", b"default-src 'self'"),
+]
 
-    def __init__(self, app: ASGIApp, max_request_size: int = 1024 * 1024):  # 1MB default
-        super().__init__(app)
-        self.max_request_size = max_request_size
+FAILED_AUTH_STATUSES = (401, 403, 429)
 
-    async def dispatch(self, request: Request, call_next):
-        if request.headers.get("content-length"):
-            content_length = int(request.headers["content-length"])
-            if content_length > self.max_request_size:
-                security_logger.warning(
-                    f"Request too large: {content_length} bytes from {request.client.host}"
-                )
-                return JSONResponse(
-                    status_code=413,
-                    content={"detail": "Request too large"}
-                )
-        return await call_next(request)
 
+def _client_host(scope: Scope) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers"""
 
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
+def _nested_stage_ms(timer: RequestTimer) -> float:
+    """Time recorded by stages that run inside the route handler."""
+    return timer.stages.get(STAGE_AUTH, 0.0) + timer.stages.get(STAGE_SERIALIZATION, 0.0)
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
 
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
+class SecurityMiddleware:
+    """
+    Pure-ASGI security stack.
 
-        return response
+    Composes what used to be separate ``BaseHTTPMiddleware`` layers into a
+    single pass over the request:
 
+    1. Request size limiting (413 on oversized ``Content-Length``)
+    2. Security logging for auth endpoints
+    3. Rate limiting for routes without an explicit ``@limiter.limit``
+    4. Security headers on every response
+    5. Per-stage timing reported via ``Server-Timing`` and stage histograms
 
-class SecurityLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log security-relevant requests"""
+    Responses are streamed straight through; only the ``http.response.start``
+    message is touched to add headers.
+    """
 
-    async def dispatch(self, request: Request, call_next):
-        # Log authentication attempts
-        if "/auth/" in str(request.url):
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_request_size: int = 1024 * 1024,  # 1MB default
+        enable_rate_limiting: bool = True,
+        enable_server_timing: bool = True,
+    ):
+        self.app = app
+        self.max_request_size = max_request_size
+        self.enable_rate_limiting = enable_rate_limiting
+        self.enable_server_timing = enable_server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timer = RequestTimer()
+        token = set_request_timer(timer)
+        state = scope.setdefault("state", {})
+        state["request_timer"] = timer
+
+        path = scope.get("path", "")
+        is_auth_request = "/auth/" in path
+        if is_auth_request:
             security_logger.info(
-                f"Auth request: {request.method} {request.url.path} from {request.client.host}"
+                f"Auth request: {scope.get('method')} {path} from {_client_host(scope)}"
             )
 
-        response = await call_next(request)
+        status_code = 500
+        extra_headers = []
+        handler_started = 0.0
+        nested_before_start = 0.0
+        response_started_at = None
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, response_started_at
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_started_at = time.perf_counter()
+                if handler_started:
+                    # Downstream time minus stages recorded inside the handler
+                    downstream_ms = (response_started_at - handler_started) * 1000
+                    nested_ms = _nested_stage_ms(timer) - nested_before_start
+                    timer.add(STAGE_HANDLER, max(downstream_ms - nested_ms, 0.0))
+
+                headers = MutableHeaders(scope=message)
+                for name, value in SECURITY_HEADERS:
+                    headers.raw.append((name, value))
+                for name, value in extra_headers:
+                    headers.raw.append((name, value))
+                if self.enable_server_timing:
+                    headers.append("Server-Timing", timer.server_timing_header())
+
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                if response_started_at is not None:
+                    # Body transmission counts toward serialization for streamed responses
+                    timer.add(
+                        STAGE_SERIALIZATION,
+                        (time.perf_counter() - response_started_at) * 1000,
+                    )
+
+            await send(message)
+
+        try:
+            # Request size limiting
+            response = self._check_request_size(scope)
+
+            # Rate limiting for undecorated routes
+            if response is None and self.enable_rate_limiting:
+                with timer.stage(STAGE_RATE_LIMIT):
+                    response, inject = await self._check_rate_limit(scope, receive)
+                if inject:
+                    extra_headers.extend(inject)
+
+            if response is not None:
+                await response(scope, receive, send_wrapper)
+            else:
+                handler_started = time.perf_counter()
+                nested_before_start = _nested_stage_ms(timer)
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_request_timer(token)
+            timer.record_histograms()
+
+            # Log failed authentication attempts
+            if is_auth_request and status_code in FAILED_AUTH_STATUSES:
+                security_logger.warning(
+                    f"Failed auth attempt: {status_code} from {_client_host(scope)} to {path}"
+                )
 
-        # Log failed authentication attempts
-        if "/auth/" in str(request.url) and response.status_code in [401, 403, 429]:
-            security_logger.warning(
-                f"Failed auth attempt: {response.status_code} from {request.client.host} to {request.url.path}"
+    def _check_request_size(self, scope: Scope):
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    content_length = int(value)
+                except ValueError:
+                    return None
+                if content_length > self.max_request_size:
+                    security_logger.warning(
+                        f"Request too large: {content_length} bytes from {_client_host(scope)}"
+                    )
+                    return JSONResponse(
+                        status_code=413,
+                        content={"detail": "Request too large"}
+                    )
+                return None
+        return None
+
+    async def _check_rate_limit(self, scope: Scope, receive: Receive):
+        """
+        Apply the application's default limits to routes that are not decorated.
+
+        Decorated routes are checked by their ``@limiter.limit`` wrapper inside
+        the handler, matching ``SlowAPIMiddleware`` semantics.
+        """
+        app = scope.get("app")
+        limiter = getattr(getattr(app, "state", None), "limiter", None)
+        if limiter is None or not limiter.enabled:
+            return None, None
+
+        request = Request(scope, receive=receive)
+        if is_healthcheck(request):
+            return None, None
+
+        handler = _find_route_handler(app.routes, scope)
+        if _should_exempt(limiter, handler):
+            return None, None
+
+        error_response, should_inject_headers = await async_check_limits(
+            limiter, request, handler, app
+        )
+        if error_response is not None:
+            return error_response, None
+
+        if should_inject_headers:
+            headers = MutableHeaders(raw=[])
+            headers = limiter._inject_asgi_headers(
+                headers, getattr(request.state, "view_rate_limit", None)
             )
-
-        return response
+            return None, headers.raw
+        return None, None
 
 
 def add_security_middleware(app):
     """Add security middleware to FastAPI app"""
-    # Request size limiting
-    app.add_middleware(RequestSizeLimitMiddleware, max_request_size=2 * 1024 * 1024)  # 2MB limit
-
-    # Security headers
-    app.add_middleware(SecurityHeadersMiddleware)
-
-    # Security logging
-    app.add_middleware(SecurityLoggingMiddleware)
+    # Size limiting, rate limiting, security headers/logging and stage timing
+    app.add_middleware(SecurityMiddleware, max_request_size=2 * 1024 * 1024)  # 2MB limit
 
     # Trusted host middleware - use specific hosts in production
     allowed_hosts = settings.ALLOWED_HOSTS if settings.ALLOWED_HOSTS else ["*"]
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=allowed_hosts)
 
-    return app
\ No newline at end of file
+    return app
@@ -15,7 +15,7 @@ from enum import Enum
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 
-from ..core.database import get_db
+from ..db.database import get_db_sync
 from ..core.cache_manager import CacheManager
 from ..models.prospect import Prospect
 from ..schemas.ml_predictions import (
@@ -273,6 +273,13 @@ class BatchPredictionService:
                 chunk = job.prospect_ids[i:i + job.chunk_size]
                 logger.debug(f"Processing chunk {i//job.chunk_size + 1} with {len(chunk)} prospects")
 
+                # One MGET for the whole chunk instead of a GET per prospect
+                cached_predictions = {}
+                if not job.include_explanations:
+                    cached_predictions = await cache_manager.get_many_predictions(
+                        chunk, job.model_version
+                    )
+
                 # Process chunk concurrently
                 chunk_tasks = []
                 for prospect_id in chunk:
@@ -280,6 +287,7 @@ class BatchPredictionService:
                         self._process_single_prospect(
                             prospect_id=prospect_id,
                             job=job,
+                            cached_prediction=cached_predictions.get(prospect_id),
                             model_server=model_server,
                             cache_manager=cache_manager,
                             confidence_scorer=confidence_scorer,
@@ -292,6 +300,7 @@ class BatchPredictionService:
                 chunk_results = await asyncio.gather(*chunk_tasks, return_exceptions=True)
 
                 # Process results
+                new_predictions = {}
                 for result in chunk_results:
                     if isinstance(result, Exception):
                         job.failed_count += 1
@@ -299,6 +308,11 @@ class BatchPredictionService:
                     else:
                         job.results.append(result)
                         job.processed_count += 1
+                        if not result.get("cache_hit"):
+                            new_predictions[result["prospect_id"]] = result
+
+                # Write fresh predictions back in one pipelined batch
+                await cache_manager.set_many_predictions(new_predictions, job.model_version)
 
                 # Optional: Add small delay between chunks to avoid overwhelming the system
                 await asyncio.sleep(0.1)
@@ -329,29 +343,34 @@ class BatchPredictionService:
         model_server: ModelServer,
         cache_manager: CacheManager,
         confidence_scorer: ConfidenceScorer,
-        feature_extractor: ProspectFeatureExtractor
+        feature_extractor: ProspectFeatureExtractor,
+        cached_prediction: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Process ML prediction for a single prospect in batch job."""
+        """
+        Process ML prediction for a single prospect in batch job.
 
-        try:
-            # Check cache first for performance
-            cached_prediction = await cache_manager.get_cached_prediction(
-                prospect_id, job.model_version
-            )
+        Cached predictions are prefetched per chunk and fresh results are
+        written back per chunk by the caller.
+        """
 
+        try:
             if cached_prediction and not job.include_explanations:
                 # Return cached result
-                cached_prediction["cache_hit"] = True
-                return cached_prediction
+                return {**cached_prediction, "cache_hit": True}
 
-            # Get database session (simplified for batch processing)
-            # In production, this would use connection pooling
-            db = next(get_db())
-
-            # Extract prospect features
-            features = await feature_extractor.get_prospect_features(
-                prospect_id, db, cache_manager
-            )
+            features = await cache_manager.get_cached_features(prospect_id)
+            if not features:
+                # The extractor queries through the sync ORM; run it on a
+                # worker thread so the rest of the chunk keeps going
+                features = await asyncio.to_thread(
+                    self._extract_features, feature_extractor, prospect_id
+                )
+                if features:
+                    await cache_manager.cache_prospect_features(
+                        prospect_id=prospect_id,
+                        features=features,
+                        ttl=feature_extractor.feature_cache_ttl
+                    )
 
             if not features:
                 raise ValueError(f"Prospect {prospect_id} not found or insufficient data")
@@ -381,19 +400,24 @@ class BatchPredictionService:
                 "cache_hit": False
             }
 
-            # Cache the result for future use
-            await cache_manager.cache_prediction(
-                prospect_id=prospect_id,
-                model_version=job.model_version,
-                prediction_data=response_data
-            )
-
             return response_data
 
         except Exception as e:
             logger.error(f"Failed to process prospect {prospect_id} in batch job: {e}")
             raise
 
+    @staticmethod
+    def _extract_features(
+        feature_extractor: ProspectFeatureExtractor,
+        prospect_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """Extract features with a session owned by the calling thread."""
+        db = get_db_sync()
+        try:
+            return feature_extractor.extract_features(prospect_id, db)
+        finally:
+            db.close()
+
     async def cleanup_old_jobs(self, retention_days: int = 7):
         """Clean up old completed/failed jobs to free memory."""
         cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
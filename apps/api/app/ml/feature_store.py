@@ -0,0 +1,528 @@
+"""
+Columnar feature store for engineered ML features.
+
+Features are stored per schema version as Arrow IPC files partitioned by
+``as_of_year``::
+
+    <root>/schemas/<version>.json
+    <root>/<version>/as_of_year=<year>/part-00000.arrow
+    <root>/<version>/as_of_year=<year>/part-00001.arrow   (incremental append)
+
+Every partition file has an ``int64`` ``prospect_id`` column followed by one
+typed column per feature in the registered schema order. Files are opened
+memory-mapped, so reading a partition does not parse or copy the feature
+columns until a matrix is assembled. When a prospect appears in several
+part files the most recent part wins; ``compact`` folds the parts back into
+one file.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:
+    pa = None
+    pa_ipc = None
+
+logger = logging.getLogger(__name__)
+
+
+PROSPECT_ID_COLUMN = "prospect_id"
+SUPPORTED_DTYPES = ("float32", "float64")
+
+_PART_PATTERN = re.compile(r"^part-(\d{5})\.arrow$")
+
+
+class FeatureStoreError(Exception):
+    """Raised for invalid feature store operations."""
+    pass
+
+
+class FeatureSchemaError(FeatureStoreError):
+    """Raised when a feature schema is missing or conflicts with a registered one."""
+    pass
+
+
+@dataclass(frozen=True)
+class FeatureSchema:
+    """Registered, ordered feature layout for one feature set version."""
+
+    version: str
+    feature_names: Tuple[str, ...]
+    dtype: str = "float32"
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of the feature order and dtype."""
+        payload = "\n".join((self.dtype,) + self.feature_names)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "feature_names": list(self.feature_names),
+            "dtype": self.dtype,
+            "created_at": self.created_at,
+            "fingerprint": self.fingerprint,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "FeatureSchema":
+        return cls(
+            version=data["version"],
+            feature_names=tuple(data["feature_names"]),
+            dtype=data.get("dtype", "float32"),
+            created_at=data.get("created_at", ""),
+        )
+
+
+def align_features(
+    features: Mapping[str, Any],
+    feature_order: Sequence[str],
+    fill_value: float = 0.0
+) -> np.ndarray:
+    """
+    Convert one feature dictionary to a vector in ``feature_order``.
+
+    Missing, null and non-numeric values become ``fill_value``.
+
+    Args:
+        features: Feature name to value mapping
+        feature_order: Feature order expected by the model
+        fill_value: Value for missing features
+
+    Returns:
+        1-D float array aligned to ``feature_order``
+    """
+    vector = np.full(len(feature_order), fill_value, dtype=np.float64)
+    for i, name in enumerate(feature_order):
+        value = features.get(name)
+        if value is None:
+            continue
+        try:
+            vector[i] = float(value)
+        except (TypeError, ValueError):
+            pass
+    return vector
+
+
+class FeatureSchemaRegistry:
+    """JSON-file registry of feature schemas, one file per version."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root) / "schemas"
+        self._schemas: Dict[str, FeatureSchema] = {}
+
+    def _path(self, version: str) -> Path:
+        return self.root / f"{version}.json"
+
+    def register(
+        self,
+        version: str,
+        feature_names: Sequence[str],
+        dtype: str = "float32"
+    ) -> FeatureSchema:
+        """
+        Register a feature schema, or return the existing identical one.
+
+        Args:
+            version: Feature set version (e.g. "v1.0")
+            feature_names: Ordered feature names
+            dtype: Column dtype, one of ``SUPPORTED_DTYPES``
+
+        Returns:
+            The registered schema
+
+        Raises:
+            FeatureSchemaError: If the version exists with a different layout
+        """
+        if dtype not in SUPPORTED_DTYPES:
+            raise FeatureSchemaError(f"Unsupported feature dtype: {dtype}")
+        if len(set(feature_names)) != len(feature_names):
+            raise FeatureSchemaError(f"Duplicate feature names in schema {version}")
+        if PROSPECT_ID_COLUMN in feature_names:
+            raise FeatureSchemaError(f"'{PROSPECT_ID_COLUMN}' is reserved")
+
+        schema = FeatureSchema(version=version, feature_names=tuple(feature_names), dtype=dtype)
+
+        existing = self.get(version, required=False)
+        if existing is not None:
+            if existing.fingerprint != schema.fingerprint:
+                raise FeatureSchemaError(
+                    f"Feature schema {version} is already registered with a different layout "
+                    f"({existing.fingerprint} != {schema.fingerprint}); register a new version"
+                )
+            return existing
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path(version).with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(schema.to_dict(), f, indent=2)
+        os.replace(tmp_path, self._path(version))
+
+        self._schemas[version] = schema
+        logger.info(f"Registered feature schema {version} ({len(feature_names)} features)")
+        return schema
+
+    def get(self, version: str, required: bool = True) -> Optional[FeatureSchema]:
+        """
+        Get a registered schema.
+
+        Raises:
+            FeatureSchemaError: If ``required`` and the version is not registered
+        """
+        if version in self._schemas:
+            return self._schemas[version]
+
+        path = self._path(version)
+        if not path.exists():
+            if required:
+                raise FeatureSchemaError(f"Feature schema {version} is not registered")
+            return None
+
+        with open(path) as f:
+            schema = FeatureSchema.from_dict(json.load(f))
+        self._schemas[version] = schema
+        return schema
+
+    def list_versions(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(path.stem for path in self.root.glob("*.json"))
+
+
+class FeaturePartition:
+    """Memory-mapped view over one (schema version, as_of_year) partition."""
+
+    def __init__(self, schema: FeatureSchema, as_of_year: int, part_paths: Sequence[Path]):
+        self.schema = schema
+        self.as_of_year = as_of_year
+        self.part_paths = list(part_paths)
+
+        self._tables = [
+            pa_ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+            for path in self.part_paths
+        ]
+
+        # Resolve which part/row holds the latest row for each prospect
+        ids = [table.column(PROSPECT_ID_COLUMN).to_numpy() for table in self._tables]
+        all_ids = np.concatenate(ids) if ids else np.array([], dtype=np.int64)
+        part_of = np.concatenate([
+            np.full(len(part_ids), i, dtype=np.int32) for i, part_ids in enumerate(ids)
+        ]) if ids else np.array([], dtype=np.int32)
+        row_of = np.concatenate([
+            np.arange(len(part_ids), dtype=np.int64) for part_ids in ids
+        ]) if ids else np.array([], dtype=np.int64)
+
+        # np.unique keeps the first occurrence, so search the reversed arrays
+        unique_ids, first_reversed = np.unique(all_ids[::-1], return_index=True)
+        latest = len(all_ids) - 1 - first_reversed
+
+        self.prospect_ids = unique_ids
+        self._parts = part_of[latest]
+        self._rows = row_of[latest]
+        self._position = {int(pid): i for i, pid in enumerate(unique_ids)}
+
+    def __len__(self) -> int:
+        return len(self.prospect_ids)
+
+    def __contains__(self, prospect_id: int) -> bool:
+        return int(prospect_id) in self._position
+
+    def _column(self, part: int, name: str) -> np.ndarray:
+        return self._tables[part].column(name).to_numpy()
+
+    def matrix(
+        self,
+        feature_order: Optional[Sequence[str]] = None,
+        prospect_ids: Optional[Iterable[int]] = None,
+        fill_value: float = 0.0,
+        dtype: Any = np.float32
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Assemble an (N x F) matrix aligned to a model's feature order.
+
+        Features the schema does not contain, and NaN values, become
+        ``fill_value``.
+
+        Args:
+            feature_order: Feature names in model order (defaults to schema order)
+            prospect_ids: Restrict to these prospects, in this order; unknown ids are skipped
+            fill_value: Value for missing features
+            dtype: Output dtype
+
+        Returns:
+            Tuple of (prospect_ids, matrix) with matrix rows aligned to the ids
+        """
+        feature_order = list(feature_order or self.schema.feature_names)
+
+        if prospect_ids is None:
+            positions = np.arange(len(self.prospect_ids))
+        else:
+            positions = np.array(
+                [self._position[int(pid)] for pid in prospect_ids if int(pid) in self._position],
+                dtype=np.int64
+            )
+
+        ids = self.prospect_ids[positions]
+        matrix = np.full((len(positions), len(feature_order)), fill_value, dtype=dtype)
+        if len(positions) == 0:
+            return ids, matrix
+
+        known = set(self.schema.feature_names)
+        columns = [(j, name) for j, name in enumerate(feature_order) if name in known]
+
+        parts = self._parts[positions]
+        rows = self._rows[positions]
+        for part in np.unique(parts):
+            selected = np.flatnonzero(parts == part)
+            part_rows = rows[selected]
+            for j, name in columns:
+                matrix[selected, j] = self._column(part, name)[part_rows]
+
+        if np.issubdtype(matrix.dtype, np.floating):
+            np.nan_to_num(matrix, copy=False, nan=fill_value)
+        return ids, matrix
+
+    def lookup(self, prospect_id: int) -> Optional[Dict[str, Optional[float]]]:
+        """
+        Point lookup of one prospect's features.
+
+        Returns:
+            Feature name to value mapping (NaN as None), or None if absent
+        """
+        position = self._position.get(int(prospect_id))
+        if position is None:
+            return None
+
+        table = self._tables[self._parts[position]]
+        row = int(self._rows[position])
+        features = {}
+        for name in self.schema.feature_names:
+            value = table.column(name)[row].as_py()
+            features[name] = None if value is None or value != value else value
+        return features
+
+
+class FeatureStore:
+    """Versioned, year-partitioned columnar store for prospect features."""
+
+    def __init__(self, root: Optional[str] = None):
+        if pa is None:
+            raise FeatureStoreError("pyarrow is required for the feature store")
+
+        self.root = Path(root or settings.FEATURE_STORE_DIR)
+        self.registry = FeatureSchemaRegistry(self.root)
+        self._partitions: Dict[Tuple[str, int], Tuple[Tuple[Any, ...], FeaturePartition]] = {}
+
+    def _partition_dir(self, version: str, as_of_year: int) -> Path:
+        return self.root / version / f"as_of_year={as_of_year}"
+
+    def _part_paths(self, version: str, as_of_year: int) -> List[Path]:
+        directory = self._partition_dir(version, as_of_year)
+        if not directory.exists():
+            return []
+        return sorted(path for path in directory.iterdir() if _PART_PATTERN.match(path.name))
+
+    def register_schema(
+        self,
+        version: str,
+        feature_names: Sequence[str],
+        dtype: str = "float32"
+    ) -> FeatureSchema:
+        """Register a feature schema version (see ``FeatureSchemaRegistry.register``)."""
+        return self.registry.register(version, feature_names, dtype)
+
+    def get_schema(self, version: str) -> FeatureSchema:
+        return self.registry.get(version)
+
+    def ensure_schema(
+        self,
+        version: str,
+        rows: Mapping[int, Mapping[str, Any]]
+    ) -> FeatureSchema:
+        """
+        Get a schema version, registering it from ``rows`` if it does not exist.
+
+        New schemas use the sorted union of feature names, the same order the
+        training script derives from ``feature_vector`` keys.
+        """
+        schema = self.registry.get(version, required=False)
+        if schema is None:
+            names = sorted({name for features in rows.values() for name in features})
+            schema = self.registry.register(version, names)
+        return schema
+
+    def years(self, version: str) -> List[int]:
+        """List partitioned as_of_years for a schema version."""
+        directory = self.root / version
+        if not directory.exists():
+            return []
+        return sorted(
+            int(path.name.split("=", 1)[1])
+            for path in directory.glob("as_of_year=*")
+            if self._part_paths(version, int(path.name.split("=", 1)[1]))
+        )
+
+    def _build_table(self, schema: FeatureSchema, rows: Mapping[int, Mapping[str, Any]]):
+        """Convert prospect_id -> features rows into an Arrow table in schema order."""
+        prospect_ids = np.fromiter((int(pid) for pid in rows), dtype=np.int64, count=len(rows))
+        values = list(rows.values())
+
+        known = set(schema.feature_names)
+        unknown = {name for features in values for name in features if name not in known}
+        if unknown:
+            logger.warning(
+                f"Dropping {len(unknown)} features not in schema {schema.version}: "
+                f"{sorted(unknown)[:10]}"
+            )
+
+        matrix = np.full((len(values), len(schema.feature_names)), np.nan, dtype=schema.dtype)
+        for i, features in enumerate(values):
+            matrix[i] = align_features(features, schema.feature_names, fill_value=np.nan)
+
+        columns = [pa.array(prospect_ids)] + [
+            pa.array(matrix[:, j]) for j in range(matrix.shape[1])
+        ]
+        return pa.Table.from_arrays(columns, names=[PROSPECT_ID_COLUMN, *schema.feature_names])
+
+    def _write_part(self, version: str, as_of_year: int, table, index: int) -> Path:
+        directory = self._partition_dir(version, as_of_year)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        path = directory / f"part-{index:05d}.arrow"
+        tmp_path = directory / f".part-{index:05d}.arrow.tmp"
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa_ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+        return path
+
+    def append(
+        self,
+        version: str,
+        as_of_year: int,
+        rows: Mapping[int, Mapping[str, Any]]
+    ) -> Optional[Path]:
+        """
+        Append recomputed features as a new part file.
+
+        Rows for prospects already in the partition supersede the older rows.
+
+        Args:
+            version: Registered schema version
+            as_of_year: Partition year
+            rows: Mapping of prospect_id to feature dictionary
+
+        Returns:
+            Path of the written part, or None if there were no rows
+        """
+        if not rows:
+            return None
+
+        schema = self.registry.get(version)
+        table = self._build_table(schema, rows)
+
+        existing = self._part_paths(version, as_of_year)
+        index = int(_PART_PATTERN.match(existing[-1].name).group(1)) + 1 if existing else 0
+        path = self._write_part(version, as_of_year, table, index)
+
+        logger.info(f"Appended {len(rows)} feature rows to {version}/{as_of_year} ({path.name})")
+        return path
+
+    def write_partition(
+        self,
+        version: str,
+        as_of_year: int,
+        rows: Mapping[int, Mapping[str, Any]]
+    ) -> Path:
+        """Replace a partition with exactly ``rows``."""
+        schema = self.registry.get(version)
+        table = self._build_table(schema, rows)
+        return self._replace_parts(version, as_of_year, table)
+
+    def _replace_parts(self, version: str, as_of_year: int, table) -> Path:
+        old_parts = self._part_paths(version, as_of_year)
+        index = int(_PART_PATTERN.match(old_parts[-1].name).group(1)) + 1 if old_parts else 0
+
+        # Write the new part before removing the old ones so readers never see an empty partition
+        path = self._write_part(version, as_of_year, table, index)
+        for old in old_parts:
+            old.unlink()
+        self._partitions.pop((version, as_of_year), None)
+        return path
+
+    def compact(self, version: str, as_of_year: int) -> Optional[Path]:
+        """Fold all part files of a partition into one, keeping the latest rows."""
+        parts = self._part_paths(version, as_of_year)
+        if len(parts) <= 1:
+            return parts[0] if parts else None
+
+        partition = self.open(version, as_of_year)
+        tables = []
+        for part in np.unique(partition._parts):
+            rows = partition._rows[partition._parts == part]
+            tables.append(partition._tables[part].take(pa.array(rows)))
+        table = pa.concat_tables(tables).sort_by(PROSPECT_ID_COLUMN)
+
+        # Release the memory maps before removing the files they point at
+        del partition
+        self._partitions.pop((version, as_of_year), None)
+
+        path = self._replace_parts(version, as_of_year, table)
+        logger.info(f"Compacted {len(parts)} parts of {version}/{as_of_year} into {path.name}")
+        return path
+
+    def open(self, version: str, as_of_year: int) -> FeaturePartition:
+        """
+        Open a partition memory-mapped, reusing it while its files are unchanged.
+
+        Raises:
+            FeatureStoreError: If the partition has no data
+        """
+        parts = self._part_paths(version, as_of_year)
+        if not parts:
+            raise FeatureStoreError(f"No features stored for {version}/{as_of_year}")
+
+        signature = tuple((path.name, path.stat().st_mtime_ns) for path in parts)
+        cached = self._partitions.get((version, as_of_year))
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        partition = FeaturePartition(self.registry.get(version), as_of_year, parts)
+        self._partitions[(version, as_of_year)] = (signature, partition)
+        return partition
+
+    def read_matrix(
+        self,
+        version: str,
+        as_of_year: int,
+        feature_order: Optional[Sequence[str]] = None,
+        prospect_ids: Optional[Iterable[int]] = None,
+        fill_value: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Read an aligned feature matrix (see ``FeaturePartition.matrix``)."""
+        return self.open(version, as_of_year).matrix(feature_order, prospect_ids, fill_value)
+
+    def lookup(
+        self,
+        version: str,
+        as_of_year: int,
+        prospect_id: int
+    ) -> Optional[Dict[str, Optional[float]]]:
+        """Point lookup of one prospect's features."""
+        return self.open(version, as_of_year).lookup(prospect_id)
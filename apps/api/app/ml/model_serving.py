@@ -22,10 +22,26 @@ import joblib
 from ..core.cache_manager import CacheManager
 from ..core.config import settings
 from ..schemas.ml_predictions import ModelInfo, PredictionExplanation, FeatureImportance
+from .feature_store import align_features
 
 logger = logging.getLogger(__name__)
 
 
+# Feature order expected by the served model (must match the training pipeline)
+SERVING_FEATURE_NAMES = (
+    "age", "height", "weight", "draft_round", "years_since_draft", "eta_years_remaining",
+    "position_encoded", "level_encoded", "bats_left", "bats_right", "bats_switch",
+    "throws_left", "throws_right", "career_pa", "career_ab", "career_avg", "career_obp",
+    "career_hr_rate", "career_bb_rate", "career_k_rate", "career_sb_rate", "games_played",
+    "recent_avg", "recent_ops", "career_ip", "career_era", "career_whip", "career_k9",
+    "career_bb9", "games_pitched", "games_started", "recent_era", "recent_whip",
+    "grade_hit", "grade_power", "grade_run", "grade_arm", "grade_field", "grade_overall",
+    "grade_fastball", "grade_curveball", "grade_slider", "grade_changeup", "grade_control",
+    "grade_age_days", "bmi", "hr_per_pa", "bb_per_k", "hitting_tool_avg",
+    "defensive_tool_avg", "pitching_stuff_avg"
+)
+
+
 class ModelLoadError(Exception):
     """Exception raised when model loading fails."""
     pass
@@ -286,31 +302,8 @@ class ModelServer:
         expected by the trained model.
         """
         try:
-            # Define expected feature order (this should match training pipeline)
-            expected_features = [
-                "age", "height", "weight", "draft_round", "years_since_draft", "eta_years_remaining",
-                "position_encoded", "level_encoded", "bats_left", "bats_right", "bats_switch",
-                "throws_left", "throws_right", "career_pa", "career_ab", "career_avg", "career_obp",
-                "career_hr_rate", "career_bb_rate", "career_k_rate", "career_sb_rate", "games_played",
-                "recent_avg", "recent_ops", "career_ip", "career_era", "career_whip", "career_k9",
-                "career_bb9", "games_pitched", "games_started", "recent_era", "recent_whip",
-                "grade_hit", "grade_power", "grade_run", "grade_arm", "grade_field", "grade_overall",
-                "grade_fastball", "grade_curveball", "grade_slider", "grade_changeup", "grade_control",
-                "grade_age_days", "bmi", "hr_per_pa", "bb_per_k", "hitting_tool_avg",
-                "defensive_tool_avg", "pitching_stuff_avg"
-            ]
-
-            # Create feature array with defaults for missing features
-            feature_array = []
-            for feature_name in expected_features:
-                value = features.get(feature_name, 0.0)
-                # Handle any non-numeric values
-                try:
-                    feature_array.append(float(value))
-                except (ValueError, TypeError):
-                    feature_array.append(0.0)
-
-            return np.array(feature_array)
+            # Missing and non-numeric values default to 0.0
+            return align_features(features, SERVING_FEATURE_NAMES)
 
         except Exception as e:
             logger.error(f"Feature preparation failed: {e}")
@@ -336,22 +329,8 @@ class ModelServer:
             # Get SHAP values for positive class (success)
             shap_values_positive = shap_values[0][:, 1] if len(shap_values[0].shape) > 1 else shap_values[0]
 
-            # Get feature names (same order as preparation)
-            feature_names = [
-                "age", "height", "weight", "draft_round", "years_since_draft", "eta_years_remaining",
-                "position_encoded", "level_encoded", "bats_left", "bats_right", "bats_switch",
-                "throws_left", "throws_right", "career_pa", "career_ab", "career_avg", "career_obp",
-                "career_hr_rate", "career_bb_rate", "career_k_rate", "career_sb_rate", "games_played",
-                "recent_avg", "recent_ops", "career_ip", "career_era", "career_whip", "career_k9",
-                "career_bb9", "games_pitched", "games_started", "recent_era", "recent_whip",
-                "grade_hit", "grade_power", "grade_run", "grade_arm", "grade_field", "grade_overall",
-                "grade_fastball", "grade_curveball", "grade_slider", "grade_changeup", "grade_control",
-                "grade_age_days", "bmi", "hr_per_pa", "bb_per_k", "hitting_tool_avg",
-                "defensive_tool_avg", "pitching_stuff_avg"
-            ]
-
             # Get top 10 most important features
-            feature_importance_pairs = list(zip(feature_names, shap_values_positive, feature_array))
+            feature_importance_pairs = list(zip(SERVING_FEATURE_NAMES, shap_values_positive, feature_array))
             feature_importance_pairs.sort(key=lambda x: abs(x[1]), reverse=True)
 
             top_features = []
@@ -33,6 +33,7 @@ class NarrativeTemplateEngine:
             template_dir = str(current_dir / "templates" / "outlook")
 
         self.template_dir = template_dir
+        self._compiled: Dict[str, Template] = {}
         self._setup_environment()
 
     def _setup_environment(self):
@@ -140,6 +141,42 @@ class NarrativeTemplateEngine:
 
         return top_features
 
+    def _get_compiled(self, template_name: str) -> Template:
+        """
+        Return a compiled template, compiling it on first use.
+
+        Compiled templates are held for the life of the engine, so rendering
+        skips the loader's up-to-date check on every call.
+        """
+        template = self._compiled.get(template_name)
+        if template is None:
+            template = self.env.get_template(template_name)
+            self._compiled[template_name] = template
+        return template
+
+    def precompile(self) -> int:
+        """
+        Compile every available template ahead of rendering.
+
+        Templates that fail to compile are logged and skipped so one broken
+        file does not block the others.
+
+        Returns:
+            Number of compiled templates
+        """
+        for template_name in self.list_available_templates():
+            try:
+                self._get_compiled(template_name)
+            except TemplateError as e:
+                logger.warning(f"Failed to precompile template {template_name}: {e}")
+
+        logger.info(f"Precompiled {len(self._compiled)} narrative templates")
+        return len(self._compiled)
+
+    def clear_compiled(self):
+        """Drop compiled templates so edited files are picked up again."""
+        self._compiled.clear()
+
     def render_outlook(self, template_name: str, context: Dict[str, Any]) -> str:
         """
         Render prospect outlook using specified template and context.
@@ -155,7 +192,7 @@ class NarrativeTemplateEngine:
             TemplateError: If template rendering fails
         """
         try:
-            template = self.env.get_template(template_name)
+            template = self._get_compiled(template_name)
             return template.render(**context)
         except TemplateError as e:
             logger.error(f"Template rendering failed for {template_name}: {e}")
@@ -1,3 +1,4 @@
+import datetime as dt
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, validator, root_validator
@@ -127,7 +128,7 @@ class HittingStatsValidationSchema(BaseModel):
     woba: Optional[float] = Field(None, ge=0.0, le=1.0, description="wOBA")
     wrc_plus: Optional[int] = Field(None, ge=0, le=300, description="wRC+")
 
-    @root_validator
+    @root_validator(skip_on_failure=True)
     def validate_hitting_consistency(cls, values):
         """Validate statistical consistency for hitting stats."""
         at_bats = values.get('at_bats')
@@ -163,7 +164,7 @@ class PitchingStatsValidationSchema(BaseModel):
     strikeouts_per_nine: Optional[float] = Field(None, ge=0.0, le=20.0, description="K/9")
     walks_per_nine: Optional[float] = Field(None, ge=0.0, le=15.0, description="BB/9")
 
-    @root_validator
+    @root_validator(skip_on_failure=True)
     def validate_pitching_consistency(cls, values):
         """Validate statistical consistency for pitching stats."""
         innings = values.get('innings_pitched')
@@ -181,7 +182,8 @@ class PitchingStatsValidationSchema(BaseModel):
 
 class ProspectStatsValidationSchema(BaseModel):
     """Schema for complete prospect statistics validation."""
-    date: date = Field(..., description="Statistics date")
+    # Module-qualified so the field name does not shadow its own type
+    date: dt.date = Field(..., description="Statistics date")
     season: int = Field(..., ge=1900, le=2050, description="Season year")
 
     # Hitting stats
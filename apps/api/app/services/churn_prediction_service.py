@@ -6,13 +6,46 @@ Churn prediction service for identifying at-risk users.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, text
 
 logger = logging.getLogger(__name__)
 
+ENGAGEMENT_WINDOW_DAYS = 30
+
+
+def score_churn_risk(days_since_login, logins_last_30_days, features_used) -> np.ndarray:
+    """
+    Vectorized churn risk score (0-100, higher = more risk).
+
+    Accepts scalars or equal-length arrays.
+
+    @param days_since_login - Days since last login
+    @param logins_last_30_days - Login events in the engagement window
+    @param features_used - Distinct event names in the engagement window
+    @returns Churn risk scores
+    """
+    days = np.asarray(days_since_login, dtype=np.float64)
+    logins = np.asarray(logins_last_30_days, dtype=np.float64)
+    features = np.asarray(features_used, dtype=np.float64)
+
+    # Normalize each factor to 0-100 scale
+    login_recency_score = np.minimum(100, (days / 30) * 100)  # 30+ days = max risk
+    login_frequency_score = np.maximum(0, (1 - (logins / 30)) * 100)  # Less than 30 logins
+    feature_usage_score = np.maximum(0, (1 - (features / 10)) * 100)  # Less than 10 unique features
+
+    # Apply weights
+    score = (
+        (login_recency_score * 0.3) +
+        (login_frequency_score * 0.25) +
+        (feature_usage_score * 0.2)
+    )
+
+    return np.clip(score, 0, 100)
+
 
 class ChurnPredictionService:
     """
@@ -91,20 +124,7 @@ class ChurnPredictionService:
                 logins_last_30_days = metrics.login_frequency
                 features_used = int(metrics.feature_usage_score)
 
-            # Calculate weighted score
-            # Normalize each factor to 0-100 scale
-            login_recency_score = min(100, (days_since_login / 30) * 100)  # 30+ days = max risk
-            login_frequency_score = max(0, (1 - (logins_last_30_days / 30)) * 100)  # Less than 30 logins
-            feature_usage_score = max(0, (1 - (features_used / 10)) * 100)  # Less than 10 unique features
-
-            # Apply weights
-            score = (
-                (login_recency_score * 0.3) +
-                (login_frequency_score * 0.25) +
-                (feature_usage_score * 0.2)
-            )
-
-            churn_risk = min(100, max(0, score))
+            churn_risk = float(score_churn_risk(days_since_login, logins_last_30_days, features_used))
 
             logger.debug(f"User {user_id} churn risk: {churn_risk:.2f} (days: {days_since_login}, logins: {logins_last_30_days}, features: {features_used})")
             return churn_risk
@@ -241,3 +261,118 @@ class ChurnPredictionService:
         except Exception as e:
             await self.db.rollback()
             logger.error(f"Failed to update engagement metrics for user {user_id}: {str(e)}")
+
+    async def update_all_engagement_metrics(
+        self,
+        risk_threshold: int = 60,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Recompute engagement metrics and churn risk for every active user.
+
+        Set-based counterpart of update_engagement_metrics: two grouped
+        aggregates over analytics events, one vectorized scoring pass and a
+        single upsert, instead of several queries per user.
+
+        @param risk_threshold - Minimum risk score reported as at-risk
+        @param now - Reference time (defaults to utcnow)
+        @returns Summary with users_updated and at_risk_users (highest risk first)
+        """
+        from app.db.models import AnalyticsEvent, User
+
+        now = now or datetime.utcnow()
+        cutoff_date = now - timedelta(days=ENGAGEMENT_WINDOW_DAYS)
+
+        try:
+            stmt = select(User.id, User.email, User.full_name, User.updated_at).where(User.is_active == True)
+            users = (await self.db.execute(stmt)).all()
+
+            if not users:
+                return {"users_updated": 0, "at_risk_users": []}
+
+            # Most recent login per user
+            stmt = select(
+                AnalyticsEvent.user_id,
+                func.max(AnalyticsEvent.timestamp)
+            ).where(
+                and_(
+                    AnalyticsEvent.event_name == 'user_login',
+                    AnalyticsEvent.user_id.isnot(None)
+                )
+            ).group_by(AnalyticsEvent.user_id)
+            last_logins = dict((await self.db.execute(stmt)).all())
+
+            # Login count and unique features used in the engagement window
+            stmt = select(
+                AnalyticsEvent.user_id,
+                func.count(AnalyticsEvent.id).filter(AnalyticsEvent.event_name == 'user_login'),
+                func.count(func.distinct(AnalyticsEvent.event_name))
+            ).where(
+                and_(
+                    AnalyticsEvent.timestamp >= cutoff_date,
+                    AnalyticsEvent.user_id.isnot(None)
+                )
+            ).group_by(AnalyticsEvent.user_id)
+            window = {row[0]: (row[1], row[2]) for row in (await self.db.execute(stmt)).all()}
+
+            last_login = [last_logins.get(user.id) or user.updated_at for user in users]
+            stamps = np.array(last_login, dtype='datetime64[us]')
+            elapsed = (np.datetime64(now, 'us') - stamps) / np.timedelta64(1, 'D')
+            days_since_login = np.where(np.isnat(stamps), ENGAGEMENT_WINDOW_DAYS, np.floor(elapsed))
+
+            login_frequency = np.array([window.get(user.id, (0, 0))[0] for user in users], dtype=np.int64)
+            features_used = np.array([window.get(user.id, (0, 0))[1] for user in users], dtype=np.float64)
+            churn_risk_scores = score_churn_risk(days_since_login, login_frequency, features_used)
+
+            await self.db.execute(
+                text("""
+                    INSERT INTO user_engagement_metrics
+                        (user_id, last_login, login_frequency, feature_usage_score, churn_risk_score, updated_at)
+                    SELECT user_id, last_login, login_frequency, feature_usage_score, churn_risk_score, :updated_at
+                    FROM unnest(
+                        CAST(:user_ids AS integer[]),
+                        CAST(:last_logins AS timestamp[]),
+                        CAST(:login_frequency AS integer[]),
+                        CAST(:features_used AS double precision[]),
+                        CAST(:churn_risk_scores AS double precision[])
+                    ) AS t(user_id, last_login, login_frequency, feature_usage_score, churn_risk_score)
+                    ON CONFLICT (user_id) DO UPDATE SET
+                        last_login = EXCLUDED.last_login,
+                        login_frequency = EXCLUDED.login_frequency,
+                        feature_usage_score = EXCLUDED.feature_usage_score,
+                        churn_risk_score = EXCLUDED.churn_risk_score,
+                        updated_at = EXCLUDED.updated_at
+                """),
+                {
+                    "user_ids": [user.id for user in users],
+                    "last_logins": last_login,
+                    "login_frequency": login_frequency.tolist(),
+                    "features_used": features_used.tolist(),
+                    "churn_risk_scores": churn_risk_scores.tolist(),
+                    "updated_at": now
+                }
+            )
+            await self.db.commit()
+
+            at_risk_users = []
+            for index in np.argsort(-churn_risk_scores, kind='stable'):
+                if churn_risk_scores[index] < risk_threshold:
+                    break
+                user = users[index]
+                at_risk_users.append({
+                    "user_id": user.id,
+                    "email": user.email,
+                    "full_name": user.full_name,
+                    "churn_risk_score": float(churn_risk_scores[index])
+                })
+
+            logger.info(
+                f"Updated engagement metrics for {len(users)} users; "
+                f"{len(at_risk_users)} at risk (>= {risk_threshold})"
+            )
+            return {"users_updated": len(users), "at_risk_users": at_risk_users}
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to update engagement metrics in bulk: {str(e)}")
+            raise
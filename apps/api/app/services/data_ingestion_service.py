@@ -11,6 +11,7 @@ from sqlalchemy.orm import selectinload
 from app.db.models import Prospect, ProspectStats, User
 from app.services.mlb_api_service import MLBAPIClient, MLBStatsAPIError
 from app.core.config import settings
+from app.services.peer_cohort_service import peer_cohort_store
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +69,10 @@ class DataIngestionService:
             #             await session.close()
             #         break  # Only take first session from generator
 
+            # New stats invalidate the peer cohort distributions
+            if self.ingestion_stats["stats_records_added"]:
+                peer_cohort_store.mark_stale()
+
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
 
@@ -358,6 +363,7 @@ class DataIngestionService:
                         await self._process_prospect_stats(prospect.id, stats_data["stats"], session)
 
             await session.commit()
+            peer_cohort_store.mark_stale()
             logger.info(f"Successfully refreshed data for prospect {prospect_id}")
             return True
 
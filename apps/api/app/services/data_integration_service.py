@@ -12,6 +12,7 @@ from app.schemas.fangraphs_schemas import (
     FangraphsStatistics
 )
 from app.services.pipeline_monitoring import PipelineMonitor
+from app.services.reference_data import ORGANIZATION_ALIASES, standardize_organization
 
 logger = logging.getLogger(__name__)
 
@@ -48,49 +49,7 @@ class DataIntegrationService:
     }
 
     # Organization name mappings
-    ORGANIZATION_MAPPINGS = {
-        # AL East
-        'BAL': 'Baltimore Orioles', 'ORIOLES': 'Baltimore Orioles',
-        'BOS': 'Boston Red Sox', 'RED SOX': 'Boston Red Sox',
-        'NYY': 'New York Yankees', 'YANKEES': 'New York Yankees',
-        'TB': 'Tampa Bay Rays', 'TBR': 'Tampa Bay Rays', 'RAYS': 'Tampa Bay Rays',
-        'TOR': 'Toronto Blue Jays', 'BLUE JAYS': 'Toronto Blue Jays',
-
-        # AL Central
-        'CLE': 'Cleveland Guardians', 'GUARDIANS': 'Cleveland Guardians',
-        'CWS': 'Chicago White Sox', 'CHW': 'Chicago White Sox', 'WHITE SOX': 'Chicago White Sox',
-        'DET': 'Detroit Tigers', 'TIGERS': 'Detroit Tigers',
-        'KC': 'Kansas City Royals', 'KCR': 'Kansas City Royals', 'ROYALS': 'Kansas City Royals',
-        'MIN': 'Minnesota Twins', 'TWINS': 'Minnesota Twins',
-
-        # AL West
-        'HOU': 'Houston Astros', 'ASTROS': 'Houston Astros',
-        'LAA': 'Los Angeles Angels', 'ANGELS': 'Los Angeles Angels',
-        'OAK': 'Oakland Athletics', 'ATHLETICS': 'Oakland Athletics', 'A\'S': 'Oakland Athletics',
-        'SEA': 'Seattle Mariners', 'MARINERS': 'Seattle Mariners',
-        'TEX': 'Texas Rangers', 'RANGERS': 'Texas Rangers',
-
-        # NL East
-        'ATL': 'Atlanta Braves', 'BRAVES': 'Atlanta Braves',
-        'MIA': 'Miami Marlins', 'MARLINS': 'Miami Marlins',
-        'NYM': 'New York Mets', 'METS': 'New York Mets',
-        'PHI': 'Philadelphia Phillies', 'PHILLIES': 'Philadelphia Phillies',
-        'WAS': 'Washington Nationals', 'WSN': 'Washington Nationals', 'NATIONALS': 'Washington Nationals',
-
-        # NL Central
-        'CHC': 'Chicago Cubs', 'CUBS': 'Chicago Cubs',
-        'CIN': 'Cincinnati Reds', 'REDS': 'Cincinnati Reds',
-        'MIL': 'Milwaukee Brewers', 'BREWERS': 'Milwaukee Brewers',
-        'PIT': 'Pittsburgh Pirates', 'PIRATES': 'Pittsburgh Pirates',
-        'STL': 'St. Louis Cardinals', 'CARDINALS': 'St. Louis Cardinals',
-
-        # NL West
-        'ARI': 'Arizona Diamondbacks', 'AZ': 'Arizona Diamondbacks', 'DIAMONDBACKS': 'Arizona Diamondbacks',
-        'COL': 'Colorado Rockies', 'ROCKIES': 'Colorado Rockies',
-        'LAD': 'Los Angeles Dodgers', 'DODGERS': 'Los Angeles Dodgers',
-        'SD': 'San Diego Padres', 'PADRES': 'San Diego Padres',
-        'SF': 'San Francisco Giants', 'SFG': 'San Francisco Giants', 'GIANTS': 'San Francisco Giants',
-    }
+    ORGANIZATION_MAPPINGS = ORGANIZATION_ALIASES
 
     def __init__(self):
         self.monitor = PipelineMonitor()
@@ -105,11 +64,7 @@ class DataIntegrationService:
 
     def standardize_organization(self, org: str) -> str:
         """Standardize organization names to consistent format."""
-        if not org:
-            return "Unknown"
-
-        org_upper = org.upper().strip()
-        return self.ORGANIZATION_MAPPINGS.get(org_upper, org)
+        return standardize_organization(org)
 
     def normalize_name(self, name: str) -> str:
         """Normalize prospect name for matching."""
@@ -1,18 +1,51 @@
-"""Discovery service for sleeper prospects and organizational analysis."""
-
-from typing import List, Optional, Dict, Any
-from sqlalchemy import select, and_, func, desc, asc, case
+"""
+Discovery service for sleeper prospects and organizational analysis.
+
+All three analyses read one joined dataset: every prospect outer-joined to
+all of its ML predictions, loaded in a single query into pandas. Sleeper
+scores and consensus gaps are computed column-wise with NumPy instead of
+per prospect. The dataset and each result are cached in-process against a
+cheap data version (prediction/prospect counts and last update times), so
+they are rebuilt only when predictions or prospects change.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from datetime import datetime, timedelta
+from datetime import datetime
+import hashlib
 import logging
 import statistics
 
-from app.db.models import Prospect, ProspectStats, ScoutingGrades, MLPrediction
-from app.core.config import settings
+import numpy as np
+import pandas as pd
+
+from app.db.models import Prospect, MLPrediction
 
 logger = logging.getLogger(__name__)
 
+PREMIUM_GAP_POSITIONS = ['SS', 'CF', 'SP']
+DISCOUNT_POSITIONS = ['1B', 'DH', 'RP']
+PREMIUM_FACTOR_POSITIONS = ['SS', 'CF', 'C', 'SP']
+LOW_LEVELS = ['A', 'A-', 'Rookie']
+DEEP_ORGANIZATIONS = ['Rays', 'Dodgers', 'Yankees']
+
+PROSPECT_COLUMNS = ['prospect_id', 'position', 'organization', 'level', 'age', 'eta_year']
+PREDICTION_COLUMNS = ['prediction_type', 'prediction_value', 'confidence_score', 'model_version', 'created_at']
+
+# (factor text, boolean column on the scored frame), in display order
+UNDERVALUATION_FACTORS = [
+    ("High ML model confidence", "high_confidence"),
+    ("Young age with development upside", "young"),
+    ("Premium position value", "premium_position"),
+    ("Distant ETA may suppress current ranking", "distant_eta"),
+    ("Lower level may hide talent from casual observers", "low_level"),
+    ("Deep organizational system may overshadow prospect", "deep_organization"),
+    ("Multiple positive ML predictions", "multiple_predictions"),
+]
+
 
 class SleeperProspect:
     """Model for sleeper prospect data."""
@@ -36,6 +69,152 @@ class SleeperProspect:
         self.market_analysis = market_analysis
 
 
+@dataclass
+class DiscoveryDataset:
+    """Prospects and their predictions, loaded once per data version."""
+
+    prospects: pd.DataFrame  # one row per prospect, indexed by prospect_id
+    predictions: pd.DataFrame  # latest prediction per (prospect_id, prediction_type), newest first
+    max_confidence: pd.Series  # best confidence of any prediction, by prospect_id
+
+    @classmethod
+    def from_rows(cls, rows) -> "DiscoveryDataset":
+        """Build the dataset from rows of the joined prospect/prediction query."""
+        frame = pd.DataFrame.from_records(rows, columns=PROSPECT_COLUMNS + PREDICTION_COLUMNS)
+
+        prospects = frame.drop_duplicates('prospect_id')[PROSPECT_COLUMNS].set_index('prospect_id')
+        predictions = frame.loc[frame['prediction_type'].notna(), ['prospect_id'] + PREDICTION_COLUMNS]
+        predictions = predictions.astype({'prediction_value': float, 'confidence_score': float})
+
+        max_confidence = predictions.groupby('prospect_id')['confidence_score'].max()
+        latest = (
+            predictions
+            .sort_values(['prospect_id', 'created_at'], ascending=[True, False], kind='stable')
+            .drop_duplicates(['prospect_id', 'prediction_type'])
+            .reset_index(drop=True)
+        )
+        return cls(prospects=prospects, predictions=latest, max_confidence=max_confidence)
+
+
+def score_sleepers(
+    dataset: DiscoveryDataset,
+    confidence_threshold: float,
+    consensus_ranking_gap: int
+) -> pd.DataFrame:
+    """
+    Score every prospect with a prediction at or above the confidence threshold.
+
+    Args:
+        dataset: Discovery dataset
+        confidence_threshold: Minimum confidence of any one prediction
+        consensus_ranking_gap: Minimum simulated consensus gap to keep
+
+    Returns:
+        DataFrame indexed by prospect_id with sleeper_score, ml_confidence,
+        consensus_gap and one boolean column per undervaluation factor,
+        sorted by sleeper_score descending
+    """
+    confident = dataset.max_confidence
+    ids = confident.index[confident >= confidence_threshold]
+    if len(ids) == 0:
+        return pd.DataFrame(columns=['sleeper_score', 'ml_confidence', 'consensus_gap'])
+
+    latest = dataset.predictions[dataset.predictions['prospect_id'].isin(ids)]
+    by_prospect = latest.groupby('prospect_id')
+
+    # Overall confidence ignores missing/zero confidences, like the per-prospect mean did
+    confidence = (
+        latest['confidence_score'].where(latest['confidence_score'] > 0)
+        .groupby(latest['prospect_id']).mean()
+        .reindex(ids).fillna(0.0).to_numpy()
+    )
+    type_count = by_prospect.size().reindex(ids).fillna(0).to_numpy()
+
+    def latest_value(prediction_type: str) -> np.ndarray:
+        values = latest.loc[latest['prediction_type'] == prediction_type].set_index('prospect_id')['prediction_value']
+        return values.reindex(ids).to_numpy(dtype=float)
+
+    prospects = dataset.prospects.loc[ids]
+    position = prospects['position']
+    age = prospects['age'].to_numpy(dtype=float)
+    eta = prospects['eta_year'].to_numpy(dtype=float)
+
+    # Simulated consensus gap; NaN comparisons are False, so missing age/ETA are neutral
+    position_multiplier = np.select(
+        [position.isin(PREMIUM_GAP_POSITIONS), position.isin(DISCOUNT_POSITIONS)], [1.2, 0.8], 1.0
+    )
+    age_multiplier = np.select([age < 20, age > 24], [1.3, 0.7], 1.0)
+    eta_multiplier = np.where(eta > 2026, 1.1, 1.0)
+    gap = 30 * np.maximum(1.0, confidence * 2) * position_multiplier * age_multiplier * eta_multiplier
+    gap = np.clip(gap.astype(np.int64), 0, 200)
+
+    scored = pd.DataFrame({
+        'ml_confidence': confidence,
+        'consensus_gap': gap,
+        'high_confidence': confidence > 0.8,
+        'young': age < 20,
+        'premium_position': position.isin(PREMIUM_FACTOR_POSITIONS).to_numpy(),
+        'distant_eta': eta > 2026,
+        'low_level': prospects['level'].isin(LOW_LEVELS).to_numpy(),
+        'deep_organization': prospects['organization'].isin(DEEP_ORGANIZATIONS).to_numpy(),
+        'multiple_predictions': type_count >= 2,
+    }, index=ids)
+
+    factor_count = scored[[column for _, column in UNDERVALUATION_FACTORS]].sum(axis=1).to_numpy()
+    prediction_bonus = (
+        np.where(latest_value('success_rating') > 0.7, 10, 0)
+        + np.where(latest_value('career_war') > 2.0, 8, 0)
+    )
+    scored['sleeper_score'] = np.clip(
+        confidence * 40 + np.minimum(gap / 2, 30) + factor_count * 5 + prediction_bonus, 0, 100
+    )
+
+    scored = scored[scored['consensus_gap'] >= consensus_ranking_gap]
+    return scored.sort_values('sleeper_score', ascending=False, kind='stable')
+
+
+class DiscoveryCache:
+    """
+    In-process cache for the discovery dataset and analysis results.
+
+    Entries are valid for one data version; any change to predictions or
+    prospects moves the version and drops everything.
+    """
+
+    def __init__(self, max_results: int = 64):
+        self.max_results = max_results
+        self.version: Optional[Tuple] = None
+        self.dataset: Optional[DiscoveryDataset] = None
+        self.results: "OrderedDict[Tuple, Any]" = OrderedDict()
+
+    def _sync(self, version: Tuple) -> None:
+        if version != self.version:
+            self.version = version
+            self.dataset = None
+            self.results.clear()
+
+    def get(self, version: Tuple, key: Tuple) -> Optional[Any]:
+        self._sync(version)
+        if key in self.results:
+            self.results.move_to_end(key)
+            return self.results[key]
+        return None
+
+    def put(self, version: Tuple, key: Tuple, value: Any) -> None:
+        self._sync(version)
+        self.results[key] = value
+        if len(self.results) > self.max_results:
+            self.results.popitem(last=False)
+
+    def clear(self) -> None:
+        self.version = None
+        self.dataset = None
+        self.results.clear()
+
+
+discovery_cache = DiscoveryCache()
+
+
 class DiscoveryService:
     """Service for prospect discovery and organizational analysis."""
 
@@ -82,12 +261,10 @@ class DiscoveryService:
             Exception: For unexpected errors during ML analysis or score calculation
 
         Performance:
-            - Typical response time: 200-500ms for analyzing 100 prospects, returning 25
-            - Database queries: 3-4 optimized queries with ML prediction joins
-            - Memory usage: ~2-3MB for analysis of 25 sleeper prospects
-            - Scales linearly with number of prospects having ML predictions
-            - Consensus ranking simulation adds 50-100ms overhead
-            - Performance degrades if analyzing 1000+ prospects without proper indexing
+            - Database queries: 1 data-version query, 1 joined prospect/prediction
+              query when the data has changed, 1 primary-key query for the results
+            - Scores, gaps and factors are computed column-wise over all candidates
+            - Results are cached per parameter set until predictions or prospects change
 
         Note:
             Requires ML predictions to be available for meaningful analysis.
@@ -119,71 +296,41 @@ class DiscoveryService:
             3.4.0
         """
         try:
-            # Get prospects with high ML confidence but potentially low consensus ranking
-            prospects_with_predictions = await DiscoveryService._get_prospects_with_ml_predictions(
-                db, confidence_threshold
-            )
+            version = await DiscoveryService.data_version(db)
+            key = ("sleepers", confidence_threshold, consensus_ranking_gap, limit)
+            ranked = discovery_cache.get(version, key)
+
+            if ranked is None:
+                dataset = await DiscoveryService._load_dataset(db, version)
+                scored = score_sleepers(dataset, confidence_threshold, consensus_ranking_gap).head(limit)
+                ranked = [
+                    DiscoveryService._sleeper_fields(dataset, prospect_id, row)
+                    for prospect_id, row in scored.iterrows()
+                ]
+                discovery_cache.put(version, key, ranked)
+
+            if not ranked:
+                return []
 
-            sleeper_prospects = []
-
-            for prospect in prospects_with_predictions:
-                try:
-                    # Get ML predictions for this prospect
-                    ml_predictions = await DiscoveryService._get_ml_predictions(
-                        db, prospect.id
-                    )
-
-                    if not ml_predictions:
-                        continue
-
-                    # Calculate ML confidence and market analysis
-                    ml_analysis = await DiscoveryService._analyze_ml_predictions(
-                        ml_predictions
-                    )
-
-                    # Simulate consensus ranking gap (in real implementation, this would
-                    # come from external ranking sources or internal consensus models)
-                    simulated_consensus_gap = await DiscoveryService._calculate_consensus_gap(
-                        prospect, ml_analysis
-                    )
-
-                    if simulated_consensus_gap < consensus_ranking_gap:
-                        continue
-
-                    # Identify undervaluation factors
-                    undervaluation_factors = await DiscoveryService._identify_undervaluation_factors(
-                        prospect, ml_analysis
-                    )
-
-                    # Calculate sleeper score
-                    sleeper_score = await DiscoveryService._calculate_sleeper_score(
-                        ml_analysis, simulated_consensus_gap, undervaluation_factors
-                    )
-
-                    # Create market analysis
-                    market_analysis = await DiscoveryService._create_market_analysis(
-                        prospect, ml_analysis, simulated_consensus_gap
-                    )
-
-                    sleeper = SleeperProspect(
-                        prospect=prospect,
-                        sleeper_score=sleeper_score,
-                        ml_confidence=ml_analysis["overall_confidence"],
-                        consensus_ranking_gap=simulated_consensus_gap,
-                        undervaluation_factors=undervaluation_factors,
-                        ml_predictions=ml_analysis,
-                        market_analysis=market_analysis
-                    )
-
-                    sleeper_prospects.append(sleeper)
-
-                except Exception as e:
-                    logger.warning(f"Failed to analyze sleeper prospect {prospect.id}: {str(e)}")
-                    continue
-
-            # Sort by sleeper score and limit results
-            sleeper_prospects.sort(key=lambda x: x.sleeper_score, reverse=True)
-            return sleeper_prospects[:limit]
+            # Sessions differ per request, so only plain data is cached
+            result = await db.execute(
+                select(Prospect).where(Prospect.id.in_([fields["prospect_id"] for fields in ranked]))
+            )
+            prospects = {prospect.id: prospect for prospect in result.scalars().all()}
+
+            return [
+                SleeperProspect(
+                    prospect=prospects[fields["prospect_id"]],
+                    sleeper_score=fields["sleeper_score"],
+                    ml_confidence=fields["ml_confidence"],
+                    consensus_ranking_gap=fields["consensus_ranking_gap"],
+                    undervaluation_factors=list(fields["undervaluation_factors"]),
+                    ml_predictions=fields["ml_predictions"],
+                    market_analysis=fields["market_analysis"]
+                )
+                for fields in ranked
+                if fields["prospect_id"] in prospects
+            ]
 
         except Exception as e:
             logger.error(f"Sleeper prospect detection failed: {str(e)}")
@@ -208,9 +355,17 @@ class DiscoveryService:
             Dict containing organizational analysis insights
         """
         try:
+            version = await DiscoveryService.data_version(db)
+            key = ("organizational_insights", limit)
+            cached = discovery_cache.get(version, key)
+            if cached is not None:
+                return cached
+
+            dataset = await DiscoveryService._load_dataset(db, version)
+
             # Get organization pipeline data
-            org_analysis = await DiscoveryService._analyze_organizational_pipelines(
-                db, limit
+            org_analysis = DiscoveryService._analyze_organizational_pipelines(
+                dataset, limit
             )
 
             # Calculate competitive advantages
@@ -223,7 +378,7 @@ class DiscoveryService:
                 org_analysis
             )
 
-            return {
+            insights = {
                 "pipeline_rankings": org_analysis,
                 "competitive_advantages": competitive_analysis,
                 "opportunity_analysis": opportunity_analysis,
@@ -233,6 +388,8 @@ class DiscoveryService:
                     "depth_metrics": ["prospect_count", "avg_eta", "grade_distribution"]
                 }
             }
+            discovery_cache.put(version, key, insights)
+            return insights
 
         except Exception as e:
             logger.error(f"Organizational analysis failed: {str(e)}")
@@ -255,8 +412,16 @@ class DiscoveryService:
             Dict containing position scarcity analysis
         """
         try:
+            version = await DiscoveryService.data_version(db)
+            key = ("position_scarcity",)
+            cached = discovery_cache.get(version, key)
+            if cached is not None:
+                return cached
+
+            dataset = await DiscoveryService._load_dataset(db, version)
+
             # Analyze position supply
-            position_supply = await DiscoveryService._analyze_position_supply(db)
+            position_supply = DiscoveryService._analyze_position_supply(dataset)
 
             # Calculate scarcity scores
             scarcity_scores = await DiscoveryService._calculate_position_scarcity(
@@ -268,7 +433,7 @@ class DiscoveryService:
                 position_supply, scarcity_scores
             )
 
-            return {
+            analysis = {
                 "position_supply": position_supply,
                 "scarcity_scores": scarcity_scores,
                 "dynasty_opportunities": dynasty_opportunities,
@@ -278,232 +443,113 @@ class DiscoveryService:
                     "scarcity_factors": ["prospect_count", "eta_distribution", "grade_quality"]
                 }
             }
+            discovery_cache.put(version, key, analysis)
+            return analysis
 
         except Exception as e:
             logger.error(f"Position scarcity analysis failed: {str(e)}")
             raise
 
     @staticmethod
-    async def _get_prospects_with_ml_predictions(
-        db: AsyncSession,
-        confidence_threshold: float
-    ) -> List[Prospect]:
-        """Get prospects with ML predictions above confidence threshold."""
-        try:
-            query = select(Prospect).join(MLPrediction).where(
-                MLPrediction.confidence_score >= confidence_threshold
-            ).options(
-                selectinload(Prospect.stats),
-                selectinload(Prospect.scouting_grades)
-            ).distinct()
-
-            result = await db.execute(query)
-            return result.scalars().unique().all()
-
-        except Exception as e:
-            logger.error(f"Failed to get prospects with ML predictions: {str(e)}")
-            raise
-
-    @staticmethod
-    async def _get_ml_predictions(
-        db: AsyncSession,
-        prospect_id: int
-    ) -> List[MLPrediction]:
-        """Get ML predictions for a specific prospect."""
-        try:
-            query = select(MLPrediction).where(
-                MLPrediction.prospect_id == prospect_id
-            ).order_by(desc(MLPrediction.created_at))
+    async def data_version(db: AsyncSession) -> Tuple:
+        """
+        Cheap fingerprint of the prediction and prospect tables.
 
-            result = await db.execute(query)
-            return result.scalars().all()
+        Args:
+            db: Database session
 
-        except Exception as e:
-            logger.error(f"Failed to get ML predictions for prospect {prospect_id}: {str(e)}")
-            raise
+        Returns:
+            Tuple of row counts and latest update times; changes whenever
+            predictions or prospects are inserted, updated or deleted
+        """
+        query = select(
+            select(func.count(MLPrediction.id)).scalar_subquery(),
+            select(func.max(MLPrediction.updated_at)).scalar_subquery(),
+            select(func.count(Prospect.id)).scalar_subquery(),
+            select(func.max(Prospect.updated_at)).scalar_subquery()
+        )
+        result = await db.execute(query)
+        return tuple(result.one())
 
     @staticmethod
-    async def _analyze_ml_predictions(
-        predictions: List[MLPrediction]
-    ) -> Dict[str, Any]:
-        """Analyze ML predictions to extract confidence and value metrics."""
-        try:
-            if not predictions:
-                return {}
-
-            # Group predictions by type
-            prediction_by_type = {}
-            for pred in predictions:
-                if pred.prediction_type not in prediction_by_type:
-                    prediction_by_type[pred.prediction_type] = []
-                prediction_by_type[pred.prediction_type].append(pred)
-
-            # Calculate aggregated metrics
-            analysis = {
-                "overall_confidence": 0,
-                "prediction_types": list(prediction_by_type.keys()),
-                "predictions": {}
-            }
-
-            confidence_scores = []
-            for pred_type, preds in prediction_by_type.items():
-                if preds:
-                    latest_pred = max(preds, key=lambda p: p.created_at)
-                    analysis["predictions"][pred_type] = {
-                        "value": latest_pred.prediction_value,
-                        "confidence": latest_pred.confidence_score,
-                        "model_version": latest_pred.model_version,
-                        "created_at": latest_pred.created_at.isoformat()
-                    }
-                    if latest_pred.confidence_score:
-                        confidence_scores.append(latest_pred.confidence_score)
-
-            # Calculate overall confidence
-            if confidence_scores:
-                analysis["overall_confidence"] = statistics.mean(confidence_scores)
-
-            return analysis
-
-        except Exception as e:
-            logger.error(f"Failed to analyze ML predictions: {str(e)}")
-            return {}
+    def version_tag(version: Tuple) -> str:
+        """Short stable string for a data version, for use in cache keys."""
+        return hashlib.sha1(repr(version).encode()).hexdigest()[:12]
 
     @staticmethod
-    async def _calculate_consensus_gap(
-        prospect: Prospect,
-        ml_analysis: Dict[str, Any]
-    ) -> int:
-        """Calculate simulated consensus ranking gap."""
-        # This is a simplified simulation. In a real implementation,
-        # you'd integrate with external ranking sources or consensus models
+    async def _load_dataset(db: AsyncSession, version: Tuple) -> DiscoveryDataset:
+        """Load every prospect with all of its predictions in one query."""
+        if discovery_cache.dataset is not None and discovery_cache.version == version:
+            return discovery_cache.dataset
 
         try:
-            # Base gap on ML confidence and prospect attributes
-            base_gap = 30
-
-            # Adjust based on ML confidence
-            confidence = ml_analysis.get("overall_confidence", 0)
-            confidence_multiplier = max(1.0, confidence * 2)
-
-            # Adjust based on prospect attributes
-            position_multiplier = 1.0
-            if prospect.position in ['SS', 'CF', 'SP']:  # Premium positions
-                position_multiplier = 1.2
-            elif prospect.position in ['1B', 'DH', 'RP']:  # Less premium
-                position_multiplier = 0.8
-
-            # Age factor
-            age_multiplier = 1.0
-            if prospect.age and prospect.age < 20:
-                age_multiplier = 1.3  # Young prospects more likely to be undervalued
-            elif prospect.age and prospect.age > 24:
-                age_multiplier = 0.7
-
-            # ETA factor
-            eta_multiplier = 1.0
-            if prospect.eta_year and prospect.eta_year > 2026:
-                eta_multiplier = 1.1  # Further out prospects more likely undervalued
-
-            simulated_gap = int(
-                base_gap * confidence_multiplier * position_multiplier *
-                age_multiplier * eta_multiplier
+            query = select(
+                Prospect.id,
+                Prospect.position,
+                Prospect.organization,
+                Prospect.level,
+                Prospect.age,
+                Prospect.eta_year,
+                MLPrediction.prediction_type,
+                MLPrediction.prediction_value,
+                MLPrediction.confidence_score,
+                MLPrediction.model_version,
+                MLPrediction.created_at
+            ).outerjoin(
+                MLPrediction, MLPrediction.prospect_id == Prospect.id
             )
 
-            return max(0, min(simulated_gap, 200))  # Cap between 0 and 200
-
-        except Exception as e:
-            logger.error(f"Failed to calculate consensus gap: {str(e)}")
-            return 0
-
-    @staticmethod
-    async def _identify_undervaluation_factors(
-        prospect: Prospect,
-        ml_analysis: Dict[str, Any]
-    ) -> List[str]:
-        """Identify factors contributing to prospect undervaluation."""
-        factors = []
-
-        try:
-            # High ML confidence
-            if ml_analysis.get("overall_confidence", 0) > 0.8:
-                factors.append("High ML model confidence")
-
-            # Young age
-            if prospect.age and prospect.age < 20:
-                factors.append("Young age with development upside")
-
-            # Premium position
-            if prospect.position in ['SS', 'CF', 'C', 'SP']:
-                factors.append("Premium position value")
-
-            # Distant ETA
-            if prospect.eta_year and prospect.eta_year > 2026:
-                factors.append("Distant ETA may suppress current ranking")
-
-            # Lower level
-            if prospect.level and prospect.level in ['A', 'A-', 'Rookie']:
-                factors.append("Lower level may hide talent from casual observers")
-
-            # Organization depth
-            if prospect.organization in ['Rays', 'Dodgers', 'Yankees']:
-                factors.append("Deep organizational system may overshadow prospect")
-
-            # Multiple prediction types
-            if len(ml_analysis.get("prediction_types", [])) >= 2:
-                factors.append("Multiple positive ML predictions")
-
-            return factors
+            result = await db.execute(query)
+            dataset = DiscoveryDataset.from_rows(result.all())
 
         except Exception as e:
-            logger.error(f"Failed to identify undervaluation factors: {str(e)}")
-            return []
-
-    @staticmethod
-    async def _calculate_sleeper_score(
-        ml_analysis: Dict[str, Any],
-        consensus_gap: int,
-        undervaluation_factors: List[str]
-    ) -> float:
-        """Calculate overall sleeper score."""
-        try:
-            # Base score from ML confidence
-            confidence_score = ml_analysis.get("overall_confidence", 0) * 40
-
-            # Gap bonus
-            gap_score = min(consensus_gap / 2, 30)  # Max 30 points from gap
-
-            # Undervaluation factors bonus
-            factor_score = len(undervaluation_factors) * 5  # 5 points per factor
-
-            # ML prediction quality bonus
-            prediction_bonus = 0
-            predictions = ml_analysis.get("predictions", {})
-            for pred_type, pred_data in predictions.items():
-                if pred_type == "success_rating" and pred_data.get("value", 0) > 0.7:
-                    prediction_bonus += 10
-                elif pred_type == "career_war" and pred_data.get("value", 0) > 2.0:
-                    prediction_bonus += 8
-
-            total_score = confidence_score + gap_score + factor_score + prediction_bonus
-            return min(max(total_score, 0), 100)  # Scale to 0-100
+            logger.error(f"Failed to load discovery dataset: {str(e)}")
+            raise
 
-        except Exception as e:
-            logger.error(f"Failed to calculate sleeper score: {str(e)}")
-            return 0.0
+        logger.info(
+            f"Loaded discovery dataset: {len(dataset.prospects)} prospects, "
+            f"{len(dataset.predictions)} latest predictions"
+        )
+        discovery_cache.version = version
+        discovery_cache.dataset = dataset
+        return dataset
 
     @staticmethod
-    async def _create_market_analysis(
-        prospect: Prospect,
-        ml_analysis: Dict[str, Any],
-        consensus_gap: int
+    def _sleeper_fields(
+        dataset: DiscoveryDataset,
+        prospect_id: int,
+        row: pd.Series
     ) -> Dict[str, Any]:
-        """Create market perception analysis."""
-        try:
-            return {
-                "ml_vs_consensus_gap": consensus_gap,
-                "ml_confidence_level": ml_analysis.get("overall_confidence", 0),
-                "market_inefficiency_score": min(consensus_gap / 100, 1.0),
-                "opportunity_window": "6-12 months" if consensus_gap > 75 else "3-6 months",
+        """Plain-data sleeper result for one scored prospect."""
+        gap = int(row["consensus_gap"])
+        confidence = float(row["ml_confidence"])
+        latest = dataset.predictions[dataset.predictions["prospect_id"] == prospect_id]
+
+        predictions = {}
+        for prediction in latest.itertuples(index=False):
+            predictions[prediction.prediction_type] = {
+                "value": float(prediction.prediction_value),
+                "confidence": None if pd.isna(prediction.confidence_score) else float(prediction.confidence_score),
+                "model_version": prediction.model_version,
+                "created_at": pd.Timestamp(prediction.created_at).isoformat()
+            }
+
+        return {
+            "prospect_id": int(prospect_id),
+            "sleeper_score": float(row["sleeper_score"]),
+            "ml_confidence": confidence,
+            "consensus_ranking_gap": gap,
+            "undervaluation_factors": [text for text, column in UNDERVALUATION_FACTORS if row[column]],
+            "ml_predictions": {
+                "overall_confidence": confidence,
+                "prediction_types": list(predictions.keys()),
+                "predictions": predictions
+            },
+            "market_analysis": {
+                "ml_vs_consensus_gap": gap,
+                "ml_confidence_level": confidence,
+                "market_inefficiency_score": min(gap / 100, 1.0),
+                "opportunity_window": "6-12 months" if gap > 75 else "3-6 months",
                 "risk_factors": [
                     "ML model accuracy limitations",
                     "Prospect development uncertainty",
@@ -515,43 +561,37 @@ class DiscoveryService:
                     "Position scarcity"
                 ]
             }
+        }
 
-        except Exception as e:
-            logger.error(f"Failed to create market analysis: {str(e)}")
-            return {}
+    @staticmethod
+    def _group_summary(prospects: pd.DataFrame, column: str) -> pd.DataFrame:
+        """Prospect count, mean age and mean ETA per value of ``column``."""
+        return prospects.groupby(column, dropna=False).agg(
+            prospect_count=("age", "size"),
+            avg_age=("age", "mean"),
+            avg_eta=("eta_year", "mean")
+        ).sort_values("prospect_count", ascending=False, kind="stable")
 
     @staticmethod
-    async def _analyze_organizational_pipelines(
-        db: AsyncSession,
+    def _analyze_organizational_pipelines(
+        dataset: DiscoveryDataset,
         limit: int
     ) -> List[Dict[str, Any]]:
         """Analyze organizational pipeline depth and quality."""
         try:
             # This is a simplified analysis - in production you'd want more sophisticated metrics
-            query = select(
-                Prospect.organization,
-                func.count(Prospect.id).label("prospect_count"),
-                func.avg(Prospect.age).label("avg_age"),
-                func.avg(Prospect.eta_year).label("avg_eta")
-            ).where(
-                Prospect.organization.isnot(None)
-            ).group_by(
-                Prospect.organization
-            ).order_by(
-                desc("prospect_count")
-            ).limit(limit)
-
-            result = await db.execute(query)
-            org_data = result.all()
+            prospects = dataset.prospects[dataset.prospects["organization"].notna()]
+            org_data = DiscoveryService._group_summary(prospects, "organization").head(limit)
 
             pipeline_analysis = []
-            for row in org_data:
+            for organization, row in org_data.iterrows():
+                prospect_count = int(row.prospect_count)
                 pipeline_analysis.append({
-                    "organization": row.organization,
-                    "prospect_count": row.prospect_count,
-                    "avg_age": float(row.avg_age) if row.avg_age else None,
-                    "avg_eta": float(row.avg_eta) if row.avg_eta else None,
-                    "depth_score": min(row.prospect_count * 2, 100)  # Simplified scoring
+                    "organization": organization,
+                    "prospect_count": prospect_count,
+                    "avg_age": _optional_float(row.avg_age),
+                    "avg_eta": _optional_float(row.avg_eta),
+                    "depth_score": min(prospect_count * 2, 100)  # Simplified scoring
                 })
 
             return pipeline_analysis
@@ -617,31 +657,19 @@ class DiscoveryService:
         return opportunities
 
     @staticmethod
-    async def _analyze_position_supply(
-        db: AsyncSession
+    def _analyze_position_supply(
+        dataset: DiscoveryDataset
     ) -> Dict[str, Any]:
         """Analyze prospect supply by position."""
         try:
-            query = select(
-                Prospect.position,
-                func.count(Prospect.id).label("prospect_count"),
-                func.avg(Prospect.age).label("avg_age"),
-                func.avg(Prospect.eta_year).label("avg_eta")
-            ).group_by(
-                Prospect.position
-            ).order_by(
-                desc("prospect_count")
-            )
-
-            result = await db.execute(query)
-            position_data = result.all()
+            position_data = DiscoveryService._group_summary(dataset.prospects, "position")
 
             supply_analysis = {}
-            for row in position_data:
-                supply_analysis[row.position] = {
-                    "prospect_count": row.prospect_count,
-                    "avg_age": float(row.avg_age) if row.avg_age else None,
-                    "avg_eta": float(row.avg_eta) if row.avg_eta else None
+            for position, row in position_data.iterrows():
+                supply_analysis[None if pd.isna(position) else position] = {
+                    "prospect_count": int(row.prospect_count),
+                    "avg_age": _optional_float(row.avg_age),
+                    "avg_eta": _optional_float(row.avg_eta)
                 }
 
             return supply_analysis
@@ -702,4 +730,9 @@ class DiscoveryService:
                 f"Target {pos} prospects due to high scarcity score ({score:.1f})"
                 for pos, score in high_scarcity.items()
             ]
-        }
\ No newline at end of file
+        }
+
+
+def _optional_float(value) -> Optional[float]:
+    """Mean as a float, or None when missing (or zero, as before)."""
+    return float(value) if pd.notna(value) and value else None
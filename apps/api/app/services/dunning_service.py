@@ -14,6 +14,7 @@ from sqlalchemy.orm import joinedload
 
 from app.db.models import User, Subscription, SubscriptionEvent, Invoice
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
 
 # Initialize Stripe
 stripe.api_key = settings.STRIPE_SECRET_KEY
@@ -277,6 +278,8 @@ class DunningService:
             db.add(event)
 
             await db.commit()
+            if user:
+                await principal_cache.invalidate(user_id=user.id)
 
             return {
                 "restricted": True,
@@ -341,6 +344,7 @@ class DunningService:
                 )
 
             await db.commit()
+            await principal_cache.invalidate(user_id=subscription.user_id)
 
         except stripe.error.StripeError as e:
             print(f"Error canceling unpaid subscription: {str(e)}")
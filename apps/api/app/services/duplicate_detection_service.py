@@ -11,6 +11,7 @@ from sqlalchemy.orm import selectinload
 
 from app.db.models import Prospect, ProspectStats
 from app.schemas.prospect_schemas import ValidationResult
+from app.services.reference_data import level_rank
 
 logger = logging.getLogger(__name__)
 
@@ -401,9 +402,8 @@ class DuplicateDetectionService:
 
         elif merge_rule == "prefer_higher":
             # For levels like A, AA, AAA
-            level_order = {"Rookie": 0, "A-": 1, "A": 2, "A+": 3, "AA": 4, "AAA": 5, "MLB": 6}
-            primary_rank = level_order.get(primary_value, -1)
-            duplicate_rank = level_order.get(duplicate_value, -1)
+            primary_rank = level_rank(primary_value)
+            duplicate_rank = level_rank(duplicate_value)
 
             if duplicate_rank > primary_rank:
                 return duplicate_value
@@ -0,0 +1,373 @@
+"""
+Batched, rate-limit-aware email delivery.
+
+Providers accept a list of messages per request (Resend's batch endpoint
+takes up to 100). BatchEmailSender keeps a bounded number of batch
+requests in flight and pauses every sender when the provider reports its
+rate limit is exhausted, instead of sleeping a fixed interval per email.
+
+Every batch carries an Idempotency-Key derived from the run, the batch's
+position and its user IDs, and retries reuse it. When a batch was accepted
+but the response was lost, the provider drops the retry instead of
+sending the digest twice.
+
+@module email_delivery
+@since 1.0.0
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RESEND_BATCH_URL = "https://api.resend.com/emails/batch"
+RESEND_MAX_BATCH_SIZE = 100
+DIGEST_FROM_ADDRESS = "A Fine Wine Dynasty <digest@afinewinedynasty.com>"
+MAX_THROTTLES_PER_BATCH = 20
+
+
+@dataclass
+class EmailMessage:
+    """A rendered email addressed to one user."""
+
+    user_id: int
+    to_email: str
+    subject: str
+    html: str
+
+    def to_payload(self) -> Dict[str, object]:
+        return {
+            "from": DIGEST_FROM_ADDRESS,
+            "to": [self.to_email],
+            "subject": self.subject,
+            "html": self.html,
+        }
+
+
+@dataclass
+class BatchResponse:
+    """Provider response to one batch request; header names are lowercased."""
+
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+@dataclass
+class DeliveryReport:
+    """Outcome of a delivery run."""
+
+    sent_user_ids: List[int] = field(default_factory=list)
+    failed_user_ids: List[int] = field(default_factory=list)
+    requests: int = 0
+    throttled: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def emails_per_second(self) -> float:
+        return len(self.sent_user_ids) / self.elapsed if self.elapsed else 0.0
+
+
+class ResendBatchProvider:
+    """
+    Sends message batches through Resend's batch endpoint.
+
+    @class ResendBatchProvider
+    @since 1.0.0
+    """
+
+    def __init__(self, api_key: str, url: str = RESEND_BATCH_URL, timeout: float = 30.0):
+        """
+        Initialize provider.
+
+        @param api_key - Resend API key
+        @param url - Batch endpoint URL
+        @param timeout - Per-request timeout in seconds
+        """
+        self.url = url
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            headers={"Authorization": f"Bearer {api_key}"}
+        )
+
+    async def send_batch(
+        self,
+        messages: List[EmailMessage],
+        idempotency_key: Optional[str] = None
+    ) -> BatchResponse:
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        response = await self.client.post(
+            self.url, json=[message.to_payload() for message in messages], headers=headers
+        )
+        if response.status_code >= 400:
+            logger.warning(f"Resend batch rejected ({response.status_code}): {response.text[:200]}")
+        return BatchResponse(
+            response.status_code,
+            {key.lower(): value for key, value in response.headers.items()}
+        )
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+class StubEmailProvider:
+    """
+    Local stand-in for dry runs and throughput benchmarks.
+
+    Simulates request latency and a requests-per-window limit, answering
+    with the same rate-limit headers Resend sends, and accepts a repeated
+    idempotency key without delivering again. Nothing leaves the process.
+
+    @class StubEmailProvider
+    @since 1.0.0
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        requests_per_window: int = 10,
+        window: float = 1.0,
+        max_batch_size: int = RESEND_MAX_BATCH_SIZE
+    ):
+        """
+        Initialize stub provider.
+
+        @param latency - Simulated seconds per request
+        @param requests_per_window - Requests accepted per window before 429s
+        @param window - Rate-limit window in seconds
+        @param max_batch_size - Largest batch accepted (larger gets a 422)
+        """
+        self.latency = latency
+        self.requests_per_window = requests_per_window
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.requests = 0
+        self.rejected = 0
+        self.delivered: List[EmailMessage] = []
+        self._accepted_at: Deque[float] = deque()
+        self._idempotency_keys: Set[str] = set()
+
+    async def send_batch(
+        self,
+        messages: List[EmailMessage],
+        idempotency_key: Optional[str] = None
+    ) -> BatchResponse:
+        self.requests += 1
+        now = time.monotonic()
+        while self._accepted_at and now - self._accepted_at[0] >= self.window:
+            self._accepted_at.popleft()
+
+        if len(self._accepted_at) >= self.requests_per_window:
+            self.rejected += 1
+            retry_after = self.window - (now - self._accepted_at[0])
+            return BatchResponse(429, {"retry-after": f"{retry_after:.3f}"})
+
+        if len(messages) > self.max_batch_size:
+            return BatchResponse(422)
+
+        self._accepted_at.append(now)
+        await asyncio.sleep(self.latency)
+        if idempotency_key is None or idempotency_key not in self._idempotency_keys:
+            self.delivered.extend(messages)
+        if idempotency_key is not None:
+            self._idempotency_keys.add(idempotency_key)
+
+        remaining = self.requests_per_window - len(self._accepted_at)
+        reset = self.window - (time.monotonic() - self._accepted_at[0])
+        return BatchResponse(200, {
+            "ratelimit-limit": str(self.requests_per_window),
+            "ratelimit-remaining": str(max(remaining, 0)),
+            "ratelimit-reset": f"{max(reset, 0.0):.3f}",
+        })
+
+    async def close(self) -> None:
+        return None
+
+
+class BatchEmailSender:
+    """
+    Delivers message batches with bounded concurrency.
+
+    All workers share one pause deadline: a 429 ``Retry-After`` or an
+    exhausted ``RateLimit-Remaining`` holds every worker until the
+    provider's window resets.
+
+    @class BatchEmailSender
+    @since 1.0.0
+    """
+
+    def __init__(self, provider, concurrency: int = 4, max_attempts: int = 3):
+        """
+        Initialize sender.
+
+        @param provider - Object with async send_batch(messages, idempotency_key) -> BatchResponse
+        @param concurrency - Batch requests in flight at once
+        @param max_attempts - Attempts per batch before its users are marked failed
+        """
+        self.provider = provider
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max_attempts
+        self._resume_at = 0.0
+        # Requests left in the provider's current window, None until it says
+        self._remaining: Optional[int] = None
+        self._reset_at = 0.0
+
+    def _pause(self, seconds: float) -> None:
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    async def _acquire(self) -> None:
+        """Wait until a request fits the provider's window, then reserve it."""
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            if self._remaining is None:
+                return
+            if self._remaining > 0:
+                self._remaining -= 1
+                return
+            delay = self._reset_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                self._remaining = None
+
+    def _observe(self, response: BatchResponse, report: DeliveryReport) -> None:
+        """Update the shared pause and window budget from rate-limit headers."""
+        headers = response.headers
+        if response.status == 429:
+            report.throttled += 1
+            self._remaining = 0
+            self._pause(_header_seconds(headers.get("retry-after"), default=1.0))
+            return
+
+        remaining = headers.get("ratelimit-remaining")
+        if remaining is not None and remaining.isdigit():
+            self._remaining = int(remaining)
+            self._reset_at = time.monotonic() + _header_seconds(headers.get("ratelimit-reset"), default=1.0)
+
+    @staticmethod
+    def _idempotency_key(run_id: str, index: int, user_ids: List[int]) -> str:
+        """Stable key for one batch of one run, shared by all its attempts."""
+        digest = hashlib.sha256(
+            f"{run_id}:{index}:{','.join(map(str, user_ids))}".encode()
+        )
+        return digest.hexdigest()
+
+    async def _send_batch(
+        self,
+        batch: List[EmailMessage],
+        report: DeliveryReport,
+        on_sent: Optional[Callable[[List[int]], Awaitable[None]]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> None:
+        user_ids = [message.user_id for message in batch]
+        attempts = 0
+        throttles = 0
+
+        # 429s wait out the window without using up an attempt
+        while attempts < self.max_attempts and throttles < MAX_THROTTLES_PER_BATCH:
+            await self._acquire()
+
+            report.requests += 1
+            try:
+                response = await self.provider.send_batch(batch, idempotency_key=idempotency_key)
+            except (httpx.HTTPError, OSError) as e:
+                attempts += 1
+                logger.warning(f"Batch of {len(batch)} failed on attempt {attempts}: {str(e)}")
+                await asyncio.sleep(min(2 ** attempts, 30))
+                continue
+
+            self._observe(response, report)
+            if response.ok:
+                report.sent_user_ids.extend(user_ids)
+                if on_sent is not None:
+                    try:
+                        await on_sent(user_ids)
+                    except Exception as e:
+                        # The emails went out; never report them as failed
+                        logger.error(f"on_sent callback failed for batch of {len(batch)}: {str(e)}")
+                return
+            if response.status == 429:
+                throttles += 1
+                continue
+            if response.status < 500:
+                # Client errors will not succeed on retry
+                break
+            attempts += 1
+            await asyncio.sleep(min(2 ** attempts, 30))
+
+        logger.error(f"Giving up on batch of {len(batch)} emails")
+        report.failed_user_ids.extend(user_ids)
+
+    async def deliver(
+        self,
+        batches: AsyncIterator[List[EmailMessage]],
+        on_sent: Optional[Callable[[List[int]], Awaitable[None]]] = None
+    ) -> DeliveryReport:
+        """
+        Send every batch produced by ``batches``.
+
+        The producer is consumed through a bounded queue, so rendering runs
+        ahead of sending by at most a few batches.
+
+        @param batches - Async iterator of message batches
+        @param on_sent - Awaited with the user IDs of each batch the provider accepts
+        @returns DeliveryReport for the run
+        """
+        report = DeliveryReport()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        start = time.monotonic()
+        run_id = uuid.uuid4().hex
+
+        async def worker():
+            while True:
+                item = await queue.get()
+                batch = None
+                try:
+                    if item is None:
+                        return
+                    index, batch = item
+                    key = self._idempotency_key(run_id, index, [message.user_id for message in batch])
+                    await self._send_batch(batch, report, on_sent, key)
+                except Exception as e:
+                    logger.error(f"Unexpected error sending batch: {str(e)}")
+                    report.failed_user_ids.extend(message.user_id for message in batch or [])
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            index = 0
+            async for batch in batches:
+                if batch:
+                    await queue.put((index, batch))
+                    index += 1
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        report.elapsed = time.monotonic() - start
+        return report
+
+
+def _header_seconds(value: Optional[str], default: float) -> float:
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return default
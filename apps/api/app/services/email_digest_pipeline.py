@@ -0,0 +1,200 @@
+"""
+Three-stage pipeline for sending a whole digest run.
+
+1. Prefetch: every eligible recipient and their preferences in one query,
+   plus the sections shared by all recipients, computed once.
+2. Render: template contexts are rendered in batches on a process pool,
+   a few batches ahead of the sender.
+3. Send: BatchEmailSender posts batches with bounded concurrency and
+   honors the provider's rate-limit headers.
+
+Delivered users get last_sent updated with one statement per accepted
+provider batch, so a run that dies midway does not email them again.
+Dry runs use StubEmailProvider and leave last_sent untouched.
+
+@module email_digest_pipeline
+@since 1.0.0
+"""
+
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.services.email_delivery import (
+    BatchEmailSender,
+    DeliveryReport,
+    EmailMessage,
+    RESEND_MAX_BATCH_SIZE,
+    ResendBatchProvider,
+    StubEmailProvider,
+)
+from app.services.email_digest_service import EmailDigestService, render_digest_batch
+
+logger = logging.getLogger(__name__)
+
+
+class DigestPipeline:
+    """
+    Prefetch, render and send digests for every eligible user.
+
+    @class DigestPipeline
+    @since 1.0.0
+    """
+
+    def __init__(
+        self,
+        db: Optional[AsyncSession],
+        provider=None,
+        dry_run: Optional[bool] = None,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        render_workers: Optional[int] = None
+    ):
+        """
+        Initialize digest pipeline.
+
+        @param db - Database session (only needed for run())
+        @param provider - Email provider; defaults to Resend, or the stub for dry runs
+        @param dry_run - Send to the local stub provider (defaults to settings)
+        @param batch_size - Emails per provider request (defaults to settings)
+        @param concurrency - Provider requests in flight (defaults to settings)
+        @param render_workers - Render processes; 0 renders on the event loop
+        """
+        self.service = EmailDigestService(db)
+        self.dry_run = settings.EMAIL_DIGEST_DRY_RUN if dry_run is None else dry_run
+        self.batch_size = min(batch_size or settings.EMAIL_DIGEST_BATCH_SIZE, RESEND_MAX_BATCH_SIZE)
+        self.concurrency = concurrency or settings.EMAIL_DIGEST_CONCURRENCY
+        self.render_workers = (
+            settings.EMAIL_DIGEST_RENDER_WORKERS if render_workers is None else render_workers
+        )
+        self.provider = provider or self._default_provider()
+
+    def _default_provider(self):
+        if self.dry_run:
+            return StubEmailProvider()
+        if not self.service.resend_api_key:
+            logger.warning("Resend API key not configured - using stub provider (dev mode)")
+            return StubEmailProvider(latency=0.0, requests_per_window=1000)
+        return ResendBatchProvider(self.service.resend_api_key)
+
+    async def run(self, frequency: str = "weekly") -> DeliveryReport:
+        """
+        Send the digest to every user due one at this frequency.
+
+        @param frequency - Digest frequency (daily, weekly, monthly)
+        @returns DeliveryReport with sent and failed user IDs
+
+        @performance
+        - Database queries: 1 recipient query + 1 last_sent update per accepted batch
+        - Provider requests: ceil(recipients / batch_size), plus retries
+
+        @since 1.0.0
+        """
+        recipients = await self.service.get_digest_recipients(frequency)
+
+        if self.dry_run:
+            report = await self.deliver(recipients)
+            logger.info(f"Dry run: {len(report.sent_user_ids)} digests accepted by stub provider")
+            return report
+
+        # Batches are accepted concurrently but share one session
+        lock = asyncio.Lock()
+        unmarked: List[int] = []
+
+        async def mark_batch_sent(user_ids: List[int]):
+            async with lock:
+                try:
+                    await self.service.mark_sent(user_ids)
+                except Exception as e:
+                    logger.error(f"Failed to set last_sent for {len(user_ids)} users, retrying at end: {str(e)}")
+                    await self.service.db.rollback()
+                    unmarked.extend(user_ids)
+
+        report = await self.deliver(recipients, on_sent=mark_batch_sent)
+        if unmarked:
+            await self.service.mark_sent(unmarked)
+
+        return report
+
+    async def deliver(
+        self,
+        recipients: List[Dict[str, Any]],
+        on_sent: Optional[Callable[[List[int]], Awaitable[None]]] = None
+    ) -> DeliveryReport:
+        """
+        Render and send digests to prefetched recipients.
+
+        @param recipients - Recipient dicts from get_digest_recipients
+        @param on_sent - Awaited with the user IDs of each accepted batch
+        @returns DeliveryReport for the run
+        """
+        shared = await self.service.get_shared_sections()
+        subject = self.service.digest_subject()
+        sender = BatchEmailSender(self.provider, concurrency=self.concurrency)
+
+        executor = ProcessPoolExecutor(self.render_workers) if self.render_workers > 0 else None
+        try:
+            report = await sender.deliver(
+                self._render_batches(recipients, shared, subject, executor), on_sent=on_sent
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            await self.provider.close()
+
+        logger.info(
+            f"Delivered {len(report.sent_user_ids)} digests ({len(report.failed_user_ids)} failed) "
+            f"in {report.elapsed:.2f}s: {report.emails_per_second:.1f} emails/s, "
+            f"{report.requests} requests, {report.throttled} throttled"
+        )
+        return report
+
+    async def _render_batches(
+        self,
+        recipients: List[Dict[str, Any]],
+        shared: Dict[str, Any],
+        subject: str,
+        executor: Optional[Executor]
+    ) -> AsyncIterator[List[EmailMessage]]:
+        """Yield rendered message batches in recipient order."""
+        loop = asyncio.get_running_loop()
+        pending: Deque = deque()
+        lookahead = max(1, self.render_workers) * 2
+
+        async def submit(chunk: List[Dict[str, Any]]):
+            contexts = [
+                self.service.build_template_context(await self.service.build_digest_content(recipient, shared))
+                for recipient in chunk
+            ]
+            if executor is None:
+                future = loop.create_future()
+                future.set_result(render_digest_batch(contexts))
+            else:
+                future = loop.run_in_executor(executor, render_digest_batch, contexts)
+            pending.append((chunk, future))
+
+        for start in range(0, len(recipients), self.batch_size):
+            await submit(recipients[start:start + self.batch_size])
+            if len(pending) >= lookahead:
+                yield await self._collect(*pending.popleft(), subject)
+
+        while pending:
+            yield await self._collect(*pending.popleft(), subject)
+
+    @staticmethod
+    async def _collect(chunk: List[Dict[str, Any]], future, subject: str) -> List[EmailMessage]:
+        htmls = await future
+        return [
+            EmailMessage(
+                user_id=recipient["user_id"],
+                to_email=recipient["user_email"],
+                subject=subject,
+                html=html
+            )
+            for recipient, html in zip(chunk, htmls)
+        ]
@@ -9,15 +9,90 @@ and delivery via Resend email provider.
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, update
 import jwt
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates" / "emails"
+DIGEST_FREQUENCY_WINDOWS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(days=7),
+    "monthly": timedelta(days=30),
+}
+
+
+@lru_cache(maxsize=None)
+def _digest_template():
+    """
+    Load and compile the digest template once per process.
+
+    @returns Compiled Jinja2 template
+    """
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(['html', 'xml'])
+    )
+    return env.get_template("weekly_digest.html")
+
+
+def fallback_digest_html(user_name: str) -> str:
+    """
+    Basic HTML used when the digest template cannot be rendered.
+
+    @param user_name - Recipient display name
+    @returns HTML string
+    """
+    return f"""
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <meta charset="utf-8">
+                <title>Weekly Dynasty Update</title>
+            </head>
+            <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
+                <h1>Hi {user_name}!</h1>
+                <p>Here's your weekly dynasty prospect update.</p>
+                <p><a href="https://afinewinedynasty.com/dashboard">View Dashboard</a></p>
+            </body>
+            </html>
+            """
+
+
+def render_digest_html(template_context: Dict[str, Any]) -> str:
+    """
+    Render one digest from a prepared template context.
+
+    Module-level so render worker processes can call it; each process
+    compiles the template on first use.
+
+    @param template_context - Context built by EmailDigestService.build_template_context
+    @returns Rendered HTML, or the fallback HTML if rendering fails
+    """
+    try:
+        return _digest_template().render(**template_context)
+    except Exception as e:
+        logger.error(f"Failed to render email template: {str(e)}")
+        return fallback_digest_html(template_context.get("user_name", "there"))
+
+
+def render_digest_batch(template_contexts: List[Dict[str, Any]]) -> List[str]:
+    """
+    Render a batch of digests (one worker pool task per batch).
+
+    @param template_contexts - Template contexts in send order
+    @returns Rendered HTML strings in the same order
+    """
+    return [render_digest_html(context) for context in template_contexts]
+
 
 class EmailDigestService:
     """
@@ -133,11 +208,11 @@ class EmailDigestService:
         logger.debug(f"Retrieved {len(updates)} watchlist updates for user {user_id}")
         return updates
 
-    async def _get_top_movers(self, user_id: int) -> List[Dict[str, Any]]:
+    async def _get_top_movers(self, user_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get top 5 rising and falling prospects.
 
-        @param user_id - User ID (for personalization)
+        @param user_id - User ID (for personalization; None for the shared list)
         @returns List of top movers with rank changes
 
         @since 1.0.0
@@ -230,7 +305,7 @@ class EmailDigestService:
             # Send via Resend
             success = await self._send_via_resend(
                 to_email=content["user_email"],
-                subject=f"Your Weekly Dynasty Prospect Update - {datetime.utcnow().strftime('%B %d, %Y')}",
+                subject=self.digest_subject(),
                 html_content=html_content
             )
 
@@ -247,73 +322,41 @@ class EmailDigestService:
             logger.error(f"Error sending digest to user {user_id}: {str(e)}")
             return False
 
-    async def _render_digest_template(self, content: Dict[str, Any]) -> str:
+    def build_template_context(self, content: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Render HTML email template with content.
-
-        Loads the email template from file and renders with Jinja2.
+        Build the Jinja2 context for a digest, including the unsubscribe link.
 
         @param content - Digest content data
-        @returns Rendered HTML string
+        @returns Template context (plain data, safe to send to render workers)
 
         @since 1.0.0
         """
-        try:
-            from jinja2 import Environment, FileSystemLoader, select_autoescape
-            from pathlib import Path
-            import os
-
-            # Get template directory path
-            template_dir = Path(__file__).parent.parent / "templates" / "emails"
-
-            # Initialize Jinja2 environment
-            env = Environment(
-                loader=FileSystemLoader(str(template_dir)),
-                autoescape=select_autoescape(['html', 'xml'])
-            )
+        unsubscribe_token = self.generate_unsubscribe_token(content.get("user_id", 0))
+        return {
+            "user_name": content.get("user_name", "there"),
+            "week_date": content.get("generated_at", datetime.utcnow()).strftime("%B %d, %Y"),
+            "watchlist_updates": content.get("watchlist_updates", []),
+            "top_movers": content.get("top_movers", []),
+            "recommendations": content.get("recommendations", []),
+            "achievement_progress": content.get("achievement_progress", {}),
+            "unsubscribe_link": f"https://afinewinedynasty.com/unsubscribe?token={unsubscribe_token}",
+            "current_year": datetime.utcnow().year
+        }
 
-            # Load template
-            template = env.get_template("weekly_digest.html")
-
-            # Generate unsubscribe link
-            unsubscribe_token = self.generate_unsubscribe_token(content.get("user_id", 0))
-            unsubscribe_link = f"https://afinewinedynasty.com/unsubscribe?token={unsubscribe_token}"
-
-            # Prepare template context
-            template_context = {
-                "user_name": content.get("user_name", "there"),
-                "week_date": content.get("generated_at", datetime.utcnow()).strftime("%B %d, %Y"),
-                "watchlist_updates": content.get("watchlist_updates", []),
-                "top_movers": content.get("top_movers", []),
-                "recommendations": content.get("recommendations", []),
-                "achievement_progress": content.get("achievement_progress", {}),
-                "unsubscribe_link": unsubscribe_link,
-                "current_year": datetime.utcnow().year
-            }
+    async def _render_digest_template(self, content: Dict[str, Any]) -> str:
+        """
+        Render HTML email template with content.
 
-            # Render template
-            html = template.render(**template_context)
+        Falls back to basic HTML if the template cannot be rendered.
 
-            logger.debug("Email template rendered successfully")
-            return html
+        @param content - Digest content data
+        @returns Rendered HTML string
 
-        except Exception as e:
-            logger.error(f"Failed to render email template: {str(e)}")
-            # Fallback to basic HTML if template loading fails
-            return f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <title>Weekly Dynasty Update</title>
-            </head>
-            <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-                <h1>Hi {content.get('user_name', 'there')}!</h1>
-                <p>Here's your weekly dynasty prospect update.</p>
-                <p><a href="https://afinewinedynasty.com/dashboard">View Dashboard</a></p>
-            </body>
-            </html>
-            """
+        @since 1.0.0
+        """
+        html = render_digest_html(self.build_template_context(content))
+        logger.debug("Email template rendered successfully")
+        return html
 
     async def _send_via_resend(
         self,
@@ -369,18 +412,64 @@ class EmailDigestService:
         @param user_id - User ID
         @since 1.0.0
         """
+        await self.mark_sent([user_id])
+
+    async def mark_sent(self, user_ids: List[int]) -> None:
+        """
+        Set last_sent for many users with a single UPDATE.
+
+        @param user_ids - IDs of users whose digest was delivered
+        @since 1.0.0
+        """
         from app.db.models import EmailPreferences
-        from sqlalchemy import update
+
+        if not user_ids:
+            return
 
         stmt = (
             update(EmailPreferences)
-            .where(EmailPreferences.user_id == user_id)
+            .where(EmailPreferences.user_id.in_(user_ids))
             .values(last_sent=datetime.utcnow())
         )
 
         await self.db.execute(stmt)
         await self.db.commit()
 
+    @staticmethod
+    def digest_subject() -> str:
+        """
+        Subject line for this run's digests.
+
+        @returns Subject string
+        @since 1.0.0
+        """
+        return f"Your Weekly Dynasty Prospect Update - {datetime.utcnow().strftime('%B %d, %Y')}"
+
+    @staticmethod
+    def _digest_eligibility(frequency: str):
+        """
+        WHERE criteria for preferences due a digest at this frequency.
+
+        @param frequency - Digest frequency (daily, weekly, monthly)
+        @returns SQLAlchemy criterion
+        @throws ValueError - If frequency is not recognized
+        """
+        from app.db.models import EmailPreferences
+
+        window = DIGEST_FREQUENCY_WINDOWS.get(frequency)
+        if window is None:
+            raise ValueError(f"Invalid frequency: {frequency}")
+        cutoff = datetime.utcnow() - window
+
+        return and_(
+            EmailPreferences.digest_enabled == True,
+            EmailPreferences.frequency == frequency,
+            or_(
+                EmailPreferences.last_sent == None,
+                EmailPreferences.last_sent < cutoff
+            )
+        )
+
     async def get_users_for_digest(self, frequency: str = "weekly") -> List[int]:
         """
         Get list of user IDs who should receive digest based on frequency.
@@ -403,28 +492,8 @@ class EmailDigestService:
         """
         from app.db.models import EmailPreferences
 
-        # Calculate cutoff time based on frequency
-        now = datetime.utcnow()
-        if frequency == "daily":
-            cutoff = now - timedelta(days=1)
-        elif frequency == "weekly":
-            cutoff = now - timedelta(days=7)
-        elif frequency == "monthly":
-            cutoff = now - timedelta(days=30)
-        else:
-            raise ValueError(f"Invalid frequency: {frequency}")
-
         # Query users eligible for digest
-        stmt = select(EmailPreferences.user_id).where(
-            and_(
-                EmailPreferences.digest_enabled == True,
-                EmailPreferences.frequency == frequency,
-                or_(
-                    EmailPreferences.last_sent == None,
-                    EmailPreferences.last_sent < cutoff
-                )
-            )
-        )
+        stmt = select(EmailPreferences.user_id).where(self._digest_eligibility(frequency))
 
         result = await self.db.execute(stmt)
         user_ids = [row[0] for row in result.fetchall()]
@@ -432,6 +501,80 @@ class EmailDigestService:
         logger.info(f"Found {len(user_ids)} users for {frequency} digest")
         return user_ids
 
+    async def get_digest_recipients(self, frequency: str = "weekly") -> List[Dict[str, Any]]:
+        """
+        Load every eligible recipient with their preferences in one query.
+
+        Replaces the per-user user and preferences lookups done by
+        generate_digest_content when sending a whole run.
+
+        @param frequency - Digest frequency (daily, weekly, monthly)
+        @returns List of recipient dicts (user_id, user_name, user_email, preferences)
+
+        @since 1.0.0
+        """
+        from app.db.models import User, EmailPreferences
+
+        stmt = (
+            select(User.id, User.email, User.full_name, EmailPreferences.preferences)
+            .join(EmailPreferences, EmailPreferences.user_id == User.id)
+            .where(self._digest_eligibility(frequency))
+            .order_by(User.id)
+        )
+
+        result = await self.db.execute(stmt)
+        recipients = [
+            {
+                "user_id": row.id,
+                "user_name": row.full_name or row.email,
+                "user_email": row.email,
+                "preferences": row.preferences or {},
+            }
+            for row in result.all()
+        ]
+
+        logger.info(f"Loaded {len(recipients)} recipients for {frequency} digest")
+        return recipients
+
+    async def get_shared_sections(self) -> Dict[str, Any]:
+        """
+        Compute digest sections that are identical for every recipient.
+
+        Called once per run instead of once per user.
+
+        @returns Dictionary of shared content sections
+        @since 1.0.0
+        """
+        return {
+            "top_movers": await self._get_top_movers(user_id=None),
+        }
+
+    async def build_digest_content(
+        self,
+        recipient: Dict[str, Any],
+        shared: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Assemble digest content for a prefetched recipient.
+
+        @param recipient - Recipient dict from get_digest_recipients
+        @param shared - Sections from get_shared_sections
+        @returns Digest content in the same shape as generate_digest_content
+
+        @since 1.0.0
+        """
+        user_id = recipient["user_id"]
+        return {
+            "user_id": user_id,
+            "user_name": recipient["user_name"],
+            "user_email": recipient["user_email"],
+            "watchlist_updates": await self._get_watchlist_updates(user_id),
+            "top_movers": shared["top_movers"],
+            "recommendations": await self._get_recommendations(user_id),
+            "achievement_progress": await self._get_achievement_progress(user_id),
+            "generated_at": datetime.utcnow(),
+        }
+
     def generate_unsubscribe_token(self, user_id: int) -> str:
         """
         Generate JWT token for unsubscribe link.
@@ -486,7 +629,6 @@ class EmailDigestService:
         @since 1.0.0
         """
         from app.db.models import EmailPreferences
-        from sqlalchemy import update
 
         try:
             stmt = (
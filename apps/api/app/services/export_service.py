@@ -1,13 +1,92 @@
-"""Export service for generating CSV exports of prospect rankings."""
+"""Export service for generating CSV and Parquet exports of prospect rankings."""
 
 import csv
 import io
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Iterable, Iterator
 from datetime import datetime
 from fastapi import HTTPException, status
 
 from app.db.models import User
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+BASE_COLUMNS = [
+    'Dynasty Rank',
+    'Name',
+    'Position',
+    'Organization',
+    'Level',
+    'Age',
+    'ETA Year',
+    'Dynasty Score'
+]
+
+ADVANCED_COLUMNS = [
+    'ML Score',
+    'Scouting Score',
+    'Confidence Level',
+    'Batting Average',
+    'On-Base %',
+    'Slugging %',
+    'ERA',
+    'WHIP',
+    'Overall Grade',
+    'Future Value'
+]
+
+# Parquet keeps raw typed values under the export dict keys
+PARQUET_FIELDS = [
+    ('dynasty_rank', 'int32'),
+    ('name', 'string'),
+    ('position', 'string'),
+    ('organization', 'string'),
+    ('level', 'string'),
+    ('age', 'int32'),
+    ('eta_year', 'int32'),
+    ('dynasty_score', 'float64'),
+    ('ml_score', 'float64'),
+    ('scouting_score', 'float64'),
+    ('confidence_level', 'string'),
+    ('batting_avg', 'float64'),
+    ('on_base_pct', 'float64'),
+    ('slugging_pct', 'float64'),
+    ('era', 'float64'),
+    ('whip', 'float64'),
+    ('overall_grade', 'int32'),
+    ('future_value', 'int32'),
+]
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose contents are drained after each row group."""
+
+    def __init__(self):
+        super().__init__()
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
 
 class ExportService:
     """Service for exporting prospect data in various formats."""
@@ -48,79 +127,177 @@ class ExportService:
         Returns:
             CSV string
         """
-        output = io.StringIO()
+        return ''.join(ExportService.iter_csv(prospects, include_advanced_metrics))
+
+    @staticmethod
+    def csv_columns(include_advanced_metrics: bool = True) -> List[str]:
+        """CSV header for an export."""
+        return BASE_COLUMNS + ADVANCED_COLUMNS if include_advanced_metrics else list(BASE_COLUMNS)
+
+    @staticmethod
+    def format_csv_row(prospect: Dict[str, Any], include_advanced_metrics: bool = True) -> Dict[str, Any]:
+        """Format one export dict as a CSV row."""
+        row = {
+            'Dynasty Rank': prospect.get('dynasty_rank', ''),
+            'Name': prospect.get('name', ''),
+            'Position': prospect.get('position', ''),
+            'Organization': prospect.get('organization', ''),
+            'Level': prospect.get('level', ''),
+            'Age': prospect.get('age', ''),
+            'ETA Year': prospect.get('eta_year', ''),
+            'Dynasty Score': f"{prospect.get('dynasty_score', 0):.2f}"
+        }
 
-        # Define columns based on what to include
-        base_columns = [
-            'Dynasty Rank',
-            'Name',
-            'Position',
-            'Organization',
-            'Level',
-            'Age',
-            'ETA Year',
-            'Dynasty Score'
-        ]
-
-        advanced_columns = [
-            'ML Score',
-            'Scouting Score',
-            'Confidence Level',
-            'Batting Average',
-            'On-Base %',
-            'Slugging %',
-            'ERA',
-            'WHIP',
-            'Overall Grade',
-            'Future Value'
-        ]
-
-        columns = base_columns
         if include_advanced_metrics:
-            columns.extend(advanced_columns)
+            row.update({
+                'ML Score': f"{prospect.get('ml_score', 0):.2f}",
+                'Scouting Score': f"{prospect.get('scouting_score', 0):.2f}",
+                'Confidence Level': prospect.get('confidence_level', 'Low'),
+                'Batting Average': f"{prospect.get('batting_avg'):.3f}" if prospect.get('batting_avg') is not None else '',
+                'On-Base %': f"{prospect.get('on_base_pct'):.3f}" if prospect.get('on_base_pct') is not None else '',
+                'Slugging %': f"{prospect.get('slugging_pct'):.3f}" if prospect.get('slugging_pct') is not None else '',
+                'ERA': f"{prospect.get('era'):.2f}" if prospect.get('era') is not None else '',
+                'WHIP': f"{prospect.get('whip'):.2f}" if prospect.get('whip') is not None else '',
+                'Overall Grade': prospect.get('overall_grade', ''),
+                'Future Value': prospect.get('future_value', '')
+            })
 
-        writer = csv.DictWriter(output, fieldnames=columns)
+        return row
+
+    @staticmethod
+    def csv_footer() -> str:
+        """Metadata footer appended to every CSV export."""
+        return (
+            f"\n# Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC\n"
+            "# Data provided by A Fine Wine Dynasty\n"
+            "# Dynasty scores calculated using proprietary algorithm combining ML predictions, scouting grades, and performance metrics\n"
+        )
+
+    @staticmethod
+    def iter_csv(
+        prospects: Iterable[Dict[str, Any]],
+        include_advanced_metrics: bool = True,
+        chunk_size: int = 500
+    ) -> Iterator[str]:
+        """
+        Yield a CSV export in chunks of ``chunk_size`` rows.
+
+        Args:
+            prospects: Export dicts in output order
+            include_advanced_metrics: Include ML scores and advanced metrics
+            chunk_size: Rows per yielded chunk
+
+        Yields:
+            Header chunk, row chunks, then the metadata footer
+        """
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=ExportService.csv_columns(include_advanced_metrics))
         writer.writeheader()
+        pending = 0
 
         for prospect in prospects:
-            row = {
-                'Dynasty Rank': prospect.get('dynasty_rank', ''),
-                'Name': prospect.get('name', ''),
-                'Position': prospect.get('position', ''),
-                'Organization': prospect.get('organization', ''),
-                'Level': prospect.get('level', ''),
-                'Age': prospect.get('age', ''),
-                'ETA Year': prospect.get('eta_year', ''),
-                'Dynasty Score': f"{prospect.get('dynasty_score', 0):.2f}"
-            }
-
-            if include_advanced_metrics:
-                row.update({
-                    'ML Score': f"{prospect.get('ml_score', 0):.2f}",
-                    'Scouting Score': f"{prospect.get('scouting_score', 0):.2f}",
-                    'Confidence Level': prospect.get('confidence_level', 'Low'),
-                    'Batting Average': f"{prospect.get('batting_avg'):.3f}" if prospect.get('batting_avg') is not None else '',
-                    'On-Base %': f"{prospect.get('on_base_pct'):.3f}" if prospect.get('on_base_pct') is not None else '',
-                    'Slugging %': f"{prospect.get('slugging_pct'):.3f}" if prospect.get('slugging_pct') is not None else '',
-                    'ERA': f"{prospect.get('era'):.2f}" if prospect.get('era') is not None else '',
-                    'WHIP': f"{prospect.get('whip'):.2f}" if prospect.get('whip') is not None else '',
-                    'Overall Grade': prospect.get('overall_grade', ''),
-                    'Future Value': prospect.get('future_value', '')
-                })
-
-            writer.writerow(row)
-
-        # Add metadata footer
-        output.write(f"\n# Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC\n")
-        output.write("# Data provided by A Fine Wine Dynasty\n")
-        output.write("# Dynasty scores calculated using proprietary algorithm combining ML predictions, scouting grades, and performance metrics\n")
-
-        return output.getvalue()
+            writer.writerow(ExportService.format_csv_row(prospect, include_advanced_metrics))
+            pending += 1
+            if pending >= chunk_size:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+                pending = 0
+
+        output.write(ExportService.csv_footer())
+        yield output.getvalue()
+
+    @staticmethod
+    async def stream_csv(
+        batches: AsyncIterator[List[Dict[str, Any]]],
+        include_advanced_metrics: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        Stream a CSV export from batches of export dicts.
+
+        The header is sent before the first batch arrives, so the client
+        receives bytes while the query is still running.
+        """
+        columns = ExportService.csv_columns(include_advanced_metrics)
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=columns)
+        writer.writeheader()
+        yield output.getvalue()
+
+        async for batch in batches:
+            output.seek(0)
+            output.truncate()
+            for prospect in batch:
+                writer.writerow(ExportService.format_csv_row(prospect, include_advanced_metrics))
+            yield output.getvalue()
+
+        yield ExportService.csv_footer()
+
+    @staticmethod
+    def validate_parquet_support() -> bool:
+        """
+        Check that Parquet export can be served.
+
+        Raises:
+            HTTPException if pyarrow is not installed
+        """
+        if pa is None:
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="Parquet export is not available on this server"
+            )
+        return True
+
+    @staticmethod
+    async def stream_parquet(batches: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[bytes]:
+        """Stream a Parquet export, writing one row group per batch."""
+        ExportService.validate_parquet_support()
+
+        schema = pa.schema([(name, getattr(pa, dtype)()) for name, dtype in PARQUET_FIELDS])
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema, compression='snappy')
+        try:
+            async for batch in batches:
+                table = pa.Table.from_pylist(
+                    [{name: prospect.get(name) for name, _ in PARQUET_FIELDS} for prospect in batch],
+                    schema=schema
+                )
+                writer.write_table(table)
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+    @staticmethod
+    def generate_comparison_csv(comparison_data: Dict[str, Any]) -> str:
+        """
+        Generate CSV export of a prospect comparison.
+
+        Args:
+            comparison_data: Result of the multi-prospect comparison endpoint
+
+        Returns:
+            CSV string with one row per compared prospect
+        """
+        rows = []
+        for prospect in comparison_data.get('prospects', []):
+            metrics = prospect.get('dynasty_metrics', {})
+            stats = prospect.get('stats', {})
+            rows.append({
+                **prospect,
+                **stats,
+                'dynasty_score': metrics.get('dynasty_score', 0),
+                'ml_score': metrics.get('ml_score', 0),
+                'scouting_score': metrics.get('scouting_score', 0),
+                'confidence_level': metrics.get('confidence_level', 'Low'),
+            })
+        return ''.join(ExportService.iter_csv(rows))
 
     @staticmethod
     def generate_filename(
         filters: Optional[Dict[str, Any]] = None,
-        prefix: str = "prospect_rankings"
+        prefix: str = "prospect_rankings",
+        extension: str = "csv"
     ) -> str:
         """
         Generate appropriate filename for export.
@@ -128,6 +305,7 @@ class ExportService:
         Args:
             filters: Applied filters to include in filename
             prefix: Filename prefix
+            extension: File extension (csv or parquet)
 
         Returns:
             Formatted filename with timestamp
@@ -149,4 +327,4 @@ class ExportService:
         else:
             filter_str = ""
 
-        return f"{prefix}{filter_str}_{timestamp}.csv"
\ No newline at end of file
+        return f"{prefix}{filter_str}_{timestamp}.{extension}"
\ No newline at end of file
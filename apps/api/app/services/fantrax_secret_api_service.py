@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.db.models import User
 from app.core.security import encrypt_value, decrypt_value
+from app.core.principal_cache import principal_cache
 import logging
 import json
 
@@ -393,6 +394,7 @@ async def store_fantrax_secret_id(
         user.fantrax_connected = True
         user.fantrax_connected_at = datetime.utcnow()
         await db.commit()
+        await principal_cache.invalidate(email=user.email, user_id=user_id)
         logger.info(f"Stored Fantrax Secret ID for user {user_id}")
 
 
@@ -15,6 +15,7 @@ from collections import defaultdict
 
 from app.db.models import Prospect, ProspectStats, MLPrediction, ScoutingGrades
 from app.core.cache_manager import cache_manager
+from app.services.peer_cohort_service import peer_cohort_store
 
 logger = logging.getLogger(__name__)
 
@@ -155,15 +156,11 @@ class HistoricalDataService:
         Returns:
             Dictionary with trend analysis and trajectory data
         """
-        # Get historical stats
-        query = select(ProspectStats).where(
-            ProspectStats.prospect_id == prospect_id
-        ).order_by(asc(ProspectStats.date_recorded))
-
-        result = await db.execute(query)
-        stats = result.scalars().all()
+        # Get historical stats from the cohort store (chronological)
+        await peer_cohort_store.ensure_fresh(db)
+        series = peer_cohort_store.get_prospect_series(prospect_id)
 
-        if not stats:
+        if not series:
             return {
                 "prospect_id": prospect_id,
                 "metric": metric,
@@ -172,16 +169,15 @@ class HistoricalDataService:
 
         # Extract metric values and dates
         data_points = []
-        for stat in stats:
-            if hasattr(stat, metric):
-                value = getattr(stat, metric)
-                if value is not None:
-                    data_points.append({
-                        "date": stat.date_recorded,
-                        "value": value,
-                        "level": stat.level,
-                        "season": stat.season or stat.date_recorded.year
-                    })
+        for observation in series:
+            value = observation.values.get(metric)
+            if value is not None:
+                data_points.append({
+                    "date": observation.date_recorded,
+                    "value": value,
+                    "level": observation.level,
+                    "season": observation.season
+                })
 
         if len(data_points) < 3:
             return {
@@ -435,89 +431,24 @@ class HistoricalDataService:
         if not prospect:
             return {"error": "Prospect not found"}
 
-        # Get prospect's stats for the season
-        stats_query = select(ProspectStats).where(
-            ProspectStats.prospect_id == prospect_id
-        )
-        if season:
-            stats_query = stats_query.where(ProspectStats.season == season)
-        stats_query = stats_query.order_by(desc(ProspectStats.date_recorded)).limit(1)
-
-        stats_result = await db.execute(stats_query)
-        prospect_stats = stats_result.scalar_one_or_none()
+        # Percentiles come from precomputed cohort distributions
+        await peer_cohort_store.ensure_fresh(db)
+        peer_comparison = peer_cohort_store.compare_to_peers(prospect_id, season)
 
-        if not prospect_stats:
+        if peer_comparison is None:
             return {
                 "prospect_id": prospect_id,
                 "message": "No stats available for comparison"
             }
 
-        # Get peer stats (same position, similar age, same level)
-        peer_query = select(ProspectStats).join(Prospect).where(
-            and_(
-                Prospect.position == prospect.position,
-                Prospect.age.between(prospect.age - 1, prospect.age + 1),
-                ProspectStats.level == prospect_stats.level,
-                ProspectStats.prospect_id != prospect_id
-            )
-        )
-        if season:
-            peer_query = peer_query.where(ProspectStats.season == season)
-
-        peer_result = await db.execute(peer_query)
-        peer_stats = peer_result.scalars().all()
-
-        if not peer_stats:
+        if not peer_comparison["comparison_group"]["peer_count"]:
             return {
                 "prospect_id": prospect_id,
                 "message": "No peer data available for comparison"
             }
 
-        # Calculate percentiles for key metrics
-        comparison = {
+        return {
             "prospect_id": prospect_id,
             "prospect_name": prospect.name,
-            "comparison_group": {
-                "position": prospect.position,
-                "age_range": f"{prospect.age-1}-{prospect.age+1}",
-                "level": prospect_stats.level,
-                "peer_count": len(peer_stats)
-            },
-            "percentiles": {}
+            **peer_comparison
         }
-
-        # Metrics to compare
-        metrics_to_compare = {
-            "batting_avg": "higher_better",
-            "on_base_pct": "higher_better",
-            "slugging_pct": "higher_better",
-            "ops": "higher_better",
-            "era": "lower_better",
-            "whip": "lower_better",
-            "k_per_9": "higher_better",
-            "bb_per_9": "lower_better"
-        }
-
-        for metric, direction in metrics_to_compare.items():
-            if hasattr(prospect_stats, metric):
-                prospect_value = getattr(prospect_stats, metric)
-                if prospect_value is not None:
-                    peer_values = [getattr(ps, metric) for ps in peer_stats
-                                 if getattr(ps, metric) is not None]
-
-                    if peer_values:
-                        # Calculate percentile
-                        if direction == "higher_better":
-                            percentile = (sum(1 for v in peer_values if v < prospect_value) / len(peer_values)) * 100
-                        else:
-                            percentile = (sum(1 for v in peer_values if v > prospect_value) / len(peer_values)) * 100
-
-                        comparison["percentiles"][metric] = {
-                            "value": prospect_value,
-                            "percentile": round(percentile, 1),
-                            "peer_average": np.mean(peer_values),
-                            "peer_median": np.median(peer_values),
-                            "rating": "elite" if percentile >= 90 else "above_average" if percentile >= 70 else "average" if percentile >= 30 else "below_average"
-                        }
-
-        return comparison
\ No newline at end of file
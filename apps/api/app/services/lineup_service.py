@@ -6,7 +6,7 @@ from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.db.models import UserLineup, LineupProspect, Prospect, User, FantraxLeague, FantraxRoster
+from app.db.models import UserLineup, LineupProspect, Prospect, FantraxLeague, FantraxRoster
 from app.models.lineup import (
     UserLineupCreate,
     UserLineupUpdate,
@@ -26,24 +26,13 @@ class LineupService:
     @staticmethod
     async def create_lineup(
         db: AsyncSession,
-        user_email: str,
+        user_id: int,
         lineup_data: UserLineupCreate
     ) -> UserLineup:
         """Create a new lineup for a user"""
-        # Get user ID from email
-        stmt = select(User).where(User.email == user_email)
-        result = await db.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-
         # Create lineup
         new_lineup = UserLineup(
-            user_id=user.id,
+            user_id=user_id,
             name=lineup_data.name,
             description=lineup_data.description,
             is_public=lineup_data.is_public,
@@ -60,27 +49,16 @@ class LineupService:
     @staticmethod
     async def get_user_lineups(
         db: AsyncSession,
-        user_email: str,
+        user_id: int,
         skip: int = 0,
         limit: int = 100
     ) -> tuple[List[UserLineup], int]:
         """Get all lineups for a user with pagination"""
-        # Get user
-        user_stmt = select(User).where(User.email == user_email)
-        user_result = await db.execute(user_stmt)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-
         # Get lineups with prospect count
         stmt = (
             select(UserLineup, func.count(LineupProspect.id).label('prospect_count'))
             .outerjoin(LineupProspect, UserLineup.id == LineupProspect.lineup_id)
-            .where(UserLineup.user_id == user.id)
+            .where(UserLineup.user_id == user_id)
             .group_by(UserLineup.id)
             .order_by(UserLineup.created_at.desc())
             .offset(skip)
@@ -91,7 +69,7 @@ class LineupService:
         rows = result.all()
 
         # Get total count
-        count_stmt = select(func.count(UserLineup.id)).where(UserLineup.user_id == user.id)
+        count_stmt = select(func.count(UserLineup.id)).where(UserLineup.user_id == user_id)
         total_result = await db.execute(count_stmt)
         total = total_result.scalar()
 
@@ -107,30 +85,19 @@ class LineupService:
     async def get_lineup_by_id(
         db: AsyncSession,
         lineup_id: int,
-        user_email: str,
+        user_id: int,
         include_prospects: bool = True
     ) -> Optional[UserLineup]:
         """Get a specific lineup by ID (with authorization check)"""
-        # Get user
-        user_stmt = select(User).where(User.email == user_email)
-        user_result = await db.execute(user_stmt)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-
         # Build query with optional prospect loading
         if include_prospects:
             stmt = (
                 select(UserLineup)
                 .options(selectinload(UserLineup.prospects).selectinload(LineupProspect.prospect))
-                .where(and_(UserLineup.id == lineup_id, UserLineup.user_id == user.id))
+                .where(and_(UserLineup.id == lineup_id, UserLineup.user_id == user_id))
             )
         else:
-            stmt = select(UserLineup).where(and_(UserLineup.id == lineup_id, UserLineup.user_id == user.id))
+            stmt = select(UserLineup).where(and_(UserLineup.id == lineup_id, UserLineup.user_id == user_id))
 
         result = await db.execute(stmt)
         lineup = result.scalar_one_or_none()
@@ -147,11 +114,11 @@ class LineupService:
     async def update_lineup(
         db: AsyncSession,
         lineup_id: int,
-        user_email: str,
+        user_id: int,
         update_data: UserLineupUpdate
     ) -> UserLineup:
         """Update a lineup"""
-        lineup = await LineupService.get_lineup_by_id(db, lineup_id, user_email, include_prospects=False)
+        lineup = await LineupService.get_lineup_by_id(db, lineup_id, user_id, include_prospects=False)
 
         # Update fields
         update_dict = update_data.dict(exclude_unset=True)
@@ -169,10 +136,10 @@ class LineupService:
     async def delete_lineup(
         db: AsyncSession,
         lineup_id: int,
-        user_email: str
+        user_id: int
     ) -> bool:
         """Delete a lineup"""
-        lineup = await LineupService.get_lineup_by_id(db, lineup_id, user_email, include_prospects=False)
+        lineup = await LineupService.get_lineup_by_id(db, lineup_id, user_id, include_prospects=False)
 
         await db.delete(lineup)
         await db.commit()
@@ -183,12 +150,12 @@ class LineupService:
     async def add_prospect_to_lineup(
         db: AsyncSession,
         lineup_id: int,
-        user_email: str,
+        user_id: int,
         prospect_data: LineupProspectCreate
     ) -> LineupProspect:
         """Add a prospect to a lineup"""
         # Verify lineup ownership
-        lineup = await LineupService.get_lineup_by_id(db, lineup_id, user_email, include_prospects=False)
+        lineup = await LineupService.get_lineup_by_id(db, lineup_id, user_id, include_prospects=False)
 
         # Verify prospect exists
         prospect_stmt = select(Prospect).where(Prospect.id == prospect_data.prospect_id)
@@ -237,12 +204,12 @@ class LineupService:
         db: AsyncSession,
         lineup_id: int,
         prospect_id: int,
-        user_email: str,
+        user_id: int,
         update_data: LineupProspectUpdate
     ) -> LineupProspect:
         """Update a prospect's position, rank, or notes in a lineup"""
         # Verify lineup ownership
-        await LineupService.get_lineup_by_id(db, lineup_id, user_email, include_prospects=False)
+        await LineupService.get_lineup_by_id(db, lineup_id, user_id, include_prospects=False)
 
         # Get lineup prospect
         stmt = select(LineupProspect).where(
@@ -275,11 +242,11 @@ class LineupService:
         db: AsyncSession,
         lineup_id: int,
         prospect_id: int,
-        user_email: str
+        user_id: int
     ) -> bool:
         """Remove a prospect from a lineup"""
         # Verify lineup ownership
-        await LineupService.get_lineup_by_id(db, lineup_id, user_email, include_prospects=False)
+        await LineupService.get_lineup_by_id(db, lineup_id, user_id, include_prospects=False)
 
         # Get lineup prospect
         stmt = select(LineupProspect).where(
@@ -305,26 +272,15 @@ class LineupService:
     @staticmethod
     async def sync_fantrax_lineup(
         db: AsyncSession,
-        user_email: str,
+        user_id: int,
         sync_request: FantraxSyncRequest
     ) -> FantraxSyncResponse:
         """Sync a Fantrax league roster to a user lineup"""
-        # Get user
-        user_stmt = select(User).where(User.email == user_email)
-        user_result = await db.execute(user_stmt)
-        user = user_result.scalar_one_or_none()
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-
         # Get Fantrax league
         league_stmt = select(FantraxLeague).where(
             and_(
                 FantraxLeague.id == sync_request.league_id,
-                FantraxLeague.user_id == user.id
+                FantraxLeague.user_id == user_id
             )
         )
         league_result = await db.execute(league_stmt)
@@ -342,7 +298,7 @@ class LineupService:
         # Check for existing sync lineup
         existing_lineup_stmt = select(UserLineup).where(
             and_(
-                UserLineup.user_id == user.id,
+                UserLineup.user_id == user_id,
                 UserLineup.lineup_type == 'fantrax_sync',
                 UserLineup.settings['fantrax_league_id'].astext == str(sync_request.league_id)
             )
@@ -353,7 +309,7 @@ class LineupService:
         if not lineup:
             # Create new lineup
             lineup = UserLineup(
-                user_id=user.id,
+                user_id=user_id,
                 name=lineup_name,
                 description=f"Auto-synced from Fantrax league: {league.league_name}",
                 lineup_type='fantrax_sync',
@@ -9,6 +9,7 @@ from aiohttp import ClientSession, ClientTimeout
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
+from app.services.statsapi_cache import statsapi_cache
 
 logger = logging.getLogger(__name__)
 
@@ -76,27 +77,28 @@ class MLBAPIClient:
 
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        try:
-            # Add request delay to avoid overwhelming API
+        async def throttle():
+            # Only real network requests count against the daily limit
             if self.request_count > 0:
                 await asyncio.sleep(self.request_delay)
+            self.request_count += 1
 
+        try:
             logger.debug(f"MLB API request: {url} with params: {params}")
 
-            async with self.session.get(url, params=params) as response:
-                self.request_count += 1
-
-                if response.status == 200:
-                    data = await response.json()
-                    logger.debug(f"MLB API response received: {len(str(data))} bytes")
-                    return data
-                elif response.status == 429:
-                    raise RateLimitExceededError(f"API rate limit exceeded: {response.status}")
-                else:
-                    error_text = await response.text()
-                    raise MLBStatsAPIError(
-                        f"MLB API request failed with status {response.status}: {error_text}"
-                    )
+            response = await statsapi_cache.get(self.session, url, params, before_request=throttle)
+
+            if response.status == 200:
+                data = response.json()
+                logger.debug(f"MLB API response received: {len(response.body)} bytes (cached: {response.from_cache})")
+                return data
+            elif response.status == 429:
+                raise RateLimitExceededError(f"API rate limit exceeded: {response.status}")
+            else:
+                error_text = response.body.decode(errors="replace")
+                raise MLBStatsAPIError(
+                    f"MLB API request failed with status {response.status}: {error_text}"
+                )
 
         except aiohttp.ClientError as e:
             raise MLBStatsAPIError(f"Network error during MLB API request: {str(e)}")
@@ -306,7 +308,8 @@ class MLBAPIClient:
             "requests_made_today": self.request_count,
             "daily_limit": self.daily_limit,
             "requests_remaining": max(0, self.daily_limit - self.request_count),
-            "last_reset": self.last_reset.isoformat()
+            "last_reset": self.last_reset.isoformat(),
+            "cache": statsapi_cache.report()
         }
 
 
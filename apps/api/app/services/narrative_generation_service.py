@@ -8,15 +8,39 @@ risk assessment, and timeline estimation.
 import logging
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
-import asyncio
+
+from sqlalchemy import func, select
 
 from app.ml.narrative_templates import template_engine
 from app.core.cache_manager import cache_manager
-from app.db.models import Prospect, ScoutingGrades
+from app.db.models import MLPrediction, Prospect, ScoutingGrades
 from app.schemas.ml_predictions import PredictionResponse
 
 logger = logging.getLogger(__name__)
 
+TEMPLATE_VERSION = "v1.0"
+DEFAULT_MODEL_VERSION = "v1.0"  # used when a prospect has no stored prediction
+NARRATIVE_CACHE_TTL = 86400  # 24 hours
+
+
+def latest_success_predictions():
+    """
+    Subquery of (prospect_id, prediction_id) for each prospect's latest
+    success rating prediction.
+
+    The nightly pre-warm caches outlooks under the model version of this
+    prediction, so readers must look narratives up with the same version.
+    """
+    return (
+        select(
+            MLPrediction.prospect_id,
+            func.max(MLPrediction.id).label("prediction_id")
+        )
+        .where(MLPrediction.prediction_type == "success_rating")
+        .group_by(MLPrediction.prospect_id)
+        .subquery()
+    )
+
 
 class NarrativeGenerationService:
     """
@@ -64,61 +88,25 @@ class NarrativeGenerationService:
                 prospect_id=prospect.id,
                 model_version=prediction_data.model_version,
                 user_id=user_id,
-                template_version="v1.0"
+                template_version=TEMPLATE_VERSION
             )
 
             if cached_narrative:
                 logger.debug(f"Returned cached outlook for prospect {prospect.id}")
                 return cached_narrative
 
-            # Extract top contributing factors from SHAP values
-            top_factors = self._extract_contributing_factors(
-                prediction_data.feature_importance or {}
-            )
-
-            # Determine risk assessment
-            risk_level = self._assess_risk_level(
-                prediction_data.confidence_level,
-                prospect.age,
-                prospect.level,
-                prediction_data.success_probability
-            )
-
-            # Calculate timeline estimation
-            timeline = self._estimate_timeline(
-                prospect.eta_year,
-                prospect.age,
-                prospect.level
-            )
-
-            # Select appropriate template
-            template_name = self._select_template(prospect, prediction_data, scouting_grades)
-
-            # Create comprehensive context
-            context = self._create_narrative_context(
-                prospect=prospect,
-                prediction_data=prediction_data,
-                scouting_grades=scouting_grades,
-                user_preferences=user_preferences,
-                top_factors=top_factors,
-                risk_level=risk_level,
-                timeline=timeline
+            optimized_narrative = self._render_outlook(
+                prospect, prediction_data, scouting_grades, user_preferences
             )
 
-            # Generate narrative
-            narrative = self.template_engine.render_outlook(template_name, context)
-
-            # Apply readability optimization
-            optimized_narrative = self._optimize_readability(narrative)
-
             # Cache the generated narrative
             await self.cache_manager.cache_narrative(
                 prospect_id=prospect.id,
                 model_version=prediction_data.model_version,
                 user_id=user_id,
                 narrative_data=optimized_narrative,
-                template_version="v1.0",
-                ttl=86400  # 24 hours
+                template_version=TEMPLATE_VERSION,
+                ttl=NARRATIVE_CACHE_TTL
             )
 
             logger.info(f"Generated and cached outlook for prospect {prospect.id}")
@@ -128,6 +116,65 @@ class NarrativeGenerationService:
             logger.error(f"Failed to generate outlook for prospect {prospect.id}: {e}")
             raise
 
+    def _render_outlook(
+        self,
+        prospect: Prospect,
+        prediction_data: PredictionResponse,
+        scouting_grades: Optional[ScoutingGrades] = None,
+        user_preferences: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Render an outlook without touching the cache.
+
+        Args:
+            prospect: Prospect model instance
+            prediction_data: ML prediction results with SHAP values
+            scouting_grades: Optional scouting grade data
+            user_preferences: Optional user personalization data
+
+        Returns:
+            Readability-optimized narrative string
+        """
+        # Extract top contributing factors from SHAP values
+        top_factors = self._extract_contributing_factors(
+            prediction_data.feature_importance or {}
+        )
+
+        # Determine risk assessment
+        risk_level = self._assess_risk_level(
+            prediction_data.confidence_level,
+            prospect.age,
+            prospect.level,
+            prediction_data.success_probability
+        )
+
+        # Calculate timeline estimation
+        timeline = self._estimate_timeline(
+            prospect.eta_year,
+            prospect.age,
+            prospect.level
+        )
+
+        # Select appropriate template
+        template_name = self._select_template(prospect, prediction_data, scouting_grades)
+
+        # Create comprehensive context
+        context = self._create_narrative_context(
+            prospect=prospect,
+            prediction_data=prediction_data,
+            scouting_grades=scouting_grades,
+            user_preferences=user_preferences,
+            top_factors=top_factors,
+            risk_level=risk_level,
+            timeline=timeline
+        )
+
+        # Generate narrative
+        narrative = self.template_engine.render_outlook(template_name, context)
+
+        # Apply readability optimization
+        return self._optimize_readability(narrative)
+
     def _extract_contributing_factors(
         self,
         shap_values: Dict[str, float],
@@ -584,19 +631,88 @@ class NarrativeGenerationService:
 
         return optimized
 
+    async def latest_model_versions(self, db, prospect_ids: List[int]) -> Dict[int, str]:
+        """
+        Model version of each prospect's latest success rating prediction.
+
+        Args:
+            db: Async database session
+            prospect_ids: Prospects to look up
+
+        Returns:
+            prospect_id -> model_version, DEFAULT_MODEL_VERSION when none is stored
+        """
+        versions = {prospect_id: DEFAULT_MODEL_VERSION for prospect_id in prospect_ids}
+        if not prospect_ids:
+            return versions
+
+        latest = latest_success_predictions()
+        result = await db.execute(
+            select(MLPrediction.prospect_id, MLPrediction.model_version)
+            .join(latest, latest.c.prediction_id == MLPrediction.id)
+            .where(MLPrediction.prospect_id.in_(prospect_ids))
+        )
+        versions.update({prospect_id: version for prospect_id, version in result.all()})
+        return versions
+
+    async def get_cached_outlooks(
+        self,
+        prospect_ids: List[int],
+        model_versions: Dict[int, str],
+        user_id: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """
+        Cached outlooks for several prospects with a single MGET.
+
+        A user's personalized outlook wins; otherwise the default outlook
+        written by the nightly pre-warm is returned.
+
+        Args:
+            prospect_ids: Prospects to look up
+            model_versions: prospect_id -> model version (see latest_model_versions)
+            user_id: Optional user ID for personalized outlooks
+
+        Returns:
+            Outlooks in prospect_ids order, None for misses
+        """
+        requests: List[Tuple[int, str, Optional[int]]] = []
+        for prospect_id in prospect_ids:
+            model_version = model_versions.get(prospect_id, DEFAULT_MODEL_VERSION)
+            if user_id:
+                requests.append((prospect_id, model_version, user_id))
+            requests.append((prospect_id, model_version, None))
+
+        cached = await self.cache_manager.get_many_narratives(
+            requests, template_version=TEMPLATE_VERSION
+        )
+
+        step = 2 if user_id else 1
+        return [
+            next((narrative for narrative in cached[i:i + step] if narrative), None)
+            for i in range(0, len(cached), step)
+        ]
+
     async def generate_batch_outlooks(
         self,
         prospects: List[Prospect],
         prediction_data_list: List[PredictionResponse],
-        user_preferences: Optional[Dict[str, Any]] = None
+        user_preferences: Optional[Dict[str, Any]] = None,
+        user_id: Optional[int] = None,
+        scouting_grades_list: Optional[List[Optional[ScoutingGrades]]] = None
     ) -> List[str]:
         """
         Generate outlooks for multiple prospects in batch.
 
+        All cache keys are read with one MGET, only the misses are rendered,
+        and the new narratives are written back in one pipelined batch, so
+        the batch costs two Redis round trips regardless of its size.
+
         Args:
             prospects: List of prospect model instances
             prediction_data_list: List of prediction results
             user_preferences: Optional user personalization data
+            user_id: Optional user ID for caching personalized outlooks
+            scouting_grades_list: Optional scouting grades aligned with prospects
 
         Returns:
             List of generated narrative outlooks
@@ -606,28 +722,52 @@ class NarrativeGenerationService:
         """
         if len(prospects) != len(prediction_data_list):
             raise ValueError("Prospect and prediction data lists must have same length")
-
-        tasks = []
-        for prospect, prediction_data in zip(prospects, prediction_data_list):
-            task = self.generate_prospect_outlook(
-                prospect=prospect,
-                prediction_data=prediction_data,
-                user_preferences=user_preferences
-            )
-            tasks.append(task)
+        if scouting_grades_list is not None and len(scouting_grades_list) != len(prospects):
+            raise ValueError("Scouting grades list must have same length as prospects")
+        if not prospects:
+            return []
 
         try:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            cached = await self.cache_manager.get_many_narratives(
+                [
+                    (prospect.id, prediction_data.model_version, user_id)
+                    for prospect, prediction_data in zip(prospects, prediction_data_list)
+                ],
+                template_version=TEMPLATE_VERSION
+            )
 
-            # Handle any exceptions in the results
-            outlooks = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Failed to generate outlook for prospect {prospects[i].id}: {result}")
-                    outlooks.append(f"Unable to generate outlook for {prospects[i].name}")
-                else:
-                    outlooks.append(result)
+            outlooks: List[str] = []
+            to_cache: List[Tuple[int, str, Optional[int], str]] = []
+
+            for i, (prospect, prediction_data) in enumerate(zip(prospects, prediction_data_list)):
+                if cached[i]:
+                    outlooks.append(cached[i])
+                    continue
+
+                scouting_grades = scouting_grades_list[i] if scouting_grades_list else None
+                try:
+                    narrative = self._render_outlook(
+                        prospect, prediction_data, scouting_grades, user_preferences
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to generate outlook for prospect {prospect.id}: {e}")
+                    outlooks.append(f"Unable to generate outlook for {prospect.name}")
+                    continue
+
+                outlooks.append(narrative)
+                to_cache.append((prospect.id, prediction_data.model_version, user_id, narrative))
+
+            await self.cache_manager.cache_many_narratives(
+                to_cache,
+                template_version=TEMPLATE_VERSION,
+                ttl=NARRATIVE_CACHE_TTL
+            )
 
+            hits = sum(1 for narrative in cached if narrative)
+            logger.info(
+                f"Batch outlooks for {len(prospects)} prospects: {hits} cache hits, "
+                f"{len(to_cache)} rendered, {len(prospects) - hits - len(to_cache)} failed"
+            )
             return outlooks
 
         except Exception as e:
@@ -15,6 +15,7 @@ from typing import Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from app.db.models import User
+from app.core.principal_cache import principal_cache
 
 import logging
 
@@ -200,6 +201,7 @@ class OnboardingService:
             user.onboarding_completed_at = datetime.now()
             user.onboarding_step = self.TOTAL_STEPS - 1
             await self.db.commit()
+            await principal_cache.invalidate(email=user.email, user_id=user_id)
 
             return {
                 "user_id": user_id,
@@ -319,6 +321,7 @@ class OnboardingService:
             user.onboarding_started_at = None
             user.onboarding_completed_at = None
             await self.db.commit()
+            await principal_cache.invalidate(email=user.email, user_id=user_id)
 
             return {
                 "user_id": user_id,
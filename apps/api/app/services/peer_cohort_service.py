@@ -0,0 +1,505 @@
+"""
+Peer Cohort Distribution Store
+
+Keeps sorted per-cohort value arrays for prospect stat metrics so peer
+percentiles can be answered with a binary search instead of re-scanning
+``ProspectStats`` on every profile view.
+
+Cohorts are keyed by (position, age, level, season, metric). Peer lookups
+span age +/- 1, so a comparison touches at most three arrays per season.
+The store is loaded lazily from the database and caught up incrementally
+using an ``updated_at`` watermark when new stats arrive.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Prospect, ProspectStats
+
+logger = logging.getLogger(__name__)
+
+
+# Metrics with cohort distributions and their comparison direction
+COHORT_METRICS: Dict[str, str] = {
+    "batting_avg": "higher_better",
+    "on_base_pct": "higher_better",
+    "slugging_pct": "higher_better",
+    "ops": "higher_better",
+    "era": "lower_better",
+    "whip": "lower_better",
+    "k_per_9": "higher_better",
+    "bb_per_9": "lower_better",
+}
+
+# Raw numeric ProspectStats fields kept per observation for trajectories
+SERIES_FIELDS = (
+    "games_played", "at_bats", "hits", "home_runs", "rbi", "stolen_bases",
+    "walks", "strikeouts", "batting_avg", "on_base_pct", "slugging_pct",
+    "innings_pitched", "earned_runs", "era", "whip", "strikeouts_per_nine",
+    "walks_per_nine", "woba", "wrc_plus", "fip", "war",
+)
+
+# Metric aliases for columns named differently on the ORM model
+METRIC_ALIASES = {
+    "k_per_9": "strikeouts_per_nine",
+    "bb_per_9": "walks_per_nine",
+}
+
+UNKNOWN_LEVEL = "Unknown"
+
+CohortBase = Tuple[str, int, str, int]  # (position, age, level, season)
+
+
+@dataclass(frozen=True)
+class StatObservation:
+    """Compact, immutable snapshot of one ``ProspectStats`` row."""
+
+    stat_id: int
+    prospect_id: int
+    date_recorded: date
+    season: int
+    level: str
+    position: str
+    age: Optional[int]
+    values: Dict[str, float]
+
+    @property
+    def cohort(self) -> Optional[CohortBase]:
+        if self.age is None:
+            return None
+        return (self.position, self.age, self.level, self.season)
+
+
+def extract_stat_values(stat: Any) -> Dict[str, float]:
+    """Pull numeric fields (including derived OPS and rate aliases) from a stat row."""
+    values: Dict[str, float] = {}
+    for field in SERIES_FIELDS:
+        value = getattr(stat, field, None)
+        if value is not None:
+            values[field] = float(value)
+
+    for metric, column in METRIC_ALIASES.items():
+        value = getattr(stat, metric, None)
+        if value is None:
+            value = values.get(column)
+        if value is not None:
+            values[metric] = float(value)
+
+    # A missing component would understate OPS, so only derive it from both
+    if "on_base_pct" in values and "slugging_pct" in values:
+        values["ops"] = values["on_base_pct"] + values["slugging_pct"]
+
+    return values
+
+
+def rating_for_percentile(percentile: float) -> str:
+    """Map a percentile onto the rating buckets used by peer comparisons."""
+    if percentile >= 90:
+        return "elite"
+    if percentile >= 70:
+        return "above_average"
+    if percentile >= 30:
+        return "average"
+    return "below_average"
+
+
+def _remove_values(sorted_values: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Remove a multiset of values (all present) from a sorted array."""
+    if values.size == 0:
+        return sorted_values
+    values = np.sort(values)
+    positions = np.searchsorted(sorted_values, values, side="left")
+    # Offset repeated values so each occurrence removes a distinct element
+    occurrence = np.arange(values.size) - np.searchsorted(values, values, side="left")
+    return np.delete(sorted_values, positions + occurrence)
+
+
+class PeerCohortStore:
+    """
+    In-process cohort distribution store.
+
+    Holds a sorted ``float64`` array per (position, age, level, season, metric)
+    plus a per-prospect observation series. Percentiles are answered with
+    ``np.searchsorted``; peer averages and medians use the merged arrays.
+    """
+
+    def __init__(self, refresh_interval: int = 300, full_rebuild_interval: int = 86400):
+        self.refresh_interval = refresh_interval
+        self.full_rebuild_interval = full_rebuild_interval
+
+        self._cohorts: Dict[Tuple[CohortBase, str], np.ndarray] = {}
+        self._cohort_rows: Dict[CohortBase, int] = defaultdict(int)
+        self._observations: Dict[int, StatObservation] = {}
+        self._by_prospect: Dict[int, Dict[int, StatObservation]] = defaultdict(dict)
+
+        self._watermark: Optional[datetime] = None
+        self._last_refresh: float = 0.0
+        self._last_full_rebuild: float = 0.0
+        self._stale = True
+        self._lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # Loading and incremental maintenance
+    # ------------------------------------------------------------------
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._last_full_rebuild > 0
+
+    def mark_stale(self):
+        """Force a catch-up query on the next access (call after stats writes)."""
+        self._stale = True
+
+    async def ensure_fresh(self, db: AsyncSession, force_rebuild: bool = False):
+        """Load the store, or catch up on rows changed since the watermark."""
+        now = time.monotonic()
+        needs_rebuild = (
+            force_rebuild
+            or not self.is_loaded
+            or now - self._last_full_rebuild > self.full_rebuild_interval
+        )
+        if not needs_rebuild and not self._stale and now - self._last_refresh < self.refresh_interval:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            needs_rebuild = (
+                force_rebuild
+                or not self.is_loaded
+                or now - self._last_full_rebuild > self.full_rebuild_interval
+            )
+            if needs_rebuild:
+                await self._rebuild(db)
+            elif self._stale or now - self._last_refresh >= self.refresh_interval:
+                await self._catch_up(db)
+
+    async def _rebuild(self, db: AsyncSession):
+        start = time.perf_counter()
+        rows = await self._fetch_rows(db, since=None)
+        self.clear()
+        self.load_rows(rows)
+        self._last_full_rebuild = self._last_refresh = time.monotonic()
+        self._stale = False
+        logger.info(
+            f"Peer cohort store rebuilt: {len(self._observations)} observations, "
+            f"{len(self._cohort_rows)} cohorts in {time.perf_counter() - start:.2f}s"
+        )
+
+    async def _catch_up(self, db: AsyncSession):
+        rows = await self._fetch_rows(db, since=self._watermark)
+        if rows:
+            self.load_rows(rows)
+            logger.debug(f"Peer cohort store applied {len(rows)} changed stat rows")
+        self._last_refresh = time.monotonic()
+        self._stale = False
+
+    @staticmethod
+    async def _fetch_rows(db: AsyncSession, since: Optional[datetime]) -> List[Tuple]:
+        query = select(
+            ProspectStats,
+            Prospect.position,
+            Prospect.age,
+            Prospect.level,
+            Prospect.updated_at,
+        ).join(Prospect, Prospect.id == ProspectStats.prospect_id)
+
+        if since is not None:
+            query = query.where(
+                or_(ProspectStats.updated_at > since, Prospect.updated_at > since)
+            )
+
+        result = await db.execute(query)
+        return result.all()
+
+    def clear(self):
+        """Drop all cohort data."""
+        self._cohorts.clear()
+        self._cohort_rows.clear()
+        self._observations.clear()
+        self._by_prospect.clear()
+        self._watermark = None
+
+    def load_rows(self, rows: Iterable[Tuple]):
+        """Apply (stat, position, age, prospect_level, prospect_updated_at) rows."""
+        pending: Dict[Tuple[CohortBase, str], List[float]] = defaultdict(list)
+
+        # Keep only the last version of each stat row in this batch
+        latest_rows = {row[0].id: row for row in rows}
+
+        for stat, position, age, prospect_level, prospect_updated_at in latest_rows.values():
+            self.remove_observation(stat.id)
+            observation = StatObservation(
+                stat_id=stat.id,
+                prospect_id=stat.prospect_id,
+                date_recorded=stat.date_recorded,
+                season=stat.season or stat.date_recorded.year,
+                level=getattr(stat, "level", None) or prospect_level or UNKNOWN_LEVEL,
+                position=position,
+                age=age,
+                values=extract_stat_values(stat),
+            )
+            self._register(observation)
+
+            cohort = observation.cohort
+            if cohort is not None:
+                self._cohort_rows[cohort] += 1
+                for metric in COHORT_METRICS:
+                    value = observation.values.get(metric)
+                    if value is not None:
+                        pending[(cohort, metric)].append(value)
+
+            for changed_at in (stat.updated_at, prospect_updated_at):
+                if changed_at and (self._watermark is None or changed_at > self._watermark):
+                    self._watermark = changed_at
+
+        # Merge new values into the sorted arrays once per cohort
+        for key, values in pending.items():
+            existing = self._cohorts.get(key)
+            new_values = np.asarray(values, dtype=np.float64)
+            if existing is not None and existing.size:
+                new_values = np.concatenate([existing, new_values])
+            new_values.sort(kind="stable")
+            self._cohorts[key] = new_values
+
+    def _register(self, observation: StatObservation):
+        self._observations[observation.stat_id] = observation
+        self._by_prospect[observation.prospect_id][observation.stat_id] = observation
+
+    def remove_observation(self, stat_id: int):
+        """Remove a previously loaded stat row from its cohort arrays."""
+        observation = self._observations.pop(stat_id, None)
+        if observation is None:
+            return
+
+        series = self._by_prospect.get(observation.prospect_id)
+        if series is not None:
+            series.pop(stat_id, None)
+            if not series:
+                del self._by_prospect[observation.prospect_id]
+
+        cohort = observation.cohort
+        if cohort is None:
+            return
+
+        self._cohort_rows[cohort] -= 1
+        if self._cohort_rows[cohort] <= 0:
+            del self._cohort_rows[cohort]
+
+        for metric in COHORT_METRICS:
+            value = observation.values.get(metric)
+            key = (cohort, metric)
+            if value is None or key not in self._cohorts:
+                continue
+            self._cohorts[key] = _remove_values(
+                self._cohorts[key], np.asarray([value], dtype=np.float64)
+            )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_prospect_series(self, prospect_id: int) -> List[StatObservation]:
+        """All observations for a prospect in chronological order."""
+        series = self._by_prospect.get(prospect_id, {})
+        return sorted(series.values(), key=lambda o: (o.date_recorded, o.stat_id))
+
+    def latest_observation(
+        self,
+        prospect_id: int,
+        season: Optional[int] = None
+    ) -> Optional[StatObservation]:
+        """Most recent observation for a prospect, optionally within a season."""
+        series = self._by_prospect.get(prospect_id)
+        if not series:
+            return None
+        candidates = [
+            o for o in series.values()
+            if season is None or o.season == season
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda o: (o.date_recorded, o.stat_id))
+
+    def _peer_cohorts(
+        self,
+        position: str,
+        age: int,
+        level: str,
+        season: Optional[int]
+    ) -> List[CohortBase]:
+        ages = {age - 1, age, age + 1}
+        return [
+            cohort for cohort in self._cohort_rows
+            if cohort[0] == position and cohort[1] in ages and cohort[2] == level
+            and (season is None or cohort[3] == season)
+        ]
+
+    def _own_values(
+        self,
+        prospect_id: int,
+        cohorts: List[CohortBase],
+        metric: str
+    ) -> np.ndarray:
+        cohort_set = set(cohorts)
+        values = [
+            o.values[metric]
+            for o in self._by_prospect.get(prospect_id, {}).values()
+            if o.cohort in cohort_set and metric in o.values
+        ]
+        return np.asarray(values, dtype=np.float64)
+
+    def percentile(
+        self,
+        metric: str,
+        value: float,
+        position: str,
+        age: int,
+        level: str,
+        season: Optional[int] = None,
+        exclude_prospect_id: Optional[int] = None
+    ) -> Optional[float]:
+        """
+        Percentile of ``value`` among peers (age +/- 1) via binary search.
+
+        For higher-is-better metrics this is the share of peers below the value;
+        for lower-is-better metrics, the share above it.
+        """
+        cohorts = self._peer_cohorts(position, age, level, season)
+        arrays = [self._cohorts.get((c, metric)) for c in cohorts]
+        arrays = [a for a in arrays if a is not None and a.size]
+
+        own = (
+            self._own_values(exclude_prospect_id, cohorts, metric)
+            if exclude_prospect_id is not None
+            else np.empty(0)
+        )
+
+        total = sum(a.size for a in arrays) - own.size
+        if total <= 0:
+            return None
+
+        if COHORT_METRICS.get(metric) == "lower_better":
+            beaten = sum(a.size - np.searchsorted(a, value, side="right") for a in arrays)
+            beaten -= int(np.count_nonzero(own > value))
+        else:
+            beaten = sum(np.searchsorted(a, value, side="left") for a in arrays)
+            beaten -= int(np.count_nonzero(own < value))
+
+        return float(beaten) / total * 100
+
+    def peer_values(
+        self,
+        metric: str,
+        position: str,
+        age: int,
+        level: str,
+        season: Optional[int] = None,
+        exclude_prospect_id: Optional[int] = None
+    ) -> np.ndarray:
+        """Sorted peer values for a metric (own observations removed)."""
+        cohorts = self._peer_cohorts(position, age, level, season)
+        arrays = [self._cohorts.get((c, metric)) for c in cohorts]
+        arrays = [a for a in arrays if a is not None and a.size]
+        if not arrays:
+            return np.empty(0)
+
+        merged = arrays[0] if len(arrays) == 1 else np.sort(np.concatenate(arrays))
+        if exclude_prospect_id is not None:
+            merged = _remove_values(
+                merged, self._own_values(exclude_prospect_id, cohorts, metric)
+            )
+        return merged
+
+    def peer_row_count(
+        self,
+        position: str,
+        age: int,
+        level: str,
+        season: Optional[int] = None,
+        exclude_prospect_id: Optional[int] = None
+    ) -> int:
+        """Number of peer stat rows in the comparison group."""
+        cohorts = self._peer_cohorts(position, age, level, season)
+        count = sum(self._cohort_rows[c] for c in cohorts)
+        if exclude_prospect_id is not None:
+            cohort_set = set(cohorts)
+            count -= sum(
+                1 for o in self._by_prospect.get(exclude_prospect_id, {}).values()
+                if o.cohort in cohort_set
+            )
+        return count
+
+    def compare_to_peers(
+        self,
+        prospect_id: int,
+        season: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Percentiles of a prospect's latest stats against their peer cohort.
+
+        Returns None when the prospect has no stats in the store.
+        """
+        latest = self.latest_observation(prospect_id, season)
+        if latest is None or latest.age is None:
+            return None
+
+        position, age, level = latest.position, latest.age, latest.level
+        peer_count = self.peer_row_count(position, age, level, season, prospect_id)
+
+        comparison = {
+            "comparison_group": {
+                "position": position,
+                "age_range": f"{age-1}-{age+1}",
+                "level": level,
+                "peer_count": peer_count
+            },
+            "percentiles": {}
+        }
+        if peer_count == 0:
+            return comparison
+
+        for metric in COHORT_METRICS:
+            prospect_value = latest.values.get(metric)
+            if prospect_value is None:
+                continue
+
+            peers = self.peer_values(metric, position, age, level, season, prospect_id)
+            if peers.size == 0:
+                continue
+
+            percentile = self.percentile(
+                metric, prospect_value, position, age, level, season, prospect_id
+            )
+            comparison["percentiles"][metric] = {
+                "value": prospect_value,
+                "percentile": round(percentile, 1),
+                "peer_average": float(np.mean(peers)),
+                "peer_median": float(np.median(peers)),
+                "rating": rating_for_percentile(percentile)
+            }
+
+        return comparison
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Store size and freshness information."""
+        return {
+            "observations": len(self._observations),
+            "prospects": len(self._by_prospect),
+            "cohorts": len(self._cohort_rows),
+            "distributions": len(self._cohorts),
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+            "stale": self._stale,
+        }
+
+
+# Singleton instance
+peer_cohort_store = PeerCohortStore()
@@ -9,9 +9,10 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_
-from app.db.models import Prospect, ProspectStats, ScoutingGrades
+from app.db.models import Prospect, ProspectStats
 from app.services.roster_analysis_service import RosterAnalysisService
 from app.services.fantrax_api_service import FantraxAPIService
+from app.services.recommendation_engine import recommendation_engine
 from app.core.cache_manager import CacheManager
 import json
 import logging
@@ -77,17 +78,11 @@ class PersonalizedRecommendationService:
         @returns List of recommended prospects with fit scores
 
         @performance
-        - Response time: 1-2 seconds
-        - Cached for 30 minutes
+        - Scores the full prospect pool in one vectorized pass
+        - Cached per league and roster needs until the prospect snapshot reloads
 
         @since 1.0.0
         """
-        # Check cache first
-        cache_key = f"recommendations:{self.user_id}:{league_id}:{limit}"
-        cached_recs = await cache_manager.get(cache_key)
-        if cached_recs:
-            return json.loads(cached_recs)
-
         # Get team analysis
         analysis = await self.roster_analysis.analyze_team(league_id)
 
@@ -95,52 +90,24 @@ class PersonalizedRecommendationService:
         weaknesses = analysis.get("weaknesses", [])
         future_holes = analysis.get("future_holes", [])
         timeline = analysis.get("timeline", "balanced")
-        available_spots = analysis.get("available_spots", 0)
-
-        # Get target positions
-        target_positions = set(weaknesses)
-        for hole in future_holes:
-            target_positions.add(hole["position"])
-
-        # If no specific needs, recommend top prospects
-        if not target_positions:
-            target_positions = set(["SS", "CF", "SP"])  # High-value positions
 
         # Get ETA range based on timeline
         eta_range = self.TIMELINE_ETA_PREFERENCES.get(timeline, (2025, 2027))
 
-        # Query prospects matching criteria
-        prospects = await self._query_matching_prospects(
-            list(target_positions),
+        # Score the whole prospect pool against team needs (cached per roster)
+        scored_prospects = await recommendation_engine.recommend(
+            self.db,
+            league_id,
+            weaknesses,
+            future_holes,
             eta_range,
-            limit * 3  # Get extra for scoring and filtering
+            limit,
+            timeline=timeline
         )
 
-        # Score and rank prospects
-        scored_prospects = []
-        for prospect in prospects:
-            fit_score = await self._calculate_fit_score(
-                prospect,
-                analysis,
-                weaknesses,
-                future_holes
-            )
-
-            if fit_score > 0:  # Only include prospects with positive fit
-                scored_prospects.append({
-                    "prospect": prospect,
-                    "fit_score": fit_score
-                })
-
-        # Sort by fit score
-        scored_prospects.sort(key=lambda x: x["fit_score"], reverse=True)
-
         # Format recommendations
         recommendations = []
-        for item in scored_prospects[:limit]:
-            prospect = item["prospect"]
-            fit_score = item["fit_score"]
-
+        for prospect, fit_score in scored_prospects:
             recommendation = {
                 "prospect_id": prospect.id,
                 "name": prospect.name,
@@ -159,13 +126,6 @@ class PersonalizedRecommendationService:
             }
             recommendations.append(recommendation)
 
-        # Cache the results
-        await cache_manager.set(
-            cache_key,
-            json.dumps(recommendations),
-            ttl=1800  # 30 minutes cache
-        )
-
         return recommendations
 
     async def analyze_trade(self, trade_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -232,115 +192,6 @@ class PersonalizedRecommendationService:
             }
         }
 
-    async def _query_matching_prospects(
-        self,
-        positions: List[str],
-        eta_range: Tuple[int, int],
-        limit: int
-    ) -> List[Prospect]:
-        """
-        Query prospects matching position and ETA criteria
-
-        @param positions - Target positions
-        @param eta_range - ETA year range (min, max)
-        @param limit - Maximum prospects to return
-
-        @returns List of matching prospects
-
-        @since 1.0.0
-        """
-        stmt = (
-            select(Prospect)
-            .where(
-                and_(
-                    Prospect.position.in_(positions),
-                    Prospect.eta_year >= eta_range[0],
-                    Prospect.eta_year <= eta_range[1]
-                )
-            )
-            .limit(limit)
-        )
-
-        result = await self.db.execute(stmt)
-        prospects = result.scalars().all()
-
-        return list(prospects)
-
-    async def _calculate_fit_score(
-        self,
-        prospect: Prospect,
-        analysis: Dict[str, Any],
-        weaknesses: List[str],
-        future_holes: List[Dict[str, Any]]
-    ) -> float:
-        """
-        Calculate how well a prospect fits team needs
-
-        @param prospect - Prospect to evaluate
-        @param analysis - Team analysis data
-        @param weaknesses - Current weak positions
-        @param future_holes - Projected future needs
-
-        @returns Fit score (0-100)
-
-        @since 1.0.0
-        """
-        score = 0.0
-
-        # Base score for matching current weakness (30 points)
-        if prospect.position in weaknesses:
-            score += 30.0
-
-        # Score for matching future holes (40 points max)
-        for hole in future_holes:
-            if hole["position"] == prospect.position:
-                # Weight by urgency and severity
-                years_until = hole["year"] - datetime.now().year
-                urgency_multiplier = max(0.5, 1.5 - (years_until * 0.2))
-
-                severity_scores = {"high": 15, "medium": 10, "low": 5}
-                severity_score = severity_scores.get(hole["severity"], 0)
-
-                score += severity_score * urgency_multiplier
-
-        # Score for timeline match (20 points)
-        timeline = analysis.get("timeline", "balanced")
-        eta_range = self.TIMELINE_ETA_PREFERENCES.get(timeline, (2025, 2027))
-
-        if prospect.eta_year:
-            if eta_range[0] <= prospect.eta_year <= eta_range[1]:
-                score += 20.0
-            elif eta_range[0] - 1 <= prospect.eta_year <= eta_range[1] + 1:
-                score += 10.0  # Partial credit for close match
-
-        # Bonus for high-value positions (10 points)
-        high_value_positions = ["SS", "CF", "SP", "C"]
-        if prospect.position in high_value_positions:
-            score += 10.0
-
-        # Get scouting grades to adjust score
-        stmt = select(ScoutingGrades).where(
-            ScoutingGrades.prospect_id == prospect.id
-        ).limit(1)
-        result = await self.db.execute(stmt)
-        grades = result.scalar_one_or_none()
-
-        if grades:
-            # Adjust based on overall grade (±10 points)
-            grade_adjustments = {
-                "80": 10,
-                "70": 7,
-                "60": 5,
-                "55": 3,
-                "50": 0,
-                "45": -3,
-                "40": -5
-            }
-            overall_grade = str(grades.overall_future_value)
-            score += grade_adjustments.get(overall_grade, 0)
-
-        return min(100.0, max(0.0, score))
-
     def _generate_recommendation_reason(
         self,
         prospect: Prospect,
@@ -681,65 +532,30 @@ class PersonalizedRecommendationService:
 
         @since 4.4.0
         """
-        candidates = []
         weaknesses = analysis.get("weaknesses", [])
         timeline = analysis.get("timeline", "balanced")
+        eta_range = self.TIMELINE_ETA_PREFERENCES.get(timeline, (2025, 2027))
 
-        # Query prospects with recent performance dips or injury returns
-        stmt = select(Prospect).where(
-            Prospect.position.in_(weaknesses) if weaknesses else Prospect.id.isnot(None)
-        ).limit(50)
-
-        result = await self.db.execute(stmt)
-        prospects = result.scalars().all()
-
-        for prospect in prospects:
-            # Detect buy-low signals
-            buy_low_score = 0
-            reasons = []
-
-            # Recent injury (placeholder - would check injury history)
-            if hasattr(prospect, 'injury_status') and prospect.injury_status == "recovering":
-                buy_low_score += 30
-                reasons.append("Returning from injury")
-
-            # Performance dip (placeholder - would check recent stats trend)
-            # For now, use a simple heuristic
-            if prospect.overall_grade and prospect.overall_grade < 55:
-                buy_low_score += 20
-                reasons.append("Recent performance concerns")
-
-            # Age-based value dip
-            if prospect.age and prospect.age >= 24:
-                buy_low_score += 15
-                reasons.append("Age-related discount")
-
-            # Timeline fit for team
-            eta_range = self.TIMELINE_ETA_PREFERENCES.get(timeline, (2025, 2027))
-            if prospect.eta_year and eta_range[0] <= prospect.eta_year <= eta_range[1]:
-                buy_low_score += 20
-                reasons.append("Timeline matches team window")
-
-            # Position need match
-            if prospect.position in weaknesses:
-                buy_low_score += 25
-                reasons.append(f"Fills {prospect.position} need")
-
-            if buy_low_score >= 50:
-                candidates.append({
-                    "prospect_id": prospect.id,
-                    "name": prospect.name,
-                    "position": prospect.position,
-                    "eta_year": prospect.eta_year,
-                    "buy_low_score": buy_low_score,
-                    "reasons": reasons,
-                    "recommendation": "Strong buy-low target" if buy_low_score >= 70 else "Consider buying low"
-                })
-
-        # Sort by score
-        candidates.sort(key=lambda x: x["buy_low_score"], reverse=True)
+        # Score buy-low signals across the whole prospect pool
+        scored = await recommendation_engine.buy_low(
+            self.db,
+            analysis.get("league_id", ""),
+            weaknesses,
+            eta_range
+        )
 
-        return candidates[:10]
+        return [
+            {
+                "prospect_id": prospect.id,
+                "name": prospect.name,
+                "position": prospect.position,
+                "eta_year": prospect.eta_year,
+                "buy_low_score": buy_low_score,
+                "reasons": reasons,
+                "recommendation": "Strong buy-low target" if buy_low_score >= 70 else "Consider buying low"
+            }
+            for prospect, buy_low_score, reasons in scored
+        ]
 
     async def _find_sell_high_opportunities(self, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
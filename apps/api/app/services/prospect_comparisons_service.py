@@ -408,8 +408,9 @@ class ProspectComparisonsService:
                     stats.on_base_pct or 0,
                     stats.slugging_pct or 0,
                     stats.wrc_plus or 100,
-                    stats.strikeout_rate or 20,
-                    stats.walk_rate or 8
+                    # K% and BB% per 100 plate appearances (AB + BB)
+                    ProspectComparisonsService._per_100_pa(stats, stats.strikeouts) or 20,
+                    ProspectComparisonsService._per_100_pa(stats, stats.walks) or 8
                 ])
             else:
                 features.extend([0, 0, 0, 100, 20, 8])
@@ -418,8 +419,8 @@ class ProspectComparisonsService:
                 features.extend([
                     stats.era or 4.0,
                     stats.whip or 1.3,
-                    stats.k_per_9 or 8,
-                    stats.bb_per_9 or 3
+                    stats.strikeouts_per_nine or 8,
+                    stats.walks_per_nine or 3
                 ])
             else:
                 features.extend([4.0, 1.3, 8, 3])
@@ -437,12 +438,20 @@ class ProspectComparisonsService:
 
         # ML prediction
         if ml_pred:
-            features.append(ml_pred.success_probability or 0.5)
+            features.append(ml_pred.prediction_value or 0.5)
         else:
             features.append(0.5)
 
         return np.array(features)
 
+    @staticmethod
+    def _per_100_pa(stats: ProspectStats, count: Optional[int]) -> Optional[float]:
+        """Rate per 100 plate appearances, approximated as at-bats plus walks."""
+        plate_appearances = (stats.at_bats or 0) + (stats.walks or 0)
+        if count is None or plate_appearances == 0:
+            return None
+        return count / plate_appearances * 100
+
     @staticmethod
     def _calculate_similarity(features1: np.ndarray, features2: np.ndarray) -> float:
         """Calculate cosine similarity between two feature vectors."""
@@ -504,8 +513,8 @@ class ProspectComparisonsService:
             formatted["pitching"] = {
                 "era": stats.era,
                 "whip": stats.whip,
-                "k_9": stats.k_per_9,
-                "bb_9": stats.bb_per_9
+                "k_9": stats.strikeouts_per_nine,
+                "bb_9": stats.walks_per_nine
             }
 
         return formatted
@@ -0,0 +1,243 @@
+"""
+Streaming source for prospect ranking exports.
+
+Dynasty rank depends on every prospect's score, so the export runs in two
+passes over the database instead of loading ORM objects with their stats,
+grades and predictions:
+
+1. A server-side cursor streams the flat scoring rows in ``yield_per``
+   partitions, keeping only (prospect id, dynasty score) for each.
+2. Ids are ranked with NumPy, then export rows are fetched one batch of ids
+   at a time and yielded in rank order.
+
+Memory is bounded by the batch size plus two numbers per prospect.
+"""
+
+import logging
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import case, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import AsyncSessionLocal
+from app.db.models import MLPrediction, Prospect, ProspectStats, ScoutingGrades
+from app.services.dynasty_ranking_service import DynastyRankingService
+
+logger = logging.getLogger(__name__)
+
+GRADE_SOURCES = ['Fangraphs', 'MLB Pipeline', 'Baseball America']
+PITCHER_POSITIONS = ['SP', 'RP']
+
+
+def export_query(filters: Sequence[Any] = (), ids: Optional[Sequence[int]] = None):
+    """
+    Flat query with one row per prospect and everything the export needs.
+
+    Args:
+        filters: SQLAlchemy criteria on Prospect
+        ids: Restrict every subquery to these prospect ids
+
+    Returns:
+        Select ordered by prospect id
+    """
+    stats_query = (
+        select(
+            ProspectStats.id,
+            ProspectStats.prospect_id,
+            ProspectStats.batting_avg,
+            ProspectStats.on_base_pct,
+            ProspectStats.slugging_pct,
+            ProspectStats.wrc_plus,
+            ProspectStats.era,
+            ProspectStats.whip,
+            ProspectStats.strikeouts_per_nine,
+        )
+        .distinct(ProspectStats.prospect_id)
+        .order_by(ProspectStats.prospect_id, ProspectStats.date_recorded.desc())
+    )
+    grade_priority = case(
+        {source: rank for rank, source in enumerate(GRADE_SOURCES)},
+        value=ScoutingGrades.source
+    )
+    grade_query = (
+        select(ScoutingGrades.prospect_id, ScoutingGrades.overall, ScoutingGrades.future_value)
+        .where(ScoutingGrades.source.in_(GRADE_SOURCES))
+        .distinct(ScoutingGrades.prospect_id)
+        .order_by(ScoutingGrades.prospect_id, grade_priority)
+    )
+    ml_query = (
+        select(MLPrediction.prospect_id, MLPrediction.prediction_value, MLPrediction.confidence_score)
+        .where(MLPrediction.prediction_type == 'success_rating')
+        .distinct(MLPrediction.prospect_id)
+        .order_by(MLPrediction.prospect_id, MLPrediction.created_at.desc())
+    )
+
+    if ids is not None:
+        stats_query = stats_query.where(ProspectStats.prospect_id.in_(ids))
+        grade_query = grade_query.where(ScoutingGrades.prospect_id.in_(ids))
+        ml_query = ml_query.where(MLPrediction.prospect_id.in_(ids))
+
+    stats = stats_query.subquery('latest_stats')
+    grade = grade_query.subquery('best_grade')
+    ml = ml_query.subquery('ml_prediction')
+
+    query = (
+        select(
+            Prospect.id,
+            Prospect.name,
+            Prospect.position,
+            Prospect.organization,
+            Prospect.level,
+            Prospect.age,
+            Prospect.eta_year,
+            stats.c.id.label('stats_id'),
+            stats.c.batting_avg,
+            stats.c.on_base_pct,
+            stats.c.slugging_pct,
+            stats.c.wrc_plus,
+            stats.c.era,
+            stats.c.whip,
+            stats.c.strikeouts_per_nine,
+            grade.c.overall,
+            grade.c.future_value,
+            ml.c.prediction_value,
+            ml.c.confidence_score,
+        )
+        .outerjoin(stats, stats.c.prospect_id == Prospect.id)
+        .outerjoin(grade, grade.c.prospect_id == Prospect.id)
+        .outerjoin(ml, ml.c.prospect_id == Prospect.id)
+        .order_by(Prospect.id)
+    )
+
+    criteria = list(filters)
+    if ids is not None:
+        criteria.append(Prospect.id.in_(ids))
+    if criteria:
+        query = query.where(*criteria)
+    return query
+
+
+def score_row(row) -> Dict[str, Any]:
+    """Dynasty score components for one flat export row."""
+    prospect = SimpleNamespace(age=row.age, position=row.position, eta_year=row.eta_year)
+
+    ml_prediction = None
+    if row.prediction_value is not None:
+        ml_prediction = SimpleNamespace(
+            prediction_type='success_rating',
+            prediction_value=row.prediction_value,
+            confidence_score=row.confidence_score
+        )
+
+    latest_stats = None
+    if row.stats_id is not None:
+        latest_stats = SimpleNamespace(
+            batting_avg=row.batting_avg,
+            on_base_pct=row.on_base_pct,
+            slugging_pct=row.slugging_pct,
+            wrc_plus=row.wrc_plus,
+            era=row.era,
+            whip=row.whip,
+            strikeouts_per_nine=row.strikeouts_per_nine
+        )
+
+    # The scorer reads the 20-80 overall grade as ``overall_grade``
+    scouting_grade = SimpleNamespace(overall_grade=row.overall) if row.overall is not None else None
+
+    return DynastyRankingService.calculate_dynasty_score(
+        prospect=prospect,
+        ml_prediction=ml_prediction,
+        latest_stats=latest_stats,
+        scouting_grade=scouting_grade
+    )
+
+
+def export_dict(row, scores: Dict[str, Any], rank: int) -> Dict[str, Any]:
+    """Export dict for one ranked row, in the shape ExportService expects."""
+    prospect_dict = {
+        'dynasty_rank': rank,
+        'name': row.name,
+        'position': row.position,
+        'organization': row.organization,
+        'level': row.level,
+        'age': row.age,
+        'eta_year': row.eta_year,
+        'dynasty_score': scores['total_score'],
+        'ml_score': scores['ml_score'],
+        'scouting_score': scores['scouting_score'],
+        'confidence_level': scores['confidence_level']
+    }
+
+    if row.stats_id is not None:
+        if row.position not in PITCHER_POSITIONS:
+            prospect_dict['batting_avg'] = row.batting_avg
+            prospect_dict['on_base_pct'] = row.on_base_pct
+            prospect_dict['slugging_pct'] = row.slugging_pct
+        else:
+            prospect_dict['era'] = row.era
+            prospect_dict['whip'] = row.whip
+
+    if row.overall is not None or row.future_value is not None:
+        prospect_dict['overall_grade'] = row.overall
+        prospect_dict['future_value'] = row.future_value
+
+    return prospect_dict
+
+
+class ProspectExportStream:
+    """Yields ranked export rows in bounded batches."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        batch_size: int = 500
+    ):
+        # The stream outlives the request handler, so it owns its session
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    async def _rank(self, session: AsyncSession, filters: Sequence[Any]) -> np.ndarray:
+        """Stream the scoring pass and return prospect ids in rank order."""
+        ids: List[int] = []
+        scores: List[float] = []
+
+        query = export_query(filters).execution_options(yield_per=self.batch_size)
+        result = await session.stream(query)
+        async for partition in result.partitions():
+            for row in partition:
+                ids.append(row.id)
+                scores.append(score_row(row)['total_score'])
+
+        if not ids:
+            return np.empty(0, dtype=np.int64)
+
+        # Stable sort keeps id order for ties, matching rank_prospects
+        order = np.argsort(-np.asarray(scores, dtype=np.float64), kind='stable')
+        return np.asarray(ids, dtype=np.int64)[order]
+
+    async def batches(self, filters: Sequence[Any] = ()) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield lists of export dicts, at most ``batch_size`` long, in rank order.
+
+        Args:
+            filters: SQLAlchemy criteria on Prospect
+        """
+        async with self.session_factory() as session:
+            ranked_ids = await self._rank(session, filters)
+            logger.info(f"Streaming export of {len(ranked_ids)} prospects")
+
+            for start in range(0, len(ranked_ids), self.batch_size):
+                chunk = ranked_ids[start:start + self.batch_size].tolist()
+                result = await session.execute(export_query(filters, ids=chunk))
+                rows = {row.id: row for row in result.all()}
+
+                batch = []
+                for offset, prospect_id in enumerate(chunk):
+                    row = rows.get(prospect_id)
+                    # Deleted between passes
+                    if row is None:
+                        continue
+                    batch.append(export_dict(row, score_row(row), start + offset + 1))
+                yield batch
@@ -44,15 +44,12 @@ class ProspectFeatureExtractor:
                 return cached_features
 
             # Extract features from database
-            features = await self._extract_raw_features(prospect_id, db)
+            processed_features = self.extract_features(prospect_id, db)
 
-            if not features:
+            if not processed_features:
                 logger.warning(f"No features found for prospect {prospect_id}")
                 return None
 
-            # Preprocess features for ML model
-            processed_features = self._preprocess_features(features)
-
             # Cache the processed features
             await cache_manager.cache_prospect_features(
                 prospect_id=prospect_id,
@@ -67,7 +64,23 @@ class ProspectFeatureExtractor:
             logger.error(f"Failed to extract features for prospect {prospect_id}: {e}")
             return None
 
-    async def _extract_raw_features(
+    def extract_features(
+        self,
+        prospect_id: int,
+        db: Session
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract and preprocess features without touching the cache.
+
+        Blocks on sync ORM queries, so async callers that can afford it
+        should run this in a worker thread with a session of its own.
+        """
+        features = self._extract_raw_features(prospect_id, db)
+        if not features:
+            return None
+        return self._preprocess_features(features)
+
+    def _extract_raw_features(
         self,
         prospect_id: int,
         db: Session
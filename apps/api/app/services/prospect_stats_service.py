@@ -9,6 +9,7 @@ import logging
 
 from app.db.models import Prospect, ProspectStats
 from app.core.cache_manager import cache_manager
+from app.services.peer_cohort_service import peer_cohort_store
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +103,10 @@ class ProspectStatsService:
             "progression": ProspectStatsService._calculate_progression(stats_records)
         }
 
+        # Peer percentiles for the latest stats (binary search on cohort arrays)
+        await peer_cohort_store.ensure_fresh(db)
+        result["peer_comparison"] = peer_cohort_store.compare_to_peers(prospect_id, season)
+
         # Cache for 6 hours
         await cache_manager.cache_prospect_features(
             cache_key, result, ttl=21600
@@ -0,0 +1,444 @@
+"""
+Vectorized Recommendation Engine
+
+Holds a compact column snapshot of the whole prospect pool and scores every
+prospect against a team's needs in one NumPy pass. The top-k is taken with
+``argpartition``, so only the k winners are sorted and formatted.
+
+Results are cached per (league, roster key), where the roster key hashes the
+parts of the roster analysis that drive scoring (weaknesses, future holes,
+timeline). Unchanged rosters are served from the cache until the snapshot is
+reloaded.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import case, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import MLPrediction, Prospect, ScoutingGrades
+
+logger = logging.getLogger(__name__)
+
+# Position codes follow the prospects.valid_position constraint; anything
+# else maps to the trailing "other" slot of the needs vector
+POSITIONS = ("C", "1B", "2B", "3B", "SS", "LF", "CF", "RF", "DH", "SP", "RP")
+POSITION_CODES = {position: code for code, position in enumerate(POSITIONS)}
+OTHER_POSITION = len(POSITIONS)
+
+HIGH_VALUE_POSITIONS = ("SS", "CF", "SP", "C")
+
+# Fit score components (same weights as the per-prospect scorer)
+WEAKNESS_POINTS = 30.0
+HIGH_VALUE_POINTS = 10.0
+TIMELINE_MATCH_POINTS = 20.0
+TIMELINE_NEAR_POINTS = 10.0
+HOLE_SEVERITY_POINTS = {"high": 15, "medium": 10, "low": 5}
+
+# Future value grade -> fit adjustment; other grades adjust by 0
+GRADE_ADJUSTMENTS = {80: 10, 70: 7, 60: 5, 55: 3, 50: 0, 45: -3, 40: -5}
+_GRADE_TABLE = np.zeros(81, dtype=np.float32)
+for _grade, _adjustment in GRADE_ADJUSTMENTS.items():
+    _GRADE_TABLE[_grade] = _adjustment
+
+# Scouting sources in priority order when a prospect has several grades
+GRADE_SOURCE_PRIORITY = ("Fangraphs", "MLB Pipeline", "Baseball America")
+
+# Dynasty value only breaks ties between equal fit scores
+TIEBREAK_WEIGHT = 1e-3
+
+SNAPSHOT_TTL = 900  # seconds
+RESULT_CACHE_MAX = 2048
+
+
+@dataclass(frozen=True)
+class ProspectRecord:
+    """Prospect fields needed to format a recommendation."""
+
+    id: int
+    name: str
+    position: str
+    organization: Optional[str]
+    eta_year: Optional[int]
+    age: Optional[int]
+
+
+@dataclass
+class ProspectSnapshot:
+    """Column arrays for the whole prospect pool (one row per prospect)."""
+
+    ids: np.ndarray              # int64
+    position_codes: np.ndarray   # int8 index into POSITIONS (OTHER_POSITION if unknown)
+    eta: np.ndarray              # float32, NaN when unknown
+    age: np.ndarray              # float32, NaN when unknown
+    future_value: np.ndarray     # float32 scouting FV (20-80), NaN when ungraded
+    ml_score: np.ndarray         # float32 success_rating (0-1), NaN when unscored
+    dynasty_value: np.ndarray    # float32 0-100
+    names: List[str]
+    positions: List[str]
+    organizations: List[Optional[str]]
+    version: int
+    loaded_at: float
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def record(self, row: int) -> ProspectRecord:
+        return ProspectRecord(
+            id=int(self.ids[row]),
+            name=self.names[row],
+            position=self.positions[row],
+            organization=self.organizations[row],
+            eta_year=None if np.isnan(self.eta[row]) else int(self.eta[row]),
+            age=None if np.isnan(self.age[row]) else int(self.age[row]),
+        )
+
+
+def dynasty_values(
+    ml_score: np.ndarray,
+    future_value: np.ndarray,
+    age: np.ndarray,
+    eta: np.ndarray,
+    current_year: int
+) -> np.ndarray:
+    """
+    Vectorized dynasty value (0-100) using DynastyRankingService weights.
+
+    The performance-stats component is left out, since it needs the full
+    stat history; missing inputs contribute nothing, as in the scalar version.
+    """
+    ml = np.nan_to_num(ml_score * 100 * 0.35)
+    scouting = np.nan_to_num((future_value - 20) / 60 * 100 * 0.25)
+    age_score = np.nan_to_num(np.clip((25 - age) * 10, 0, 100) * 0.20)
+    years_to_majors = np.maximum(0, eta - current_year)
+    eta_score = np.nan_to_num(np.maximum(0, 100 - years_to_majors * 20) * 0.05)
+    return (ml + scouting + age_score + eta_score).astype(np.float32)
+
+
+def build_snapshot(rows: Sequence[Tuple], version: int = 0, current_year: Optional[int] = None) -> ProspectSnapshot:
+    """
+    Build a snapshot from (id, name, position, organization, eta_year, age,
+    future_value, ml_score) rows.
+    """
+    current_year = current_year or datetime.now().year
+    columns = list(zip(*rows)) if rows else [()] * 8
+    ids, names, positions, organizations, eta, age, future_value, ml_score = columns
+
+    def floats(values) -> np.ndarray:
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float32)
+
+    eta_arr = floats(eta)
+    age_arr = floats(age)
+    fv_arr = floats(future_value)
+    ml_arr = floats(ml_score)
+
+    return ProspectSnapshot(
+        ids=np.array(ids, dtype=np.int64),
+        position_codes=np.array(
+            [POSITION_CODES.get(p, OTHER_POSITION) for p in positions], dtype=np.int8
+        ),
+        eta=eta_arr,
+        age=age_arr,
+        future_value=fv_arr,
+        ml_score=ml_arr,
+        dynasty_value=dynasty_values(ml_arr, fv_arr, age_arr, eta_arr, current_year),
+        names=list(names),
+        positions=list(positions),
+        organizations=list(organizations),
+        version=version,
+        loaded_at=time.monotonic(),
+    )
+
+
+def needs_vector(
+    weaknesses: Sequence[str],
+    future_holes: Sequence[Dict[str, Any]],
+    current_year: Optional[int] = None
+) -> np.ndarray:
+    """
+    Per-position need points (weakness, future holes, high-value bonus).
+
+    Returns:
+        float32 array of length len(POSITIONS) + 1, indexed by position code
+    """
+    current_year = current_year or datetime.now().year
+    needs = np.zeros(len(POSITIONS) + 1, dtype=np.float32)
+
+    for position in set(weaknesses):
+        if position in POSITION_CODES:
+            needs[POSITION_CODES[position]] += WEAKNESS_POINTS
+
+    for hole in future_holes:
+        code = POSITION_CODES.get(hole.get("position"))
+        if code is None:
+            continue
+        years_until = hole.get("year", current_year) - current_year
+        urgency_multiplier = max(0.5, 1.5 - (years_until * 0.2))
+        needs[code] += HOLE_SEVERITY_POINTS.get(hole.get("severity"), 0) * urgency_multiplier
+
+    for position in HIGH_VALUE_POSITIONS:
+        needs[POSITION_CODES[position]] += HIGH_VALUE_POINTS
+
+    return needs
+
+
+def timeline_points(eta: np.ndarray, eta_range: Tuple[int, int]) -> np.ndarray:
+    """Full credit inside the ETA window, partial within a year of it, none if unknown."""
+    low, high = eta_range
+    inside = (eta >= low) & (eta <= high)
+    near = (eta >= low - 1) & (eta <= high + 1)
+    return np.where(inside, TIMELINE_MATCH_POINTS, np.where(near, TIMELINE_NEAR_POINTS, 0.0)).astype(np.float32)
+
+
+def grade_adjustments(future_value: np.ndarray) -> np.ndarray:
+    """Fit adjustment per prospect from the scouting FV lookup table."""
+    graded = ~np.isnan(future_value)
+    index = np.clip(np.nan_to_num(future_value), 0, len(_GRADE_TABLE) - 1).astype(np.intp)
+    return np.where(graded, _GRADE_TABLE[index], 0.0).astype(np.float32)
+
+
+def fit_scores(snapshot: ProspectSnapshot, needs: np.ndarray, eta_range: Tuple[int, int]) -> np.ndarray:
+    """Fit score (0-100) for every prospect in the snapshot."""
+    scores = needs[snapshot.position_codes] + timeline_points(snapshot.eta, eta_range)
+    scores += grade_adjustments(snapshot.future_value)
+    return np.clip(scores, 0.0, 100.0)
+
+
+def top_k(keys: np.ndarray, k: int, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Indices of the k largest keys (optionally among ``mask``), best first.
+
+    Uses argpartition, so only the k selected rows are sorted.
+    """
+    candidates = np.flatnonzero(mask) if mask is not None else np.arange(len(keys))
+    if k <= 0 or len(candidates) == 0:
+        return np.empty(0, dtype=np.intp)
+    if len(candidates) > k:
+        part = np.argpartition(-keys[candidates], k - 1)[:k]
+        candidates = candidates[part]
+    return candidates[np.argsort(-keys[candidates], kind="stable")]
+
+
+def roster_key(
+    weaknesses: Sequence[str],
+    future_holes: Sequence[Dict[str, Any]],
+    timeline: str,
+    strengths: Sequence[str] = ()
+) -> str:
+    """Stable hash of the roster analysis fields that drive scoring."""
+    payload = json.dumps({
+        "weaknesses": sorted(weaknesses),
+        "strengths": sorted(strengths),
+        "future_holes": sorted(
+            (h.get("position"), h.get("year"), h.get("severity")) for h in future_holes
+        ),
+        "timeline": timeline,
+    }, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+class RecommendationEngine:
+    """Full-pool recommendation scorer with a shared snapshot and result cache."""
+
+    def __init__(self, snapshot_ttl: float = SNAPSHOT_TTL, max_results: int = RESULT_CACHE_MAX):
+        self.snapshot_ttl = snapshot_ttl
+        self.max_results = max_results
+        self._snapshot: Optional[ProspectSnapshot] = None
+        self._version = 0
+        self._lock = asyncio.Lock()
+        self._results: "OrderedDict[Tuple, Tuple[int, Any]]" = OrderedDict()
+        self._metrics = {"hits": 0, "misses": 0, "snapshot_loads": 0}
+
+    @staticmethod
+    def _snapshot_query():
+        """One row per prospect with its preferred FV grade and latest ML score."""
+        source_rank = case(
+            {source: rank for rank, source in enumerate(GRADE_SOURCE_PRIORITY)},
+            value=ScoutingGrades.source,
+            else_=len(GRADE_SOURCE_PRIORITY)
+        )
+        grades = (
+            select(ScoutingGrades.prospect_id, ScoutingGrades.future_value)
+            .where(ScoutingGrades.future_value.isnot(None))
+            .distinct(ScoutingGrades.prospect_id)
+            .order_by(ScoutingGrades.prospect_id, source_rank, ScoutingGrades.id.desc())
+            .subquery()
+        )
+        predictions = (
+            select(MLPrediction.prospect_id, MLPrediction.prediction_value)
+            .where(MLPrediction.prediction_type == "success_rating")
+            .distinct(MLPrediction.prospect_id)
+            .order_by(MLPrediction.prospect_id, MLPrediction.updated_at.desc())
+            .subquery()
+        )
+        return (
+            select(
+                Prospect.id,
+                Prospect.name,
+                Prospect.position,
+                Prospect.organization,
+                Prospect.eta_year,
+                Prospect.age,
+                grades.c.future_value,
+                predictions.c.prediction_value,
+            )
+            .outerjoin(grades, grades.c.prospect_id == Prospect.id)
+            .outerjoin(predictions, predictions.c.prospect_id == Prospect.id)
+            .order_by(Prospect.id)
+        )
+
+    async def snapshot(self, db: AsyncSession) -> ProspectSnapshot:
+        """Current snapshot, reloading it once the TTL has passed."""
+        current = self._snapshot
+        if current is not None and time.monotonic() - current.loaded_at < self.snapshot_ttl:
+            return current
+
+        async with self._lock:
+            current = self._snapshot
+            if current is not None and time.monotonic() - current.loaded_at < self.snapshot_ttl:
+                return current
+
+            start = time.perf_counter()
+            result = await db.execute(self._snapshot_query())
+            self._version += 1
+            self._snapshot = build_snapshot(result.all(), version=self._version)
+            self._results.clear()
+            self._metrics["snapshot_loads"] += 1
+            logger.info(
+                f"Loaded recommendation snapshot v{self._version}: {len(self._snapshot)} prospects "
+                f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+            return self._snapshot
+
+    def invalidate(self):
+        """Force a snapshot reload (and drop cached results) on next use."""
+        self._snapshot = None
+        self._results.clear()
+
+    def _cached(self, key: Tuple, version: int) -> Optional[Any]:
+        entry = self._results.get(key)
+        if entry is None or entry[0] != version:
+            self._metrics["misses"] += 1
+            return None
+        self._results.move_to_end(key)
+        self._metrics["hits"] += 1
+        return entry[1]
+
+    def _store(self, key: Tuple, version: int, value: Any):
+        self._results[key] = (version, value)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+
+    async def recommend(
+        self,
+        db: AsyncSession,
+        league_id: str,
+        weaknesses: Sequence[str],
+        future_holes: Sequence[Dict[str, Any]],
+        eta_range: Tuple[int, int],
+        limit: int,
+        timeline: str = "balanced"
+    ) -> List[Tuple[ProspectRecord, float]]:
+        """
+        Top prospects for a team's needs across the whole pool.
+
+        Args:
+            db: Database session (used only to load the snapshot)
+            league_id: Fantrax league ID (cache scope)
+            weaknesses: Current weak positions
+            future_holes: Projected holes with position, year and severity
+            eta_range: Preferred ETA window for the team timeline
+            limit: Number of recommendations
+            timeline: Team timeline (part of the cache key)
+
+        Returns:
+            List of (prospect record, fit score) best first, positive fits only
+        """
+        snapshot = await self.snapshot(db)
+        key = ("recommend", league_id, roster_key(weaknesses, future_holes, timeline), tuple(eta_range), limit)
+        cached = self._cached(key, snapshot.version)
+        if cached is not None:
+            return cached
+
+        scores = fit_scores(snapshot, needs_vector(weaknesses, future_holes), eta_range)
+        ranking_keys = scores + TIEBREAK_WEIGHT * snapshot.dynasty_value
+        rows = top_k(ranking_keys, limit, mask=scores > 0)
+
+        recommendations = [(snapshot.record(row), float(scores[row])) for row in rows]
+        self._store(key, snapshot.version, recommendations)
+        return recommendations
+
+    async def buy_low(
+        self,
+        db: AsyncSession,
+        league_id: str,
+        weaknesses: Sequence[str],
+        eta_range: Tuple[int, int],
+        limit: int = 10,
+        min_score: int = 50
+    ) -> List[Tuple[ProspectRecord, int, List[str]]]:
+        """
+        Buy-low candidates across the whole pool (at weakness positions if any).
+
+        Returns:
+            List of (prospect record, buy-low score, reasons) best first
+        """
+        snapshot = await self.snapshot(db)
+        key = ("buy_low", league_id, roster_key(weaknesses, (), ""), tuple(eta_range), limit, min_score)
+        cached = self._cached(key, snapshot.version)
+        if cached is not None:
+            return cached
+
+        weak_codes = [POSITION_CODES[p] for p in set(weaknesses) if p in POSITION_CODES]
+        at_need = np.isin(snapshot.position_codes, weak_codes)
+        grade_dip = snapshot.future_value < 55
+        age_discount = snapshot.age >= 24
+        in_window = (snapshot.eta >= eta_range[0]) & (snapshot.eta <= eta_range[1])
+
+        scores = (
+            20 * grade_dip + 15 * age_discount + 20 * in_window + 25 * at_need
+        ).astype(np.int32)
+        eligible = scores >= min_score
+        if weak_codes:
+            eligible &= at_need
+
+        rows = top_k(scores + TIEBREAK_WEIGHT * snapshot.dynasty_value, limit, mask=eligible)
+
+        candidates = []
+        for row in rows:
+            record = snapshot.record(row)
+            reasons = []
+            if grade_dip[row]:
+                reasons.append("Recent performance concerns")
+            if age_discount[row]:
+                reasons.append("Age-related discount")
+            if in_window[row]:
+                reasons.append("Timeline matches team window")
+            if at_need[row]:
+                reasons.append(f"Fills {record.position} need")
+            candidates.append((record, int(scores[row]), reasons))
+
+        self._store(key, snapshot.version, candidates)
+        return candidates
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            **self._metrics,
+            "snapshot_version": self._version,
+            "snapshot_size": len(self._snapshot) if self._snapshot is not None else 0,
+            "cached_results": len(self._results),
+        }
+
+
+# Global recommendation engine instance
+recommendation_engine = RecommendationEngine()
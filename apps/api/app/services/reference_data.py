@@ -0,0 +1,507 @@
+"""
+In-process cache of small, rarely changing reference data.
+
+Two kinds of reference data live here:
+
+- Static vocabularies (levels, organizations, positions, MiLB sport ids)
+  are integer-coded module constants. They need no database and are safe to
+  import from the API, services and scripts alike.
+- Database-backed tables (prospect id maps, park factors, league factors)
+  are loaded into a ReferenceSnapshot: sorted, read-only numpy arrays that
+  answer lookups by binary search with no database round trip.
+
+The module-level ``reference_data`` singleton holds the current snapshot.
+A refresh first reads a cheap fingerprint (row count and latest
+``updated_at`` of each table) and only reloads when that fingerprint or
+``REFERENCE_DATA_VERSION`` changes, swapping the snapshot atomically.
+Callers should take ``reference_data.snapshot`` once per unit of work so
+every lookup in it sees the same data.
+
+@module reference_data
+@since 1.0.0
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of a snapshot or the static vocabularies change so
+# every process reloads even if the underlying tables did not
+REFERENCE_DATA_VERSION = 1
+
+
+# ---------------------------------------------------------------------------
+# Levels
+# ---------------------------------------------------------------------------
+
+class Level(IntEnum):
+    """Playing levels in ascending order; the value is the level's rank."""
+
+    COMPLEX = 0
+    ROOKIE = 1
+    ROOKIE_PLUS = 2
+    A_MINUS = 3
+    A = 4
+    A_PLUS = 5
+    AA = 6
+    AAA = 7
+    MLB = 8
+
+
+LEVEL_NAMES: Dict[Level, str] = {
+    Level.COMPLEX: "Complex",
+    Level.ROOKIE: "Rookie",
+    Level.ROOKIE_PLUS: "Rookie+",
+    Level.A_MINUS: "A-",
+    Level.A: "A",
+    Level.A_PLUS: "A+",
+    Level.AA: "AA",
+    Level.AAA: "AAA",
+    Level.MLB: "MLB",
+}
+
+# Lowercased spellings seen across sources -> level
+LEVEL_ALIASES: Dict[str, Level] = {
+    **{name.lower(): level for level, name in LEVEL_NAMES.items()},
+    "dsl": Level.COMPLEX, "fcl": Level.COMPLEX, "acl": Level.COMPLEX,
+    "complex/dsl": Level.COMPLEX, "rk": Level.ROOKIE,
+    "rookie advanced": Level.ROOKIE_PLUS, "short-season a": Level.A_MINUS,
+    "low-a": Level.A, "single-a": Level.A,
+    "high-a": Level.A_PLUS, "double-a": Level.AA, "triple-a": Level.AAA,
+}
+
+# MLB Stats API sportId -> level name for the affiliated minor leagues
+MILB_SPORT_IDS: Dict[int, str] = {
+    11: "AAA", 12: "AA", 13: "A+", 14: "A",
+    15: "Rookie", 16: "Rookie+", 21: "Complex"
+}
+
+
+def parse_level(value: Any) -> Optional[Level]:
+    """
+    Level for a name, alias or MLB Stats API sportId.
+
+    @param value - e.g. "AA", "Double-A", 12 (sportId) or Level.AA
+    @returns Level, or None when the value is not a known level
+    """
+    if isinstance(value, Level):
+        return value
+    if isinstance(value, (int, np.integer)):
+        name = MILB_SPORT_IDS.get(int(value))
+        return LEVEL_ALIASES.get(name.lower()) if name else None
+    if isinstance(value, str):
+        return LEVEL_ALIASES.get(value.strip().lower())
+    return None
+
+
+def level_rank(value: Any) -> int:
+    """Rank of a level for ordering comparisons; -1 when unknown."""
+    level = parse_level(value)
+    return int(level) if level is not None else -1
+
+
+# ---------------------------------------------------------------------------
+# Organizations and positions
+# ---------------------------------------------------------------------------
+
+# Canonical organization names; the index is the organization code
+ORGANIZATIONS: Tuple[str, ...] = (
+    "Arizona Diamondbacks", "Atlanta Braves", "Baltimore Orioles", "Boston Red Sox",
+    "Chicago Cubs", "Chicago White Sox", "Cincinnati Reds", "Cleveland Guardians",
+    "Colorado Rockies", "Detroit Tigers", "Houston Astros", "Kansas City Royals",
+    "Los Angeles Angels", "Los Angeles Dodgers", "Miami Marlins", "Milwaukee Brewers",
+    "Minnesota Twins", "New York Mets", "New York Yankees", "Oakland Athletics",
+    "Philadelphia Phillies", "Pittsburgh Pirates", "San Diego Padres", "San Francisco Giants",
+    "Seattle Mariners", "St. Louis Cardinals", "Tampa Bay Rays", "Texas Rangers",
+    "Toronto Blue Jays", "Washington Nationals",
+)
+
+# Uppercased abbreviations and nicknames -> canonical organization name
+ORGANIZATION_ALIASES: Dict[str, str] = {
+    # AL East
+    'BAL': 'Baltimore Orioles', 'ORIOLES': 'Baltimore Orioles',
+    'BOS': 'Boston Red Sox', 'RED SOX': 'Boston Red Sox',
+    'NYY': 'New York Yankees', 'YANKEES': 'New York Yankees',
+    'TB': 'Tampa Bay Rays', 'TBR': 'Tampa Bay Rays', 'RAYS': 'Tampa Bay Rays',
+    'TOR': 'Toronto Blue Jays', 'BLUE JAYS': 'Toronto Blue Jays',
+
+    # AL Central
+    'CLE': 'Cleveland Guardians', 'GUARDIANS': 'Cleveland Guardians',
+    'CWS': 'Chicago White Sox', 'CHW': 'Chicago White Sox', 'WHITE SOX': 'Chicago White Sox',
+    'DET': 'Detroit Tigers', 'TIGERS': 'Detroit Tigers',
+    'KC': 'Kansas City Royals', 'KCR': 'Kansas City Royals', 'ROYALS': 'Kansas City Royals',
+    'MIN': 'Minnesota Twins', 'TWINS': 'Minnesota Twins',
+
+    # AL West
+    'HOU': 'Houston Astros', 'ASTROS': 'Houston Astros',
+    'LAA': 'Los Angeles Angels', 'ANGELS': 'Los Angeles Angels',
+    'OAK': 'Oakland Athletics', 'ATHLETICS': 'Oakland Athletics', 'A\'S': 'Oakland Athletics',
+    'SEA': 'Seattle Mariners', 'MARINERS': 'Seattle Mariners',
+    'TEX': 'Texas Rangers', 'RANGERS': 'Texas Rangers',
+
+    # NL East
+    'ATL': 'Atlanta Braves', 'BRAVES': 'Atlanta Braves',
+    'MIA': 'Miami Marlins', 'MARLINS': 'Miami Marlins',
+    'NYM': 'New York Mets', 'METS': 'New York Mets',
+    'PHI': 'Philadelphia Phillies', 'PHILLIES': 'Philadelphia Phillies',
+    'WAS': 'Washington Nationals', 'WSN': 'Washington Nationals', 'NATIONALS': 'Washington Nationals',
+
+    # NL Central
+    'CHC': 'Chicago Cubs', 'CUBS': 'Chicago Cubs',
+    'CIN': 'Cincinnati Reds', 'REDS': 'Cincinnati Reds',
+    'MIL': 'Milwaukee Brewers', 'BREWERS': 'Milwaukee Brewers',
+    'PIT': 'Pittsburgh Pirates', 'PIRATES': 'Pittsburgh Pirates',
+    'STL': 'St. Louis Cardinals', 'CARDINALS': 'St. Louis Cardinals',
+
+    # NL West
+    'ARI': 'Arizona Diamondbacks', 'AZ': 'Arizona Diamondbacks', 'DIAMONDBACKS': 'Arizona Diamondbacks',
+    'COL': 'Colorado Rockies', 'ROCKIES': 'Colorado Rockies',
+    'LAD': 'Los Angeles Dodgers', 'DODGERS': 'Los Angeles Dodgers',
+    'SD': 'San Diego Padres', 'PADRES': 'San Diego Padres',
+    'SF': 'San Francisco Giants', 'SFG': 'San Francisco Giants', 'GIANTS': 'San Francisco Giants',
+}
+
+_ORGANIZATION_CODES: Dict[str, int] = {
+    **{name.upper(): code for code, name in enumerate(ORGANIZATIONS)},
+    **{alias: ORGANIZATIONS.index(name) for alias, name in ORGANIZATION_ALIASES.items()},
+}
+
+# Positions allowed by the prospects table; the index is the position code
+POSITIONS: Tuple[str, ...] = ("C", "1B", "2B", "3B", "SS", "LF", "CF", "RF", "DH", "SP", "RP")
+_POSITION_CODES: Dict[str, int] = {name: code for code, name in enumerate(POSITIONS)}
+
+
+def standardize_organization(org: Optional[str]) -> str:
+    """Canonical organization name; unknown names are returned unchanged."""
+    if not org:
+        return "Unknown"
+    return ORGANIZATION_ALIASES.get(org.upper().strip(), org)
+
+
+def organization_code(org: Optional[str]) -> int:
+    """Index of an organization in ORGANIZATIONS; -1 when unknown."""
+    if not org:
+        return -1
+    return _ORGANIZATION_CODES.get(org.upper().strip(), -1)
+
+
+def position_code(position: Optional[str]) -> int:
+    """Index of a position in POSITIONS; -1 when unknown."""
+    if not position:
+        return -1
+    return _POSITION_CODES.get(position.upper().strip(), -1)
+
+
+# ---------------------------------------------------------------------------
+# Database-backed snapshot
+# ---------------------------------------------------------------------------
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+class ArrayMap:
+    """
+    Immutable integer-keyed map backed by a sorted key array.
+
+    Values are row indexes into the snapshot's column arrays, so one map
+    serves every column and a batch of keys resolves in one vectorized
+    binary search.
+    """
+
+    __slots__ = ("keys", "rows")
+
+    def __init__(self, keys: Sequence[int], rows: Optional[Sequence[int]] = None):
+        keys = np.asarray(keys, dtype=np.int64)
+        rows = np.arange(len(keys), dtype=np.int64) if rows is None else np.asarray(rows, dtype=np.int64)
+        # First occurrence wins when a key repeats
+        unique, first = np.unique(keys, return_index=True)
+        self.keys = _readonly(unique)
+        self.rows = _readonly(rows[first])
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: int) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: int) -> Optional[int]:
+        """Row index for a key, or None."""
+        i = int(np.searchsorted(self.keys, key))
+        if i < len(self.keys) and self.keys[i] == key:
+            return int(self.rows[i])
+        return None
+
+    def lookup(self, keys: Iterable[int]) -> np.ndarray:
+        """Row index for each key, -1 where the key is absent."""
+        keys = np.asarray(keys if isinstance(keys, np.ndarray) else list(keys), dtype=np.int64)
+        if not len(self.keys):
+            return np.full(len(keys), -1, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        return np.where(self.keys[positions] == keys, self.rows[positions], -1)
+
+
+def _factor_key(venue_id: int, season: int, level: int) -> int:
+    # venue_id | season | level rank packed into one int64 (venue 0 for league rows)
+    return (int(venue_id) << 20) | (int(season) << 4) | int(level)
+
+
+PARK_FACTOR_COLUMNS = ("pf_overall", "pf_avg", "pf_obp", "pf_slg", "pf_hr")
+LEAGUE_FACTOR_COLUMNS = (
+    "lg_avg", "lg_obp", "lg_slg", "lg_ops", "lg_iso", "lg_hr_rate", "lg_bb_rate", "lg_so_rate"
+)
+
+PROSPECTS_SQL = "SELECT id, mlb_player_id, name, position, organization, level FROM prospects ORDER BY id"
+PARK_FACTORS_SQL = f"SELECT venue_id, season, level, {', '.join(PARK_FACTOR_COLUMNS)} FROM milb_park_factors"
+LEAGUE_FACTORS_SQL = f"SELECT season, level, {', '.join(LEAGUE_FACTOR_COLUMNS)} FROM milb_league_factors"
+
+# Tables whose row count and latest update make up the data fingerprint
+FINGERPRINT_TABLES = ("prospects", "milb_park_factors", "milb_league_factors")
+
+
+@dataclass(frozen=True, eq=False)
+class ReferenceSnapshot:
+    """One consistent, read-only load of the database-backed reference data."""
+
+    version: str = f"{REFERENCE_DATA_VERSION}:empty"
+    loaded_at: float = 0.0
+    prospect_ids: np.ndarray = field(default_factory=lambda: _readonly(np.empty(0, dtype=np.int32)))
+    mlb_player_ids: np.ndarray = field(default_factory=lambda: _readonly(np.empty(0, dtype=np.int64)))
+    names: np.ndarray = field(default_factory=lambda: _readonly(np.empty(0, dtype=object)))
+    positions: np.ndarray = field(default_factory=lambda: _readonly(np.empty(0, dtype=np.int8)))
+    organizations: np.ndarray = field(default_factory=lambda: _readonly(np.empty(0, dtype=np.int16)))
+    organization_names: Tuple[str, ...] = ()
+    levels: np.ndarray = field(default_factory=lambda: _readonly(np.empty(0, dtype=np.int8)))
+    by_prospect_id: ArrayMap = field(default_factory=lambda: ArrayMap([]))
+    by_mlb_id: ArrayMap = field(default_factory=lambda: ArrayMap([]))
+    park_factor_map: ArrayMap = field(default_factory=lambda: ArrayMap([]))
+    park_factor_values: np.ndarray = field(
+        default_factory=lambda: _readonly(np.empty((0, len(PARK_FACTOR_COLUMNS)), dtype=np.float32))
+    )
+    league_factor_map: ArrayMap = field(default_factory=lambda: ArrayMap([]))
+    league_factor_values: np.ndarray = field(
+        default_factory=lambda: _readonly(np.empty((0, len(LEAGUE_FACTOR_COLUMNS)), dtype=np.float32))
+    )
+
+    @classmethod
+    def build(
+        cls,
+        version: str,
+        prospects: List[Any],
+        park_factors: List[Any],
+        league_factors: List[Any]
+    ) -> "ReferenceSnapshot":
+        """Build a snapshot from raw rows of the three reference queries."""
+        n = len(prospects)
+        prospect_ids = np.fromiter((row[0] for row in prospects), dtype=np.int32, count=n)
+        mlb_ids = np.fromiter(
+            (int(row[1]) if row[1] and str(row[1]).isdigit() else -1 for row in prospects),
+            dtype=np.int64, count=n
+        )
+        names = np.empty(n, dtype=object)
+        names[:] = [row[2] for row in prospects]
+        has_mlb_id = np.flatnonzero(mlb_ids >= 0)
+        # Organizations are stored as written, each distinct spelling once
+        organization_names, organizations = np.unique(
+            np.array([row[4] or "" for row in prospects] or [""], dtype=object), return_inverse=True
+        )
+
+        park_rows = [row for row in park_factors if level_rank(row[2]) >= 0]
+        league_rows = [row for row in league_factors if level_rank(row[1]) >= 0]
+
+        return cls(
+            version=version,
+            loaded_at=time.time(),
+            prospect_ids=_readonly(prospect_ids),
+            mlb_player_ids=_readonly(mlb_ids),
+            names=_readonly(names),
+            positions=_readonly(np.array([position_code(row[3]) for row in prospects], dtype=np.int8)),
+            organizations=_readonly(organizations[:n].astype(np.int16)),
+            organization_names=tuple(organization_names),
+            levels=_readonly(np.array([level_rank(row[5]) for row in prospects], dtype=np.int8)),
+            by_prospect_id=ArrayMap(prospect_ids),
+            by_mlb_id=ArrayMap(mlb_ids[has_mlb_id], has_mlb_id),
+            park_factor_map=ArrayMap([
+                _factor_key(row[0], row[1], level_rank(row[2])) for row in park_rows
+            ]),
+            park_factor_values=_readonly(np.array(
+                [row[3:] for row in park_rows], dtype=np.float32
+            ).reshape(len(park_rows), len(PARK_FACTOR_COLUMNS))),
+            league_factor_map=ArrayMap([
+                _factor_key(0, row[0], level_rank(row[1])) for row in league_rows
+            ]),
+            league_factor_values=_readonly(np.array(
+                [row[2:] for row in league_rows], dtype=np.float32
+            ).reshape(len(league_rows), len(LEAGUE_FACTOR_COLUMNS))),
+        )
+
+    def _prospect(self, row: Optional[int]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        position, org, level = int(self.positions[row]), int(self.organizations[row]), int(self.levels[row])
+        return {
+            "id": int(self.prospect_ids[row]),
+            "mlb_player_id": int(self.mlb_player_ids[row]) if self.mlb_player_ids[row] >= 0 else None,
+            "name": self.names[row],
+            "position": POSITIONS[position] if position >= 0 else None,
+            "organization": self.organization_names[org] or None,
+            "level": LEVEL_NAMES[Level(level)] if level >= 0 else None,
+        }
+
+    def prospect(self, prospect_id: int) -> Optional[Dict[str, Any]]:
+        """Reference attributes of a prospect by prospects.id."""
+        return self._prospect(self.by_prospect_id.get(prospect_id))
+
+    def prospect_for_mlb_id(self, mlb_player_id: int) -> Optional[Dict[str, Any]]:
+        """Reference attributes of the prospect with this MLB Stats API id."""
+        return self._prospect(self.by_mlb_id.get(mlb_player_id))
+
+    def prospect_id_for(self, mlb_player_id: int) -> Optional[int]:
+        row = self.by_mlb_id.get(mlb_player_id)
+        return int(self.prospect_ids[row]) if row is not None else None
+
+    def mlb_id_for(self, prospect_id: int) -> Optional[int]:
+        row = self.by_prospect_id.get(prospect_id)
+        if row is None or self.mlb_player_ids[row] < 0:
+            return None
+        return int(self.mlb_player_ids[row])
+
+    def prospect_ids_for(self, mlb_player_ids: Iterable[int]) -> np.ndarray:
+        """Vectorized mlb_player_id -> prospects.id, -1 where not a prospect."""
+        rows = self.by_mlb_id.lookup(mlb_player_ids)
+        return np.where(rows >= 0, self.prospect_ids[np.maximum(rows, 0)], -1)
+
+    def park_factors(self, venue_id: int, season: int, level: Any) -> Optional[Dict[str, float]]:
+        """Park factors for a venue, season and level."""
+        rank = level_rank(level)
+        row = self.park_factor_map.get(_factor_key(venue_id, season, rank)) if rank >= 0 else None
+        if row is None:
+            return None
+        return dict(zip(PARK_FACTOR_COLUMNS, self.park_factor_values[row].tolist()))
+
+    def league_factors(self, season: int, level: Any) -> Optional[Dict[str, float]]:
+        """League averages for a season and level."""
+        rank = level_rank(level)
+        row = self.league_factor_map.get(_factor_key(0, season, rank)) if rank >= 0 else None
+        if row is None:
+            return None
+        return dict(zip(LEAGUE_FACTOR_COLUMNS, self.league_factor_values[row].tolist()))
+
+
+def _fingerprint(rows: Dict[str, Optional[List[Any]]]) -> str:
+    digest = hashlib.sha1()
+    for table in FINGERPRINT_TABLES:
+        digest.update(f"{table}={rows.get(table)!r};".encode())
+    return f"{REFERENCE_DATA_VERSION}:{digest.hexdigest()[:16]}"
+
+
+def _fingerprint_sql(table: str) -> str:
+    return f"SELECT COUNT(*), MAX(updated_at) FROM {table}"
+
+
+class ReferenceData:
+    """Holds the current snapshot and reloads it when the data changes."""
+
+    def __init__(self, refresh_seconds: Optional[int] = None):
+        self.refresh_seconds = (
+            settings.REFERENCE_DATA_REFRESH_SECONDS if refresh_seconds is None else refresh_seconds
+        )
+        self._snapshot = ReferenceSnapshot()
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> ReferenceSnapshot:
+        return self._snapshot
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot.loaded_at > 0
+
+    def _due(self, force: bool) -> bool:
+        return force or not self.loaded or time.time() - self._checked_at >= self.refresh_seconds
+
+    def _install(self, version: str, rows: Dict[str, List[Any]]) -> ReferenceSnapshot:
+        snapshot = ReferenceSnapshot.build(
+            version, rows["prospects"], rows["park_factors"], rows["league_factors"]
+        )
+        with self._lock:
+            self._snapshot = snapshot
+        logger.info(
+            f"Reference data {version} loaded: {len(snapshot.prospect_ids)} prospects, "
+            f"{len(snapshot.park_factor_map)} park factors, {len(snapshot.league_factor_map)} league factors"
+        )
+        return snapshot
+
+    async def _fetch_async(self, db, sql: str) -> Optional[List[Any]]:
+        try:
+            return list((await db.execute(text(sql))).all())
+        except SQLAlchemyError as e:
+            logger.warning(f"Reference query failed, using no rows: {sql} ({e})")
+            await db.rollback()
+            return None
+
+    def _fetch_sync(self, db, sql: str) -> Optional[List[Any]]:
+        try:
+            return list(db.execute(text(sql)).all())
+        except SQLAlchemyError as e:
+            logger.warning(f"Reference query failed, using no rows: {sql} ({e})")
+            db.rollback()
+            return None
+
+    async def refresh(self, db, force: bool = False) -> ReferenceSnapshot:
+        """
+        Reload from an AsyncSession if the data changed.
+
+        @param db - AsyncSession
+        @param force - Check the fingerprint even if the refresh interval has not passed
+        @returns The current snapshot
+        """
+        if not self._due(force):
+            return self._snapshot
+        fingerprint = {
+            table: await self._fetch_async(db, _fingerprint_sql(table)) for table in FINGERPRINT_TABLES
+        }
+        self._checked_at = time.time()
+        version = _fingerprint(fingerprint)
+        if version == self._snapshot.version and self.loaded:
+            return self._snapshot
+        rows = {
+            "prospects": await self._fetch_async(db, PROSPECTS_SQL) or [],
+            "park_factors": await self._fetch_async(db, PARK_FACTORS_SQL) or [],
+            "league_factors": await self._fetch_async(db, LEAGUE_FACTORS_SQL) or [],
+        }
+        return self._install(version, rows)
+
+    def refresh_sync(self, db, force: bool = False) -> ReferenceSnapshot:
+        """Same as refresh() for a synchronous Session (scripts)."""
+        if not self._due(force):
+            return self._snapshot
+        fingerprint = {table: self._fetch_sync(db, _fingerprint_sql(table)) for table in FINGERPRINT_TABLES}
+        self._checked_at = time.time()
+        version = _fingerprint(fingerprint)
+        if version == self._snapshot.version and self.loaded:
+            return self._snapshot
+        rows = {
+            "prospects": self._fetch_sync(db, PROSPECTS_SQL) or [],
+            "park_factors": self._fetch_sync(db, PARK_FACTORS_SQL) or [],
+            "league_factors": self._fetch_sync(db, LEAGUE_FACTORS_SQL) or [],
+        }
+        return self._install(version, rows)
+
+
+# Module-level singleton; collector scripts refresh it with refresh_sync()
+reference_data = ReferenceData()
@@ -0,0 +1,250 @@
+"""
+On-disk HTTP response cache for MLB Stats API requests.
+
+Responses are keyed on the normalized URL (lowercased host, sorted query
+parameters) and stored zlib-compressed in a SQLite file together with their
+ETag / Last-Modified validators, so every collector process on the machine
+shares one cache.
+
+- Immutable resources (feeds of finished games, anything scoped to a past
+  season) are served straight from disk with no network call.
+- Mutable resources are reused for ``max_age`` seconds and then revalidated
+  with a conditional request; a 304 reuses the stored body.
+
+Each process keeps hit/miss/bytes-saved counters so scripts can print a
+per-run report.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+FINAL_GAME_STATES = {"Final"}
+
+
+def normalize_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Canonical form of a request URL, used as the cache key and request URL."""
+    parts = urlsplit(url)
+    query: List[Tuple[str, str]] = parse_qsl(parts.query)
+    if params:
+        query.extend((key, str(value)) for key, value in params.items() if value is not None)
+    query.sort()
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query, safe=","), ""))
+
+
+def is_immutable(url: str, payload: Any) -> bool:
+    """Whether a successful response can never change."""
+    if isinstance(payload, dict):
+        status = (payload.get("gameData") or {}).get("status") or {}
+        if status.get("abstractGameState") in FINAL_GAME_STATES:
+            return True
+
+    season = dict(parse_qsl(urlsplit(url).query)).get("season", "")
+    return season.isdigit() and int(season) < datetime.now().year
+
+
+@dataclass
+class CachedResponse:
+    """Status and raw body of a statsapi response, from disk or the network."""
+
+    status: int
+    body: bytes
+    from_cache: bool = False
+    _payload: Any = field(default=None, repr=False)
+    _parsed: bool = field(default=False, repr=False)
+
+    def json(self) -> Any:
+        if not self._parsed:
+            self._payload = json.loads(self.body) if self.body else None
+            self._parsed = True
+        return self._payload
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    immutable: bool
+    validated_at: float
+
+
+class StatsAPICache:
+    """Shared on-disk cache with conditional revalidation."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            immutable INTEGER NOT NULL,
+            fetched_at REAL NOT NULL,
+            validated_at REAL NOT NULL,
+            size INTEGER NOT NULL,
+            body BLOB NOT NULL
+        )
+    """
+
+    def __init__(self, path: Optional[str] = None, max_age: Optional[int] = None,
+                 enabled: Optional[bool] = None):
+        self.path = path or settings.STATSAPI_CACHE_PATH
+        self.max_age = settings.STATSAPI_CACHE_MAX_AGE if max_age is None else max_age
+        self.enabled = settings.STATSAPI_CACHE_ENABLED if enabled is None else enabled
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self.stats = {
+            "hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "not_cached": 0,
+            "bytes_saved": 0,
+            "bytes_fetched": 0,
+        }
+
+    def _connection(self) -> sqlite3.Connection:
+        # Collectors fork worker processes; SQLite connections must not cross a fork
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(self.SCHEMA)
+            self._pid = os.getpid()
+        return self._conn
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        if self._conn is None and not os.path.exists(self.path):
+            return None
+        row = self._connection().execute(
+            "SELECT body, etag, last_modified, immutable, validated_at FROM responses WHERE url = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            body = zlib.decompress(row[0])
+        except zlib.error:
+            logger.warning(f"Discarding corrupt statsapi cache entry for {key}")
+            return None
+        return CacheEntry(body, row[1], row[2], bool(row[3]), row[4])
+
+    def _store(self, key: str, response: CachedResponse, etag: Optional[str],
+               last_modified: Optional[str], immutable: bool, now: float):
+        self._connection().execute(
+            """
+            INSERT OR REPLACE INTO responses
+                (url, etag, last_modified, immutable, fetched_at, validated_at, size, body)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (key, etag, last_modified, int(immutable), now, now, len(response.body),
+             zlib.compress(response.body, 6))
+        )
+
+    def _touch(self, key: str, now: float):
+        self._connection().execute("UPDATE responses SET validated_at = ? WHERE url = ?", (now, key))
+
+    async def get(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        immutable: bool = False,
+        before_request: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> CachedResponse:
+        """
+        GET a statsapi URL through the cache.
+
+        Args:
+            session: Caller's aiohttp session (headers, timeouts)
+            url: Request URL, optionally with a query string
+            params: Extra query parameters
+            immutable: Caller knows the resource is final (e.g. a completed game)
+            before_request: Awaited only before a real network request, so
+                callers' rate limiting is skipped for disk hits
+
+        Returns:
+            CachedResponse; non-200 responses are passed through uncached.
+        """
+        key = normalize_url(url, params)
+        now = time.time()
+        entry = self._load(key) if self.enabled else None
+
+        if entry and (entry.immutable or now - entry.validated_at < self.max_age):
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += len(entry.body)
+            return CachedResponse(200, entry.body, from_cache=True)
+
+        headers = {}
+        if entry:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        if before_request:
+            await before_request()
+
+        async with session.get(key, headers=headers) as response:
+            if response.status == 304 and entry:
+                self._touch(key, now)
+                self.stats["revalidated"] += 1
+                self.stats["bytes_saved"] += len(entry.body)
+                return CachedResponse(200, entry.body, from_cache=True)
+
+            result = CachedResponse(response.status, await response.read())
+            if response.status != 200:
+                self.stats["not_cached"] += 1
+                return result
+
+            self.stats["misses"] += 1
+            self.stats["bytes_fetched"] += len(result.body)
+            if self.enabled:
+                try:
+                    final = immutable or is_immutable(key, result.json())
+                except ValueError:
+                    # Not JSON; let the caller deal with it
+                    return result
+                self._store(key, result, response.headers.get("ETag"),
+                            response.headers.get("Last-Modified"), final, now)
+            return result
+
+    def report(self) -> Dict[str, Any]:
+        """Counters for this process plus derived totals."""
+        served = self.stats["hits"] + self.stats["revalidated"]
+        total = served + self.stats["misses"] + self.stats["not_cached"]
+        return {
+            **self.stats,
+            "requests": total,
+            "network_requests": total - self.stats["hits"],
+            "hit_rate": served / total if total else 0.0,
+        }
+
+    def format_report(self) -> str:
+        report = self.report()
+        return (
+            f"statsapi cache: {report['requests']} requests, {report['hits']} hits, "
+            f"{report['revalidated']} revalidated, {report['misses']} misses, "
+            f"{report['not_cached']} not cached | {report['hit_rate']:.1%} served from disk, "
+            f"{report['bytes_saved'] / 1_048_576:.1f} MB saved, "
+            f"{report['bytes_fetched'] / 1_048_576:.1f} MB downloaded"
+        )
+
+
+# Module-level singleton shared by the API client and collector scripts
+statsapi_cache = StatsAPICache()
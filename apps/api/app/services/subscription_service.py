@@ -16,6 +16,7 @@ from fastapi import HTTPException, status
 
 from app.db.models import User, Subscription, PaymentMethod, Invoice, SubscriptionEvent, PaymentAuditLog
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
 from app.core.rate_limiter import get_redis_client
 
 # Initialize Stripe
@@ -661,7 +662,8 @@ class SubscriptionService:
             await db.commit()
 
     async def _invalidate_subscription_cache(self, user_id: int):
-        """Invalidate subscription cache for a user."""
+        """Invalidate subscription cache and cached principal (tier) for a user."""
+        await principal_cache.invalidate(user_id=user_id)
         redis = await get_redis_client()
         if redis:
             cache_key = f"subscription:status:{user_id}"
@@ -0,0 +1,12 @@
+"""
+Performance benchmarks for the API's hot paths.
+
+Run from apps/api:
+
+  python -m benchmarks seed                     # build the SQLite stand-in
+  python -m benchmarks run --save-baseline main
+  python -m benchmarks run --baseline benchmarks/baselines/main.json
+  python -m benchmarks compare old.json new.json
+
+See benchmarks/__main__.py for every option.
+"""
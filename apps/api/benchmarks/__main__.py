@@ -0,0 +1,235 @@
+"""
+Benchmark Command Line
+
+Seeds a synthetic dataset, runs micro and end-to-end benchmarks, and
+compares JSON reports so regressions show up between runs.
+
+Without --database-url a SQLite file under benchmarks/.data is used and
+seeded automatically for the requested size and seed. A Postgres URL must
+point at a dedicated benchmark database and be seeded explicitly, because
+seeding deletes the benchmark tables' rows.
+
+Usage:
+  python -m benchmarks list
+  python -m benchmarks seed --prospects 5000
+  python -m benchmarks seed --database-url postgresql://localhost/afwd_bench
+  python -m benchmarks run
+  python -m benchmarks run -k hype -k rankings --iterations 50
+  python -m benchmarks run --kind micro --save-baseline main
+  python -m benchmarks run --baseline benchmarks/baselines/main.json
+  python -m benchmarks run --include-slow          # adds the O(n^2) duplicate scan
+  python -m benchmarks compare baselines/main.json results/latest.json --threshold 0.15
+
+Exit status is 1 when a comparison finds a regression.
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import suites  # noqa: F401  registers benchmarks
+from benchmarks.harness import (
+    DEFAULT_RSS_THRESHOLD,
+    DEFAULT_THRESHOLD,
+    REGISTRY,
+    BenchmarkResult,
+    build_report,
+    compare_reports,
+    dataset_mismatch,
+    load_report,
+    run_benchmarks,
+    save_report,
+)
+from benchmarks.synthetic import SyntheticConfig, dataset_counts, populate
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DATA_DIR = BENCHMARK_DIR / ".data"
+RESULTS_DIR = BENCHMARK_DIR / "results"
+BASELINES_DIR = BENCHMARK_DIR / "baselines"
+
+
+def _config(args) -> SyntheticConfig:
+    return SyntheticConfig(prospects=args.prospects, seed=args.seed)
+
+
+def _default_url(config: SyntheticConfig) -> str:
+    return f"sqlite:///{DATA_DIR / f'bench-{config.prospects}-{config.seed}.db'}"
+
+
+def cmd_list(args) -> int:
+    for spec in sorted(REGISTRY.values(), key=lambda s: (s.kind, s.name)):
+        slow = " (slow)" if spec.slow else ""
+        print(f"{spec.kind:<6} {spec.name:<28} {spec.description}{slow}")
+    return 0
+
+
+def cmd_seed(args) -> int:
+    config = _config(args)
+    url = args.database_url or _default_url(config)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 80)
+    print(f"SEEDING {url.split('@')[-1]}")
+    print("=" * 80)
+    counts = populate(url, config)
+    for table, count in counts.items():
+        print(f"  {table:<20} {count:>10,}")
+    return 0
+
+
+def _ensure_seeded(args, config: SyntheticConfig) -> str:
+    url = args.database_url or _default_url(config)
+    counts = dataset_counts(url)
+    if counts.get("prospects") == config.prospects:
+        return url
+    if args.database_url:
+        raise SystemExit(
+            f"{url.split('@')[-1]} is not seeded for {config.prospects} prospects; "
+            f"run `python -m benchmarks seed --database-url ...` first"
+        )
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    print(f"Seeding {config.prospects} synthetic prospects (seed {config.seed})...")
+    populate(url, config)
+    return url
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    if result.error:
+        print(f"{result.name:<28} {result.kind:<6} {result.error}")
+        return
+    print(
+        f"{result.name:<28} {result.kind:<6} "
+        f"{result.p50_ms:>10.2f} {result.p95_ms:>10.2f} "
+        f"{result.throughput:>12.1f} {result.peak_rss_mb:>9.1f}"
+    )
+
+
+def _print_comparison(baseline, current, threshold, rss_threshold) -> int:
+    for note in dataset_mismatch(baseline, current):
+        print(f"WARNING: reports differ in {note}")
+
+    changes = compare_reports(baseline, current, threshold, rss_threshold)
+    print(f"{'benchmark':<28} {'metric':<12} {'baseline':>12} {'current':>12} {'change':>9}")
+    print("-" * 80)
+    regressions = 0
+    for change in changes:
+        flag = "  REGRESSION" if change.regressed else ""
+        regressions += change.regressed
+        if change.metric == "error":
+            state = "now failing" if change.regressed else "failing"
+            print(f"{change.benchmark:<28} {'error':<12} {state:>35}{flag}")
+            continue
+        print(
+            f"{change.benchmark:<28} {change.metric:<12} {change.baseline:>12.2f} "
+            f"{change.current:>12.2f} {change.change:>+8.1%}{flag}"
+        )
+    print("-" * 80)
+    print(f"{regressions} regression(s) at {threshold:.0%} latency/throughput, "
+          f"{rss_threshold:.0%} memory")
+    return 1 if regressions else 0
+
+
+def cmd_run(args) -> int:
+    config = _config(args)
+    names = [
+        spec.name for spec in REGISTRY.values()
+        if (not args.kind or spec.kind == args.kind)
+        and (not args.filter or any(pattern in spec.name for pattern in args.filter))
+        and (args.include_slow or not spec.slow or args.filter)
+    ]
+    if not names:
+        print("No benchmarks match")
+        return 1
+
+    needs_db = any(REGISTRY[name].kind == "e2e" for name in names)
+    url = _ensure_seeded(args, config) if needs_db else (args.database_url or _default_url(config))
+
+    print("=" * 80)
+    print(f"BENCHMARKS: {len(names)} on {config.prospects} prospects (seed {config.seed})")
+    print("=" * 80)
+    print(f"{'benchmark':<28} {'kind':<6} {'p50 ms':>10} {'p95 ms':>10} {'items/s':>12} {'rss MB':>9}")
+    print("-" * 80)
+    results = run_benchmarks(
+        names, url, config,
+        iterations=args.iterations,
+        isolate=not args.no_isolate,
+        on_result=_print_result
+    )
+    report = build_report(results, config, url)
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    )
+    save_report(report, output)
+    print("-" * 80)
+    print(f"Report: {output}")
+
+    if args.save_baseline:
+        baseline_path = BASELINES_DIR / f"{args.save_baseline}.json"
+        save_report(report, baseline_path)
+        print(f"Baseline: {baseline_path}")
+
+    if args.baseline:
+        print()
+        return _print_comparison(load_report(args.baseline), report, args.threshold, args.rss_threshold)
+    return 0
+
+
+def cmd_compare(args) -> int:
+    return _print_comparison(
+        load_report(args.baseline), load_report(args.current), args.threshold, args.rss_threshold
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="API performance benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def dataset_options(sub):
+        sub.add_argument("--database-url", help="Sync SQLAlchemy URL (default: SQLite under benchmarks/.data)")
+        sub.add_argument("--prospects", type=int, default=2000, help="Synthetic prospects")
+        sub.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    def threshold_options(sub):
+        sub.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                         help="Allowed latency/throughput change (fraction)")
+        sub.add_argument("--rss-threshold", type=float, default=DEFAULT_RSS_THRESHOLD,
+                         help="Allowed peak RSS growth (fraction)")
+
+    subparsers.add_parser("list", help="List registered benchmarks").set_defaults(func=cmd_list)
+
+    seed = subparsers.add_parser("seed", help="Load the synthetic dataset")
+    dataset_options(seed)
+    seed.set_defaults(func=cmd_seed)
+
+    run = subparsers.add_parser("run", help="Run benchmarks and write a JSON report")
+    dataset_options(run)
+    threshold_options(run)
+    run.add_argument("-k", "--filter", action="append", help="Only benchmarks whose name contains this")
+    run.add_argument("--kind", choices=["micro", "e2e"], help="Only micro or only end-to-end")
+    run.add_argument("--iterations", type=int, help="Override timed iterations per benchmark")
+    run.add_argument("--include-slow", action="store_true", help="Include slow benchmarks")
+    run.add_argument("--no-isolate", action="store_true", help="Run in this process (RSS is then cumulative)")
+    run.add_argument("--output", help="Report path (default: benchmarks/results/<timestamp>.json)")
+    run.add_argument("--save-baseline", metavar="NAME", help="Also write benchmarks/baselines/NAME.json")
+    run.add_argument("--baseline", help="Compare against this report after running")
+    run.set_defaults(func=cmd_run)
+
+    compare = subparsers.add_parser("compare", help="Compare two reports")
+    compare.add_argument("baseline", help="Baseline report JSON")
+    compare.add_argument("current", help="Current report JSON")
+    threshold_options(compare)
+    compare.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
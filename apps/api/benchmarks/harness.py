@@ -0,0 +1,379 @@
+"""
+Benchmark registry, timing and baseline comparison.
+
+A benchmark is a setup function registered with ``@benchmark``. Setup
+receives a BenchmarkContext and returns the operation to time (sync or
+async); the operation returns how many items it processed so throughput
+can be reported per item rather than per call.
+
+Each benchmark runs in its own spawned process so peak RSS belongs to that
+benchmark alone and one benchmark's caches cannot warm the next.
+
+@module harness
+@since 1.0.0
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.synthetic import SyntheticConfig
+
+logger = logging.getLogger(__name__)
+
+# Latency and throughput changes beyond this fraction are regressions
+DEFAULT_THRESHOLD = 0.10
+# Peak RSS is noisier; allow more before flagging
+DEFAULT_RSS_THRESHOLD = 0.20
+# Ignore latency deltas smaller than this, whatever the ratio
+MIN_LATENCY_DELTA_MS = 0.05
+
+
+@dataclass
+class BenchmarkSpec:
+    """A registered benchmark."""
+
+    name: str
+    kind: str
+    setup: Callable
+    iterations: int
+    warmup: int
+    slow: bool = False
+    description: str = ""
+
+
+REGISTRY: Dict[str, BenchmarkSpec] = {}
+
+
+def benchmark(
+    name: str,
+    kind: str = "micro",
+    iterations: int = 30,
+    warmup: int = 3,
+    slow: bool = False
+):
+    """
+    Register a benchmark setup function.
+
+    @param name - Unique benchmark name
+    @param kind - "micro" (in-memory) or "e2e" (hits the seeded database)
+    @param iterations - Timed calls of the operation
+    @param warmup - Untimed calls before timing starts
+    @param slow - Only run when slow benchmarks are requested
+    """
+    def decorator(setup: Callable) -> Callable:
+        if name in REGISTRY:
+            raise ValueError(f"Benchmark {name} registered twice")
+        REGISTRY[name] = BenchmarkSpec(
+            name=name,
+            kind=kind,
+            setup=setup,
+            iterations=iterations,
+            warmup=warmup,
+            slow=slow,
+            description=(inspect.getdoc(setup) or "").split("\n")[0],
+        )
+        return setup
+    return decorator
+
+
+@dataclass
+class BenchmarkContext:
+    """What a benchmark setup gets: the seeded database and dataset config."""
+
+    database_url: str
+    config: SyntheticConfig
+    _cleanups: List[Callable] = field(default_factory=list)
+
+    @property
+    def async_database_url(self) -> str:
+        if self.database_url.startswith("sqlite:"):
+            return self.database_url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+        if self.database_url.startswith("postgresql://"):
+            return self.database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        return self.database_url
+
+    def add_cleanup(self, cleanup: Callable) -> None:
+        """Register a sync or async callable to run after timing."""
+        self._cleanups.append(cleanup)
+
+    async def close(self) -> None:
+        for cleanup in reversed(self._cleanups):
+            outcome = cleanup()
+            if inspect.isawaitable(outcome):
+                await outcome
+        self._cleanups.clear()
+
+
+@dataclass
+class BenchmarkResult:
+    """Summary statistics for one benchmark run."""
+
+    name: str
+    kind: str
+    iterations: int = 0
+    items: int = 0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    mean_ms: float = 0.0
+    min_ms: float = 0.0
+    max_ms: float = 0.0
+    throughput: float = 0.0
+    peak_rss_mb: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        known = {key: value for key, value in data.items() if key in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+def summarize(
+    name: str,
+    kind: str,
+    durations: List[float],
+    items: int,
+    peak_rss_mb: float
+) -> BenchmarkResult:
+    """
+    Reduce per-call durations to a result.
+
+    @param durations - Seconds per timed call
+    @param items - Items processed across all timed calls
+    @param peak_rss_mb - Peak resident set size of the benchmark process
+    @returns BenchmarkResult with latencies in milliseconds and items/second
+    """
+    millis = np.asarray(durations, dtype=float) * 1000.0
+    total = float(np.sum(durations))
+    return BenchmarkResult(
+        name=name,
+        kind=kind,
+        iterations=len(durations),
+        items=items,
+        p50_ms=round(float(np.percentile(millis, 50)), 4),
+        p95_ms=round(float(np.percentile(millis, 95)), 4),
+        mean_ms=round(float(np.mean(millis)), 4),
+        min_ms=round(float(np.min(millis)), 4),
+        max_ms=round(float(np.max(millis)), 4),
+        throughput=round(items / total, 2) if total > 0 else 0.0,
+        peak_rss_mb=round(peak_rss_mb, 1),
+    )
+
+
+def peak_rss_mb() -> float:
+    """Peak RSS of this process in megabytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def _call(operation: Callable) -> int:
+    outcome = operation()
+    if inspect.isawaitable(outcome):
+        outcome = await outcome
+    return outcome if isinstance(outcome, int) else 1
+
+
+async def _measure(spec: BenchmarkSpec, context: BenchmarkContext, iterations: int):
+    try:
+        operation = spec.setup(context)
+        if inspect.isawaitable(operation):
+            operation = await operation
+
+        for _ in range(spec.warmup):
+            await _call(operation)
+
+        durations, items = [], 0
+        for _ in range(iterations):
+            start = time.perf_counter()
+            items += await _call(operation)
+            durations.append(time.perf_counter() - start)
+        return durations, items
+    finally:
+        await context.close()
+
+
+def run_benchmark(
+    name: str,
+    database_url: str,
+    config: Dict[str, Any],
+    iterations: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Run one registered benchmark in the current process.
+
+    Importing the suites module registers every benchmark, so this works as
+    the entry point of a freshly spawned worker.
+
+    @returns BenchmarkResult as a dict (picklable across processes)
+    """
+    import benchmarks.suites  # noqa: F401  registers benchmarks
+
+    logging.basicConfig(level=logging.WARNING)
+    spec = REGISTRY[name]
+    context = BenchmarkContext(database_url=database_url, config=SyntheticConfig(**config))
+    try:
+        durations, items = asyncio.run(_measure(spec, context, iterations or spec.iterations))
+    except ImportError as e:
+        return BenchmarkResult(name=name, kind=spec.kind, error=f"skipped: {e}").to_dict()
+    except Exception as e:
+        message = str(e).strip().splitlines()[0] if str(e).strip() else ""
+        return BenchmarkResult(name=name, kind=spec.kind, error=f"{type(e).__name__}: {message}").to_dict()
+    return summarize(name, spec.kind, durations, items, peak_rss_mb()).to_dict()
+
+
+def run_benchmarks(
+    names: List[str],
+    database_url: str,
+    config: SyntheticConfig,
+    iterations: Optional[int] = None,
+    isolate: bool = True,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None
+) -> List[BenchmarkResult]:
+    """
+    Run benchmarks one after another.
+
+    @param names - Registered benchmark names
+    @param database_url - Sync URL of the seeded database
+    @param config - Dataset the database was seeded with
+    @param iterations - Override each benchmark's iteration count
+    @param isolate - Run each benchmark in a fresh spawned process
+    @param on_result - Called with each result as it completes
+    @returns Results in the order given
+    """
+    results = []
+    for name in names:
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                data = pool.submit(run_benchmark, name, database_url, config.to_dict(), iterations).result()
+        else:
+            data = run_benchmark(name, database_url, config.to_dict(), iterations)
+        result = BenchmarkResult.from_dict(data)
+        results.append(result)
+        if on_result:
+            on_result(result)
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_report(
+    results: List[BenchmarkResult],
+    config: SyntheticConfig,
+    database_url: str
+) -> Dict[str, Any]:
+    """Results plus enough context to tell whether two reports are comparable."""
+    return {
+        "created_at": datetime.utcnow().isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "database": database_url.split(":", 1)[0],
+        "dataset": config.to_dict(),
+        "results": {result.name: result.to_dict() for result in results},
+    }
+
+
+def save_report(report: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True))
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text())
+
+
+@dataclass
+class MetricChange:
+    """One metric of one benchmark, baseline vs current."""
+
+    benchmark: str
+    metric: str
+    baseline: Optional[float]
+    current: Optional[float]
+    change: Optional[float]
+    regressed: bool
+
+
+# Metric name -> True when a higher value is worse
+COMPARED_METRICS = {
+    "p50_ms": True,
+    "p95_ms": True,
+    "throughput": False,
+    "peak_rss_mb": True,
+}
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    rss_threshold: float = DEFAULT_RSS_THRESHOLD
+) -> List[MetricChange]:
+    """
+    Compare every benchmark present in both reports.
+
+    A benchmark that ran in the baseline but errors now is a regression;
+    benchmarks missing from either side are ignored.
+
+    @param threshold - Allowed fractional change for latency and throughput
+    @param rss_threshold - Allowed fractional growth of peak RSS
+    @returns One MetricChange per compared metric
+    """
+    changes = []
+    for name, base_data in sorted(baseline.get("results", {}).items()):
+        if name not in current.get("results", {}):
+            continue
+        base = BenchmarkResult.from_dict(base_data)
+        now = BenchmarkResult.from_dict(current["results"][name])
+
+        if base.error or now.error:
+            changes.append(MetricChange(
+                name, "error", None, None, None,
+                regressed=bool(now.error and not base.error)
+            ))
+            continue
+
+        for metric, higher_is_worse in COMPARED_METRICS.items():
+            old, new = getattr(base, metric), getattr(now, metric)
+            change = (new - old) / old if old else 0.0
+            limit = rss_threshold if metric == "peak_rss_mb" else threshold
+            worse = change > limit if higher_is_worse else change < -limit
+            if metric.endswith("_ms") and abs(new - old) < MIN_LATENCY_DELTA_MS:
+                worse = False
+            changes.append(MetricChange(name, metric, old, new, round(change, 4), worse))
+    return changes
+
+
+def dataset_mismatch(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Describe differences that make two reports not directly comparable."""
+    notes = []
+    for key in ("dataset", "database", "machine"):
+        if baseline.get(key) != current.get(key):
+            notes.append(f"{key}: {baseline.get(key)} -> {current.get(key)}")
+    return notes
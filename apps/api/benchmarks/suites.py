@@ -0,0 +1,298 @@
+"""
+Micro and end-to-end benchmarks for the API's hot paths.
+
+Micro benchmarks time pure computation on in-memory synthetic rows.
+End-to-end benchmarks call the service or endpoint function against the
+seeded database, the way a request would, with Redis absent so every call
+misses the cache.
+
+Imports of application modules happen inside each setup, so a module that
+cannot be imported in the current environment skips its benchmarks
+instead of breaking the whole run.
+
+@module suites
+@since 1.0.0
+"""
+
+import asyncio
+import itertools
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+
+from benchmarks.harness import BenchmarkContext, benchmark
+from benchmarks.synthetic import generate
+
+# Cache misses are expected without Redis; keep them out of benchmark output
+logging.getLogger("app.core.cache_manager").setLevel(logging.CRITICAL)
+
+# Chunk size used by BatchPredictionProcessor
+BATCH_CHUNK_SIZE = 50
+
+
+def _async_session(context: BenchmarkContext):
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(context.async_database_url)
+    session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+
+    async def close():
+        await session.close()
+        await engine.dispose()
+
+    context.add_cleanup(close)
+    return session
+
+
+def _sync_session(context: BenchmarkContext):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    engine = create_engine(context.database_url)
+    session = sessionmaker(bind=engine)()
+
+    def close():
+        session.close()
+        engine.dispose()
+
+    context.add_cleanup(close)
+    return session
+
+
+# ---------------------------------------------------------------------------
+# Micro benchmarks
+# ---------------------------------------------------------------------------
+
+@benchmark("dynasty_scoring", kind="micro", iterations=20)
+def dynasty_scoring(context: BenchmarkContext):
+    """Score and rank every prospect with DynastyRankingService."""
+    from app.services.dynasty_ranking_service import DynastyRankingService
+
+    data = generate(context.config)
+    latest_stats = {row["prospect_id"]: SimpleNamespace(**row) for row in data["prospect_stats"]}
+    grades = {}
+    for row in data["scouting_grades"]:
+        grades.setdefault(row["prospect_id"], SimpleNamespace(overall_grade=row["overall"], **row))
+    predictions = {
+        row["prospect_id"]: SimpleNamespace(**row)
+        for row in data["ml_predictions"] if row["prediction_type"] == "success_rating"
+    }
+    prospects = [SimpleNamespace(**row) for row in data["prospects"]]
+
+    def run():
+        scored = [
+            (
+                prospect,
+                DynastyRankingService.calculate_dynasty_score(
+                    prospect=prospect,
+                    ml_prediction=predictions.get(prospect.id),
+                    latest_stats=latest_stats.get(prospect.id),
+                    scouting_grade=grades.get(prospect.id)
+                )
+            )
+            for prospect in prospects
+        ]
+        DynastyRankingService.rank_prospects(scored)
+        return len(scored)
+
+    return run
+
+
+@benchmark("comparison_similarity", kind="micro", iterations=50)
+def comparison_similarity(context: BenchmarkContext):
+    """Cosine similarity of one prospect against a 50-candidate pool."""
+    from app.services.prospect_comparisons_service import ProspectComparisonsService
+
+    rng = np.random.default_rng(context.config.seed)
+    # Same 15 features _extract_features builds, in realistic ranges
+    low = np.array([17, 1, 0.15, 0.25, 0.3, 60, 10, 4, 1.5, 0.8, 5, 1, 35, 35, 0.0])
+    high = np.array([26, 5, 0.35, 0.45, 0.6, 160, 35, 15, 6.5, 1.8, 13, 5, 70, 70, 1.0])
+    vectors = rng.uniform(low, high, size=(max(context.config.prospects, 51), len(low)))
+    targets = itertools.cycle(range(len(vectors)))
+
+    def run():
+        target = next(targets)
+        candidates = [(target + offset) % len(vectors) for offset in range(1, 51)]
+        scores = [
+            ProspectComparisonsService._calculate_similarity(vectors[target], vectors[other])
+            for other in candidates
+        ]
+        sorted(zip(scores, candidates), reverse=True)[:5]
+        return len(candidates)
+
+    return run
+
+
+@benchmark("duplicate_name_similarity", kind="micro", iterations=10)
+def duplicate_name_similarity(context: BenchmarkContext):
+    """Fuzzy-match one incoming name against every prospect name."""
+    from app.services.duplicate_detection_service import DuplicateDetectionService
+
+    service = DuplicateDetectionService()
+    names = [row["name"] for row in generate(context.config)["prospects"]]
+    incoming = itertools.cycle(names)
+
+    def run():
+        name = next(incoming)
+        for other in names:
+            service._calculate_name_similarity(name, other)
+        return len(names)
+
+    return run
+
+
+@benchmark("batch_confidence_scoring", kind="micro", iterations=10)
+def batch_confidence_scoring(context: BenchmarkContext):
+    """Confidence scoring for a batch job, chunked and gathered like BatchPredictionProcessor."""
+    from app.ml.confidence_scoring import ConfidenceScorer
+
+    rng = np.random.default_rng(context.config.seed)
+    n = min(context.config.prospects, 1000)
+    probabilities = rng.uniform(0.05, 0.95, size=n)
+    shap_values = rng.normal(0.0, 0.05, size=(n, 30))
+    feature_rows = [
+        {"age": float(age), "level": "AA", "batting_avg": float(avg), "on_base_pct": float(avg + 0.07)}
+        for age, avg in zip(rng.integers(17, 27, size=n), rng.uniform(0.2, 0.33, size=n))
+    ]
+    scorer = ConfidenceScorer()
+
+    async def run():
+        for start in range(0, n, BATCH_CHUNK_SIZE):
+            await asyncio.gather(*(
+                scorer.calculate_confidence(
+                    float(probabilities[i]), shap_values[i].tolist(), feature_rows[i]
+                )
+                for i in range(start, min(start + BATCH_CHUNK_SIZE, n))
+            ))
+        return n
+
+    return run
+
+
+# ---------------------------------------------------------------------------
+# End-to-end benchmarks (seeded database)
+# ---------------------------------------------------------------------------
+
+@benchmark("rankings_endpoint", kind="e2e", iterations=10, warmup=1)
+def rankings_endpoint(context: BenchmarkContext):
+    """GET /prospects rankings page for a premium user, cache cold."""
+    from app.api.api_v1.endpoints.prospects import get_prospect_rankings
+    from app.core.principal_cache import Principal
+
+    db = _async_session(context)
+    principal = Principal(id=1, email="bench@example.com", subscription_tier="premium")
+
+    async def run():
+        await get_prospect_rankings(
+            page=1, page_size=50, limit=500,
+            position=None, organization=None, level=None,
+            eta_min=None, eta_max=None, age_min=None, age_max=None,
+            search=None, sort_by="dynasty_rank", sort_order="asc",
+            current_user=principal, db=db
+        )
+        db.expunge_all()
+        return 1
+
+    return run
+
+
+@benchmark("hype_calculation", kind="e2e", iterations=30, warmup=2)
+def hype_calculation(context: BenchmarkContext):
+    """HypeCalculator.calculate_hype_score, one player per call."""
+    from app.models.hype import PlayerHype
+    from app.services.hype_calculator import HypeCalculator
+
+    db = _sync_session(context)
+    player_ids = itertools.cycle([row.player_id for row in db.query(PlayerHype.player_id).all()])
+    calculator = HypeCalculator(db)
+
+    def run():
+        calculator.calculate_hype_score(next(player_ids))
+        return 1
+
+    return run
+
+
+@benchmark("similar_prospects", kind="e2e", iterations=30, warmup=2)
+def similar_prospects(context: BenchmarkContext):
+    """ProspectComparisonsService.find_similar_prospects, one prospect per call."""
+    from app.services.prospect_comparisons_service import ProspectComparisonsService
+
+    db = _async_session(context)
+    prospect_ids = itertools.cycle(range(1, context.config.prospects + 1, 7))
+
+    async def run():
+        result = await ProspectComparisonsService.find_similar_prospects(
+            db, next(prospect_ids), limit=5, include_historical=True
+        )
+        if "error" in result:
+            raise RuntimeError(result["error"])
+        return 1
+
+    return run
+
+
+@benchmark("duplicate_check_incoming", kind="e2e", iterations=10, warmup=1)
+def duplicate_check_incoming(context: BenchmarkContext):
+    """DuplicateDetectionService.detect_duplicates for one incoming prospect."""
+    from app.services.duplicate_detection_service import DuplicateDetectionService
+
+    db = _async_session(context)
+    service = DuplicateDetectionService()
+    incoming = itertools.cycle(generate(context.config)["prospects"][::11])
+
+    async def run():
+        row = next(incoming)
+        await service.detect_duplicates(db, {
+            "name": row["name"],
+            "organization": row["organization"],
+            "position": row["position"],
+            "age": row["age"],
+        })
+        db.expunge_all()
+        return 1
+
+    return run
+
+
+@benchmark("duplicate_full_scan", kind="e2e", iterations=1, warmup=0, slow=True)
+def duplicate_full_scan(context: BenchmarkContext):
+    """DuplicateDetectionService.detect_duplicates over the whole table (pairwise)."""
+    from app.services.duplicate_detection_service import DuplicateDetectionService
+
+    db = _async_session(context)
+    service = DuplicateDetectionService()
+    n = context.config.prospects
+
+    async def run():
+        await service.detect_duplicates(db)
+        db.expunge_all()
+        return n * (n - 1) // 2
+
+    return run
+
+
+@benchmark("milb_season_totals", kind="e2e", iterations=20, warmup=2)
+def milb_season_totals(context: BenchmarkContext):
+    """Per player, season and level totals from milb_game_logs."""
+    from sqlalchemy import func, select
+
+    from benchmarks.synthetic import milb_game_logs as logs
+
+    db = _async_session(context)
+    query = select(
+        logs.c.mlb_player_id, logs.c.season, logs.c.level,
+        func.count().label("games"),
+        func.sum(logs.c.plate_appearances).label("pa"),
+        func.sum(logs.c.hits).label("hits"),
+        func.sum(logs.c.home_runs).label("hr"),
+        func.sum(logs.c.walks).label("bb"),
+        func.sum(logs.c.strikeouts).label("so"),
+    ).group_by(logs.c.mlb_player_id, logs.c.season, logs.c.level)
+
+    async def run():
+        rows = (await db.execute(query)).all()
+        return len(rows)
+
+    return run
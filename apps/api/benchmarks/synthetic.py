@@ -0,0 +1,481 @@
+"""
+Seeded synthetic data for benchmarks.
+
+Generates prospects with stats snapshots, scouting grades, ML predictions,
+hype records with social mentions and media articles, and MiLB game logs,
+then bulk-loads them into Postgres or a SQLite stand-in. The same seed and
+sizes always produce the same rows, so runs on different days compare
+like for like.
+
+A small fraction of prospects are near-duplicates of others (nickname or
+reversed name, same organization) so duplicate detection has real work to
+find.
+
+@module synthetic
+@since 1.0.0
+"""
+
+import logging
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+import numpy as np
+from sqlalchemy import (
+    BigInteger, Column, Date, Integer, MetaData, String, Table,
+    create_engine, delete, func, select,
+)
+
+from app.db.database import Base
+from app.db.models import MLPrediction, Prospect, ProspectStats, ScoutingGrades
+from app.models.hype import (
+    HypeAlert, HypeHistory, MediaArticle, PlayerHype, SearchTrend,
+    SocialMention, TrendingTopic,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fixed reference time so generated timestamps do not drift between runs
+REFERENCE_TIME = datetime(2025, 9, 1, 12, 0, 0)
+
+# milb_game_logs has no ORM model; this is the subset the collectors write
+benchmark_metadata = MetaData()
+milb_game_logs = Table(
+    "milb_game_logs",
+    benchmark_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("prospect_id", Integer, index=True),
+    Column("mlb_player_id", Integer, index=True),
+    Column("season", Integer),
+    Column("game_pk", BigInteger),
+    Column("game_date", Date),
+    Column("level", String(20)),
+    Column("game_type", String(20)),
+    Column("games_played", Integer),
+    Column("data_source", String(50)),
+    Column("plate_appearances", Integer),
+    Column("at_bats", Integer),
+    Column("hits", Integer),
+    Column("doubles", Integer),
+    Column("triples", Integer),
+    Column("home_runs", Integer),
+    Column("walks", Integer),
+    Column("strikeouts", Integer),
+    Column("rbi", Integer),
+    Column("stolen_bases", Integer),
+)
+
+ORM_TABLES = [
+    Prospect.__table__,
+    ProspectStats.__table__,
+    ScoutingGrades.__table__,
+    MLPrediction.__table__,
+    PlayerHype.__table__,
+    SocialMention.__table__,
+    MediaArticle.__table__,
+    HypeHistory.__table__,
+    HypeAlert.__table__,
+    TrendingTopic.__table__,
+    SearchTrend.__table__,
+]
+
+# Insert order respects foreign keys; deletes run in reverse
+LOAD_ORDER = [
+    ("prospects", Prospect.__table__),
+    ("prospect_stats", ProspectStats.__table__),
+    ("scouting_grades", ScoutingGrades.__table__),
+    ("ml_predictions", MLPrediction.__table__),
+    ("player_hype", PlayerHype.__table__),
+    ("social_mentions", SocialMention.__table__),
+    ("media_articles", MediaArticle.__table__),
+    ("milb_game_logs", milb_game_logs),
+]
+DERIVED_TABLES = [
+    HypeHistory.__table__, HypeAlert.__table__,
+    TrendingTopic.__table__, SearchTrend.__table__,
+]
+
+FIRST_NAMES = [
+    "Jackson", "Junior", "Ethan", "Roman", "Marcelo", "Jordan", "Carson", "Walker",
+    "Max", "Colt", "Travis", "Dylan", "Samuel", "Jett", "Kevin", "Leodalis",
+    "Aidan", "Bubba", "Cole", "Chase", "Jacob", "Jonathan", "Thomas", "Andrew",
+    "Michael", "Christopher", "Alexander", "Daniel", "Matthew", "Nicholas",
+]
+LAST_NAMES = [
+    "Holliday", "Caminero", "Salas", "Anthony", "Mayer", "Lawlar", "Williams",
+    "Jenkins", "Clark", "Keith", "Bazzana", "Crews", "Basallo", "Wetherholt",
+    "Montgomery", "De Vries", "Emerson", "Chandler", "Tolle", "Wilson",
+    "Rodriguez", "Martinez", "Johnson", "Smith", "Garcia", "Miller", "Davis",
+    "Lopez", "Gonzalez", "Hernandez", "Perez", "Young", "Walker", "Hall",
+]
+NICKNAMES = {
+    "Jacob": "Jake", "Jonathan": "Jon", "Thomas": "Tom", "Andrew": "Andy",
+    "Michael": "Mike", "Christopher": "Chris", "Alexander": "Alex",
+    "Daniel": "Dan", "Matthew": "Matt", "Nicholas": "Nick", "Samuel": "Sam",
+}
+ORGANIZATIONS = [
+    "Arizona Diamondbacks", "Atlanta Braves", "Baltimore Orioles", "Boston Red Sox",
+    "Chicago Cubs", "Chicago White Sox", "Cincinnati Reds", "Cleveland Guardians",
+    "Colorado Rockies", "Detroit Tigers", "Houston Astros", "Kansas City Royals",
+    "Los Angeles Angels", "Los Angeles Dodgers", "Miami Marlins", "Milwaukee Brewers",
+    "Minnesota Twins", "New York Mets", "New York Yankees", "Athletics",
+    "Philadelphia Phillies", "Pittsburgh Pirates", "San Diego Padres",
+    "San Francisco Giants", "Seattle Mariners", "St. Louis Cardinals",
+    "Tampa Bay Rays", "Texas Rangers", "Toronto Blue Jays", "Washington Nationals",
+]
+POSITIONS = ["C", "1B", "2B", "3B", "SS", "LF", "CF", "RF", "DH", "SP", "RP"]
+POSITION_WEIGHTS = [0.07, 0.05, 0.07, 0.07, 0.11, 0.05, 0.08, 0.07, 0.02, 0.30, 0.11]
+PITCHER_POSITIONS = {"SP", "RP"}
+LEVELS = ["Rookie", "A", "A+", "AA", "AAA"]
+LEVEL_WEIGHTS = [0.15, 0.25, 0.25, 0.2, 0.15]
+GRADE_SOURCES = ["Fangraphs", "MLB Pipeline", "Baseball America", "Baseball Prospectus"]
+RISKS = ["Safe", "Moderate", "High", "Extreme"]
+PLATFORMS = ["twitter", "reddit", "bluesky", "instagram", "tiktok"]
+SENTIMENTS = ["positive", "neutral", "negative"]
+MEDIA_SOURCES = ["MLB.com", "FanGraphs", "Baseball America", "ESPN", "The Athletic"]
+
+
+@dataclass
+class SyntheticConfig:
+    """Sizes and seed for one synthetic dataset."""
+
+    prospects: int = 2000
+    seed: int = 42
+    stats_per_prospect: int = 3
+    games_per_prospect: int = 40
+    hype_fraction: float = 0.05
+    mentions_per_player: int = 60
+    articles_per_player: int = 8
+    duplicate_fraction: float = 0.02
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _grade(rng: np.random.Generator, size: int, mean: float = 50.0) -> np.ndarray:
+    """Scouting grades on the 20-80 scale, rounded to the nearest 5."""
+    raw = rng.normal(mean, 8.0, size)
+    return (np.clip(np.round(raw / 5) * 5, 20, 80)).astype(int)
+
+
+def generate(config: SyntheticConfig) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build every synthetic row for a config.
+
+    @param config - Dataset sizes and seed
+    @returns Mapping of table name to row dicts, in load order
+    """
+    rng = np.random.default_rng(config.seed)
+    n = config.prospects
+    ids = np.arange(1, n + 1)
+
+    positions = rng.choice(POSITIONS, size=n, p=POSITION_WEIGHTS)
+    levels = rng.choice(LEVELS, size=n, p=LEVEL_WEIGHTS)
+    orgs = rng.choice(ORGANIZATIONS, size=n)
+    ages = rng.integers(17, 27, size=n)
+    etas = np.clip(2025 + (26 - ages) // 3 + rng.integers(-1, 2, size=n), 2024, 2035)
+    firsts = rng.choice(FIRST_NAMES, size=n)
+    lasts = rng.choice(LAST_NAMES, size=n)
+    names = [f"{first} {last}" for first, last in zip(firsts, lasts)]
+
+    # Near-duplicates copy an earlier prospect's identity with a name variant
+    n_dupes = int(n * config.duplicate_fraction)
+    if n > 1 and n_dupes:
+        for idx in rng.choice(np.arange(1, n), size=n_dupes, replace=False):
+            source = int(rng.integers(0, idx))
+            first, last = firsts[source], lasts[source]
+            variant = f"{NICKNAMES[first]} {last}" if first in NICKNAMES else f"{last} {first}"
+            names[idx] = variant
+            positions[idx], orgs[idx], levels[idx] = positions[source], orgs[source], levels[source]
+            ages[idx] = ages[source]
+
+    prospects = [
+        {
+            "id": int(pid),
+            "mlb_id": str(prospect_id_to_mlb(int(pid))),
+            "mlb_player_id": prospect_id_to_mlb(int(pid)),
+            "name": names[i],
+            "position": str(positions[i]),
+            "organization": str(orgs[i]),
+            "level": str(levels[i]),
+            "age": int(ages[i]),
+            "eta_year": int(etas[i]),
+            "created_at": REFERENCE_TIME,
+            "updated_at": REFERENCE_TIME,
+        }
+        for i, pid in enumerate(ids)
+    ]
+
+    is_pitcher = np.isin(positions, list(PITCHER_POSITIONS))
+
+    # Stats snapshots, one per month going back from the reference time
+    stats = []
+    k = config.stats_per_prospect
+    games = rng.integers(20, 120, size=(n, k))
+    at_bats = games * rng.integers(3, 5, size=(n, k))
+    avg = np.clip(rng.normal(0.265, 0.035, size=(n, k)), 0.150, 0.400)
+    obp = np.clip(avg + rng.normal(0.075, 0.02, size=(n, k)), 0.0, 1.0)
+    slg = np.clip(avg + rng.normal(0.16, 0.06, size=(n, k)), 0.0, 1.0)
+    era = np.clip(rng.normal(3.9, 1.0, size=(n, k)), 0.5, 9.0)
+    whip = np.clip(rng.normal(1.25, 0.18, size=(n, k)), 0.7, 2.2)
+    innings = rng.uniform(20.0, 150.0, size=(n, k))
+    stat_id = 0
+    for i, pid in enumerate(ids):
+        for j in range(k):
+            stat_id += 1
+            recorded = REFERENCE_TIME - timedelta(days=30 * (k - 1 - j))
+            row = {
+                "id": stat_id,
+                "prospect_id": int(pid),
+                "date_recorded": recorded.date(),
+                "season": recorded.year,
+                "games_played": int(games[i, j]),
+                "created_at": recorded,
+                "updated_at": recorded,
+            }
+            if is_pitcher[i]:
+                row.update({
+                    "innings_pitched": round(float(innings[i, j]), 1),
+                    "earned_runs": int(era[i, j] * innings[i, j] / 9),
+                    "era": round(float(era[i, j]), 2),
+                    "whip": round(float(whip[i, j]), 2),
+                    "strikeouts_per_nine": round(float(rng.normal(9.5, 1.8)), 1),
+                    "walks_per_nine": round(float(rng.normal(3.4, 0.9)), 1),
+                })
+            else:
+                ab = int(at_bats[i, j])
+                row.update({
+                    "at_bats": ab,
+                    "hits": int(ab * avg[i, j]),
+                    "home_runs": int(ab * rng.uniform(0.01, 0.06)),
+                    "rbi": int(ab * rng.uniform(0.08, 0.2)),
+                    "stolen_bases": int(rng.integers(0, 30)),
+                    "walks": int(ab * rng.uniform(0.06, 0.14)),
+                    "strikeouts": int(ab * rng.uniform(0.15, 0.32)),
+                    "batting_avg": round(float(avg[i, j]), 3),
+                    "on_base_pct": round(float(obp[i, j]), 3),
+                    "slugging_pct": round(float(slg[i, j]), 3),
+                    "woba": round(float(obp[i, j] * 0.7 + slg[i, j] * 0.3), 3),
+                    "wrc_plus": int(rng.normal(105, 20)),
+                })
+            stats.append(row)
+
+    # One to three grading sources per prospect
+    grades = []
+    overall = _grade(rng, n)
+    n_sources = rng.integers(1, 4, size=n)
+    grade_id = 0
+    for i, pid in enumerate(ids):
+        for source in rng.choice(GRADE_SOURCES, size=n_sources[i], replace=False):
+            grade_id += 1
+            tools = _grade(rng, 5, mean=float(overall[i]))
+            grades.append({
+                "id": grade_id,
+                "prospect_id": int(pid),
+                "source": str(source),
+                "overall": int(overall[i]),
+                "hit": None if is_pitcher[i] else int(tools[0]),
+                "power": None if is_pitcher[i] else int(tools[1]),
+                "run": int(tools[2]),
+                "field": int(tools[3]),
+                "throw": int(tools[4]),
+                "future_value": int(overall[i]),
+                "risk": str(rng.choice(RISKS)),
+                "created_at": REFERENCE_TIME,
+                "updated_at": REFERENCE_TIME,
+            })
+
+    # success_rating for every prospect, career_war for half of them
+    predictions = []
+    confidence = rng.uniform(0.35, 0.98, size=n)
+    rating = np.clip((overall - 20) / 60 + rng.normal(0, 0.08, size=n), 0.0, 1.0)
+    for i, pid in enumerate(ids):
+        predictions.append({
+            "id": len(predictions) + 1,
+            "prospect_id": int(pid),
+            "model_version": "bench-v1",
+            "prediction_type": "success_rating",
+            "prediction_value": round(float(rating[i]), 4),
+            "confidence_score": round(float(confidence[i]), 4),
+            "created_at": REFERENCE_TIME,
+            "updated_at": REFERENCE_TIME,
+        })
+        if i % 2 == 0:
+            predictions.append({
+                "id": len(predictions) + 1,
+                "prospect_id": int(pid),
+                "model_version": "bench-v1",
+                "prediction_type": "career_war",
+                "prediction_value": round(float(rating[i] * 25), 2),
+                "confidence_score": round(float(confidence[i]), 4),
+                "created_at": REFERENCE_TIME,
+                "updated_at": REFERENCE_TIME,
+            })
+
+    # Hype records for the best-graded prospects, with mentions over 30 days
+    n_hype = max(1, int(n * config.hype_fraction))
+    hype_idx = np.argsort(-overall, kind="stable")[:n_hype]
+    player_hype, mentions, articles = [], [], []
+    for hype_id, i in enumerate(hype_idx, start=1):
+        prospect = prospects[i]
+        player_hype.append({
+            "id": hype_id,
+            "player_id": prospect["mlb_id"],
+            "player_name": prospect["name"],
+            "player_type": "prospect",
+            "hype_score": 0.0,
+            "created_at": REFERENCE_TIME,
+            "updated_at": REFERENCE_TIME,
+        })
+        m = config.mentions_per_player
+        hours_ago = rng.exponential(120.0, size=m).clip(0, 30 * 24)
+        followers = rng.lognormal(6.0, 1.6, size=m).astype(int)
+        likes = rng.negative_binomial(2, 0.05, size=m)
+        for j in range(m):
+            mentions.append({
+                "id": len(mentions) + 1,
+                "player_hype_id": hype_id,
+                "platform": str(PLATFORMS[j % len(PLATFORMS)]),
+                "post_id": f"post-{hype_id}-{j}",
+                "author_handle": f"fan{int(rng.integers(0, 5000))}",
+                "author_followers": int(followers[j]),
+                "content": f"{prospect['name']} is raking again",
+                "likes": int(likes[j]),
+                "shares": int(likes[j] // 8),
+                "comments": int(likes[j] // 5),
+                "views": int(likes[j] * 40),
+                "sentiment": str(rng.choice(SENTIMENTS, p=[0.55, 0.35, 0.10])),
+                "sentiment_confidence": round(float(rng.uniform(0.5, 1.0)), 3),
+                "posted_at": REFERENCE_TIME - timedelta(hours=float(hours_ago[j])),
+                "collected_at": REFERENCE_TIME,
+            })
+        for j in range(config.articles_per_player):
+            articles.append({
+                "id": len(articles) + 1,
+                "player_hype_id": hype_id,
+                "source": MEDIA_SOURCES[j % len(MEDIA_SOURCES)],
+                "title": f"Scouting report: {prospect['name']}",
+                "url": f"https://example.com/articles/{hype_id}/{j}",
+                "sentiment": str(rng.choice(SENTIMENTS, p=[0.6, 0.3, 0.1])),
+                "sentiment_confidence": round(float(rng.uniform(0.5, 1.0)), 3),
+                "prominence_score": round(float(rng.uniform(0.1, 1.0)), 3),
+                "published_at": REFERENCE_TIME - timedelta(hours=float(rng.uniform(0, 720))),
+                "collected_at": REFERENCE_TIME,
+            })
+
+    # Game logs for hitters across the last two seasons
+    game_logs = []
+    g = config.games_per_prospect
+    season_start = {2024: date(2024, 4, 5), 2025: date(2025, 4, 4)}
+    for i, pid in enumerate(ids):
+        if is_pitcher[i]:
+            continue
+        pa = rng.integers(2, 6, size=g)
+        hits = rng.binomial(pa, float(avg[i, -1]))
+        for j in range(g):
+            season = 2024 if j < g // 2 else 2025
+            walks = int(rng.binomial(pa[j], 0.1))
+            game_logs.append({
+                "id": len(game_logs) + 1,
+                "prospect_id": int(pid),
+                "mlb_player_id": prospect_id_to_mlb(int(pid)),
+                "season": season,
+                "game_pk": 700000 + int(pid) * 1000 + j,
+                "game_date": season_start[season] + timedelta(days=int(j % (g // 2 or 1)) * 2),
+                "level": str(levels[i]),
+                "game_type": "Regular",
+                "games_played": 1,
+                "data_source": "synthetic",
+                "plate_appearances": int(pa[j]),
+                "at_bats": int(pa[j]) - walks,
+                "hits": int(min(hits[j], pa[j] - walks)),
+                "doubles": int(rng.binomial(1, 0.2)),
+                "triples": 0,
+                "home_runs": int(rng.binomial(1, 0.04)),
+                "walks": walks,
+                "strikeouts": int(rng.binomial(pa[j], 0.22)),
+                "rbi": int(rng.integers(0, 3)),
+                "stolen_bases": int(rng.binomial(1, 0.1)),
+            })
+
+    return {
+        "prospects": prospects,
+        "prospect_stats": stats,
+        "scouting_grades": grades,
+        "ml_predictions": predictions,
+        "player_hype": player_hype,
+        "social_mentions": mentions,
+        "media_articles": articles,
+        "milb_game_logs": game_logs,
+    }
+
+
+def prospect_id_to_mlb(prospect_id: int) -> int:
+    """MLB player id assigned to a synthetic prospect."""
+    return 680000 + prospect_id
+
+
+def populate(database_url: str, config: SyntheticConfig, chunk_size: int = 5000) -> Dict[str, int]:
+    """
+    Create the benchmark tables and load a synthetic dataset.
+
+    Existing rows in the benchmark tables are deleted first, so pointing this
+    at a shared database is destructive; use a dedicated benchmark database.
+
+    @param database_url - Sync SQLAlchemy URL (postgresql:// or sqlite:///)
+    @param config - Dataset sizes and seed
+    @param chunk_size - Rows per executemany batch
+    @returns Row counts per table
+    """
+    data = generate(config)
+    engine = create_engine(database_url)
+    try:
+        Base.metadata.create_all(engine, tables=ORM_TABLES)
+        benchmark_metadata.create_all(engine)
+
+        with engine.begin() as conn:
+            for table in DERIVED_TABLES:
+                conn.execute(delete(table))
+            for _, table in reversed(LOAD_ORDER):
+                conn.execute(delete(table))
+
+            for name, table in LOAD_ORDER:
+                rows = _uniform_keys(data[name])
+                for start in range(0, len(rows), chunk_size):
+                    conn.execute(table.insert(), rows[start:start + chunk_size])
+
+        if engine.dialect.name == "postgresql":
+            # Explicit ids leave sequences behind; move them past the loaded rows
+            with engine.begin() as conn:
+                for _, table in LOAD_ORDER:
+                    conn.exec_driver_sql(
+                        f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                        f"COALESCE((SELECT MAX(id) FROM {table.name}), 1))"
+                    )
+
+        counts = {name: len(rows) for name, rows in data.items()}
+        logger.info(f"Loaded synthetic dataset {config.to_dict()}: {counts}")
+        return counts
+    finally:
+        engine.dispose()
+
+
+def _uniform_keys(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Give every row the same keys, as executemany requires."""
+    keys = {key for row in rows for key in row}
+    return [{key: row.get(key) for key in keys} for row in rows]
+
+
+def dataset_counts(database_url: str) -> Dict[str, int]:
+    """Row counts of the benchmark tables, or an empty dict if not seeded."""
+    engine = create_engine(database_url)
+    try:
+        with engine.connect() as conn:
+            return {
+                name: conn.execute(select(func.count()).select_from(table)).scalar_one()
+                for name, table in LOAD_ORDER
+            }
+    except Exception:
+        return {}
+    finally:
+        engine.dispose()
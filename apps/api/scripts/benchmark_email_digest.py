@@ -0,0 +1,90 @@
+"""
+Email Digest Throughput Benchmark
+
+Runs the digest pipeline in dry-run mode against the local stub provider
+with synthetic recipients, so batch size, concurrency and render workers
+can be tuned without a database or sending real email. The stub enforces
+a requests-per-second limit and returns Resend-style rate-limit headers.
+
+Usage:
+  python benchmark_email_digest.py --recipients 5000
+  python benchmark_email_digest.py --recipients 20000 --concurrency 8 --render-workers 4
+  python benchmark_email_digest.py --provider-rate 2 --latency 0.2   # tight provider limit
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.email_delivery import StubEmailProvider
+from app.services.email_digest_pipeline import DigestPipeline
+
+# Previous job loop: one send per user plus a fixed 0.1s sleep
+LEGACY_EMAILS_PER_SECOND = 10
+
+
+def synthetic_recipients(count: int):
+    return [
+        {
+            "user_id": user_id,
+            "user_name": f"Benchmark User {user_id}",
+            "user_email": f"user{user_id}@example.com",
+            "preferences": {},
+        }
+        for user_id in range(1, count + 1)
+    ]
+
+
+async def run(args):
+    provider = StubEmailProvider(
+        latency=args.latency,
+        requests_per_window=args.provider_rate,
+        window=1.0
+    )
+    pipeline = DigestPipeline(
+        db=None,
+        provider=provider,
+        dry_run=True,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        render_workers=args.render_workers
+    )
+
+    report = await pipeline.deliver(synthetic_recipients(args.recipients))
+
+    print("=" * 80)
+    print("EMAIL DIGEST DRY-RUN BENCHMARK")
+    print("=" * 80)
+    print(f"Recipients:        {args.recipients}")
+    print(f"Batch size:        {pipeline.batch_size}")
+    print(f"Concurrency:       {pipeline.concurrency}")
+    print(f"Render workers:    {pipeline.render_workers}")
+    print(f"Provider limit:    {args.provider_rate} requests/s, {args.latency * 1000:.0f}ms latency")
+    print("-" * 80)
+    print(f"Delivered:         {len(report.sent_user_ids)} ({len(report.failed_user_ids)} failed)")
+    print(f"Elapsed:           {report.elapsed:.2f}s")
+    print(f"Throughput:        {report.emails_per_second:.1f} emails/s")
+    print(f"Provider requests: {report.requests} ({report.throttled} throttled)")
+    print(f"Legacy estimate:   {args.recipients / LEGACY_EMAILS_PER_SECOND:.1f}s at "
+          f"{LEGACY_EMAILS_PER_SECOND} emails/s")
+    print("=" * 80)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark digest delivery against a stub provider")
+    parser.add_argument("--recipients", type=int, default=5000, help="Synthetic recipients")
+    parser.add_argument("--batch-size", type=int, default=100, help="Emails per provider request")
+    parser.add_argument("--concurrency", type=int, default=4, help="Provider requests in flight")
+    parser.add_argument("--render-workers", type=int, default=2, help="Render processes (0 = in-process)")
+    parser.add_argument("--provider-rate", type=int, default=10, help="Stub provider requests per second")
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub provider seconds per request")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
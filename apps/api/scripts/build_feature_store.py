@@ -0,0 +1,153 @@
+"""
+Build the columnar feature store from ml_features.
+
+Decodes the JSON feature_vector rows once per as-of year and writes them
+as Arrow partitions under the registered schema version. Optionally
+materializes a typed wide table (one DOUBLE PRECISION column per feature)
+for SQL consumers, and compacts partitions that have accumulated appends.
+
+Usage:
+  python build_feature_store.py --year 2024
+  python build_feature_store.py --year 2023 --year 2024 --wide-table
+  python build_feature_store.py --year 2024 --compact-only
+"""
+
+import sys
+import os
+import io
+import csv
+import json
+import re
+import time
+import argparse
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db.database import get_db_sync
+from app.ml.feature_store import FeatureStore, PROSPECT_ID_COLUMN
+
+
+def load_feature_rows(db, as_of_year, feature_version):
+    """Load prospect_id -> feature dict for one as-of year."""
+    query = text("""
+        SELECT prospect_id, feature_vector
+        FROM ml_features
+        WHERE as_of_year = :as_of_year
+        AND feature_set_version = :version
+        ORDER BY prospect_id
+    """)
+
+    rows = db.execute(query, {'as_of_year': as_of_year, 'version': feature_version}).fetchall()
+    return {
+        prospect_id: json.loads(vector) if isinstance(vector, str) else (vector or {})
+        for prospect_id, vector in rows
+    }
+
+
+def wide_table_name(feature_version):
+    """Table name for a schema version, e.g. v1.0 -> ml_features_wide_v1_0."""
+    return "ml_features_wide_" + re.sub(r'[^a-z0-9]+', '_', feature_version.lower()).strip('_')
+
+
+def write_wide_table(db, store, feature_version, as_of_year):
+    """Replace one year of the typed wide table from the store partition."""
+    schema = store.get_schema(feature_version)
+    table = wide_table_name(feature_version)
+    ids, matrix = store.open(feature_version, as_of_year).matrix(fill_value=float('nan'))
+
+    columns = ",\n".join(f'"{name}" DOUBLE PRECISION' for name in schema.feature_names)
+    column_list = ", ".join(f'"{name}"' for name in schema.feature_names)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for prospect_id, row in zip(ids.tolist(), matrix.tolist()):
+        # Empty CSV fields load as NULL
+        writer.writerow([prospect_id, as_of_year] + ['' if value != value else value for value in row])
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                {PROSPECT_ID_COLUMN} INTEGER NOT NULL,
+                as_of_year INTEGER NOT NULL,
+                {columns},
+                PRIMARY KEY ({PROSPECT_ID_COLUMN}, as_of_year)
+            )
+        """)
+        cursor.execute(f"DELETE FROM {table} WHERE as_of_year = %s", (as_of_year,))
+        cursor.copy_expert(
+            f"COPY {table} ({PROSPECT_ID_COLUMN}, as_of_year, {column_list}) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    print(f"  Wrote {len(ids)} rows to {table}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the columnar ML feature store')
+    parser.add_argument('--year', type=int, action='append', dest='years',
+                        help='As-of year to build (repeatable, default: 2024)')
+    parser.add_argument('--feature-version', default='v1.0', help='Feature set / schema version')
+    parser.add_argument('--wide-table', action='store_true',
+                        help='Also materialize the typed wide table in Postgres')
+    parser.add_argument('--compact-only', action='store_true',
+                        help='Only compact existing partitions')
+    args = parser.parse_args()
+
+    years = args.years or [2024]
+
+    print("=" * 80)
+    print("FEATURE STORE BUILD")
+    print("=" * 80)
+    print(f"Schema version: {args.feature_version}")
+    print(f"Years: {', '.join(str(year) for year in years)}")
+
+    store = FeatureStore()
+    db = get_db_sync()
+
+    try:
+        for year in years:
+            start = time.perf_counter()
+            print(f"\n{year}:")
+
+            if args.compact_only:
+                path = store.compact(args.feature_version, year)
+                print(f"  Compacted to {path}")
+                continue
+
+            rows = load_feature_rows(db, year, args.feature_version)
+            if not rows:
+                print("  No ml_features rows, skipping")
+                continue
+
+            schema = store.ensure_schema(args.feature_version, rows)
+            path = store.write_partition(args.feature_version, year, rows)
+            print(f"  Wrote {len(rows)} rows x {len(schema.feature_names)} features to {path}")
+
+            if args.wide_table:
+                write_wide_table(db, store, args.feature_version, year)
+
+            print(f"  Done in {time.perf_counter() - start:.2f}s")
+
+        print("\nFeature store build complete!")
+
+    except Exception as e:
+        print(f"\nFatal error: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
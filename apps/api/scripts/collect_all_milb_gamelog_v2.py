@@ -10,10 +10,20 @@ Key improvements over v1:
 - Rate limiting with backoff
 - Memory optimization
 - Better duplicate detection
+- Incremental daily sync driven by per-player watermarks
+
+Incremental mode skips roster discovery. The newest stored game per
+(player, season, level, stat group) is that player's watermark. The
+schedule endpoint shows which teams finished games since then, and the
+transactions endpoint shows who changed teams. Only those players'
+game logs are requested, and only games on or after the watermark are
+appended. The watermarks live in milb_game_logs itself, so they can never
+disagree with the stored rows. New players still come from a full run.
 
 Usage:
     python collect_all_milb_gamelog_v2.py --season 2025 --levels AAA AA A+
     python collect_all_milb_gamelog_v2.py --season 2025 --resume  # Resume interrupted collection
+    python collect_all_milb_gamelog_v2.py --season 2025 --incremental  # Nightly refresh
 """
 
 import argparse
@@ -22,14 +32,15 @@ import json
 import logging
 import os
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
 import aiohttp
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from app.db.database import engine
+from app.services.statsapi_cache import statsapi_cache
 
 # Configure logging
 LOG_DIR = Path(__file__).parent.parent / "logs"
@@ -118,6 +129,17 @@ class ProgressTracker:
         }
 
 
+class Watermark(NamedTuple):
+    """Newest stored game for a (player, level, stat group) in the season."""
+
+    last_game_date: date
+    team_id: Optional[int]
+
+
+# (mlb_player_id, level, 'hitting' | 'pitching') -> Watermark
+WatermarkKey = Tuple[int, str, str]
+
+
 class EnhancedMiLBCollector:
     """Enhanced MiLB game log collector with improved reliability."""
 
@@ -137,11 +159,14 @@ class EnhancedMiLBCollector:
     PITCHER_POSITIONS = {'P', 'SP', 'RP', 'LHP', 'RHP', 'CL', 'SU', 'MR'}
 
     def __init__(self, season: int, levels: List[str], concurrent_limit: int = 5,
-                 resume_file: Optional[str] = None):
+                 resume_file: Optional[str] = None, incremental: bool = False,
+                 lookback_days: int = 14):
         self.session: Optional[aiohttp.ClientSession] = None
         self.season = season
         self.levels = levels
         self.concurrent_limit = concurrent_limit
+        self.incremental = incremental
+        self.lookback_days = lookback_days
 
         # Rate limiting
         self.request_delay = 0.2  # Base delay between requests
@@ -157,7 +182,9 @@ class EnhancedMiLBCollector:
             'players_with_hitting': 0,
             'players_with_pitching': 0,
             'errors': 0,
-            'api_calls': 0
+            'api_calls': 0,
+            'players_checked': 0,
+            'players_updated': 0
         }
 
         # Resume capability
@@ -181,18 +208,18 @@ class EnhancedMiLBCollector:
             connector=connector
         )
 
-        # Load existing data
-        await self.load_existing_data()
-
-        # Load resume state if exists
-        self.load_resume_state()
+        # Incremental syncs read watermarks instead of the full player sets
+        if not self.incremental:
+            await self.load_existing_data()
+            self.load_resume_state()
 
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Clean up session and save state."""
         # Save resume state
-        self.save_resume_state()
+        if not self.incremental:
+            self.save_resume_state()
 
         if self.session:
             await self.session.close()
@@ -260,22 +287,24 @@ class EnhancedMiLBCollector:
         """Fetch JSON with automatic retry and exponential backoff."""
         retries = retries if retries is not None else self.max_retries
 
+        async def throttle():
+            # Cached responses skip the request delay entirely
+            await asyncio.sleep(self.request_delay)
+            self.stats['api_calls'] += 1
+
         for attempt in range(retries):
             try:
-                await asyncio.sleep(self.request_delay)
-                self.stats['api_calls'] += 1
-
-                async with self.session.get(url) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    elif response.status == 404:
-                        return None  # Not found is not an error
-                    elif response.status == 429:  # Rate limited
-                        wait_time = self.retry_delay * (2 ** attempt)
-                        logger.warning(f"Rate limited, waiting {wait_time}s...")
-                        await asyncio.sleep(wait_time)
-                    else:
-                        logger.warning(f"HTTP {response.status} for {url}")
+                response = await statsapi_cache.get(self.session, url, before_request=throttle)
+                if response.status == 200:
+                    return response.json()
+                elif response.status == 404:
+                    return None  # Not found is not an error
+                elif response.status == 429:  # Rate limited
+                    wait_time = self.retry_delay * (2 ** attempt)
+                    logger.warning(f"Rate limited, waiting {wait_time}s...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.warning(f"HTTP {response.status} for {url}")
 
             except asyncio.TimeoutError:
                 logger.warning(f"Timeout on attempt {attempt + 1} for {url}")
@@ -382,7 +411,12 @@ class EnhancedMiLBCollector:
 
     async def save_game_logs(self, player_id: int, game_logs: List[Dict],
                            level: str, stat_type: str) -> int:
-        """Save multiple game logs to database in a single transaction."""
+        """
+        Save multiple game logs to database in a single transaction.
+
+        Returns the number of rows actually inserted; games already stored
+        are skipped by ON CONFLICT and not counted.
+        """
         if not game_logs:
             return 0
 
@@ -398,8 +432,8 @@ class EnhancedMiLBCollector:
                         record = self.prepare_pitching_record(player_id, game_log, level)
                         query = self.get_pitching_insert_query()
 
-                    await conn.execute(text(query), record)
-                    saved_count += 1
+                    result = await conn.execute(text(query), record)
+                    saved_count += max(result.rowcount, 0)
 
             self.stats[f'{stat_type}_games'] += saved_count
             return saved_count
@@ -732,6 +766,7 @@ class EnhancedMiLBCollector:
         logger.info(f"Total hitting games: {self.stats['hitting_games']}")
         logger.info(f"Total pitching games: {self.stats['pitching_games']}")
         logger.info(f"API calls made: {self.stats['api_calls']}")
+        logger.info(statsapi_cache.format_report())
         logger.info(f"Errors encountered: {self.stats['errors']}")
 
         # Clean up resume file on successful completion
@@ -740,6 +775,200 @@ class EnhancedMiLBCollector:
             logger.info("Removed resume file (collection completed)")
 
 
+    async def load_watermarks(self) -> Dict[WatermarkKey, Watermark]:
+        """Newest stored game date and team per (player, level, stat group)."""
+        query = text("""
+            SELECT mlb_player_id, level, stat_group, game_date, team_id
+            FROM (
+                SELECT
+                    mlb_player_id,
+                    level,
+                    CASE WHEN COALESCE(games_pitched, 0) > 0 THEN 'pitching' ELSE 'hitting' END AS stat_group,
+                    game_date,
+                    team_id,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY mlb_player_id, level,
+                            CASE WHEN COALESCE(games_pitched, 0) > 0 THEN 'pitching' ELSE 'hitting' END
+                        ORDER BY game_date DESC, game_pk DESC
+                    ) AS rn
+                FROM milb_game_logs
+                WHERE season = :season
+                AND level IN :levels
+                AND mlb_player_id IS NOT NULL
+                AND game_date IS NOT NULL
+            ) latest
+            WHERE rn = 1
+        """).bindparams(bindparam('levels', expanding=True))
+
+        async with engine.begin() as conn:
+            result = await conn.execute(query, {'season': self.season, 'levels': list(self.levels)})
+            watermarks = {}
+            for row in result:
+                game_date = row.game_date
+                if isinstance(game_date, str):
+                    game_date = date.fromisoformat(game_date[:10])
+                elif isinstance(game_date, datetime):
+                    game_date = game_date.date()
+                watermarks[(int(row.mlb_player_id), row.level, row.stat_group)] = Watermark(
+                    game_date, row.team_id
+                )
+        return watermarks
+
+    def sync_window(self, watermarks: Dict[WatermarkKey, Watermark]) -> Tuple[date, date]:
+        """
+        Dates to scan for finished games.
+
+        Starts the day after the oldest watermark, but never more than
+        lookback_days back. When the cap applies, a player whose team last
+        played between the watermark and the window start is not selected
+        until a full collection runs, so that case is logged.
+        """
+        end = min(date.today(), date(self.season, 12, 31))
+        oldest = min(mark.last_game_date for mark in watermarks.values())
+        start = max(oldest + timedelta(days=1), end - timedelta(days=self.lookback_days))
+        if oldest + timedelta(days=1) < start:
+            logger.warning(
+                f"Oldest watermark {oldest} predates the {self.lookback_days}-day window "
+                f"starting {start}; games before then are only picked up by a full "
+                f"collection or a larger --lookback-days"
+            )
+        return min(start, end), end
+
+    async def get_team_game_dates(self, start: date, end: date) -> Dict[int, date]:
+        """Latest finished game date per team in the window, for the requested levels."""
+        level_map = {v: k for k, v in self.MILB_SPORT_IDS.items()}
+        latest: Dict[int, date] = {}
+
+        for level in self.levels:
+            sport_id = level_map.get(level)
+            if not sport_id:
+                continue
+            url = (f"{self.BASE_URL}/schedule?sportId={sport_id}&gameType=R"
+                   f"&startDate={start.isoformat()}&endDate={end.isoformat()}")
+            data = await self.fetch_with_retry(url)
+            if not data:
+                continue
+
+            for day in data.get('dates', []):
+                for game in day.get('games', []):
+                    if game.get('status', {}).get('abstractGameState') != 'Final':
+                        continue
+                    game_date = date.fromisoformat(game.get('officialDate') or day['date'])
+                    for side in ('home', 'away'):
+                        team_id = game.get('teams', {}).get(side, {}).get('team', {}).get('id')
+                        if team_id and game_date > latest.get(team_id, date.min):
+                            latest[team_id] = game_date
+
+        return latest
+
+    async def get_moved_players(self, start: date, end: date) -> Set[int]:
+        """Players with a transaction (promotion, assignment, ...) in the window."""
+        url = (f"{self.BASE_URL}/transactions?"
+               f"startDate={start.isoformat()}&endDate={end.isoformat()}")
+        data = await self.fetch_with_retry(url)
+        if not data:
+            return set()
+        return {
+            entry['person']['id'] for entry in data.get('transactions', [])
+            if entry.get('person', {}).get('id')
+        }
+
+    def plan_incremental(
+        self,
+        watermarks: Dict[WatermarkKey, Watermark],
+        team_game_dates: Dict[int, date],
+        moved_players: Set[int]
+    ) -> Dict[int, List[Tuple[str, str, Optional[date]]]]:
+        """
+        Game logs to request: player -> [(level, group, watermark date)].
+
+        A (player, level, group) is due when the player's last team has
+        finished a game after the watermark. Players who changed teams are
+        checked at every requested level, because a promotion starts a
+        level with no watermark yet.
+        """
+        plan: Dict[int, List[Tuple[str, str, Optional[date]]]] = {}
+        for (player_id, level, group), mark in watermarks.items():
+            team_date = team_game_dates.get(mark.team_id)
+            if player_id in moved_players or (team_date and team_date > mark.last_game_date):
+                plan.setdefault(player_id, []).append((level, group, mark.last_game_date))
+
+        for player_id in moved_players & set(plan):
+            known = {(level, group) for level, group, _ in plan[player_id]}
+            for group in {group for _, group, _ in plan[player_id]}:
+                for level in self.levels:
+                    if (level, group) not in known:
+                        plan[player_id].append((level, group, None))
+        return plan
+
+    async def sync_player(self, player_id: int, targets: List[Tuple[str, str, Optional[date]]]) -> int:
+        """Append games on or after each watermark; ON CONFLICT drops ones already stored."""
+        level_map = {v: k for k, v in self.MILB_SPORT_IDS.items()}
+        appended = 0
+        try:
+            for level, group, watermark in targets:
+                sport_id = level_map.get(level)
+                if not sport_id:
+                    continue
+                game_logs = await self.get_player_game_logs(player_id, sport_id, group)
+                # Same-day games are kept so the second game of a doubleheader is not lost
+                new_logs = [
+                    log for log in game_logs
+                    if watermark is None or (log.get('date') and date.fromisoformat(log['date']) >= watermark)
+                ]
+                if new_logs:
+                    appended += await self.save_game_logs(player_id, new_logs, level, group)
+        except Exception as e:
+            error_logger.error(f"Error syncing player {player_id}: {str(e)}")
+            self.stats['errors'] += 1
+
+        self.stats['players_checked'] += 1
+        if appended:
+            self.stats['players_updated'] += 1
+        return appended
+
+    async def sync_incremental(self):
+        """Append games played since each player's watermark."""
+        logger.info("="*80)
+        logger.info(f"Incremental MiLB GameLog Sync - Season {self.season}")
+        logger.info(f"Levels: {', '.join(self.levels)}")
+        logger.info("="*80)
+
+        watermarks = await self.load_watermarks()
+        if not watermarks:
+            logger.info("No stored game logs for this season; run a full collection first")
+            return
+
+        start, end = self.sync_window(watermarks)
+        logger.info(f"Watermarks: {len(watermarks)} player/level/group entries, "
+                    f"checking finished games {start} to {end}")
+
+        team_game_dates = await self.get_team_game_dates(start, end)
+        moved_players = await self.get_moved_players(start, end)
+        plan = self.plan_incremental(watermarks, team_game_dates, moved_players)
+
+        logger.info(f"{len(team_game_dates)} teams played, {len(moved_players)} transactions; "
+                    f"{len(plan)} players to update "
+                    f"({sum(len(targets) for targets in plan.values())} game log requests)")
+
+        self.progress = ProgressTracker(len(plan))
+        players = list(plan.items())
+        for i in range(0, len(players), self.concurrent_limit):
+            batch = players[i:i + self.concurrent_limit]
+            await asyncio.gather(*(self.sync_player(player_id, targets) for player_id, targets in batch))
+            self.progress.update(len(batch))
+
+        logger.info("\n" + "="*80)
+        logger.info("SYNC COMPLETE!")
+        logger.info("="*80)
+        logger.info(f"Players checked: {self.stats['players_checked']}")
+        logger.info(f"Players with new games: {self.stats['players_updated']}")
+        logger.info(f"Hitting games appended: {self.stats['hitting_games']}")
+        logger.info(f"Pitching games appended: {self.stats['pitching_games']}")
+        logger.info(f"API calls made: {self.stats['api_calls']}")
+        logger.info(statsapi_cache.format_report())
+        logger.info(f"Errors encountered: {self.stats['errors']}")
+
 async def main():
     parser = argparse.ArgumentParser(
         description='Enhanced MiLB game log collector with improved reliability'
@@ -752,6 +981,10 @@ async def main():
                        help='Number of concurrent player requests')
     parser.add_argument('--resume', action='store_true',
                        help='Resume from previous collection')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only append games played since each player\'s last stored game')
+    parser.add_argument('--lookback-days', type=int, default=14,
+                       help='Furthest back the incremental schedule scan reaches')
 
     args = parser.parse_args()
 
@@ -762,9 +995,14 @@ async def main():
         season=args.season,
         levels=args.levels,
         concurrent_limit=args.concurrent,
-        resume_file=resume_file
+        resume_file=resume_file,
+        incremental=args.incremental,
+        lookback_days=args.lookback_days
     ) as collector:
-        await collector.collect_all()
+        if args.incremental:
+            await collector.sync_incremental()
+        else:
+            await collector.collect_all()
 
 
 if __name__ == "__main__":
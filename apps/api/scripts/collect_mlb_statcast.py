@@ -16,13 +16,33 @@ For Pitchers:
 - Whiff%, Chase%, In-Zone%
 
 Data Source: Baseball Savant via pybaseball library
+
+Collection works season-wide instead of per player:
+1. Each season is split into fixed date-range chunks and every pitch thrown
+   in a chunk is pulled once with pybaseball.statcast().
+2. Raw chunks are cached as Parquet under --cache-dir. Re-runs only fetch
+   chunks that are not cached yet; a chunk that reaches today is cached as
+   partial and fetched again next run.
+3. Each chunk is partitioned locally by batter/pitcher id for all tracked
+   prospects at once and bulk-loaded. A manifest records which chunks were
+   loaded for which prospect set, so re-runs skip them until the set changes.
+
+Usage:
+  python collect_mlb_statcast.py
+  python collect_mlb_statcast.py --seasons 2025 --chunk-days 5
+  python collect_mlb_statcast.py --fetch-only            # warm the Parquet cache
+  python collect_mlb_statcast.py --reload                # reload every cached chunk
 """
 
 import asyncio
+import hashlib
+import json
 import logging
-from datetime import datetime
-from typing import List, Tuple, Optional
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 import pandas as pd
+import pyarrow.parquet as pq
 from sqlalchemy import text
 import sys
 import os
@@ -31,31 +51,192 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
-    from pybaseball import statcast_batter, statcast_pitcher, cache
+    from pybaseball import statcast
 except ImportError:
     print("ERROR: pybaseball not installed. Run: pip install pybaseball")
     exit(1)
 
 from app.db.database import engine
 
-# Enable pybaseball caching to speed up repeated queries
-cache.enable()
-
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_DIR = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) / 'data' / 'statcast_chunks'
+SEASON_START = (3, 1)
+SEASON_END = (11, 1)
+INSERT_BATCH_SIZE = 5000
+
+HITTING_COLUMNS = [
+    'mlb_player_id', 'season', 'game_date', 'pitch_type', 'release_speed',
+    'events', 'description', 'zone', 'stand', 'p_throws',
+    'home_team', 'away_team', 'type', 'hit_location', 'bb_type',
+    'balls', 'strikes', 'plate_x', 'plate_z',
+    'hc_x', 'hc_y', 'launch_speed', 'launch_angle', 'hit_distance_sc',
+    'estimated_ba_using_speedangle', 'estimated_woba_using_speedangle',
+    'woba_value', 'launch_speed_angle', 'sv_id'
+]
+
+PITCHING_COLUMNS = [
+    'mlb_player_id', 'season', 'game_date', 'pitch_type', 'pitch_name',
+    'release_speed', 'release_pos_x', 'release_pos_y', 'release_pos_z',
+    'release_spin_rate', 'release_extension',
+    'events', 'description', 'zone', 'stand', 'p_throws',
+    'home_team', 'away_team', 'type', 'balls', 'strikes',
+    'pfx_x', 'pfx_z', 'plate_x', 'plate_z',
+    'vx0', 'vy0', 'vz0', 'ax', 'ay', 'az',
+    'sz_top', 'sz_bot', 'effective_speed', 'spin_axis',
+    'launch_speed', 'launch_angle', 'hit_distance_sc',
+    'estimated_woba_using_speedangle', 'woba_value', 'sv_id'
+]
+
+# INTEGER/SMALLINT columns; Statcast delivers them as floats with NaN
+INTEGER_COLUMNS = {
+    'mlb_player_id', 'season', 'zone', 'hit_location', 'balls', 'strikes', 'launch_speed_angle'
+}
+
+# Raw columns needed from a chunk: ids for partitioning plus both tables' fields
+RAW_COLUMNS = sorted(
+    (set(HITTING_COLUMNS) | set(PITCHING_COLUMNS) | {'batter', 'pitcher'})
+    - {'mlb_player_id', 'season'}
+)
+
+
+def season_chunks(season: int, chunk_days: int, today: date) -> List[Tuple[date, date, bool]]:
+    """
+    Split a season into date-range chunks.
+
+    Returns (start, end, complete) tuples. The window stops at yesterday for
+    the current season; a chunk cut short that way is not complete.
+    """
+    official_end = date(season, *SEASON_END)
+    window_end = min(official_end, today - timedelta(days=1))
+
+    chunks = []
+    start = date(season, *SEASON_START)
+    while start <= window_end:
+        full_end = min(start + timedelta(days=chunk_days - 1), official_end)
+        end = min(full_end, window_end)
+        chunks.append((start, end, end == full_end))
+        start = full_end + timedelta(days=1)
+    return chunks
+
+
+class StatcastChunkCache:
+    """Parquet files of raw league-wide Statcast pulls, one per date range."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.manifest_path = self.root / 'manifest.json'
+        self.manifest: Dict[str, str] = {}
+        if self.manifest_path.exists():
+            self.manifest = json.loads(self.manifest_path.read_text())
+
+    @staticmethod
+    def key(start: date, end: date) -> str:
+        return f"{start.isoformat()}_{end.isoformat()}"
+
+    def path(self, start: date, end: date, complete: bool) -> Path:
+        suffix = '' if complete else '.partial'
+        return self.root / str(start.year) / f"{self.key(start, end)}{suffix}.parquet"
+
+    def has(self, start: date, end: date, complete: bool) -> bool:
+        # Partial chunks are always fetched again
+        return complete and self.path(start, end, complete).exists()
+
+    def write(self, df: pd.DataFrame, start: date, end: date, complete: bool) -> Path:
+        path = self.path(start, end, complete)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop stale partial files covering the same start date
+        for stale in path.parent.glob(f"{start.isoformat()}_*.partial.parquet"):
+            stale.unlink()
+        tmp = path.with_suffix('.tmp')
+        df.to_parquet(tmp, index=False)
+        tmp.replace(path)
+        # New contents have not been loaded yet
+        if self.manifest.pop(path.name, None) is not None:
+            self._save_manifest()
+        return path
+
+    def read(self, path: Path, columns: List[str]) -> pd.DataFrame:
+        available = set(pq.read_schema(path).names)
+        wanted = [col for col in columns if col in available]
+        if not wanted:
+            return pd.DataFrame(columns=columns)
+        return pd.read_parquet(path, columns=wanted)
+
+    def loaded_for(self, path: Path) -> Optional[str]:
+        return self.manifest.get(path.name)
+
+    def mark_loaded(self, path: Path, tracked_hash: str) -> None:
+        self.manifest[path.name] = tracked_hash
+        self._save_manifest()
+
+    def _save_manifest(self) -> None:
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(self.manifest, indent=2, sort_keys=True))
+
+
+def partition_chunk(
+    df: pd.DataFrame,
+    hitter_ids: Set[int],
+    pitcher_ids: Set[int],
+    season: int
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Split one raw chunk into hitting rows (tracked batters) and pitching rows
+    (tracked pitchers), each keyed by mlb_player_id.
+    """
+    def select(id_column: str, ids: Set[int], columns: List[str]) -> pd.DataFrame:
+        if df.empty or id_column not in df.columns or not ids:
+            return pd.DataFrame(columns=columns)
+        rows = df[df[id_column].isin(ids)]
+        out = pd.DataFrame({'mlb_player_id': rows[id_column].astype('int64'), 'season': season})
+        for col in columns[2:]:
+            out[col] = rows[col] if col in rows.columns else None
+        out['game_date'] = pd.to_datetime(out['game_date']).dt.date
+        return out.reset_index(drop=True)
+
+    return (
+        select('batter', hitter_ids, HITTING_COLUMNS),
+        select('pitcher', pitcher_ids, PITCHING_COLUMNS),
+    )
+
+
+def to_records(df: pd.DataFrame) -> List[Dict]:
+    """DataFrame rows as dicts with NaN as None and integer columns as ints."""
+    df = df.copy()
+    for col in INTEGER_COLUMNS & set(df.columns):
+        df[col] = pd.to_numeric(df[col], errors='coerce').round().astype('Int64')
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict('records')
+
 
 class MLBStatcastCollector:
     """Collect MLB Statcast data for prospects."""
 
-    def __init__(self, seasons: List[int]):
+    def __init__(
+        self,
+        seasons: List[int],
+        chunk_days: int = 7,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        fetch_only: bool = False,
+        reload: bool = False
+    ):
         self.seasons = seasons
-        self.players_processed = 0
-        self.hitters_collected = 0
-        self.pitchers_collected = 0
+        self.chunk_days = chunk_days
+        self.cache = StatcastChunkCache(cache_dir)
+        self.fetch_only = fetch_only
+        self.reload = reload
+        self.chunks_fetched = 0
+        self.chunks_cached = 0
+        self.chunks_loaded = 0
+        self.hitting_rows = 0
+        self.pitching_rows = 0
+        self.hitters_collected: Set[int] = set()
+        self.pitchers_collected: Set[int] = set()
         self.errors = []
 
     async def get_prospects_with_positions(self) -> List[Tuple[int, str, int]]:
@@ -92,242 +273,105 @@ class MLBStatcastCollector:
 
         return players
 
-    async def check_existing_data(self, player_id: int, season: int, data_type: str) -> bool:
-        """Check if we already have Statcast data for this player/season."""
-        table_name = 'mlb_statcast_hitting' if data_type == 'H' else 'mlb_statcast_pitching'
-
-        try:
-            async with engine.begin() as conn:
-                result = await conn.execute(
-                    text(f"""
-                        SELECT COUNT(*) FROM {table_name}
-                        WHERE mlb_player_id = :player_id
-                        AND season = :season
-                    """),
-                    {'player_id': player_id, 'season': season}
-                )
-
-                count = result.scalar()
-                return count > 0
-        except Exception:
-            # Table doesn't exist yet, so no existing data
-            return False
-
-    def collect_hitting_statcast(self, player_id: int, season: int) -> Optional[pd.DataFrame]:
-        """
-        Collect hitting Statcast data for a player/season using pybaseball.
-
-        Returns DataFrame with batted ball events or None if no data.
-        """
-        try:
-            start_date = f'{season}-03-01'
-            end_date = f'{season}-11-01'
-
-            logger.debug(f"Fetching hitting Statcast for player {player_id}, season {season}")
-
-            df = statcast_batter(start_date, end_date, player_id)
-
-            if df is None or len(df) == 0:
-                return None
-
-            # Add metadata
-            df['mlb_player_id'] = player_id
-            df['season'] = season
-
-            return df
-
-        except Exception as e:
-            logger.error(f"Error collecting hitting for player {player_id}, season {season}: {e}")
-            self.errors.append((player_id, season, 'hitting', str(e)))
-            return None
+    def fetch_chunk(self, start: date, end: date) -> pd.DataFrame:
+        """Pull every pitch thrown between start and end (inclusive)."""
+        df = statcast(start_dt=start.isoformat(), end_dt=end.isoformat(), verbose=False)
+        if df is None:
+            return pd.DataFrame()
+        return df
+
+    async def fetch_missing_chunks(self, season: int) -> List[Path]:
+        """Fetch chunks not cached yet; return every chunk file for the season."""
+        paths = []
+        for start, end, complete in season_chunks(season, self.chunk_days, date.today()):
+            path = self.cache.path(start, end, complete)
+            if self.cache.has(start, end, complete):
+                self.chunks_cached += 1
+                paths.append(path)
+                continue
 
-    def collect_pitching_statcast(self, player_id: int, season: int) -> Optional[pd.DataFrame]:
+            try:
+                logger.info(f"  Fetching {start} to {end}{'' if complete else ' (partial)'}")
+                df = await asyncio.to_thread(self.fetch_chunk, start, end)
+                self.cache.write(df, start, end, complete)
+                self.chunks_fetched += 1
+                paths.append(path)
+                logger.info(f"    {len(df)} pitches cached")
+            except Exception as e:
+                logger.error(f"Error fetching Statcast {start} to {end}: {e}")
+                self.errors.append((season, f"{start}..{end}", 'fetch', str(e)))
+        return paths
+
+    async def bulk_load(
+        self,
+        table: str,
+        columns: List[str],
+        df: pd.DataFrame,
+        player_ids: Set[int],
+        start: date,
+        end: date
+    ) -> int:
         """
-        Collect pitching Statcast data for a player/season using pybaseball.
+        Replace a chunk's rows for the tracked players with the given frame.
 
-        Returns DataFrame with pitch events or None if no data.
+        Deleting the chunk's date range first keeps reloads idempotent even
+        though Savant no longer fills sv_id for most pitches.
         """
-        try:
-            start_date = f'{season}-03-01'
-            end_date = f'{season}-11-01'
-
-            logger.debug(f"Fetching pitching Statcast for player {player_id}, season {season}")
-
-            df = statcast_pitcher(start_date, end_date, player_id)
-
-            if df is None or len(df) == 0:
-                return None
+        records = to_records(df[columns]) if len(df) else []
+        column_list = ', '.join(columns)
+        values = ', '.join(f':{col}' for col in columns)
 
-            # Add metadata
-            df['mlb_player_id'] = player_id
-            df['season'] = season
-
-            return df
-
-        except Exception as e:
-            logger.error(f"Error collecting pitching for player {player_id}, season {season}: {e}")
-            self.errors.append((player_id, season, 'pitching', str(e)))
-            return None
-
-    async def save_hitting_statcast(self, df: pd.DataFrame):
-        """Save hitting Statcast data to database."""
-        if df is None or len(df) == 0:
-            return
-
-        # Select relevant columns (pybaseball returns 80+ columns)
-        hitting_cols = [
-            'mlb_player_id', 'season', 'game_date', 'pitch_type',
-            'release_speed', 'release_pos_x', 'release_pos_z',
-            'events', 'description', 'zone',
-            'stand', 'p_throws',
-            'home_team', 'away_team',
-            'type',  # B, S, X (ball, strike, in play)
-            'hit_location', 'bb_type',  # batted ball type
-            'balls', 'strikes', 'pfx_x', 'pfx_z',  # pitch movement
-            'plate_x', 'plate_z',  # pitch location
-            'on_3b', 'on_2b', 'on_1b',
-            'outs_when_up', 'inning', 'inning_topbot',
-            'hc_x', 'hc_y',  # hit coordinates
-            'fielder_2', 'fielder_3', 'fielder_4', 'fielder_5', 'fielder_6',
-            'fielder_7', 'fielder_8', 'fielder_9',
-            'sv_id',  # Unique pitch ID
-            # STATCAST METRICS (the important ones!)
-            'launch_speed', 'launch_angle', 'hit_distance_sc',
-            'estimated_ba_using_speedangle', 'estimated_woba_using_speedangle',
-            'woba_value', 'woba_denom', 'babip_value',
-            'iso_value', 'launch_speed_angle',
-            'at_bat_number', 'pitch_number'
-        ]
-
-        # Only keep columns that exist
-        available_cols = [col for col in hitting_cols if col in df.columns]
-        df_clean = df[available_cols].copy()
-
-        # Convert game_date to date
-        df_clean['game_date'] = pd.to_datetime(df_clean['game_date']).dt.date
-
-        # Create table if needed
-        await self.create_hitting_table()
-
-        # Insert data
-        rows_inserted = 0
         async with engine.begin() as conn:
-            for _, row in df_clean.iterrows():
-                # Convert row to dict, handling NaN values
-                record = row.to_dict()
-                record = {k: (None if pd.isna(v) else v) for k, v in record.items()}
-
-                try:
-                    await conn.execute(text("""
-                        INSERT INTO mlb_statcast_hitting
-                        (mlb_player_id, season, game_date, pitch_type, release_speed,
-                         events, description, zone, stand, p_throws,
-                         home_team, away_team, type, hit_location, bb_type,
-                         balls, strikes, plate_x, plate_z,
-                         hc_x, hc_y, launch_speed, launch_angle, hit_distance_sc,
-                         estimated_ba_using_speedangle, estimated_woba_using_speedangle,
-                         woba_value, launch_speed_angle, sv_id)
-                        VALUES
-                        (:mlb_player_id, :season, :game_date, :pitch_type, :release_speed,
-                         :events, :description, :zone, :stand, :p_throws,
-                         :home_team, :away_team, :type, :hit_location, :bb_type,
-                         :balls, :strikes, :plate_x, :plate_z,
-                         :hc_x, :hc_y, :launch_speed, :launch_angle, :hit_distance_sc,
-                         :estimated_ba_using_speedangle, :estimated_woba_using_speedangle,
-                         :woba_value, :launch_speed_angle, :sv_id)
+            await conn.execute(
+                text(f"""
+                    DELETE FROM {table}
+                    WHERE game_date BETWEEN :start AND :end
+                    AND mlb_player_id = ANY(:player_ids)
+                """),
+                {'start': start, 'end': end, 'player_ids': list(player_ids)}
+            )
+            for i in range(0, len(records), INSERT_BATCH_SIZE):
+                await conn.execute(
+                    text(f"""
+                        INSERT INTO {table} ({column_list})
+                        VALUES ({values})
                         ON CONFLICT (sv_id) DO NOTHING
-                    """), record)
-
-                    rows_inserted += 1
-
-                except Exception as e:
-                    if "violates not-null constraint" in str(e) or "column" in str(e):
-                        # Skip rows with missing required data
-                        continue
-                    else:
-                        logger.error(f"Error inserting hitting row: {e}")
-
-        logger.info(f"  Inserted {rows_inserted} hitting Statcast events")
-
-    async def save_pitching_statcast(self, df: pd.DataFrame):
-        """Save pitching Statcast data to database."""
-        if df is None or len(df) == 0:
+                    """),
+                    records[i:i + INSERT_BATCH_SIZE]
+                )
+        return len(records)
+
+    async def load_chunk(
+        self,
+        path: Path,
+        season: int,
+        hitter_ids: Set[int],
+        pitcher_ids: Set[int],
+        tracked_hash: str
+    ):
+        """Partition one cached chunk for all tracked players and load it."""
+        if not self.reload and self.cache.loaded_for(path) == tracked_hash:
             return
 
-        # Select relevant columns
-        pitching_cols = [
-            'mlb_player_id', 'season', 'game_date', 'pitch_type', 'pitch_name',
-            'release_speed', 'release_pos_x', 'release_pos_y', 'release_pos_z',
-            'release_spin_rate', 'release_extension',
-            'events', 'description', 'zone',
-            'stand', 'p_throws',
-            'home_team', 'away_team',
-            'type',
-            'balls', 'strikes', 'pfx_x', 'pfx_z',  # pitch movement
-            'plate_x', 'plate_z',  # pitch location at plate
-            'vx0', 'vy0', 'vz0',  # velocity components
-            'ax', 'ay', 'az',  # acceleration components
-            'sz_top', 'sz_bot',  # strike zone dimensions
-            'effective_speed', 'release_spin_rate',
-            'spin_axis',
-            # Outcome
-            'launch_speed', 'launch_angle', 'hit_distance_sc',
-            'estimated_ba_using_speedangle', 'estimated_woba_using_speedangle',
-            'woba_value',
-            'sv_id'  # Unique pitch ID
-        ]
-
-        available_cols = [col for col in pitching_cols if col in df.columns]
-        df_clean = df[available_cols].copy()
-
-        df_clean['game_date'] = pd.to_datetime(df_clean['game_date']).dt.date
-
-        # Create table if needed
-        await self.create_pitching_table()
-
-        # Insert data
-        rows_inserted = 0
-        async with engine.begin() as conn:
-            for _, row in df_clean.iterrows():
-                record = row.to_dict()
-                record = {k: (None if pd.isna(v) else v) for k, v in record.items()}
-
-                try:
-                    await conn.execute(text("""
-                        INSERT INTO mlb_statcast_pitching
-                        (mlb_player_id, season, game_date, pitch_type, pitch_name,
-                         release_speed, release_pos_x, release_pos_y, release_pos_z,
-                         release_spin_rate, release_extension,
-                         events, description, zone, stand, p_throws,
-                         home_team, away_team, type, balls, strikes,
-                         pfx_x, pfx_z, plate_x, plate_z,
-                         vx0, vy0, vz0, ax, ay, az,
-                         sz_top, sz_bot, effective_speed, spin_axis,
-                         launch_speed, launch_angle, hit_distance_sc,
-                         estimated_woba_using_speedangle, woba_value, sv_id)
-                        VALUES
-                        (:mlb_player_id, :season, :game_date, :pitch_type, :pitch_name,
-                         :release_speed, :release_pos_x, :release_pos_y, :release_pos_z,
-                         :release_spin_rate, :release_extension,
-                         :events, :description, :zone, :stand, :p_throws,
-                         :home_team, :away_team, :type, :balls, :strikes,
-                         :pfx_x, :pfx_z, :plate_x, :plate_z,
-                         :vx0, :vy0, :vz0, :ax, :ay, :az,
-                         :sz_top, :sz_bot, :effective_speed, :spin_axis,
-                         :launch_speed, :launch_angle, :hit_distance_sc,
-                         :estimated_woba_using_speedangle, :woba_value, :sv_id)
-                        ON CONFLICT (sv_id) DO NOTHING
-                    """), record)
-
-                    rows_inserted += 1
-
-                except Exception as e:
-                    if "violates not-null constraint" in str(e) or "column" in str(e):
-                        continue
-                    else:
-                        logger.error(f"Error inserting pitching row: {e}")
-
-        logger.info(f"  Inserted {rows_inserted} pitching Statcast events")
+        start, end = (date.fromisoformat(part) for part in path.name.split('.')[0].split('_'))
+        raw = await asyncio.to_thread(self.cache.read, path, RAW_COLUMNS)
+        hitting, pitching = partition_chunk(raw, hitter_ids, pitcher_ids, season)
+
+        self.hitting_rows += await self.bulk_load(
+            'mlb_statcast_hitting', HITTING_COLUMNS, hitting, hitter_ids, start, end
+        )
+        self.pitching_rows += await self.bulk_load(
+            'mlb_statcast_pitching', PITCHING_COLUMNS, pitching, pitcher_ids, start, end
+        )
+        self.hitters_collected.update(hitting['mlb_player_id'].unique().tolist())
+        self.pitchers_collected.update(pitching['mlb_player_id'].unique().tolist())
+        self.chunks_loaded += 1
+
+        self.cache.mark_loaded(path, tracked_hash)
+        logger.info(
+            f"  Loaded {path.name}: {len(hitting)} hitting events, "
+            f"{len(pitching)} pitches for tracked prospects"
+        )
 
     async def create_hitting_table(self):
         """Create mlb_statcast_hitting table if it doesn't exist."""
@@ -453,85 +497,59 @@ class MLBStatcastCollector:
                 ON mlb_statcast_pitching(game_date)
             """))
 
-    async def collect_for_player(self, player_id: int, position_type: str, milb_games: int):
-        """Collect Statcast data for a single player across all seasons."""
-        self.players_processed += 1
-
-        total_data_collected = False
-
-        for season in self.seasons:
-            # Check if we already have data
-            has_data = await self.check_existing_data(player_id, season, position_type)
-
-            if has_data:
-                logger.debug(f"  Skipping {player_id} {season} ({position_type}) - already have data")
-                continue
-
-            # Collect based on position type
-            if position_type == 'H':
-                # Hitter
-                df = self.collect_hitting_statcast(player_id, season)
-
-                if df is not None and len(df) > 0:
-                    await self.save_hitting_statcast(df)
-                    self.hitters_collected += 1
-                    total_data_collected = True
-                    logger.info(f"  [{self.players_processed}] Player {player_id} (H): {len(df)} events in {season}")
-
-            else:
-                # Pitcher
-                df = self.collect_pitching_statcast(player_id, season)
-
-                if df is not None and len(df) > 0:
-                    await self.save_pitching_statcast(df)
-                    self.pitchers_collected += 1
-                    total_data_collected = True
-                    logger.info(f"  [{self.players_processed}] Player {player_id} (P): {len(df)} pitches in {season}")
-
-        if not total_data_collected:
-            logger.debug(f"  [{self.players_processed}] Player {player_id}: No MLB Statcast data found")
-
-        # Progress update
-        if self.players_processed % 50 == 0:
-            logger.info(f"\nProgress: {self.players_processed} players processed")
-            logger.info(f"  Hitters with data: {self.hitters_collected}")
-            logger.info(f"  Pitchers with data: {self.pitchers_collected}\n")
-
     async def run(self):
         """Main collection loop."""
         logger.info("=" * 80)
         logger.info("MLB Statcast Collection for Prospects")
         logger.info(f"Seasons: {', '.join(map(str, self.seasons))}")
+        logger.info(f"Chunk size: {self.chunk_days} days, cache: {self.cache.root}")
         logger.info("=" * 80)
 
-        # Create tables first
-        logger.info("Creating database tables...")
-        await self.create_hitting_table()
-        await self.create_pitching_table()
-        logger.info("Tables ready\n")
+        hitter_ids: Set[int] = set()
+        pitcher_ids: Set[int] = set()
+        if not self.fetch_only:
+            # Create tables first
+            logger.info("Creating database tables...")
+            await self.create_hitting_table()
+            await self.create_pitching_table()
+            logger.info("Tables ready\n")
+
+            prospects = await self.get_prospects_with_positions()
+            hitter_ids = {player_id for player_id, position_type, _ in prospects if position_type == 'H'}
+            pitcher_ids = {player_id for player_id, position_type, _ in prospects if position_type == 'P'}
 
-        # Get all prospects
-        prospects = await self.get_prospects_with_positions()
+        # Chunks loaded for a different prospect set are loaded again
+        tracked_hash = hashlib.sha1(
+            json.dumps([sorted(hitter_ids), sorted(pitcher_ids)]).encode()
+        ).hexdigest()[:12]
 
-        logger.info(f"\nStarting collection for {len(prospects)} prospects...")
-        logger.info("")
+        for season in self.seasons:
+            logger.info(f"\nSeason {season}")
+            paths = await self.fetch_missing_chunks(season)
+            if self.fetch_only:
+                continue
 
-        # Process each prospect
-        for player_id, position_type, milb_games in prospects:
-            await self.collect_for_player(player_id, position_type, milb_games)
+            for path in paths:
+                try:
+                    await self.load_chunk(path, season, hitter_ids, pitcher_ids, tracked_hash)
+                except Exception as e:
+                    logger.error(f"Error loading {path.name}: {e}")
+                    self.errors.append((season, path.name, 'load', str(e)))
 
         # Summary
         logger.info("\n" + "=" * 80)
         logger.info("COLLECTION COMPLETE!")
         logger.info("=" * 80)
-        logger.info(f"Prospects processed: {self.players_processed}")
-        logger.info(f"Hitters with MLB Statcast: {self.hitters_collected}")
-        logger.info(f"Pitchers with MLB Statcast: {self.pitchers_collected}")
+        logger.info(f"Chunks fetched: {self.chunks_fetched} (already cached: {self.chunks_cached})")
+        if not self.fetch_only:
+            logger.info(f"Chunks loaded: {self.chunks_loaded}")
+            logger.info(f"Hitters with MLB Statcast: {len(self.hitters_collected)} ({self.hitting_rows} events)")
+            logger.info(f"Pitchers with MLB Statcast: {len(self.pitchers_collected)} ({self.pitching_rows} pitches)")
 
         if self.errors:
             logger.warning(f"\nErrors encountered: {len(self.errors)}")
-            for player_id, season, data_type, error in self.errors[:10]:
-                logger.warning(f"  Player {player_id}, {season}, {data_type}: {error}")
+            for season, chunk, stage, error in self.errors[:10]:
+                logger.warning(f"  {season} {chunk} ({stage}): {error}")
 
         logger.info("=" * 80)
 
@@ -543,9 +561,23 @@ async def main():
     parser = argparse.ArgumentParser(description='Collect MLB Statcast data for prospects')
     parser.add_argument('--seasons', type=int, nargs='+', default=[2025, 2024, 2023, 2022, 2021],
                        help='Seasons to collect (default: 2025 2024 2023 2022 2021)')
+    parser.add_argument('--chunk-days', type=int, default=7,
+                       help='Days per league-wide Statcast pull (default: 7)')
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR,
+                       help='Directory for cached Parquet chunks')
+    parser.add_argument('--fetch-only', action='store_true',
+                       help='Only fill the Parquet cache, do not touch the database')
+    parser.add_argument('--reload', action='store_true',
+                       help='Load every cached chunk again, even if already loaded')
     args = parser.parse_args()
 
-    collector = MLBStatcastCollector(seasons=args.seasons)
+    collector = MLBStatcastCollector(
+        seasons=args.seasons,
+        chunk_days=args.chunk_days,
+        cache_dir=args.cache_dir,
+        fetch_only=args.fetch_only,
+        reload=args.reload
+    )
     await collector.run()
 
 
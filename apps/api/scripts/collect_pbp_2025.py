@@ -26,6 +26,7 @@ sys.path.insert(0, str(api_dir))
 os.chdir(api_dir)
 
 from app.db.database import sync_engine
+from app.services.statsapi_cache import statsapi_cache
 
 # Configure logging
 logging.basicConfig(
@@ -76,19 +77,20 @@ class MiLBPBPCollector2025:
             await self.session.close()
             await asyncio.sleep(0.25)
 
-    async def fetch_json(self, url: str) -> Optional[Dict[str, Any]]:
-        """Fetch JSON data from URL with rate limiting."""
+    async def fetch_json(self, url: str, immutable: bool = False) -> Optional[Dict[str, Any]]:
+        """Fetch JSON through the statsapi disk cache, rate limiting network requests only."""
         try:
-            await asyncio.sleep(self.request_delay)
-
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 404:
-                    return None
-                else:
-                    logger.debug(f"HTTP {response.status} for {url}")
-                    return None
+            response = await statsapi_cache.get(
+                self.session, url, immutable=immutable,
+                before_request=lambda: asyncio.sleep(self.request_delay)
+            )
+            if response.status == 200:
+                return response.json()
+            elif response.status == 404:
+                return None
+            else:
+                logger.debug(f"HTTP {response.status} for {url}")
+                return None
 
         except Exception as e:
             logger.error(f"Error fetching {url}: {str(e)}")
@@ -191,9 +193,10 @@ class MiLBPBPCollector2025:
         if data:
             return data
 
-        # Fallback to basic playByPlay endpoint
+        # Fallback to basic playByPlay endpoint; games come from game logs, so
+        # they have been played and never change
         url = f"{self.BASE_URL}/game/{game_pk}/playByPlay"
-        return await self.fetch_json(url)
+        return await self.fetch_json(url, immutable=True)
 
     def extract_and_save_pbp_data(
         self,
@@ -511,6 +514,7 @@ async def main():
             logger.info(f"Games processed: {collector.games_collected}")
             logger.info(f"Errors: {collector.errors}")
             logger.info(f"Time elapsed: {elapsed:.1f}s")
+            logger.info(statsapi_cache.format_report())
 
             if collector.players_processed > 0:
                 logger.info(f"Average PAs/player: {total_pas_collected/collector.players_processed:.1f}")
@@ -6,9 +6,14 @@ who played in 2025. Creates records in both milb_batter_pitches and milb_pitcher
 
 Run concurrently with other season scripts for faster collection.
 
+Players are spread over --workers concurrent workers. Database writes go
+through the async script runtime, so saving one game's pitches overlaps with
+downloading the next game instead of blocking it.
+
 Usage:
     python collect_pitch_data_2025.py --limit 100  # Test with 100 players
     python collect_pitch_data_2025.py              # Full collection
+    python collect_pitch_data_2025.py --workers 8  # More players in flight
 """
 
 import argparse
@@ -33,7 +38,9 @@ script_dir = Path(__file__).resolve().parent
 api_dir = script_dir.parent
 sys.path.insert(0, str(api_dir))
 
-from app.db.database import get_db_sync
+from app.db.script_runtime import ScriptRuntime, execute_many, run_sharded
+from app.services.reference_data import MILB_SPORT_IDS, reference_data
+from app.services.statsapi_cache import statsapi_cache
 
 # Configure logging
 logging.basicConfig(
@@ -48,14 +55,14 @@ class PitchDataCollector2025:
     """Collect pitch-level data for 2025 season."""
 
     BASE_URL = "https://statsapi.mlb.com/api/v1"
-    MILB_SPORT_IDS = {
-        11: "AAA", 12: "AA", 13: "A+", 14: "A",
-        15: "Rookie", 16: "Rookie+", 21: "Complex"
-    }
+    MILB_SPORT_IDS = MILB_SPORT_IDS
 
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
+        # Minimum spacing between network requests across all workers
         self.request_delay = 0.3
+        self._throttle_lock = asyncio.Lock()
+        self._last_request = 0.0
         self.games_processed = 0
         self.pitches_collected = 0
         self.errors = 0
@@ -76,14 +83,22 @@ class PitchDataCollector2025:
             await self.session.close()
             await asyncio.sleep(0.25)
 
-    async def fetch_json(self, url: str) -> Optional[Dict[str, Any]]:
-        """Fetch JSON with rate limiting."""
+    async def _throttle(self):
+        async with self._throttle_lock:
+            wait = self._last_request + self.request_delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request = time.monotonic()
+
+    async def fetch_json(self, url: str, immutable: bool = False) -> Optional[Dict[str, Any]]:
+        """Fetch JSON through the statsapi disk cache, rate limiting network requests only."""
         try:
-            await asyncio.sleep(self.request_delay)
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
+            response = await statsapi_cache.get(
+                self.session, url, immutable=immutable, before_request=self._throttle
+            )
+            if response.status == 200:
+                return response.json()
+            return None
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             self.errors += 1
@@ -91,35 +106,35 @@ class PitchDataCollector2025:
 
     def get_players_for_season(self, db, limit: Optional[int] = None) -> List[Dict]:
         """Get prospects with MLB IDs who played in 2025."""
+        # Names, positions and organizations come from the shared reference
+        # snapshot, so only game logs are aggregated and no join is needed
+        snapshot = reference_data.refresh_sync(db)
         query = text("""
-            SELECT DISTINCT
-                CAST(p.mlb_player_id AS INTEGER) as mlb_player_id,
-                p.name,
-                p.position,
-                p.organization,
-                COUNT(g.game_pk) as game_count
-            FROM prospects p
-            INNER JOIN milb_game_logs g ON g.mlb_player_id = CAST(p.mlb_player_id AS INTEGER)
-            WHERE g.season = :season
-            AND p.mlb_player_id IS NOT NULL
-            AND p.mlb_player_id != ''
-            GROUP BY p.mlb_player_id, p.name, p.position, p.organization
-            HAVING COUNT(g.game_pk) > 10
+            SELECT mlb_player_id, COUNT(game_pk) as game_count
+            FROM milb_game_logs
+            WHERE season = :season
+            GROUP BY mlb_player_id
+            HAVING COUNT(game_pk) > 10
             ORDER BY game_count DESC
-            LIMIT :limit
         """)
 
-        result = db.execute(query, {"season": SEASON, "limit": limit or 10000})
+        result = db.execute(query, {"season": SEASON})
+        limit = limit or 10000
 
         players = []
         for row in result:
+            prospect = snapshot.prospect_for_mlb_id(row.mlb_player_id)
+            if prospect is None:
+                continue
             players.append({
                 "mlb_player_id": row.mlb_player_id,
-                                "name": row.name or f"Player {row.mlb_player_id}",
-                                "position": row.position,
-                                "organization": row.organization,
+                "name": prospect["name"] or f"Player {row.mlb_player_id}",
+                "position": prospect["position"],
+                "organization": prospect["organization"],
                 "game_count": row.game_count
             })
+            if len(players) >= limit:
+                break
 
         return players
 
@@ -161,8 +176,9 @@ class PitchDataCollector2025:
         For MiLB games, playByPlay endpoint is more reliable than feed/live.
         """
         # Try playByPlay first (works for MiLB)
+        # Games come from game logs, so they have been played and never change
         url = f"{self.BASE_URL}/game/{game_pk}/playByPlay"
-        data = await self.fetch_json(url)
+        data = await self.fetch_json(url, immutable=True)
 
         if data:
             return data
@@ -279,47 +295,48 @@ class PitchDataCollector2025:
             'coord_y': batted_ball_data.get('coord_y') if batted_ball_data else None
         }
 
-    def save_pitch_data(self, db, pitch_data: Dict, player_id: int, is_pitcher: bool):
-        """Save pitch data to appropriate table."""
-        table = 'milb_pitcher_pitches' if is_pitcher else 'milb_batter_pitches'
-        id_field = 'mlb_pitcher_id' if is_pitcher else 'mlb_batter_id'
+    async def save_pitches(
+        self,
+        session,
+        table: str,
+        id_field: str,
+        player_id: int,
+        game_pk: int,
+        pitches: List[Dict]
+    ) -> int:
+        """Insert one game's pitches for a player, skipping pitches already stored."""
+        if not pitches:
+            return 0
 
-        # Check if already exists
-        check_query = text(f"""
-            SELECT id FROM {table}
+        existing_query = text(f"""
+            SELECT at_bat_index, pitch_number FROM {table}
             WHERE {id_field} = :player_id
             AND game_pk = :game_pk
-            AND at_bat_index = :at_bat_index
-            AND pitch_number = :pitch_number
         """)
+        result = await session.execute(existing_query, {'player_id': player_id, 'game_pk': game_pk})
+        existing = {(row.at_bat_index, row.pitch_number) for row in result}
+
+        # Only non-null columns are inserted, so group pitches by column set
+        # and send each group as one batched statement
+        groups: Dict[tuple, List[Dict]] = {}
+        for pitch_data in pitches:
+            if (pitch_data['at_bat_index'], pitch_data['pitch_number']) in existing:
+                continue
+            columns = tuple(k for k in pitch_data.keys() if pitch_data[k] is not None)
+            groups.setdefault(columns, []).append({col: pitch_data[col] for col in columns})
 
-        existing = db.execute(check_query, {
-            'player_id': player_id,
-            'game_pk': pitch_data['game_pk'],
-            'at_bat_index': pitch_data['at_bat_index'],
-            'pitch_number': pitch_data['pitch_number']
-        }).fetchone()
-
-        if existing:
-            return False
-
-        # Build insert query
-        columns = [k for k in pitch_data.keys() if pitch_data[k] is not None]
-        placeholders = [f":{col}" for col in columns]
+        saved = 0
+        for columns, rows in groups.items():
+            placeholders = [f":{col}" for col in columns]
+            insert_query = text(f"""
+                INSERT INTO {table} ({', '.join(columns)}, created_at)
+                VALUES ({', '.join(placeholders)}, NOW())
+            """)
+            saved += await execute_many(session, insert_query, rows)
 
-        insert_query = text(f"""
-            INSERT INTO {table} ({', '.join(columns)}, created_at)
-            VALUES ({', '.join(placeholders)}, NOW())
-        """)
+        return saved
 
-        try:
-            db.execute(insert_query, pitch_data)
-            return True
-        except Exception as e:
-            logger.error(f"Error inserting pitch: {e}")
-            return False
-
-    async def process_game(self, db, game_info: Dict, player_id: int) -> int:
+    async def process_game(self, runtime: ScriptRuntime, game_info: Dict, player_id: int) -> int:
         """Process a single game and extract pitch data."""
         game_pk = game_info['game_pk']
         game_date = game_info['game_date']
@@ -340,6 +357,8 @@ class PitchDataCollector2025:
             return 0
 
         pitches_saved = 0
+        batter_pitches = []
+        pitcher_pitches = []
 
         try:
             for play in all_plays:
@@ -396,25 +415,29 @@ class PitchDataCollector2025:
 
                     # Save for batter if player is batter
                     if batter_id == player_id:
-                        if self.save_pitch_data(db, pitch_data, player_id, False):
-                            pitches_saved += 1
+                        batter_pitches.append(pitch_data)
 
                     # Save for pitcher if player is pitcher
                     if pitcher_id == player_id:
-                        if self.save_pitch_data(db, pitch_data, player_id, True):
-                            pitches_saved += 1
-
-            if pitches_saved > 0:
-                db.commit()
-                self.pitches_collected += pitches_saved
+                        pitcher_pitches.append(pitch_data)
+
+            # One transaction per game, rolled back as a whole on error
+            async with runtime.session() as session:
+                pitches_saved += await self.save_pitches(
+                    session, 'milb_batter_pitches', 'mlb_batter_id', player_id, game_pk, batter_pitches
+                )
+                pitches_saved += await self.save_pitches(
+                    session, 'milb_pitcher_pitches', 'mlb_pitcher_id', player_id, game_pk, pitcher_pitches
+                )
+            self.pitches_collected += pitches_saved
 
         except Exception as e:
             logger.error(f"Error processing game {game_pk}: {e}")
-            db.rollback()
+            return 0
 
         return pitches_saved
 
-    async def collect_player_data(self, db, player: Dict) -> int:
+    async def collect_player_data(self, runtime: ScriptRuntime, player: Dict) -> int:
         """Collect all pitch data for a player."""
         player_id = player['mlb_player_id']
         name = player['name']
@@ -434,7 +457,7 @@ class PitchDataCollector2025:
             if i % 20 == 0:
                 logger.info(f"      Progress: {i}/{len(games)} games")
 
-            pitches = await self.process_game(db, game_info, player_id)
+            pitches = await self.process_game(runtime, game_info, player_id)
             total_pitches += pitches
 
             if pitches > 0:
@@ -447,59 +470,59 @@ class PitchDataCollector2025:
 async def main():
     parser = argparse.ArgumentParser(description=f"Collect pitch data for {SEASON}")
     parser.add_argument('--limit', type=int, help='Limit number of players')
+    parser.add_argument('--workers', type=int, default=4, help='Players collected concurrently')
     args = parser.parse_args()
 
     logger.info("="*80)
     logger.info(f"PITCH-BY-PITCH DATA COLLECTION - {SEASON} SEASON")
     logger.info("="*80)
 
-    db = get_db_sync()
-
-    try:
-        async with PitchDataCollector2025() as collector:
-            # Get players
-            players = collector.get_players_for_season(db, args.limit)
-            logger.info(f"Found {len(players)} players for {SEASON}")
-            logger.info("")
-
-            if not players:
-                logger.warning("No players found")
-                return
-
-            start_time = time.time()
-
-            for i, player in enumerate(players, 1):
-                logger.info(f"[{i}/{len(players)}] {player['name']} ({player['organization']})")
-
-                try:
-                    await collector.collect_player_data(db, player)
-                except Exception as e:
-                    logger.error(f"  ERROR: {e}")
-                    collector.errors += 1
-
-                if i % 10 == 0:
-                    elapsed = time.time() - start_time
-                    logger.info("")
-                    logger.info(f"Progress: {i}/{len(players)} players")
-                    logger.info(f"Pitches collected: {collector.pitches_collected:,}")
-                    logger.info(f"Games processed: {collector.games_processed}")
-                    logger.info(f"Errors: {collector.errors}")
-                    logger.info("")
-
-            # Final summary
-            elapsed = time.time() - start_time
-            logger.info("")
-            logger.info("="*80)
-            logger.info("COLLECTION COMPLETE - 2025")
-            logger.info("="*80)
-            logger.info(f"Total pitches collected: {collector.pitches_collected:,}")
-            logger.info(f"Games processed: {collector.games_processed}")
-            logger.info(f"Errors: {collector.errors}")
-            logger.info(f"Time: {elapsed:.1f}s")
-
-    finally:
-        db.close()
+    async with ScriptRuntime() as runtime, PitchDataCollector2025() as collector:
+        # Get players
+        players = await runtime.run_in_sync_session(collector.get_players_for_season, args.limit)
+        logger.info(f"Found {len(players)} players for {SEASON}")
+        logger.info("")
 
+        if not players:
+            logger.warning("No players found")
+            return
+
+        start_time = time.time()
+        completed = 0
+
+        async def collect(player: Dict):
+            nonlocal completed
+            logger.info(f"{player['name']} ({player['organization']})")
+
+            try:
+                await collector.collect_player_data(runtime, player)
+            except Exception as e:
+                logger.error(f"  ERROR: {e}")
+                collector.errors += 1
+
+            completed += 1
+            if completed % 10 == 0:
+                logger.info("")
+                logger.info(f"Progress: {completed}/{len(players)} players")
+                logger.info(f"Pitches collected: {collector.pitches_collected:,}")
+                logger.info(f"Games processed: {collector.games_processed}")
+                logger.info(f"Errors: {collector.errors}")
+                logger.info("")
+
+        # A player's games always stay on one worker
+        await run_sharded(players, collect, shards=args.workers, key=lambda p: p['mlb_player_id'])
+
+        # Final summary
+        elapsed = time.time() - start_time
+        logger.info("")
+        logger.info("="*80)
+        logger.info("COLLECTION COMPLETE - 2025")
+        logger.info("="*80)
+        logger.info(f"Total pitches collected: {collector.pitches_collected:,}")
+        logger.info(f"Games processed: {collector.games_processed}")
+        logger.info(f"Errors: {collector.errors}")
+        logger.info(f"Time: {elapsed:.1f}s")
+        logger.info(statsapi_cache.format_report())
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -14,8 +14,12 @@ Feature Categories:
 
 Total: ~120 features
 
+Features are saved to ml_features and appended to the columnar feature
+store (app.ml.feature_store) as one new part for the as-of year.
+
 Usage:
     python engineer_ml_features.py --year 2024
+    python engineer_ml_features.py --year 2024 --no-feature-store
 """
 
 import sys
@@ -29,6 +33,7 @@ import json
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.db.database import get_db_sync
+from app.ml.feature_store import FeatureStore
 from sqlalchemy import text
 import numpy as np
 
@@ -963,6 +968,8 @@ def main():
     parser = argparse.ArgumentParser(description='Engineer ML features for prospects')
     parser.add_argument('--year', type=int, default=2024, help='As-of year for features')
     parser.add_argument('--prospect-id', type=int, help='Single prospect to process (for testing)')
+    parser.add_argument('--no-feature-store', action='store_true',
+                        help='Only write ml_features, skip the columnar feature store')
 
     args = parser.parse_args()
 
@@ -992,6 +999,7 @@ def main():
             'features_created': 0,
             'errors': 0
         }
+        store_rows = {}
 
         for i, prospect_id in enumerate(prospect_ids, 1):
             if i % 50 == 0:
@@ -1003,6 +1011,7 @@ def main():
                 if features:
                     engineer.save_features(prospect_id, features, db)
                     stats['features_created'] += 1
+                    store_rows[prospect_id] = features
 
                 stats['processed'] += 1
 
@@ -1011,6 +1020,12 @@ def main():
                 stats['errors'] += 1
                 db.rollback()
 
+        if store_rows and not args.no_feature_store:
+            store = FeatureStore()
+            store.ensure_schema(engineer.feature_version, store_rows)
+            part = store.append(engineer.feature_version, args.year, store_rows)
+            print(f"\nAppended {len(store_rows)} rows to feature store: {part}")
+
         print("\n" + "=" * 80)
         print("FEATURE ENGINEERING SUMMARY")
         print("=" * 80)
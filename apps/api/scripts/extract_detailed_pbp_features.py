@@ -12,30 +12,46 @@ Features extracted include:
 - Batted ball distribution (pull%, center%, oppo%)
 - Advanced metrics (wOBA, xwOBA, expected stats)
 
+Games run through a three-stage pipeline:
+- Async fetchers download each game's playByPlay once, however many
+  prospects played in it. Responses come from the shared statsapi disk
+  cache when possible and land in a bounded queue.
+- A process pool parses each payload into one feature row per prospect.
+- A single writer streams rows to CSV, or to Parquet when the output name
+  ends in .parquet.
+
+Network and parsing overlap, every core parses, and memory is bounded by
+--queue-size. Rows are written in completion order, not per prospect.
+
 Usage:
     python extract_detailed_pbp_features.py --seasons 2024 --output pbp_features_2024.csv
     python extract_detailed_pbp_features.py --prospect-id 513 --seasons 2024 2023
+    python extract_detailed_pbp_features.py --seasons 2024 --output pbp_2024.parquet --workers 8
 """
 
 import argparse
 import asyncio
 import csv
+import json
 import logging
+import os
 import sys
+import time
 from collections import defaultdict
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 # Add parent directory to path
 script_dir = Path(__file__).resolve().parent
 api_dir = script_dir.parent
 sys.path.insert(0, str(api_dir))
 
-from app.db.database import get_db_sync
+from app.db.script_runtime import ScriptRuntime
+from app.services.statsapi_cache import statsapi_cache
 
 # Configure logging
 logging.basicConfig(
@@ -44,6 +60,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# (prospect_info, game_info) for each prospect that appeared in a game
+GameTargets = List[Tuple[Dict[str, Any], Dict[str, Any]]]
+
+WRITE_BATCH_SIZE = 5000
+# Seconds between statsapi requests; the public API is shared, so stay polite
+DEFAULT_REQUEST_DELAY = 0.5
+
 
 class DetailedPBPFeatureExtractor:
     """Extract comprehensive features from pitch-by-pitch data."""
@@ -55,9 +78,13 @@ class DetailedPBPFeatureExtractor:
         11: "AAA", 12: "AA", 13: "A+", 14: "A", 15: "Rookie", 16: "Rookie+"
     }
 
-    def __init__(self):
+    def __init__(self, request_delay: float = DEFAULT_REQUEST_DELAY):
         self.session: Optional[aiohttp.ClientSession] = None
-        self.request_delay = 0.5
+        # Minimum spacing between network requests across all fetchers
+        self.request_delay = request_delay
+        self._throttle_lock = asyncio.Lock()
+        self._last_request = 0.0
+        self.stats = defaultdict(int)
 
     async def __aenter__(self):
         timeout = aiohttp.ClientTimeout(total=60)
@@ -69,90 +96,90 @@ class DetailedPBPFeatureExtractor:
             await self.session.close()
             await asyncio.sleep(0.25)
 
-    async def fetch_json(self, url: str) -> Optional[Dict[str, Any]]:
-        """Fetch JSON data from URL."""
+    async def _throttle(self):
+        async with self._throttle_lock:
+            wait = self._last_request + self.request_delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request = time.monotonic()
+
+    async def fetch_pbp_body(self, game_pk: int) -> Optional[bytes]:
+        """
+        Raw playByPlay JSON for a game, unparsed so the pool does the parsing.
+
+        Games in milb_game_logs have been played, so their feeds are final
+        and cached without revalidation.
+        """
+        url = f"{self.BASE_URL}/game/{game_pk}/playByPlay"
         try:
-            await asyncio.sleep(self.request_delay)
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
+            response = await statsapi_cache.get(
+                self.session, url, immutable=True, before_request=self._throttle
+            )
+            if response.status == 200:
+                return response.body
+            return None
         except Exception as e:
             logger.error(f"Error fetching {url}: {str(e)}")
             return None
 
-    def get_prospects_with_milb_data(self, db, prospect_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get prospects that have MiLB game log data."""
-        if prospect_id:
-            query = text("""
-                SELECT DISTINCT
-                    p.id as prospect_id,
-                    p.name,
-                    p.mlb_player_id,
-                    p.position
-                FROM prospects p
-                JOIN milb_game_logs m ON p.id = m.prospect_id
-                WHERE p.id = :prospect_id
-            """)
-            result = db.execute(query, {"prospect_id": prospect_id})
-        else:
-            query = text("""
-                SELECT DISTINCT
-                    p.id as prospect_id,
-                    p.name,
-                    p.mlb_player_id,
-                    p.position
-                FROM prospects p
-                JOIN milb_game_logs m ON p.id = m.prospect_id
-                ORDER BY p.name
-            """)
-            result = db.execute(query)
-
-        prospects = []
-        for row in result:
-            prospects.append({
-                "prospect_id": row.prospect_id,
-                "name": row.name,
-                "mlb_player_id": row.mlb_player_id,
-                "position": row.position
-            })
-        return prospects
-
-    def get_prospect_games(self, db, prospect_id: int, seasons: List[int]) -> List[Dict[str, Any]]:
-        """Get all games for a prospect."""
-        season_list = ','.join(str(s) for s in seasons)
+    def get_games_to_process(
+        self,
+        db,
+        seasons: List[int],
+        prospect_id: Optional[int] = None
+    ) -> Dict[int, GameTargets]:
+        """
+        Games in the requested seasons, each with the prospects who played in it.
 
+        One query covers every prospect, and a game shared by several
+        prospects is listed once.
+        """
         query = text(f"""
-            SELECT
-                game_pk,
-                game_date,
-                season,
-                level
-            FROM milb_game_logs
-            WHERE prospect_id = :prospect_id
-                AND season IN ({season_list})
-            ORDER BY game_date
-        """)
-
-        result = db.execute(query, {"prospect_id": prospect_id})
-
-        games = []
-        for row in result:
-            games.append({
-                'game_pk': row.game_pk,
-                'game_date': row.game_date,
-                'season': row.season,
-                'level': row.level
-            })
-        return games
+            SELECT DISTINCT
+                p.id as prospect_id,
+                p.name,
+                p.mlb_player_id,
+                p.position,
+                m.game_pk,
+                m.game_date,
+                m.season,
+                m.level
+            FROM prospects p
+            JOIN milb_game_logs m ON p.id = m.prospect_id
+            WHERE m.season IN :seasons
+            {"AND p.id = :prospect_id" if prospect_id else ""}
+            ORDER BY m.game_pk, p.id
+        """).bindparams(bindparam("seasons", expanding=True))
+
+        params: Dict[str, Any] = {"seasons": list(seasons)}
+        if prospect_id:
+            params["prospect_id"] = prospect_id
 
-    async def fetch_pbp_data(self, game_pk: int) -> Optional[Dict[str, Any]]:
-        """Fetch pitch-by-pitch data for a game."""
-        url = f"{self.BASE_URL}/game/{game_pk}/playByPlay"
-        return await self.fetch_json(url)
+        games: Dict[int, GameTargets] = {}
+        seen = set()
+        for row in db.execute(query, params):
+            # A player can have a hitting and a pitching log for the same game
+            if (row.game_pk, row.prospect_id) in seen:
+                continue
+            seen.add((row.game_pk, row.prospect_id))
+            games.setdefault(row.game_pk, []).append((
+                {
+                    "prospect_id": row.prospect_id,
+                    "name": row.name,
+                    "mlb_player_id": row.mlb_player_id,
+                    "position": row.position
+                },
+                {
+                    'game_pk': row.game_pk,
+                    'game_date': row.game_date,
+                    'season': row.season,
+                    'level': row.level
+                }
+            ))
+        return games
 
+    @staticmethod
     def extract_detailed_features(
-        self,
         pbp_data: Dict[str, Any],
         player_id: int,
         prospect_info: Dict[str, Any],
@@ -417,65 +444,162 @@ class DetailedPBPFeatureExtractor:
 
         return features
 
-    async def process_prospect(
+    async def run_pipeline(
         self,
-        db,
-        prospect: Dict[str, Any],
-        seasons: List[int]
-    ) -> List[Dict[str, Any]]:
-        """Process all games for a prospect and extract features."""
-
-        logger.info(f"Processing {prospect['name']}...")
-
-        games = self.get_prospect_games(db, prospect['prospect_id'], seasons)
-
-        if not games:
-            logger.info(f"  No games found")
-            return []
-
-        logger.info(f"  Found {len(games)} games")
-
-        all_features = []
-
-        for i, game_info in enumerate(games, 1):
-            if i % 10 == 0:
-                logger.info(f"    Processing game {i}/{len(games)}...")
-
-            # Fetch PBP data
-            pbp_data = await self.fetch_pbp_data(game_info['game_pk'])
-            if not pbp_data:
-                continue
-
-            # Extract features
-            features = self.extract_detailed_features(
-                pbp_data,
-                prospect['mlb_player_id'],
-                prospect,
-                game_info
-            )
-
-            all_features.append(features)
-
-        logger.info(f"  Extracted features from {len(all_features)} games")
-        return all_features
-
-
-def write_features_to_csv(features: List[Dict[str, Any]], output_file: str):
-    """Write extracted features to CSV file."""
-
-    if not features:
-        logger.warning("No features to write!")
-        return
+        games: Dict[int, GameTargets],
+        writer: "FeatureWriter",
+        fetchers: int = 8,
+        workers: Optional[int] = None,
+        queue_size: int = 64
+    ) -> Dict[str, int]:
+        """
+        Fetch, parse and write every game.
 
-    # Get all fieldnames from first feature dict
-    fieldnames = list(features[0].keys())
+        Args:
+            games: game_pk -> prospects to extract, from get_games_to_process
+            writer: Destination for feature rows
+            fetchers: Concurrent download tasks
+            workers: Parse processes (default: one per core)
+            queue_size: Payloads and result batches buffered between stages
 
-    with open(output_file, 'w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(features)
+        Returns:
+            Counters for the run
+        """
+        loop = asyncio.get_running_loop()
+        workers = workers or os.cpu_count() or 1
+        payloads: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        results: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        pending = iter(games.items())
+        started = time.monotonic()
+
+        async def fetch():
+            for game_pk, targets in pending:
+                body = await self.fetch_pbp_body(game_pk)
+                if body is None:
+                    self.stats["games_missing"] += 1
+                    continue
+                await payloads.put((game_pk, body, targets))
 
-    logger.info(f"Wrote {len(features)} feature rows to {output_file}")
+        async def parse(pool: ProcessPoolExecutor):
+            while (item := await payloads.get()) is not None:
+                game_pk, body, targets = item
+                try:
+                    rows = await loop.run_in_executor(pool, parse_game, body, targets)
+                except Exception as e:
+                    logger.error(f"Error parsing game {game_pk}: {str(e)}")
+                    self.stats["games_failed"] += 1
+                    continue
+                await results.put(rows)
+
+        async def write():
+            batch: List[Dict[str, Any]] = []
+            while (rows := await results.get()) is not None:
+                self.stats["games_parsed"] += 1
+                batch.extend(rows)
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    await asyncio.to_thread(writer.write, batch)
+                    batch = []
+                if self.stats["games_parsed"] % 500 == 0:
+                    elapsed = time.monotonic() - started
+                    logger.info(
+                        f"  {self.stats['games_parsed']}/{len(games)} games "
+                        f"({self.stats['games_parsed'] / elapsed:.1f}/s), {writer.rows + len(batch)} rows"
+                    )
+            if batch:
+                await asyncio.to_thread(writer.write, batch)
+
+        # Two parse tasks per process keep the pool busy while results move on
+        parsers = workers * 2
+
+        async def fetch_stage():
+            await asyncio.gather(*(fetch() for _ in range(fetchers)))
+            for _ in range(parsers):
+                await payloads.put(None)
+
+        async def parse_stage(pool: ProcessPoolExecutor):
+            await asyncio.gather(*(parse(pool) for _ in range(parsers)))
+            await results.put(None)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            stages = [
+                asyncio.create_task(fetch_stage()),
+                asyncio.create_task(parse_stage(pool)),
+                asyncio.create_task(write())
+            ]
+            try:
+                # A failed stage would leave the others blocked on full or
+                # empty queues, so stop at the first failure
+                done, _ = await asyncio.wait(stages, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    if not task.cancelled() and task.exception() is not None:
+                        raise task.exception()
+            finally:
+                for task in stages:
+                    task.cancel()
+                await asyncio.gather(*stages, return_exceptions=True)
+
+        self.stats["rows_written"] = writer.rows
+        return dict(self.stats)
+
+
+def parse_game(body: bytes, targets: GameTargets) -> List[Dict[str, Any]]:
+    """Parse one playByPlay payload into a feature row per prospect (runs in the pool)."""
+    pbp_data = json.loads(body)
+    return [
+        DetailedPBPFeatureExtractor.extract_detailed_features(
+            pbp_data, prospect['mlb_player_id'], prospect, game_info
+        )
+        for prospect, game_info in targets
+    ]
+
+
+class FeatureWriter:
+    """Stream feature rows to CSV, or Parquet for a .parquet output path."""
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self.parquet = output_file.endswith('.parquet')
+        self.rows = 0
+        self._file = None
+        self._writer = None
+        self._schema = None
+
+    def write(self, rows: List[Dict[str, Any]]):
+        if not rows:
+            return
+        if self.parquet:
+            self._write_parquet(rows)
+        else:
+            if self._writer is None:
+                self._file = open(self.output_file, 'w', newline='')
+                self._writer = csv.DictWriter(self._file, fieldnames=list(rows[0].keys()))
+                self._writer.writeheader()
+            self._writer.writerows(rows)
+        self.rows += len(rows)
+
+    def _write_parquet(self, rows: List[Dict[str, Any]]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            inferred = pa.Table.from_pylist(rows).schema
+            # Columns that are all null in the first batch default to strings
+            self._schema = pa.schema([
+                pa.field(f.name, pa.string() if pa.types.is_null(f.type) else f.type)
+                for f in inferred
+            ])
+            self._writer = pq.ParquetWriter(self.output_file, self._schema, compression='snappy')
+        self._writer.write_table(pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self):
+        if self._writer is not None and self.parquet:
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+        if self.rows:
+            logger.info(f"Wrote {self.rows} feature rows to {self.output_file}")
+        else:
+            logger.warning("No features to write!")
 
 
 async def main():
@@ -499,7 +623,31 @@ async def main():
         '--output',
         type=str,
         default='milb_pbp_features.csv',
-        help='Output CSV filename'
+        help='Output filename (.csv or .parquet)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Parse processes (default: CPU count)'
+    )
+    parser.add_argument(
+        '--fetchers',
+        type=int,
+        default=8,
+        help='Concurrent playByPlay downloads'
+    )
+    parser.add_argument(
+        '--queue-size',
+        type=int,
+        default=64,
+        help='Payloads buffered between fetch and parse (bounds memory)'
+    )
+    parser.add_argument(
+        '--request-delay',
+        type=float,
+        default=DEFAULT_REQUEST_DELAY,
+        help=f'Minimum seconds between network requests (default: {DEFAULT_REQUEST_DELAY})'
     )
 
     args = parser.parse_args()
@@ -508,43 +656,39 @@ async def main():
     logger.info(f"Seasons: {args.seasons}")
     logger.info(f"Output: {args.output}")
 
-    db = get_db_sync()
+    writer = FeatureWriter(args.output)
 
     try:
-        async with DetailedPBPFeatureExtractor() as extractor:
-            # Get prospects
-            prospects = extractor.get_prospects_with_milb_data(db, args.prospect_id)
+        async with ScriptRuntime() as runtime, \
+                DetailedPBPFeatureExtractor(request_delay=args.request_delay) as extractor:
+            games = await runtime.run_in_sync_session(
+                extractor.get_games_to_process, args.seasons, args.prospect_id
+            )
 
-            if not prospects:
+            if not games:
                 logger.warning("No prospects found with MiLB game data")
                 return
 
-            logger.info(f"Found {len(prospects)} prospects with game data")
+            prospects = {prospect['prospect_id'] for targets in games.values() for prospect, _ in targets}
+            logger.info(f"Found {len(games)} games for {len(prospects)} prospects")
 
-            # Extract features for all prospects
-            all_features = []
-
-            for i, prospect in enumerate(prospects, 1):
-                logger.info(f"[{i}/{len(prospects)}] {prospect['name']}")
-
-                try:
-                    features = await extractor.process_prospect(db, prospect, args.seasons)
-                    all_features.extend(features)
-                except Exception as e:
-                    logger.error(f"  Error: {str(e)}")
-                    continue
+            stats = await extractor.run_pipeline(
+                games, writer,
+                fetchers=args.fetchers,
+                workers=args.workers,
+                queue_size=args.queue_size
+            )
 
-            # Write to CSV
-            if all_features:
-                write_features_to_csv(all_features, args.output)
-                logger.info(f"\nExtraction complete!")
-                logger.info(f"Total feature rows: {len(all_features)}")
-                logger.info(f"Features per row: {len(all_features[0])}")
-            else:
-                logger.warning("No features extracted!")
+            logger.info(f"\nExtraction complete!")
+            logger.info(
+                f"Games parsed: {stats.get('games_parsed', 0)}, missing: {stats.get('games_missing', 0)}, "
+                f"failed: {stats.get('games_failed', 0)}"
+            )
+            logger.info(f"Total feature rows: {stats.get('rows_written', 0)}")
+            logger.info(statsapi_cache.format_report())
 
     finally:
-        db.close()
+        writer.close()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,24 @@
 """
 Generate ML predictions for all prospects using trained model.
+
+All feature vectors are decoded into one (N x F) matrix, scored with a
+single predict_proba call per model, and written back with one staged
+COPY plus delete/insert swap per model version inside one transaction.
+
+Usage:
+  python generate_predictions.py
+  python generate_predictions.py --model v1.0:latest --model v0.9:20251005_231657
+  python generate_predictions.py --as-of-year 2024 --dry-run
+  python generate_predictions.py --source store --feature-version v1.0
 """
 
 import sys
 import os
+import io
+import csv
 import json
+import time
+import argparse
 import numpy as np
 
 # Add parent directory to path for imports
@@ -16,19 +30,31 @@ if sys.platform == "win32":
 
 from sqlalchemy import text
 from app.db.database import get_db_sync
+from app.ml.feature_store import FeatureStore
 
 # ML imports
 import xgboost as xgb
 import joblib
 
 
-def load_model():
-    """Load the trained model, encoder, and feature names."""
-    model_dir = os.path.join(os.path.dirname(__file__), '..', 'models')
+MODEL_DIR = os.path.join(os.path.dirname(__file__), '..', 'models')
+
+# FV mapping
+FV_MAP = {
+    'Elite': 70,
+    'Star': 60,
+    'Solid': 50,
+    'Role Player': 45,
+    'Org Filler': 40
+}
+DEFAULT_FV = 50
 
-    model_path = os.path.join(model_dir, 'prospect_model_latest.json')
-    encoder_path = os.path.join(model_dir, 'label_encoder_latest.pkl')
-    features_path = os.path.join(model_dir, 'feature_names_latest.json')
+
+def load_model(artifact_tag='latest'):
+    """Load the trained model, encoder, and feature names for an artifact tag."""
+    model_path = os.path.join(MODEL_DIR, f'prospect_model_{artifact_tag}.json')
+    encoder_path = os.path.join(MODEL_DIR, f'label_encoder_{artifact_tag}.pkl')
+    features_path = os.path.join(MODEL_DIR, f'feature_names_{artifact_tag}.json')
 
     print(f"Loading model from: {model_path}")
 
@@ -46,111 +72,148 @@ def load_model():
     return model, label_encoder, feature_names
 
 
-def generate_predictions(model, label_encoder, feature_names, db):
-    """Generate predictions for all prospects."""
-    print("\n" + "=" * 80)
-    print("GENERATING PREDICTIONS")
-    print("=" * 80)
-
-    # Load all prospects with features
+def load_feature_vectors(db, as_of_year):
+    """Load prospect ids and raw feature vectors in one query."""
     query = text("""
-        SELECT
-            p.id, p.name, p.position,
-            mf.feature_vector
+        SELECT mf.prospect_id, mf.feature_vector
         FROM ml_features mf
         INNER JOIN prospects p ON p.id = mf.prospect_id
-        WHERE mf.as_of_year = 2024
-        ORDER BY p.id
+        WHERE mf.as_of_year = :as_of_year
+        ORDER BY mf.prospect_id
     """)
 
-    result = db.execute(query)
-    rows = result.fetchall()
-
-    print(f"\nLoaded {len(rows)} prospects with features")
-
-    # FV mapping
-    fv_map = {
-        'Elite': 70,
-        'Star': 60,
-        'Solid': 50,
-        'Role Player': 45,
-        'Org Filler': 40
-    }
-
-    predictions_saved = 0
-    predictions_failed = 0
-
-    for i, (prospect_id, name, position, feature_vector) in enumerate(rows, 1):
-        try:
-            # Extract features in correct order
-            feature_list = []
-            for feat_name in feature_names:
-                val = feature_vector.get(feat_name)
-                feature_list.append(0.0 if val is None else float(val))
-
-            X = np.array([feature_list])
-
-            # Predict
-            pred_encoded = model.predict(X)[0]
-            pred_proba = model.predict_proba(X)[0]
-
-            # Decode
-            pred_tier = label_encoder.inverse_transform([pred_encoded])[0]
-            confidence = float(pred_proba[pred_encoded])
-            predicted_fv = fv_map.get(pred_tier, 50)
-
-            # Save to database - use raw SQL to avoid transaction issues
-            # First delete any existing prediction
-            delete_sql = f"""
-                DELETE FROM ml_predictions
-                WHERE prospect_id = {prospect_id}
-                AND model_version = 'v1.0'
-            """
-            db.execute(text(delete_sql))
-
-            # Then insert new prediction
-            insert_sql = f"""
-                INSERT INTO ml_predictions (
-                    prospect_id, model_version, prediction_date,
-                    predicted_tier, predicted_fv, confidence_score,
-                    created_at, updated_at
-                ) VALUES (
-                    {prospect_id}, 'v1.0', NOW(),
-                    '{pred_tier}', {predicted_fv}, {confidence},
-                    NOW(), NOW()
-                )
-            """
-            db.execute(text(insert_sql))
-
-            predictions_saved += 1
-
-            # Commit every 50 to avoid long transactions
-            if predictions_saved % 50 == 0:
-                db.commit()
-                print(f"  [{i}/{len(rows)}] Saved {predictions_saved} predictions...")
-
-        except Exception as e:
-            predictions_failed += 1
-            if predictions_failed <= 5:  # Only show first 5 errors
-                print(f"  Error predicting for {name}: {e}")
-            continue
-
-    # Final commit
-    db.commit()
+    rows = db.execute(query, {'as_of_year': as_of_year}).fetchall()
 
-    print("\n" + "=" * 80)
-    print("PREDICTION SUMMARY")
-    print("=" * 80)
-    print(f"Total prospects: {len(rows)}")
-    print(f"Predictions saved: {predictions_saved}")
-    print(f"Predictions failed: {predictions_failed}")
-    print(f"Success rate: {predictions_saved/len(rows)*100:.1f}%")
+    prospect_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    vectors = [
+        json.loads(row[1]) if isinstance(row[1], str) else (row[1] or {})
+        for row in rows
+    ]
+    return prospect_ids, vectors
+
+
+def load_prospect_ids(db):
+    """Ids of every prospect, so feature store rows match the ml_features join."""
+    rows = db.execute(text("SELECT id FROM prospects")).fetchall()
+    return np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+
+
+def build_feature_matrix(vectors, feature_names):
+    """
+    Decode feature vectors into an (N x F) float matrix in one pass.
+
+    Missing or null features become 0.0, matching training.
+    """
+    matrix = np.zeros((len(vectors), len(feature_names)), dtype=np.float32)
+    for i, vector in enumerate(vectors):
+        row = [vector.get(name) for name in feature_names]
+        matrix[i] = [0.0 if value is None else value for value in row]
+    return matrix
+
+
+def score_matrix(model, label_encoder, X):
+    """
+    Score every prospect with one predict_proba call.
+
+    Returns:
+        Tuple of (tiers, predicted_fv, confidence) arrays aligned with X rows
+    """
+    if len(X) == 0:
+        return np.array([], dtype=object), np.array([], dtype=np.int64), np.array([])
+
+    proba = model.predict_proba(X)
+    best = proba.argmax(axis=1)
+
+    classes = np.asarray(label_encoder.classes_)
+    class_fv = np.array([FV_MAP.get(tier, DEFAULT_FV) for tier in classes], dtype=np.int64)
+
+    tiers = classes[best]
+    predicted_fv = class_fv[best]
+    confidence = proba[np.arange(len(best)), best].astype(float)
+    return tiers, predicted_fv, confidence
+
+
+def _copy_buffer(prospect_ids, tiers, predicted_fv, confidence):
+    """Render predictions as CSV for COPY."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(zip(
+        prospect_ids.tolist(),
+        tiers.tolist(),
+        predicted_fv.tolist(),
+        confidence.tolist()
+    ))
+    buffer.seek(0)
+    return buffer
 
-    # Show distribution
+
+def replace_predictions(db, scored):
+    """
+    Replace predictions for each model version in a single transaction.
+
+    Rows are COPYed into a temp staging table, then each version's old rows
+    are deleted and the staged rows inserted in the same transaction, so
+    readers see either the complete old set or the complete new set.
+
+    Args:
+        db: Sync database session
+        scored: Dict of model_version -> (prospect_ids, tiers, predicted_fv, confidence)
+    """
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute("""
+            CREATE TEMP TABLE ml_predictions_stage (
+                model_version VARCHAR(50),
+                prospect_id INTEGER,
+                predicted_tier VARCHAR(50),
+                predicted_fv INTEGER,
+                confidence_score DOUBLE PRECISION
+            ) ON COMMIT DROP
+        """)
+
+        for model_version, (prospect_ids, tiers, predicted_fv, confidence) in scored.items():
+            buffer = _copy_buffer(prospect_ids, tiers, predicted_fv, confidence)
+            cursor.copy_expert(
+                "COPY ml_predictions_stage "
+                "(prospect_id, predicted_tier, predicted_fv, confidence_score) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+            cursor.execute(
+                "UPDATE ml_predictions_stage SET model_version = %s WHERE model_version IS NULL",
+                (model_version,)
+            )
+
+        cursor.execute("""
+            DELETE FROM ml_predictions
+            WHERE model_version IN (SELECT DISTINCT model_version FROM ml_predictions_stage)
+        """)
+        cursor.execute("""
+            INSERT INTO ml_predictions (
+                prospect_id, model_version, prediction_date,
+                predicted_tier, predicted_fv, confidence_score,
+                created_at, updated_at
+            )
+            SELECT
+                prospect_id, model_version, NOW(),
+                predicted_tier, predicted_fv, confidence_score,
+                NOW(), NOW()
+            FROM ml_predictions_stage
+        """)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def print_distribution(db, model_version, total):
+    """Print the tier distribution for a model version."""
     query = text("""
         SELECT predicted_tier, COUNT(*) as count
         FROM ml_predictions
-        WHERE model_version = 'v1.0'
+        WHERE model_version = :model_version
         GROUP BY predicted_tier
         ORDER BY
             CASE predicted_tier
@@ -162,15 +225,118 @@ def generate_predictions(model, label_encoder, feature_names, db):
             END
     """)
 
-    result = db.execute(query)
-    rows = result.fetchall()
+    rows = db.execute(query, {'model_version': model_version}).fetchall()
 
-    print("\nPrediction Distribution:")
+    print(f"\nPrediction Distribution ({model_version}):")
     for tier, count in rows:
-        print(f"  {tier}: {count} ({count/predictions_saved*100:.1f}%)")
+        print(f"  {tier}: {count} ({count/max(total, 1)*100:.1f}%)")
+
+
+def generate_predictions(models, db, as_of_year=2024, dry_run=False, feature_version=None):
+    """
+    Generate predictions for all prospects for one or more model versions.
+
+    Args:
+        models: List of (model_version, artifact_tag) pairs
+        db: Sync database session
+        as_of_year: Feature snapshot year to score
+        dry_run: Score without writing to the database
+        feature_version: Read features from this feature store schema version
+            instead of the ml_features JSON column
+    """
+    print("\n" + "=" * 80)
+    print("GENERATING PREDICTIONS")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    if feature_version:
+        partition = FeatureStore().open(feature_version, as_of_year)
+        # Skip rows for prospects that no longer exist, as the db source's join does
+        prospect_ids = partition.prospect_ids[np.isin(partition.prospect_ids, load_prospect_ids(db))]
+        vectors = None
+        print(f"\nOpened feature store partition {feature_version}/{as_of_year}: "
+              f"{len(prospect_ids)} prospects ({time.perf_counter() - start:.2f}s)")
+    else:
+        prospect_ids, vectors = load_feature_vectors(db, as_of_year)
+        print(f"\nLoaded {len(prospect_ids)} prospects with features "
+              f"({time.perf_counter() - start:.2f}s)")
+
+    if len(prospect_ids) == 0:
+        print("No feature vectors found, nothing to score")
+        return {}
+
+    # Models trained on the same feature list share one matrix
+    matrices = {}
+    scored = {}
+
+    for model_version, artifact_tag in models:
+        model, label_encoder, feature_names = load_model(artifact_tag)
+
+        key = tuple(feature_names)
+        if key not in matrices:
+            step = time.perf_counter()
+            if vectors is None:
+                _, matrices[key] = partition.matrix(feature_names, prospect_ids)
+            else:
+                matrices[key] = build_feature_matrix(vectors, feature_names)
+            print(f"Built {matrices[key].shape[0]} x {matrices[key].shape[1]} feature matrix "
+                  f"({time.perf_counter() - step:.2f}s)")
+
+        step = time.perf_counter()
+        tiers, predicted_fv, confidence = score_matrix(model, label_encoder, matrices[key])
+        scored[model_version] = (prospect_ids, tiers, predicted_fv, confidence)
+        print(f"Scored {len(tiers)} prospects with {model_version} "
+              f"({time.perf_counter() - step:.2f}s)")
+
+    if dry_run:
+        print("\nDry run: predictions not written")
+    else:
+        step = time.perf_counter()
+        replace_predictions(db, scored)
+        print(f"\nReplaced predictions for {len(scored)} model version(s) "
+              f"({time.perf_counter() - step:.2f}s)")
+
+    print("\n" + "=" * 80)
+    print("PREDICTION SUMMARY")
+    print("=" * 80)
+    print(f"Total prospects: {len(prospect_ids)}")
+    print(f"Model versions: {', '.join(scored)}")
+    print(f"Total time: {time.perf_counter() - start:.2f}s")
+
+    for model_version, (_, tiers, _, _) in scored.items():
+        if dry_run:
+            values, counts = np.unique(tiers, return_counts=True)
+            print(f"\nPrediction Distribution ({model_version}):")
+            for tier, count in sorted(zip(values, counts), key=lambda tc: -FV_MAP.get(tc[0], 0)):
+                print(f"  {tier}: {count} ({count/len(tiers)*100:.1f}%)")
+        else:
+            print_distribution(db, model_version, len(tiers))
+
+    return scored
+
+
+def parse_model_spec(spec):
+    """Parse VERSION[:ARTIFACT_TAG] into a (version, tag) pair."""
+    version, _, tag = spec.partition(':')
+    return version, tag or 'latest'
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate ML predictions for all prospects')
+    parser.add_argument(
+        '--model', action='append', dest='models', metavar='VERSION[:ARTIFACT_TAG]',
+        help="Model version to write and artifact tag to load (default: v1.0:latest). Repeatable."
+    )
+    parser.add_argument('--as-of-year', type=int, default=2024, help='Feature snapshot year')
+    parser.add_argument('--dry-run', action='store_true', help='Score without writing')
+    parser.add_argument('--source', choices=['db', 'store'], default='db',
+                        help='Read features from ml_features JSON (db) or the columnar feature store')
+    parser.add_argument('--feature-version', default='v1.0',
+                        help='Feature store schema version (with --source store)')
+    args = parser.parse_args()
+
+    models = [parse_model_spec(spec) for spec in (args.models or ['v1.0:latest'])]
+
     print("=" * 80)
     print("ML PREDICTION GENERATION")
     print("=" * 80)
@@ -178,11 +344,12 @@ def main():
     db = get_db_sync()
 
     try:
-        # Load model
-        model, label_encoder, feature_names = load_model()
-
-        # Generate predictions
-        generate_predictions(model, label_encoder, feature_names, db)
+        generate_predictions(
+            models, db,
+            as_of_year=args.as_of_year,
+            dry_run=args.dry_run,
+            feature_version=args.feature_version if args.source == 'store' else None
+        )
 
         print("\nPredictions generated successfully!")
 
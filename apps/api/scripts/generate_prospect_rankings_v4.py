@@ -26,6 +26,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from sqlalchemy import text
 from app.db.database import engine
 from scripts.prospect_age_curves import ProspectAgeCurve, LevelAgeAdjustment
+from scripts.ranking_pipeline import get_ranking_pipeline
 
 logging.basicConfig(
     level=logging.INFO,
@@ -544,8 +545,8 @@ async def main():
     """Main execution."""
     system = UnifiedProspectRankingSystem()
 
-    # Generate unified rankings
-    rankings = await system.generate_unified_rankings()
+    # Generate unified rankings (cached as the 'v4' pipeline stage)
+    rankings = await get_ranking_pipeline().run('v4')
 
     # Print top 100
     system.print_top_prospects(rankings, n=100)
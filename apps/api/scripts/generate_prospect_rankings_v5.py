@@ -21,6 +21,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.db.database import engine
 from scripts.prospect_age_curves import ProspectAgeCurve
+from scripts.ranking_pipeline import MLB_PREDICTOR_FILE, get_ranking_pipeline
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -33,7 +34,7 @@ class MLBProjectionEngine:
 
     def load_models(self):
         """Load trained MLB predictor models."""
-        with open('age_aware_mlb_predictor.pkl', 'rb') as f:
+        with open(MLB_PREDICTOR_FILE, 'rb') as f:
             data = pickle.load(f)
             self.models = data['models']
             self.feature_cols = data['feature_cols']
@@ -88,11 +89,8 @@ class MLBProjectionEngine:
         return df
 
 
-async def main():
-    print('=' * 100)
-    print('PROSPECT RANKINGS V5 - MLB PROJECTION ENGINE')
-    print('=' * 100)
-
+async def build_v5_rankings() -> pd.DataFrame:
+    """Load hitters, project MLB performance and rank (cached as the 'v5' pipeline stage)."""
     # Initialize projection engine
     logger.info('Loading MLB projection models...')
     projector = MLBProjectionEngine()
@@ -205,6 +203,16 @@ async def main():
     df = df.sort_values('prospect_value', ascending=False).reset_index(drop=True)
     df['rank'] = range(1, len(df) + 1)
 
+    return df
+
+
+async def main():
+    print('=' * 100)
+    print('PROSPECT RANKINGS V5 - MLB PROJECTION ENGINE')
+    print('=' * 100)
+
+    df = await get_ranking_pipeline().run('v5')
+
     # Save
     output_file = 'prospect_rankings_v5_hitters_mlb_projected.csv'
     df.to_csv(output_file, index=False)
@@ -25,6 +25,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.db.database import engine
 from scripts.prospect_age_curves import ProspectAgeCurve
+from scripts.ranking_pipeline import MLB_PREDICTOR_FILE, get_ranking_pipeline
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -188,11 +189,8 @@ async def load_hitters_with_recency() -> pd.DataFrame:
     return player_df
 
 
-async def main():
-    print('=' * 100)
-    print('PROSPECT RANKINGS V6 - BALANCED BLEND')
-    print('=' * 100)
-
+async def build_v6_rankings() -> pd.DataFrame:
+    """Build the V4/V5 blend and rank (cached as the 'v6' pipeline stage)."""
     # Load data with recency weighting
     logger.info('Loading hitter data with recency weighting...')
     df = await load_hitters_with_recency()
@@ -270,7 +268,7 @@ async def main():
     logger.info('Loading V5 projections...')
 
     # Load ML predictor
-    with open('age_aware_mlb_predictor.pkl', 'rb') as f:
+    with open(MLB_PREDICTOR_FILE, 'rb') as f:
         model_data = pickle.load(f)
         models = model_data['models']
         feature_cols = model_data['feature_cols']
@@ -342,10 +340,20 @@ async def main():
     df = df[df['mlb_pa'] < 500].copy()
     logger.info(f'After MLB experience filter: {len(df)} hitters')
 
-    # Rank and save
+    # Rank
     df = df.sort_values('v6_score', ascending=False).reset_index(drop=True)
     df['rank'] = range(1, len(df) + 1)
 
+    return df
+
+
+async def main():
+    print('=' * 100)
+    print('PROSPECT RANKINGS V6 - BALANCED BLEND')
+    print('=' * 100)
+
+    df = await get_ranking_pipeline().run('v6')
+
     output_file = 'prospect_rankings_v6_blended.csv'
     df.to_csv(output_file, index=False)
 
@@ -7,6 +7,9 @@ V7 Formula:
 - 10% V5 ML Projection Rankings (ensemble predictions)
 
 This makes expert grades "a large portion" of the ranking as requested.
+
+Inputs (V6 output, FanGraphs grades, MLB graduates) come from the cached
+ranking pipeline, so a FanGraphs refresh only reloads the grades.
 """
 
 import pandas as pd
@@ -19,18 +22,33 @@ import joblib
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.db.database import engine
+from scripts.ranking_pipeline import get_ranking_pipeline
 
 
-def load_v6_rankings():
-    """Load V6 rankings which contain both V4 and V5 scores."""
-    df = pd.read_csv('prospect_rankings_v6_blended.csv')
-    # Keep only what we need
-    df = df[['mlb_player_id', 'full_name', 'v4_score', 'v5_score']].copy()
+def select_v6_columns(v6_df):
+    """Keep only the V6 columns V7 needs (V6 contains both V4 and V5 scores)."""
+    df = v6_df[['mlb_player_id', 'full_name', 'v4_score', 'v5_score']].copy()
     df = df.rename(columns={'full_name': 'name'})
     return df
 
 
+async def load_v6_rankings():
+    """Load V6 rankings from the ranking pipeline cache."""
+    return select_v6_columns(await get_ranking_pipeline().run('v6'))
+
+
 async def load_fangraphs_grades():
+    """Load latest FanGraphs grades from the ranking pipeline cache."""
+    return await get_ranking_pipeline().run('fangraphs_grades')
+
+
+async def get_mlb_graduates():
+    """Get players with 130+ MLB at-bats to exclude, via the ranking pipeline cache."""
+    df = await get_ranking_pipeline().run('mlb_graduates')
+    return set(df['mlb_player_id'].astype(str))
+
+
+async def query_fangraphs_grades():
     """
     Load latest FanGraphs grades for each prospect.
     Filters out players with 130+ MLB at-bats.
@@ -157,7 +175,7 @@ def calculate_fangraphs_score(fg_df):
     return composite_score
 
 
-async def get_mlb_graduates():
+async def query_mlb_graduates():
     """Get players with 130+ MLB at-bats to exclude."""
     async with engine.begin() as conn:
         result = await conn.execute(text("""
@@ -166,32 +184,48 @@ async def get_mlb_graduates():
             GROUP BY mlb_player_id
             HAVING SUM(at_bats) >= 130
         """))
-        df = pd.DataFrame(result.fetchall(), columns=result.keys())
-        return set(df['mlb_player_id'].astype(str))
+        return pd.DataFrame(result.fetchall(), columns=result.keys())
 
 
-async def generate_v7_rankings():
-    """Generate V7 rankings: 50% FG grades + 40% V4 + 10% V5."""
+def component_matrix(df, redistribute_missing=True):
+    """
+    Build the (N x 3) component matrix A so that ``A @ [fg, v4, v5]`` is the V7 score.
 
-    print('=' * 80)
-    print('PROSPECT RANKINGS V7: FANGRAPHS INTEGRATED')
-    print('=' * 80)
-    print('\nFormula: 50% FanGraphs Grades + 40% V4 Performance + 10% V5 ML')
-    print('Baseline: Prospects without FG grades get FV~35-40 equivalent')
-    print('\n' + '=' * 80)
+    Redistributing a missing V4/V5 weight to FanGraphs is the same as scoring
+    the missing component with the FanGraphs score, so with redistribution
+    missing components are filled from the FG column. Without it they stay
+    NaN, as do the resulting scores.
+    """
+    fg = df['fg_score_normalized'].to_numpy(dtype=float)
+    v4 = df['v4_normalized'].to_numpy(dtype=float)
+    v5 = df['v5_normalized'].to_numpy(dtype=float)
 
-    # Load all components
-    print('\nLoading V6 rankings (contains V4 and V5)...')
-    v6_df = load_v6_rankings()
-    print(f'  Loaded {len(v6_df)} prospects from V6')
+    if redistribute_missing:
+        v4 = np.where(df['has_v4'].to_numpy(dtype=bool), v4, fg)
+        v5 = np.where(df['has_v5'].to_numpy(dtype=bool), v5, fg)
 
-    print('Loading FanGraphs grades...')
-    fg_df = await load_fangraphs_grades()
-    print(f'  Loaded {len(fg_df)} prospects with FanGraphs grades')
+    return np.column_stack([fg, v4, v5])
 
-    print('Identifying MLB graduates (130+ AB)...')
-    mlb_graduates = await get_mlb_graduates()
-    print(f'  Found {len(mlb_graduates)} players to exclude')
+
+def compute_v7_rankings(v6_df, fg_df, mlb_graduates, fg_weight=0.50, v4_weight=0.40,
+                        v5_weight=0.10, redistribute_missing=True):
+    """
+    Blend V6 (V4 + V5) scores with FanGraphs grades into V7 rankings.
+
+    Args:
+        v6_df: V6 pipeline output
+        fg_df: Latest FanGraphs grades
+        mlb_graduates: Set of mlb_player_id strings to exclude
+        fg_weight: Weight for FanGraphs grades
+        v4_weight: Weight for V4 performance
+        v5_weight: Weight for V5 ML projection
+        redistribute_missing: Move V4/V5 weight to FanGraphs when a score is missing
+
+    Returns:
+        Ranked DataFrame with v7_score and v7_rank
+    """
+    v6_df = select_v6_columns(v6_df)
+    fg_df = fg_df.copy()
 
     # Calculate FanGraphs scores
     print('\nCalculating FanGraphs composite scores...')
@@ -244,31 +278,30 @@ async def generate_v7_rankings():
     df['has_v4'] = df['v4_score'].notna()
     df['has_v5'] = df['v5_score'].notna()
 
-    def calc_v7_score(row):
-        fg_weight = 0.50
-        v4_weight = 0.40 if row['has_v4'] else 0
-        v5_weight = 0.10 if row['has_v5'] else 0
-
-        # Redistribute missing weights to FG
-        if not row['has_v4']:
-            fg_weight += 0.40
-        if not row['has_v5']:
-            fg_weight += 0.10
-
-        score = (
-            row['fg_score_normalized'] * fg_weight +
-            row['v4_normalized'] * v4_weight +
-            row['v5_normalized'] * v5_weight
-        )
-        return score
-
-    df['v7_score'] = df.apply(calc_v7_score, axis=1)
+    weights = np.array([fg_weight, v4_weight, v5_weight])
+    df['v7_score'] = component_matrix(df, redistribute_missing) @ weights
 
     # Rank
     df = df.sort_values('v7_score', ascending=False)
     df['v7_rank'] = range(1, len(df) + 1)
 
     print(f'\nGenerated V7 rankings for {len(df)} prospects')
+    return df
+
+
+async def generate_v7_rankings():
+    """Generate V7 rankings: 50% FG grades + 40% V4 + 10% V5."""
+
+    print('=' * 80)
+    print('PROSPECT RANKINGS V7: FANGRAPHS INTEGRATED')
+    print('=' * 80)
+    print('\nFormula: 50% FanGraphs Grades + 40% V4 Performance + 10% V5 ML')
+    print('Baseline: Prospects without FG grades get FV~35-40 equivalent')
+    print('\n' + '=' * 80)
+
+    pipeline = get_ranking_pipeline()
+    df = await pipeline.run('v7')
+    print(f"Recomputed stages: {', '.join(pipeline.computed) or 'none (all cached)'}")
 
     # Stats
     print('\n' + '=' * 80)
@@ -6,9 +6,16 @@ This script allows you to easily adjust the weights between:
 - V4 Performance-Based Rankings (MiLB stats)
 - V5 ML Projection Rankings (ensemble predictions)
 
+Sweep mode scores every weight combination on a grid at once: the
+normalized component scores are loaded into an (N x 3) matrix and the whole
+grid is evaluated as one matrix product per chunk, reporting Spearman rank
+correlation and top-N overlap against a reference ranking.
+
 Usage:
   python generate_prospect_rankings_v7_configurable.py --fg 60 --v4 30 --v5 10
   python generate_prospect_rankings_v7_configurable.py --fg 40 --v4 50 --v5 10
+  python generate_prospect_rankings_v7_configurable.py --sweep --step 0.01 --top-n 100
+  python generate_prospect_rankings_v7_configurable.py --sweep --reference prospect_rankings_v7_fg60_v430_v510.csv
 """
 
 import pandas as pd
@@ -18,17 +25,15 @@ from sqlalchemy import text
 import sys
 import os
 import argparse
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.db.database import engine
 
-# Import the core functions from the main V7 script
-from generate_prospect_rankings_v7 import (
-    load_v6_rankings,
-    load_fangraphs_grades,
-    get_mlb_graduates,
-    calculate_fangraphs_score
-)
+from scripts.ranking_pipeline import get_ranking_pipeline
+from scripts.generate_prospect_rankings_v7 import component_matrix
+
+DEFAULT_WEIGHTS = (0.50, 0.40, 0.10)
 
 
 async def generate_v7_configurable(fg_weight=0.50, v4_weight=0.40, v5_weight=0.10, output_suffix=''):
@@ -54,76 +59,16 @@ async def generate_v7_configurable(fg_weight=0.50, v4_weight=0.40, v5_weight=0.1
     print('Baseline: Prospects without FG grades get FV~35-40 equivalent')
     print('\n' + '=' * 80)
 
-    # Load all components
-    print('\nLoading V6 rankings (contains V4 and V5)...')
-    v6_df = load_v6_rankings()
-    print(f'  Loaded {len(v6_df)} prospects from V6')
-
-    print('Loading FanGraphs grades...')
-    fg_df = await load_fangraphs_grades()
-    print(f'  Loaded {len(fg_df)} prospects with FanGraphs grades')
-
-    print('Identifying MLB graduates (130+ AB)...')
-    mlb_graduates = await get_mlb_graduates()
-    print(f'  Found {len(mlb_graduates)} players to exclude')
-
-    # Calculate FanGraphs scores
-    print('\nCalculating FanGraphs composite scores...')
-    fg_df['fg_score'] = calculate_fangraphs_score(fg_df)
-    fg_df['fg_score_normalized'] = (fg_df['fg_score'] / fg_df['fg_score'].max()) * 100
-
-    # Merge all data
-    print('Merging rankings...')
-
-    # Start with V6 as base, filter out MLB graduates
-    v6_df['mlb_player_id'] = v6_df['mlb_player_id'].astype(str)
-    df = v6_df[~v6_df['mlb_player_id'].isin(mlb_graduates)].copy()
-
-    excluded_count = len(v6_df) - len(df)
-    print(f'  Excluded {excluded_count} MLB graduates from V6')
-    print(f'  Working with {len(df)} true prospects')
-
-    # Merge FanGraphs grades
-    fg_df['mlb_player_id'] = fg_df['mlb_player_id'].astype(str)
-    fg_merge = fg_df[['mlb_player_id', 'player_name', 'fv', 'report_year', 'fg_score', 'fg_score_normalized']].copy()
-
-    df = df.merge(
-        fg_merge,
-        on='mlb_player_id',
-        how='left',
-        suffixes=('', '_fg')
-    )
-
-    # Assign baseline for ungraded prospects
-    baseline_fg_score = 25.0
-    df['fg_score_normalized'] = df['fg_score_normalized'].fillna(baseline_fg_score)
-    df['has_fg_grade'] = df['fv'].notna()
-    df['player_name'] = df['player_name'].fillna(df['name'])
-
-    print(f'  {df["has_fg_grade"].sum()} prospects with FanGraphs grades')
-    print(f'  {(~df["has_fg_grade"]).sum()} prospects assigned baseline grade')
-
-    # Normalize V4 and V5
-    df['v4_normalized'] = (df['v4_score'] / df['v4_score'].max()) * 100
-    df['v5_normalized'] = (df['v5_score'] / df['v5_score'].max()) * 100
-
-    df['has_v4'] = df['v4_score'].notna()
-    df['has_v5'] = df['v5_score'].notna()
-
-    # Calculate V7 score with custom weights
-    def calc_v7_score(row):
-        score = (
-            row['fg_score_normalized'] * fg_weight +
-            row['v4_normalized'] * v4_weight +
-            row['v5_normalized'] * v5_weight
-        )
-        return score
-
-    df['v7_score'] = df.apply(calc_v7_score, axis=1)
-
-    # Rank
-    df = df.sort_values('v7_score', ascending=False)
-    df['v7_rank'] = range(1, len(df) + 1)
+    # V6, FanGraphs grades and MLB graduates come from the ranking pipeline
+    # cache; only the weighted blend is recomputed for new weights
+    pipeline = get_ranking_pipeline()
+    df = await pipeline.run('v7', params={
+        'fg_weight': fg_weight,
+        'v4_weight': v4_weight,
+        'v5_weight': v5_weight,
+        'redistribute_missing': False,
+    })
+    print(f"Recomputed stages: {', '.join(pipeline.computed) or 'none (all cached)'}")
 
     print(f'\nGenerated V7 rankings for {len(df)} prospects')
 
@@ -181,15 +126,145 @@ async def generate_v7_configurable(fg_weight=0.50, v4_weight=0.40, v5_weight=0.1
     return df
 
 
+def weight_grid(step=0.05):
+    """All (fg, v4, v5) weight vectors summing to 1.0 at the given step."""
+    n = int(round(1 / step))
+    fg, v4 = np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing='ij')
+    mask = fg + v4 <= n
+    fg, v4 = fg[mask], v4[mask]
+    return np.column_stack([fg, v4, n - fg - v4]) / n
+
+
+def rank_positions(scores):
+    """
+    Rank each column of an (N x K) score matrix, highest score first.
+
+    Returns:
+        Tuple of (order, ranks): order[:, k] lists row indices best-first and
+        ranks[i, k] is the 0-based rank of row i. NaN scores rank last.
+    """
+    order = np.argsort(-np.nan_to_num(scores, nan=-np.inf), axis=0, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(len(scores))[:, None], axis=0)
+    return order, ranks
+
+
+def sweep_weights(components, weights, reference_scores, top_n=100, chunk_size=512):
+    """
+    Evaluate many weight vectors against a reference ranking.
+
+    Args:
+        components: (N x 3) component matrix from ``component_matrix``
+        weights: (K x 3) weight vectors (fg, v4, v5)
+        reference_scores: (N,) scores defining the reference ranking (higher is better)
+        top_n: Size of the top-N overlap window
+        chunk_size: Weight vectors scored per matrix product (bounds memory at N x chunk_size)
+
+    Returns:
+        DataFrame with one row per weight vector: weights, spearman, top_n_overlap
+    """
+    n = len(components)
+    top_n = min(top_n, n)
+
+    _, reference_ranks = rank_positions(reference_scores[:, None])
+    reference_ranks = reference_ranks[:, 0]
+    reference_top = reference_ranks < top_n
+
+    results = []
+    for start in range(0, len(weights), chunk_size):
+        chunk = weights[start:start + chunk_size]
+        scores = components @ chunk.T
+
+        order, ranks = rank_positions(scores)
+        d = (ranks - reference_ranks[:, None]).astype(float)
+        spearman = 1 - 6 * (d ** 2).sum(axis=0) / (n * (n ** 2 - 1)) if n > 1 else np.ones(len(chunk))
+        overlap = reference_top[order[:top_n]].sum(axis=0) / max(top_n, 1)
+
+        results.append(np.column_stack([chunk, spearman, overlap]))
+
+    return pd.DataFrame(
+        np.vstack(results),
+        columns=['fg_weight', 'v4_weight', 'v5_weight', 'spearman', 'top_n_overlap']
+    )
+
+
+def reference_scores_for(df, reference, redistribute_missing):
+    """Scores for the reference ranking: 'default' weights, 'fangraphs', or a rankings CSV."""
+    if reference == 'default':
+        return component_matrix(df, redistribute_missing) @ np.array(DEFAULT_WEIGHTS)
+    if reference == 'fangraphs':
+        return df['fg_score_normalized'].to_numpy(dtype=float)
+
+    ref_df = pd.read_csv(reference, usecols=['mlb_player_id', 'rank'])
+    ref_rank = dict(zip(ref_df['mlb_player_id'].astype(str), ref_df['rank']))
+    ranks = df['mlb_player_id'].astype(str).map(ref_rank).to_numpy(dtype=float)
+    return -ranks  # unranked players (NaN) sort last
+
+
+async def sweep_v7_weights(step=0.05, top_n=100, reference='default', redistribute_missing=True,
+                           output_file='prospect_rankings_v7_sweep.csv'):
+    """Sweep the FG/V4/V5 weight grid and report agreement with a reference ranking."""
+    print('=' * 80)
+    print('PROSPECT RANKINGS V7: WEIGHT SWEEP')
+    print('=' * 80)
+
+    # Component scores do not depend on the weights, so the cached default blend is enough
+    df = await get_ranking_pipeline().run('v7')
+
+    start = time.perf_counter()
+    components = component_matrix(df, redistribute_missing)
+    weights = weight_grid(step)
+    reference_scores = reference_scores_for(df, reference, redistribute_missing)
+
+    results = sweep_weights(components, weights, reference_scores, top_n=top_n)
+    elapsed = time.perf_counter() - start
+
+    results = results.sort_values(['spearman', 'top_n_overlap'], ascending=False)
+    results.to_csv(output_file, index=False)
+
+    print(f'\nScored {len(weights)} weight combinations x {len(df)} prospects in {elapsed:.2f}s')
+    print(f'Reference: {reference} | Redistribute missing: {redistribute_missing} | Top-N: {top_n}')
+
+    display = results.head(20).copy()
+    for col in ['fg_weight', 'v4_weight', 'v5_weight', 'top_n_overlap']:
+        display[col] = (display[col] * 100).round().astype(int).astype(str) + '%'
+    display['spearman'] = display['spearman'].map('{:.4f}'.format)
+
+    print('\n' + '=' * 80)
+    print('TOP 20 COMBINATIONS BY RANK CORRELATION')
+    print('=' * 80)
+    print(display.to_string(index=False))
+    print(f'\nExported {len(results)} combinations to {output_file}')
+
+    return results
+
+
 async def main():
     parser = argparse.ArgumentParser(description='Generate V7 rankings with configurable weights')
     parser.add_argument('--fg', type=int, default=50, help='FanGraphs weight (0-100)')
     parser.add_argument('--v4', type=int, default=40, help='V4 performance weight (0-100)')
     parser.add_argument('--v5', type=int, default=10, help='V5 ML projection weight (0-100)')
     parser.add_argument('--output', type=str, default='', help='Output filename suffix')
+    parser.add_argument('--sweep', action='store_true', help='Evaluate the whole weight grid')
+    parser.add_argument('--step', type=float, default=0.05, help='Sweep grid step (e.g. 0.01)')
+    parser.add_argument('--top-n', type=int, default=100, help='Sweep top-N overlap window')
+    parser.add_argument('--reference', default='default',
+                        help="Sweep reference ranking: 'default', 'fangraphs' or a rankings CSV")
+    parser.add_argument('--no-redistribute', action='store_true',
+                        help='Sweep without moving missing V4/V5 weight to FanGraphs')
 
     args = parser.parse_args()
 
+    if args.sweep:
+        await sweep_v7_weights(
+            step=args.step,
+            top_n=args.top_n,
+            reference=args.reference,
+            redistribute_missing=not args.no_redistribute,
+            output_file=f'prospect_rankings_v7_sweep{"_" + args.output if args.output else ""}.csv'
+        )
+        return
+
     # Convert to decimals
     fg_weight = args.fg / 100.0
     v4_weight = args.v4 / 100.0
@@ -0,0 +1,617 @@
+"""
+MiLB Game Log Collection Orchestrator
+
+Runs game log collection for many seasons from one persistent work queue
+instead of one independent subprocess per season. Each task is a single
+(season, level, player) with the stat groups still missing in
+milb_game_logs.
+
+- The queue is a SQLite file, so a run can be stopped at any point and
+  resumed; tasks left running by a crashed worker are reclaimed on start.
+- N worker processes claim tasks in batches and share ONE token-bucket
+  request budget served by a local coordinator process, so the whole run
+  stays at the configured statsapi rate however many workers are used.
+  A 429 from any worker halves the shared rate and pauses everyone briefly;
+  the rate then recovers gradually.
+- Progress and throughput are reported per season/level while running
+  and on demand with the status command.
+
+Usage:
+  python milb_collection_orchestrator.py plan --seasons 2021 2022 2023 --levels AAA AA A+ A
+  python milb_collection_orchestrator.py run --workers 4 --rate 8
+  python milb_collection_orchestrator.py run --seasons 2024 --levels AAA AA --workers 4
+  python milb_collection_orchestrator.py status
+  python milb_collection_orchestrator.py retry   # requeue failed tasks
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from multiprocessing.managers import BaseManager
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aiohttp
+from sqlalchemy import text
+
+from app.db.database import engine
+from app.services.statsapi_cache import statsapi_cache
+from scripts.collect_all_milb_gamelog_v2 import EnhancedMiLBCollector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_PATH = 'milb_collection_queue.db'
+DEFAULT_LEVELS = ['AAA', 'AA', 'A+', 'A']
+
+# A task claimed longer ago than this is assumed to belong to a dead worker
+STALE_CLAIM_SECONDS = 30 * 60
+MAX_ATTEMPTS = 3
+
+
+class FetchError(Exception):
+    """Raised when a statsapi request still fails after retries."""
+
+
+# ---------------------------------------------------------------------------
+# Shared request budget
+# ---------------------------------------------------------------------------
+
+class TokenBucket:
+    """
+    Token bucket shared by every worker through the coordinator process.
+
+    ``reserve`` never blocks inside the coordinator: it books the tokens
+    (the balance may go negative) and returns how long the caller must
+    sleep before sending, so callers queue up in booking order.
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: float = 0.5,
+                 recovery_interval: float = 30.0):
+        self.target_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.recovery_interval = recovery_interval
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.last_change = self.updated
+        self.granted = 0
+        self.throttles = 0
+        self.started = self.updated
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        # Additive recovery toward the target rate after a throttle
+        if self.rate < self.target_rate and now - self.last_change >= self.recovery_interval:
+            self.rate = min(self.target_rate, self.rate + self.target_rate * 0.1)
+            self.last_change = now
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, n: int = 1) -> float:
+        """Book n requests; returns seconds to wait before sending them."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= n
+            self.granted += n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.paused_until - now)
+
+    def throttle(self, pause: float = 5.0) -> float:
+        """Back off after a 429: halve the shared rate and pause all workers."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Several workers often see the same burst of 429s; count it once
+            if now >= self.paused_until:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self.throttles += 1
+                self.last_change = now
+            self.paused_until = max(self.paused_until, now + pause)
+            self.tokens = min(self.tokens, 0.0)
+            return self.rate
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            elapsed = max(time.monotonic() - self.started, 1e-9)
+            return {
+                'rate': self.rate,
+                'target_rate': self.target_rate,
+                'granted': self.granted,
+                'throttles': self.throttles,
+                'requests_per_sec': self.granted / elapsed,
+            }
+
+
+class BudgetManager(BaseManager):
+    """Coordinator process that serves the shared TokenBucket."""
+
+
+BudgetManager.register('TokenBucket', TokenBucket)
+
+
+# ---------------------------------------------------------------------------
+# Persistent work queue
+# ---------------------------------------------------------------------------
+
+class WorkQueue:
+    """SQLite queue of (season, level, player) collection tasks."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            season INTEGER NOT NULL,
+            level TEXT NOT NULL,
+            player_id INTEGER NOT NULL,
+            position TEXT,
+            need_hitting INTEGER NOT NULL,
+            need_pitching INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            worker TEXT,
+            claimed_at REAL,
+            finished_at REAL,
+            hitting_games INTEGER NOT NULL DEFAULT 0,
+            pitching_games INTEGER NOT NULL DEFAULT 0,
+            error TEXT,
+            UNIQUE (season, level, player_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, season, level);
+        CREATE TABLE IF NOT EXISTS planned (
+            season INTEGER NOT NULL,
+            level TEXT NOT NULL,
+            planned_at REAL NOT NULL,
+            PRIMARY KEY (season, level)
+        );
+    """
+
+    def __init__(self, path: str = DEFAULT_QUEUE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def planned_levels(self) -> set:
+        return {(season, level) for season, level in self.conn.execute("SELECT season, level FROM planned")}
+
+    def add_tasks(self, season: int, level: str, players: Iterable[Dict[str, Any]],
+                  mark_planned: bool = True) -> int:
+        """Enqueue tasks for one season/level and, unless told not to, mark it planned."""
+        rows = [
+            (season, level, p['player_id'], p.get('position'), int(p['need_hitting']), int(p['need_pitching']))
+            for p in players
+        ]
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = self.conn.total_changes
+            self.conn.executemany("""
+                INSERT OR IGNORE INTO tasks (season, level, player_id, position, need_hitting, need_pitching)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+            added = self.conn.total_changes - before
+            if mark_planned:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO planned (season, level, planned_at) VALUES (?, ?, ?)",
+                    (season, level, time.time())
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def reclaim_stale(self, older_than: float = STALE_CLAIM_SECONDS) -> int:
+        """Return tasks claimed by workers that never finished them."""
+        cursor = self.conn.execute("""
+            UPDATE tasks SET status = 'pending', worker = NULL
+            WHERE status = 'running' AND claimed_at < ?
+        """, (time.time() - older_than,))
+        return cursor.rowcount
+
+    def retry_failed(self) -> int:
+        cursor = self.conn.execute("UPDATE tasks SET status = 'pending', attempts = 0 WHERE status = 'failed'")
+        return cursor.rowcount
+
+    def claim(self, worker: str, n: int, seasons: Optional[List[int]] = None) -> List[Tuple]:
+        """Atomically claim up to n pending tasks for a worker."""
+        season_filter = ""
+        params: List[Any] = []
+        if seasons:
+            season_filter = f"AND season IN ({', '.join('?' for _ in seasons)})"
+            params.extend(seasons)
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self.conn.execute(f"""
+                SELECT id, season, level, player_id, position, need_hitting, need_pitching
+                FROM tasks
+                WHERE status = 'pending' {season_filter}
+                ORDER BY season DESC, level, id
+                LIMIT ?
+            """, params + [n]).fetchall()
+            if rows:
+                self.conn.executemany(
+                    "UPDATE tasks SET status = 'running', worker = ?, claimed_at = ?, attempts = attempts + 1 WHERE id = ?",
+                    [(worker, time.time(), row[0]) for row in rows]
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return rows
+
+    def complete(self, task_id: int, hitting_games: int, pitching_games: int):
+        self.conn.execute("""
+            UPDATE tasks SET status = 'done', finished_at = ?, hitting_games = ?, pitching_games = ?, error = NULL
+            WHERE id = ?
+        """, (time.time(), hitting_games, pitching_games, task_id))
+
+    def fail(self, task_id: int, error: str, max_attempts: int = MAX_ATTEMPTS):
+        """Requeue a failed task until it runs out of attempts."""
+        self.conn.execute("""
+            UPDATE tasks
+            SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                finished_at = ?, error = ?
+            WHERE id = ?
+        """, (max_attempts, time.time(), error[:500], task_id))
+
+    def summary(self) -> List[Tuple]:
+        """(season, level, pending, running, done, failed, hitting_games, pitching_games) rows."""
+        return self.conn.execute("""
+            SELECT season, level,
+                   SUM(status = 'pending'), SUM(status = 'running'),
+                   SUM(status = 'done'), SUM(status = 'failed'),
+                   SUM(hitting_games), SUM(pitching_games)
+            FROM tasks
+            GROUP BY season, level
+            ORDER BY season DESC, level
+        """).fetchall()
+
+    def throughput(self, window: float = 300.0) -> Tuple[int, float]:
+        """Tasks finished in the last ``window`` seconds and the rate per minute."""
+        finished, = self.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE status = 'done' AND finished_at >= ?",
+            (time.time() - window,)
+        ).fetchone()
+        return finished, finished / (window / 60)
+
+
+# ---------------------------------------------------------------------------
+# Collection
+# ---------------------------------------------------------------------------
+
+class BudgetedCollector(EnhancedMiLBCollector):
+    """Game log collector whose requests draw from the shared token bucket."""
+
+    def __init__(self, season: int, bucket, session: aiohttp.ClientSession):
+        super().__init__(season=season, levels=[])
+        self.bucket = bucket
+        self.session = session
+
+    async def fetch_with_retry(self, url: str, retries: int = None) -> Optional[Dict[str, Any]]:
+        """Fetch JSON within the shared budget; raises FetchError when retries run out."""
+        retries = retries if retries is not None else self.max_retries
+        last_error = None
+
+        async def reserve():
+            # Proxy calls block on a socket, so keep them off the event loop
+            wait = await asyncio.to_thread(self.bucket.reserve)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self.stats['api_calls'] += 1
+
+        for attempt in range(retries):
+            try:
+                # Disk cache hits never draw from the shared budget
+                response = await statsapi_cache.get(self.session, url, before_request=reserve)
+                if response.status == 200:
+                    return response.json()
+                if response.status == 404:
+                    return None
+                last_error = f"HTTP {response.status}"
+                if response.status == 429:
+                    pause = self.retry_delay * (2 ** attempt) * 5
+                    new_rate = await asyncio.to_thread(self.bucket.throttle, pause)
+                    logger.warning(f"Rate limited; shared budget now {new_rate:.2f} req/s")
+                    continue
+            except asyncio.TimeoutError:
+                last_error = "timeout"
+            except aiohttp.ClientError as e:
+                last_error = str(e)
+
+            if attempt < retries - 1:
+                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+
+        self.stats['errors'] += 1
+        raise FetchError(f"{url}: {last_error}")
+
+
+def sport_id_for(level: str) -> Optional[int]:
+    return {v: k for k, v in EnhancedMiLBCollector.MILB_SPORT_IDS.items()}.get(level)
+
+
+async def load_existing_levels(season: int) -> Tuple[set, set]:
+    """(player, level) pairs that already have hitting / pitching logs for a season."""
+    async with engine.begin() as conn:
+        result = await conn.execute(text("""
+            SELECT mlb_player_id, level,
+                   BOOL_OR(games_played > 0) AS has_hitting,
+                   BOOL_OR(games_pitched > 0) AS has_pitching
+            FROM milb_game_logs
+            WHERE season = :season AND mlb_player_id IS NOT NULL
+            GROUP BY mlb_player_id, level
+        """), {'season': season})
+        rows = result.fetchall()
+
+    hitting = {(row[0], row[1]) for row in rows if row[2]}
+    pitching = {(row[0], row[1]) for row in rows if row[3]}
+    return hitting, pitching
+
+
+async def plan_seasons(queue: WorkQueue, seasons: List[int], levels: List[str], bucket,
+                       replan: bool = False):
+    """Discover rosters and enqueue tasks for every season/level not yet planned."""
+    planned = queue.planned_levels()
+    timeout = aiohttp.ClientTimeout(total=60)
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        for season in seasons:
+            todo = [level for level in levels if replan or (season, level) not in planned]
+            if not todo:
+                print(f"{season}: already planned ({', '.join(levels)})")
+                continue
+
+            collector = BudgetedCollector(season, bucket, session)
+            existing_hitting, existing_pitching = await load_existing_levels(season)
+
+            for level in todo:
+                sport_id = sport_id_for(level)
+                if not sport_id:
+                    print(f"{season} {level}: unknown level, skipping")
+                    continue
+
+                teams = await collector.get_milb_teams(sport_id)
+                results = await asyncio.gather(
+                    *(collector.get_team_roster(team['id']) for team in teams),
+                    return_exceptions=True
+                )
+
+                rosters = []
+                failed = 0
+                for team, result in zip(teams, results):
+                    if isinstance(result, Exception):
+                        failed += 1
+                        print(f"{season} {level}: roster for team {team['id']} failed ({result}), skipping")
+                    else:
+                        rosters.append(result)
+
+                players = {}
+                for roster in rosters:
+                    for entry in roster:
+                        player_id = entry.get('person', {}).get('id')
+                        if not player_id or player_id in players:
+                            continue
+                        position = entry.get('position', {}).get('abbreviation', '')
+                        need_hitting = (player_id, level) not in existing_hitting
+                        need_pitching = (
+                            position in collector.PITCHER_POSITIONS
+                            and (player_id, level) not in existing_pitching
+                        )
+                        if need_hitting or need_pitching:
+                            players[player_id] = {
+                                'player_id': player_id,
+                                'position': position,
+                                'need_hitting': need_hitting,
+                                'need_pitching': need_pitching,
+                            }
+
+                # Leave the level unplanned when teams failed so the next run retries them
+                added = queue.add_tasks(season, level, players.values(), mark_planned=not failed)
+                print(f"{season} {level}: {len(teams)} teams, {len(players)} players need data, {added} new tasks")
+                if failed:
+                    print(f"{season} {level}: {failed} rosters failed, level will be re-planned next run")
+
+
+async def run_task(collector: BudgetedCollector, task: Tuple) -> Tuple[int, int]:
+    """Collect one (season, level, player) task; returns (hitting, pitching) games saved."""
+    _, season, level, player_id, _, need_hitting, need_pitching = task
+    sport_id = sport_id_for(level)
+    hitting = pitching = 0
+
+    for group, needed in (('hitting', need_hitting), ('pitching', need_pitching)):
+        if not needed:
+            continue
+        logs = await collector.get_player_game_logs(player_id, sport_id, group)
+        saved = await collector.save_game_logs(player_id, logs, level, group)
+        # save_game_logs logs and swallows DB errors; keep the task retryable
+        if logs and not saved:
+            raise RuntimeError(f"could not save {len(logs)} {group} logs")
+        if group == 'hitting':
+            hitting = saved
+        else:
+            pitching = saved
+
+    return hitting, pitching
+
+
+async def worker_loop(worker: str, queue_path: str, bucket, concurrency: int,
+                      seasons: Optional[List[int]]):
+    """Claim and process tasks until the queue is drained."""
+    queue = WorkQueue(queue_path)
+    timeout = aiohttp.ClientTimeout(total=60)
+    connector = aiohttp.TCPConnector(limit=concurrency * 2)
+    collectors: Dict[int, BudgetedCollector] = {}
+
+    async def process(session, task):
+        task_id, season = task[0], task[1]
+        collector = collectors.get(season)
+        if collector is None:
+            collector = collectors[season] = BudgetedCollector(season, bucket, session)
+        try:
+            hitting, pitching = await run_task(collector, task)
+            queue.complete(task_id, hitting, pitching)
+        except Exception as e:
+            queue.fail(task_id, f"{type(e).__name__}: {e}")
+
+    try:
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            while True:
+                tasks = queue.claim(worker, concurrency, seasons)
+                if not tasks:
+                    break
+                await asyncio.gather(*(process(session, task) for task in tasks))
+    finally:
+        queue.close()
+        await engine.dispose()
+        print(f"{worker}: {statsapi_cache.format_report()}")
+
+
+def worker_main(worker: str, queue_path: str, bucket, concurrency: int,
+                seasons: Optional[List[int]]):
+    """Worker process entry point."""
+    logging.basicConfig(level=logging.WARNING, format=f'%(asctime)s - {worker} - %(levelname)s - %(message)s')
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    asyncio.run(worker_loop(worker, queue_path, bucket, concurrency, seasons))
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def print_status(queue: WorkQueue, bucket_stats: Optional[Dict[str, float]] = None):
+    """Per season/level progress plus overall throughput and ETA."""
+    rows = queue.summary()
+    print('=' * 80)
+    print(f"MiLB COLLECTION STATUS  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print('=' * 80)
+    print(f"{'Season':<8}{'Level':<8}{'Pending':>9}{'Running':>9}{'Done':>9}{'Failed':>8}{'Pct':>8}{'Hit G':>10}{'Pitch G':>10}")
+    print('-' * 80)
+
+    totals = [0, 0, 0, 0, 0, 0]
+    for season, level, pending, running, done, failed, hitting, pitching in rows:
+        counts = [pending or 0, running or 0, done or 0, failed or 0, hitting or 0, pitching or 0]
+        totals = [a + b for a, b in zip(totals, counts)]
+        total = sum(counts[:4])
+        pct = 100 * (counts[2] + counts[3]) / total if total else 0
+        print(f"{season:<8}{level:<8}{counts[0]:>9}{counts[1]:>9}{counts[2]:>9}{counts[3]:>8}{pct:>7.1f}%{counts[4]:>10}{counts[5]:>10}")
+
+    print('-' * 80)
+    total = sum(totals[:4])
+    pct = 100 * (totals[2] + totals[3]) / total if total else 0
+    print(f"{'ALL':<16}{totals[0]:>9}{totals[1]:>9}{totals[2]:>9}{totals[3]:>8}{pct:>7.1f}%{totals[4]:>10}{totals[5]:>10}")
+
+    recent, per_minute = queue.throughput()
+    remaining = totals[0] + totals[1]
+    eta = (datetime.now() + timedelta(minutes=remaining / per_minute)).strftime('%H:%M') if per_minute else 'unknown'
+    print(f"\nThroughput: {per_minute:.1f} tasks/min ({recent} in last 5 min) | Remaining: {remaining} | ETA: {eta}")
+    if bucket_stats:
+        print(f"Request budget: {bucket_stats['rate']:.2f}/{bucket_stats['target_rate']:.2f} req/s, "
+              f"{bucket_stats['requests_per_sec']:.2f} req/s actual, "
+              f"{bucket_stats['granted']} requests, {bucket_stats['throttles']} throttles")
+
+
+def run_workers(args, bucket) -> None:
+    """Start the worker processes and report progress until they finish."""
+    queue = WorkQueue(args.queue)
+    reclaimed = queue.reclaim_stale(0 if args.reclaim_all else STALE_CLAIM_SECONDS)
+    if reclaimed:
+        print(f"Reclaimed {reclaimed} tasks from interrupted workers")
+
+    workers = []
+    for i in range(args.workers):
+        process = multiprocessing.Process(
+            target=worker_main,
+            args=(f"worker-{i + 1}", args.queue, bucket, args.concurrency, args.seasons),
+            name=f"milb-worker-{i + 1}",
+        )
+        process.start()
+        workers.append(process)
+
+    print(f"Started {len(workers)} workers x {args.concurrency} concurrent tasks "
+          f"sharing {args.rate} req/s\n")
+
+    start = time.time()
+    try:
+        while any(process.is_alive() for process in workers):
+            for process in workers:
+                process.join(timeout=args.report_interval / len(workers))
+            if any(process.is_alive() for process in workers):
+                print_status(queue, bucket.stats())
+    except KeyboardInterrupt:
+        print("\nInterrupted - stopping workers (queue state is kept, run again to resume)")
+        for process in workers:
+            process.terminate()
+        for process in workers:
+            process.join()
+        queue.reclaim_stale(0)
+
+    print_status(queue, bucket.stats())
+    print(f"\nRun finished in {timedelta(seconds=int(time.time() - start))}")
+    queue.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Orchestrate MiLB game log collection across seasons')
+    parser.add_argument('command', choices=['plan', 'run', 'status', 'retry'])
+    parser.add_argument('--seasons', type=int, nargs='+', help='Seasons to plan/run (default: all planned)')
+    parser.add_argument('--levels', nargs='+', default=DEFAULT_LEVELS, help='MiLB levels to plan')
+    parser.add_argument('--queue', default=DEFAULT_QUEUE_PATH, help='SQLite work queue file')
+    parser.add_argument('--workers', type=int, default=4, help='Worker processes')
+    parser.add_argument('--concurrency', type=int, default=5, help='Concurrent tasks per worker')
+    parser.add_argument('--rate', type=float, default=8.0, help='Shared statsapi budget (requests/sec)')
+    parser.add_argument('--burst', type=int, default=10, help='Token bucket burst size')
+    parser.add_argument('--replan', action='store_true', help='Rediscover rosters for planned seasons')
+    parser.add_argument('--reclaim-all', action='store_true',
+                        help='Treat every running task as abandoned (no other run is active)')
+    parser.add_argument('--report-interval', type=float, default=60.0, help='Seconds between progress reports')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.command == 'status':
+        queue = WorkQueue(args.queue)
+        print_status(queue)
+        queue.close()
+        return
+
+    if args.command == 'retry':
+        queue = WorkQueue(args.queue)
+        print(f"Requeued {queue.retry_failed()} failed tasks")
+        queue.close()
+        return
+
+    with BudgetManager() as manager:
+        bucket = manager.TokenBucket(args.rate, args.burst)
+
+        if args.command == 'plan' or (args.command == 'run' and args.seasons):
+            if not args.seasons:
+                parser.error('plan requires --seasons')
+            queue = WorkQueue(args.queue)
+            print('=' * 80)
+            print('PLANNING COLLECTION TASKS')
+            print('=' * 80)
+            asyncio.run(plan_seasons(queue, args.seasons, args.levels, bucket, replan=args.replan))
+            print(statsapi_cache.format_report())
+            queue.close()
+
+        if args.command == 'run':
+            run_workers(args, bucket)
+
+
+if __name__ == '__main__':
+    main()
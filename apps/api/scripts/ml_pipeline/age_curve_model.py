@@ -3,17 +3,75 @@
 Age Curve Modeling for Year-by-Year Projections
 
 Generates career arc projections with visualization-ready output.
+
+project_career_arcs projects a whole pool at once: ages, positions and
+current rates go in as arrays, and the curves broadcast over an
+(N x years x stats) tensor. project_career_arc is the one-player view of
+the same computation.
 """
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Stat axis of a CareerArcBatch
+STATS = (
+    'wrc_plus', 'woba', 'avg', 'obp', 'slg', 'ops', 'hr', 'sb',
+    'rbi', 'runs', 'war', 'bb_rate', 'k_rate'
+)
+
+# Inputs read from current stats, with the default used when one is missing.
+# wrc_plus and woba have no default: players without them are not projected
+# for those stats.
+INPUT_DEFAULTS = {
+    'wrc_plus': np.nan,
+    'woba': np.nan,
+    'batting_avg': .250,
+    'obp': .320,
+    'slg': .400,
+    'hr_rate': 0.04,
+    'sb_rate': 0.03,
+    'walk_rate': 0.08,
+    'strikeout_rate': 0.22,
+    'war': 2.0,
+}
+
+PLAYER_TYPES = ('hitter', 'pitcher')
+PLATE_APPEARANCES = 600  # Full season for counting stats
+MAX_PROJECTED_AGE = 37   # Projections stop at age 37
+MAX_AGE = 60             # Size of the age lookup tables
+
+
+@dataclass
+class CareerArcBatch:
+    """
+    Career arcs for N players over Y years.
+
+    values, lower and upper are (N x Y x len(STATS)); ages, valid,
+    confidence and uncertainty are (N x Y). Years past MAX_PROJECTED_AGE
+    are computed but marked invalid.
+    """
+
+    ages: np.ndarray
+    seasons: np.ndarray
+    valid: np.ndarray
+    positions: np.ndarray
+    values: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    confidence: np.ndarray
+    uncertainty: np.ndarray
+
+    def stat(self, name: str) -> np.ndarray:
+        """(N x Y) slice of one stat."""
+        return self.values[..., STATS.index(name)]
+
 
 class AgeAdjustedProjector:
     """Generate year-by-year projections based on age curves."""
@@ -76,181 +134,182 @@ class AgeAdjustedProjector:
             List of yearly projections with confidence bands
         """
 
-        projections = []
-        player_type = 'pitcher' if position in ['SP', 'RP'] else 'hitter'
-
-        # Calculate peak potential from current performance
-        peak_stats = self._calculate_peak_potential(
-            current_stats,
-            current_age,
-            player_type,
-            position
+        batch = self.project_career_arcs(
+            ages=[current_age],
+            positions=[position],
+            current_stats={
+                key: [current_stats[key]] for key in INPUT_DEFAULTS if key in current_stats
+            },
+            years_ahead=years_ahead
         )
+        return self.arc_records(batch, 0)
 
-        # Generate projections for each year
-        for year_offset in range(years_ahead):
-            age = current_age + year_offset
-            season = datetime.now().year + year_offset
+    def _curve_table(self, curve: Dict[int, float], default: float) -> np.ndarray:
+        """Curve as an array indexed by age, `default` outside the curve."""
+        table = np.full(MAX_AGE + 1, default)
+        for age, factor in curve.items():
+            table[age] = factor
+        return table
 
-            if age > 37:  # Stop at age 37
-                break
-
-            projection = self._project_single_year(
-                peak_stats,
-                age,
-                season,
-                player_type,
-                position,
-                current_age
-            )
-
-            projections.append(projection)
-
-        return projections
-
-    def _calculate_peak_potential(
+    def project_career_arcs(
         self,
-        current_stats: Dict,
-        current_age: int,
-        player_type: str,
-        position: str
-    ) -> Dict:
-        """Calculate expected peak statistics."""
-
-        # Get age adjustment factors
-        curve = self.age_curves[player_type]
-        current_factor = curve.get(current_age, 0.80)
-
-        # Peak age varies by position
-        peak_age = 26 if player_type == 'pitcher' else 27
-
-        # Adjust for position
-        position_adj = self.position_aging.get(position, 0.0)
-        peak_age += int(position_adj * 3)  # Adjust peak age slightly
-
-        peak_factor = curve[peak_age]
-
-        # Calculate scaling factor
-        scaling = peak_factor / current_factor
-
-        # Apply development boost for very young players
-        if current_age <= 21:
-            scaling *= 1.15  # Young players have more upside
-        elif current_age <= 23:
-            scaling *= 1.08
-
-        # Calculate peak projections
-        peak_stats = {}
-
-        # Offensive stats
-        if 'wrc_plus' in current_stats:
-            # wRC+ scales with overall performance
-            peak_stats['wrc_plus'] = current_stats['wrc_plus'] * scaling
-
-        if 'woba' in current_stats:
-            # wOBA scales but less dramatically
-            peak_stats['woba'] = current_stats['woba'] * (1 + (scaling - 1) * 0.5)
-
-        # Traditional stats
-        peak_stats['avg'] = current_stats.get('batting_avg', .250) * (1 + (scaling - 1) * 0.3)
-        peak_stats['obp'] = current_stats.get('obp', .320) * (1 + (scaling - 1) * 0.4)
-        peak_stats['slg'] = current_stats.get('slg', .400) * (1 + (scaling - 1) * 0.6)
-        peak_stats['ops'] = peak_stats['obp'] + peak_stats['slg']
-
-        # Power develops later, peaks around 27-29
-        power_scaling = scaling * 1.1 if current_age < 24 else scaling
-        peak_stats['hr_rate'] = current_stats.get('hr_rate', 0.04) * power_scaling
-
-        # Speed declines earlier
-        speed_curve = self.age_curves['speed']
-        speed_current = speed_curve.get(current_age, 0.90)
-        speed_peak = speed_curve[23]  # Speed peaks at 23-24
-        speed_scaling = speed_peak / speed_current
-        peak_stats['sb_rate'] = current_stats.get('sb_rate', 0.03) * speed_scaling
-
-        # Plate discipline improves with age
-        peak_stats['bb_rate'] = current_stats.get('walk_rate', 0.08) * (1 + (scaling - 1) * 0.8)
-        peak_stats['k_rate'] = current_stats.get('strikeout_rate', 0.22) * (1 + (scaling - 1) * -0.3)
+        ages: Sequence[int],
+        positions: Sequence[str],
+        current_stats: Dict[str, Sequence[float]],
+        years_ahead: int = 10
+    ) -> CareerArcBatch:
+        """
+        Project career arcs for N players at once.
 
-        # WAR projection
-        current_war = current_stats.get('war', 2.0)
-        peak_stats['war'] = current_war * scaling
+        Args:
+            ages: Current age per player
+            positions: Position per player
+            current_stats: Input name (see INPUT_DEFAULTS) -> N values; missing
+                inputs and NaN entries take the defaults, and players without
+                wrc_plus / woba get NaN for those stats
+            years_ahead: Number of years to project
 
-        return peak_stats
+        Returns:
+            CareerArcBatch of (N x years x stats) projections and bands
+        """
 
-    def _project_single_year(
-        self,
-        peak_stats: Dict,
-        age: int,
-        season: int,
-        player_type: str,
-        position: str,
-        current_age: int
-    ) -> Dict:
-        """Project statistics for a single year."""
-
-        # Get age factor
-        curve = self.age_curves[player_type]
-        age_factor = curve.get(age, 0.70)
-
-        # Position adjustment
-        position_adj = self.position_aging.get(position, 0.0)
-        age_factor *= (1 + position_adj * (age - 27))  # Adjust based on distance from peak
-
-        # Calculate projected stats
-        projection = {
-            'season': season,
-            'age': age,
-            'level': self._project_level(age, position)
+        ages = np.asarray(ages, dtype=np.int64)
+        n = len(ages)
+        inputs = {}
+        for key, default in INPUT_DEFAULTS.items():
+            values = np.asarray(current_stats.get(key, np.full(n, np.nan)), dtype=float)
+            inputs[key] = values if np.isnan(default) else np.where(np.isnan(values), default, values)
+
+        positions = np.asarray(positions, dtype=object)
+        is_pitcher = np.isin(positions, ['SP', 'RP'])
+        curve_index = is_pitcher.astype(np.int64)
+        position_adj = np.array([self.position_aging.get(p, 0.0) for p in positions], dtype=float)
+
+        # Rows: hitter, pitcher
+        current_curves = np.stack([self._curve_table(self.age_curves[t], 0.80) for t in PLAYER_TYPES])
+        yearly_curves = np.stack([self._curve_table(self.age_curves[t], 0.70) for t in PLAYER_TYPES])
+        speed_curve = self._curve_table(self.age_curves['speed'], 0.90)
+
+        # Peak potential from current performance
+        current_factor = current_curves[curve_index, np.clip(ages, 0, MAX_AGE)]
+        peak_age = np.where(is_pitcher, 26, 27) + np.trunc(position_adj * 3).astype(np.int64)
+        scaling = current_curves[curve_index, peak_age] / current_factor
+        scaling = np.where(ages <= 21, scaling * 1.15, np.where(ages <= 23, scaling * 1.08, scaling))
+
+        power_scaling = np.where(ages < 24, scaling * 1.1, scaling)
+        speed_scaling = speed_curve[23] / speed_curve[np.clip(ages, 0, MAX_AGE)]
+        peak = {
+            'wrc_plus': inputs['wrc_plus'] * scaling,
+            'woba': inputs['woba'] * (1 + (scaling - 1) * 0.5),
+            'avg': inputs['batting_avg'] * (1 + (scaling - 1) * 0.3),
+            'obp': inputs['obp'] * (1 + (scaling - 1) * 0.4),
+            'slg': inputs['slg'] * (1 + (scaling - 1) * 0.6),
+            'hr_rate': inputs['hr_rate'] * power_scaling,
+            'sb_rate': inputs['sb_rate'] * speed_scaling,
+            'bb_rate': inputs['walk_rate'] * (1 + (scaling - 1) * 0.8),
+            'k_rate': inputs['strikeout_rate'] * (1 + (scaling - 1) * -0.3),
+            'war': inputs['war'] * scaling,
         }
+        peak = {key: value[:, None] for key, value in peak.items()}
+
+        # (N x years) age grid and age factors
+        offsets = np.arange(years_ahead)
+        age_grid = ages[:, None] + offsets[None, :]
+        age_factor = yearly_curves[curve_index[:, None], np.clip(age_grid, 0, MAX_AGE)]
+        age_factor = age_factor * (1 + position_adj[:, None] * (age_grid - 27))
+
+        obp = peak['obp'] * age_factor
+        slg = peak['slg'] * age_factor
+        hr = peak['hr_rate'] * PLATE_APPEARANCES * age_factor
+        by_stat = {
+            'wrc_plus': peak['wrc_plus'] * age_factor,
+            'woba': peak['woba'] * age_factor,
+            'avg': peak['avg'] * age_factor,
+            'obp': obp,
+            'slg': slg,
+            'ops': obp + slg,
+            'hr': hr,
+            'sb': peak['sb_rate'] * PLATE_APPEARANCES * age_factor,
+            'rbi': hr * 3.0 + 30,
+            'runs': obp * 150,
+            'war': peak['war'] * age_factor,
+            'bb_rate': peak['bb_rate'] * age_factor,
+            'k_rate': peak['k_rate'] / age_factor,  # K-rate gets worse with age
+        }
+        values = np.stack([by_stat[stat] for stat in STATS], axis=-1)
+
+        # Confidence falls and uncertainty grows with distance from today
+        years_out = np.broadcast_to(offsets, age_grid.shape)
+        confidence = np.select(
+            [years_out == 0, years_out <= 1, years_out <= 2, years_out <= 3, years_out <= 5],
+            [0.95, 0.90, 0.80, 0.70, 0.55],
+            default=0.40
+        )
+        uncertainty = 0.15 * (1 + years_out * 0.05)
+
+        return CareerArcBatch(
+            ages=age_grid,
+            seasons=datetime.now().year + offsets,
+            valid=age_grid <= MAX_PROJECTED_AGE,
+            positions=positions,
+            values=values,
+            lower=values * (1 - uncertainty[..., None]),
+            upper=values * (1 + uncertainty[..., None]),
+            confidence=confidence,
+            uncertainty=uncertainty,
+        )
 
-        # Core projections
-        if 'wrc_plus' in peak_stats:
-            projection['projected_wrc_plus'] = round(peak_stats['wrc_plus'] * age_factor)
-
-        if 'woba' in peak_stats:
-            projection['projected_woba'] = round(peak_stats['woba'] * age_factor, 3)
-
-        # Traditional stats
-        projection['projected_avg'] = round(peak_stats['avg'] * age_factor, 3)
-        projection['projected_obp'] = round(peak_stats['obp'] * age_factor, 3)
-        projection['projected_slg'] = round(peak_stats['slg'] * age_factor, 3)
-        projection['projected_ops'] = round(projection['projected_obp'] + projection['projected_slg'], 3)
-
-        # Counting stats (assume 600 PA for full season)
-        pa_adjustment = 600
-        projection['projected_hr'] = round(peak_stats['hr_rate'] * pa_adjustment * age_factor)
-        projection['projected_sb'] = round(peak_stats['sb_rate'] * pa_adjustment * age_factor)
-
-        # Calculate RBI/Runs (rough estimates)
-        projection['projected_rbi'] = round(projection['projected_hr'] * 3.0 + 30)
-        projection['projected_runs'] = round(projection['projected_obp'] * 150)
-
-        # WAR projection
-        projection['projected_war'] = round(peak_stats['war'] * age_factor, 1)
-
-        # Plate discipline
-        projection['projected_bb_rate'] = round(peak_stats['bb_rate'] * age_factor, 3)
-        projection['projected_k_rate'] = round(peak_stats['k_rate'] / age_factor, 3)  # K-rate gets worse with age
-
-        # Development phase
-        projection['development_phase'] = self._get_development_phase(age)
-
-        # Confidence calculation
-        projection['confidence'] = self._calculate_confidence(age, current_age)
+    def arc_records(self, batch: CareerArcBatch, index: int) -> List[Dict]:
+        """One player's arc from a batch, in the project_career_arc format."""
 
-        # Confidence bands (±15% for uncertainty)
-        uncertainty = 0.15 * (1 + abs(age - current_age) * 0.05)  # More uncertainty further out
+        position = batch.positions[index]
+        projections = []
+        for year in np.flatnonzero(batch.valid[index]):
+            stat = dict(zip(STATS, batch.values[index, year].tolist()))
+            age = int(batch.ages[index, year])
+            projection = {
+                'season': int(batch.seasons[year]),
+                'age': age,
+                'level': self._project_level(age, position)
+            }
 
-        projection['confidence_band'] = {
-            'upper': round(projection.get('projected_wrc_plus', 100) * (1 + uncertainty)),
-            'lower': round(projection.get('projected_wrc_plus', 100) * (1 - uncertainty))
-        }
+            # Core projections
+            if not np.isnan(stat['wrc_plus']):
+                projection['projected_wrc_plus'] = round(stat['wrc_plus'])
+            if not np.isnan(stat['woba']):
+                projection['projected_woba'] = round(stat['woba'], 3)
+
+            # Traditional stats
+            projection['projected_avg'] = round(stat['avg'], 3)
+            projection['projected_obp'] = round(stat['obp'], 3)
+            projection['projected_slg'] = round(stat['slg'], 3)
+            projection['projected_ops'] = round(projection['projected_obp'] + projection['projected_slg'], 3)
+
+            # Counting stats (assume 600 PA for full season)
+            projection['projected_hr'] = round(stat['hr'])
+            projection['projected_sb'] = round(stat['sb'])
+
+            # Calculate RBI/Runs (rough estimates)
+            projection['projected_rbi'] = round(projection['projected_hr'] * 3.0 + 30)
+            projection['projected_runs'] = round(projection['projected_obp'] * 150)
+
+            projection['projected_war'] = round(stat['war'], 1)
+            projection['projected_bb_rate'] = round(stat['bb_rate'], 3)
+            projection['projected_k_rate'] = round(stat['k_rate'], 3)
+
+            projection['development_phase'] = self._get_development_phase(age)
+            projection['confidence'] = float(batch.confidence[index, year])
+
+            uncertainty = float(batch.uncertainty[index, year])
+            projection['confidence_band'] = {
+                'upper': round(projection.get('projected_wrc_plus', 100) * (1 + uncertainty)),
+                'lower': round(projection.get('projected_wrc_plus', 100) * (1 - uncertainty))
+            }
+            projection['percentiles'] = self._calculate_percentiles(projection, uncertainty)
 
-        # Add percentile projections
-        projection['percentiles'] = self._calculate_percentiles(projection, uncertainty)
+            projections.append(projection)
 
-        return projection
+        return projections
 
     def _project_level(self, age: int, position: str) -> str:
         """Project what level the player will be at given age."""
@@ -278,24 +337,6 @@ class AgeAdjustedProjector:
         else:
             return 'Decline'
 
-    def _calculate_confidence(self, projected_age: int, current_age: int) -> float:
-        """Calculate confidence in projection based on age distance."""
-
-        years_out = abs(projected_age - current_age)
-
-        if years_out == 0:
-            return 0.95
-        elif years_out <= 1:
-            return 0.90
-        elif years_out <= 2:
-            return 0.80
-        elif years_out <= 3:
-            return 0.70
-        elif years_out <= 5:
-            return 0.55
-        else:
-            return 0.40
-
     def _calculate_percentiles(self, projection: Dict, uncertainty: float) -> Dict:
         """Calculate percentile outcomes for visualization."""
 
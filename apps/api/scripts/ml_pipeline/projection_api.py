@@ -3,21 +3,32 @@
 ML Projection API Integration
 
 Provides unified interface for generating player projections using trained models.
+
+Career arcs are precomputed for the whole pool in one vectorized pass and
+stored in career_arc_projections. Per-player requests serve the stored arc
+while it is younger than CAREER_ARC_MAX_AGE, and otherwise compute it from
+the same inputs the precompute uses.
+
+Usage:
+    python projection_api.py                       # Demo projection for a top AAA hitter
+    python projection_api.py --precompute          # Precompute career arcs for every player
+    python projection_api.py --precompute --players 691406 694973
 """
 
+import argparse
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 import pickle
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from app.db.database import engine
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 # Import ML pipeline modules
 from feature_engineering import FeatureEngineer
@@ -28,6 +39,86 @@ from player_similarity import PlayerSimilarityEngine
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+CAREER_ARC_YEARS = 12
+CAREER_ARC_MAX_AGE = timedelta(days=7)  # stored arcs older than this are recomputed
+CAREER_ARC_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS career_arc_projections (
+        mlb_player_id BIGINT NOT NULL,
+        season INTEGER NOT NULL,
+        age INTEGER NOT NULL,
+        position VARCHAR(10),
+        level VARCHAR(20),
+        development_phase VARCHAR(20),
+        projected_wrc_plus INTEGER,
+        projected_woba FLOAT,
+        projected_avg FLOAT,
+        projected_obp FLOAT,
+        projected_slg FLOAT,
+        projected_ops FLOAT,
+        projected_hr INTEGER,
+        projected_sb INTEGER,
+        projected_rbi INTEGER,
+        projected_runs INTEGER,
+        projected_war FLOAT,
+        projected_bb_rate FLOAT,
+        projected_k_rate FLOAT,
+        confidence FLOAT,
+        wrc_plus_lower INTEGER,
+        wrc_plus_upper INTEGER,
+        wrc_plus_p10 INTEGER,
+        wrc_plus_p25 INTEGER,
+        wrc_plus_p75 INTEGER,
+        wrc_plus_p90 INTEGER,
+        generated_at TIMESTAMP NOT NULL,
+        PRIMARY KEY (mlb_player_id, season)
+    )
+"""
+CAREER_ARC_COLUMNS = [
+    'mlb_player_id', 'season', 'age', 'position', 'level', 'development_phase',
+    'projected_wrc_plus', 'projected_woba', 'projected_avg', 'projected_obp', 'projected_slg',
+    'projected_ops', 'projected_hr', 'projected_sb', 'projected_rbi', 'projected_runs',
+    'projected_war', 'projected_bb_rate', 'projected_k_rate', 'confidence',
+    'wrc_plus_lower', 'wrc_plus_upper', 'wrc_plus_p10', 'wrc_plus_p25', 'wrc_plus_p75',
+    'wrc_plus_p90', 'generated_at'
+]
+WRITE_BATCH_SIZE = 5000
+
+
+def arc_record_to_row(player_id: int, position: str, record: Dict, generated_at: datetime) -> Dict:
+    """Flatten a project_career_arc entry into a career_arc_projections row."""
+    row = {column: record.get(column) for column in CAREER_ARC_COLUMNS}
+    row.update({
+        'mlb_player_id': player_id,
+        'position': position,
+        'wrc_plus_lower': record['confidence_band']['lower'],
+        'wrc_plus_upper': record['confidence_band']['upper'],
+        'wrc_plus_p10': record['percentiles']['10th'],
+        'wrc_plus_p25': record['percentiles']['25th'],
+        'wrc_plus_p75': record['percentiles']['75th'],
+        'wrc_plus_p90': record['percentiles']['90th'],
+        'generated_at': generated_at,
+    })
+    return row
+
+
+def arc_row_to_record(row: Dict) -> Dict:
+    """Rebuild the project_career_arc entry for a stored row."""
+    record = {'season': row['season'], 'age': row['age'], 'level': row['level']}
+    for column in CAREER_ARC_COLUMNS[6:19]:
+        if row[column] is not None:
+            record[column] = row[column]
+    record['development_phase'] = row['development_phase']
+    record['confidence'] = row['confidence']
+    record['confidence_band'] = {'upper': row['wrc_plus_upper'], 'lower': row['wrc_plus_lower']}
+    record['percentiles'] = {
+        '90th': row['wrc_plus_p90'],
+        '75th': row['wrc_plus_p75'],
+        '50th': record.get('projected_wrc_plus', 100),
+        '25th': row['wrc_plus_p25'],
+        '10th': row['wrc_plus_p10'],
+    }
+    return record
+
 
 class ProjectionAPI:
     """Unified API for player projections."""
@@ -91,11 +182,7 @@ class ProjectionAPI:
         ml_projections = await self._get_ml_projections(player_id, current_stats)
 
         # Get career arc projections
-        career_projections = await self._get_career_projections(
-            player_id,
-            current_stats,
-            ml_projections
-        )
+        career_projections = await self._get_career_projections(player_id)
 
         # Get similar players
         similar_players = await self._get_similar_players(player_id, current_stats)
@@ -255,6 +342,11 @@ class ProjectionAPI:
     def _predict_with_model(self, model_package: Dict, feature_df: pd.DataFrame) -> float:
         """Make prediction using loaded model."""
 
+        return self._predict_batch(model_package, feature_df)[0]
+
+    def _predict_batch(self, model_package: Dict, feature_df: pd.DataFrame) -> np.ndarray:
+        """Predict every row of a feature frame in one ensemble pass."""
+
         # Get expected features
         feature_cols = model_package['feature_cols']
 
@@ -283,7 +375,7 @@ class ProjectionAPI:
                 pred = model.predict(X)
             predictions += weight * pred
 
-        return predictions[0]
+        return predictions
 
     def _get_fallback_projections(self, current_stats: Dict) -> Dict:
         """Simple fallback projections when ML models unavailable."""
@@ -299,61 +391,236 @@ class ProjectionAPI:
             'method': 'fallback'
         }
 
-    async def _get_career_projections(
+    async def _get_career_projections(self, player_id: int) -> List[Dict]:
+        """Year-by-year career projections, precomputed when available."""
+
+        stored = await self.get_career_arc(player_id)
+        if stored:
+            return stored
+
+        # Same inputs and projection as precompute_career_arcs, for one player
+        inputs = await self._load_projection_inputs([player_id])
+        if inputs.empty:
+            return []
+        batch = await self._project_career_arc_batch(inputs, CAREER_ARC_YEARS)
+        return self.age_projector.arc_records(batch, 0)
+
+    async def get_career_arc(
         self,
         player_id: int,
-        current_stats: Dict,
-        ml_projections: Dict
+        max_age: timedelta = CAREER_ARC_MAX_AGE
     ) -> List[Dict]:
-        """Generate year-by-year career projections."""
+        """Stored career arc for a player, [] if none was precomputed within max_age."""
 
-        # Get player age
-        age_query = """
-            SELECT
-                MIN(season) as first_season,
-                MAX(season) as last_season,
-                COUNT(DISTINCT season) as seasons
-            FROM milb_game_logs
+        query = text(f"""
+            SELECT {', '.join(CAREER_ARC_COLUMNS)}
+            FROM career_arc_projections
             WHERE mlb_player_id = :player_id
-        """
+            AND generated_at >= :cutoff
+            ORDER BY season
+        """)
+        params = {"player_id": player_id, "cutoff": datetime.now() - max_age}
+        try:
+            async with engine.begin() as conn:
+                result = await conn.execute(query, params)
+                rows = [dict(row._mapping) for row in result]
+        except Exception as e:
+            # Table not created yet - fall back to computing the arc
+            logger.debug(f"No stored career arc for {player_id}: {str(e)}")
+            return []
 
-        async with engine.begin() as conn:
-            result = await conn.execute(
-                text(age_query),
-                {"player_id": player_id}
+        return [arc_row_to_record(row) for row in rows]
+
+    async def _load_projection_inputs(self, player_ids: Optional[List[int]]) -> pd.DataFrame:
+        """Current-season stats, seasons played and position for many players in one query."""
+
+        player_filter = "AND mlb_player_id IN :player_ids" if player_ids else ""
+        query = text(f"""
+            WITH current_stats AS (
+                SELECT
+                    mlb_player_id,
+                    COUNT(*) as games,
+                    SUM(plate_appearances) as pa,
+                    SUM(at_bats) as ab,
+                    SUM(hits) as h,
+                    SUM(doubles) as d,
+                    SUM(triples) as t,
+                    SUM(home_runs) as hr,
+                    SUM(walks) as bb,
+                    SUM(strikeouts) as so,
+                    SUM(stolen_bases) as sb,
+                    AVG(batting_avg) as avg,
+                    AVG(obp) as obp,
+                    AVG(slg) as slg,
+                    AVG(ops) as ops,
+                    MAX(level) as highest_level
+                FROM milb_game_logs
+                WHERE season = 2024
+                AND plate_appearances > 0
+                {player_filter}
+                GROUP BY mlb_player_id
+            ),
+            careers AS (
+                SELECT mlb_player_id, COUNT(DISTINCT season) as seasons
+                FROM milb_game_logs
+                WHERE mlb_player_id IN (SELECT mlb_player_id FROM current_stats)
+                GROUP BY mlb_player_id
+            ),
+            positions AS (
+                SELECT mlb_player_id, MAX(position) as position
+                FROM prospects
+                WHERE mlb_player_id IS NOT NULL
+                GROUP BY mlb_player_id
             )
-            age_data = result.fetchone()
-
-        # Estimate current age
-        if age_data:
-            seasons_played = age_data.seasons
-            current_age = 18 + seasons_played
-        else:
-            current_age = 22
-
-        # Prepare stats for projection
-        projection_stats = {
-            'wrc_plus': ml_projections.get('wrc_plus', 100),
-            'woba': ml_projections.get('woba', .320),
-            'batting_avg': current_stats.get('avg', .250),
-            'obp': current_stats.get('obp', .320),
-            'slg': current_stats.get('slg', .400),
-            'hr_rate': current_stats.get('hr_rate', 0.03),
-            'sb_rate': current_stats.get('sb_rate', 0.02),
-            'walk_rate': current_stats.get('bb_rate', 0.08),
-            'strikeout_rate': current_stats.get('k_rate', 0.22),
-            'war': ml_projections.get('wrc_plus', 100) / 20
-        }
+            SELECT
+                c.*,
+                careers.seasons,
+                positions.position,
+                c.bb * 1.0 / NULLIF(c.pa, 0) as bb_rate,
+                c.so * 1.0 / NULLIF(c.pa, 0) as k_rate,
+                c.hr * 1.0 / NULLIF(c.ab, 0) as hr_rate,
+                c.sb * 1.0 / NULLIF(c.pa, 0) as sb_rate
+            FROM current_stats c
+            JOIN careers ON careers.mlb_player_id = c.mlb_player_id
+            LEFT JOIN positions ON positions.mlb_player_id = CAST(c.mlb_player_id AS VARCHAR)
+        """)
+        params = {}
+        if player_ids:
+            query = query.bindparams(bindparam("player_ids", expanding=True))
+            params["player_ids"] = list(player_ids)
+
+        async with engine.begin() as conn:
+            result = await conn.execute(query, params)
+            return pd.DataFrame([dict(row._mapping) for row in result])
+
+    async def precompute_career_arcs(
+        self,
+        player_ids: Optional[List[int]] = None,
+        years_ahead: int = CAREER_ARC_YEARS
+    ) -> int:
+        """
+        Project and store career arcs for many players in one pass.
+
+        Inputs come from one query, ML projections from one batched
+        prediction per model, and the arcs from a single
+        project_career_arcs call over the whole pool.
+
+        Args:
+            player_ids: Players to refresh (default: everyone with 2024 plate appearances)
+            years_ahead: Years per arc
 
-        # Generate projections
-        projections = self.age_projector.project_career_arc(
-            current_stats=projection_stats,
-            current_age=current_age,
-            position='SS',  # Would need position from database
-            years_ahead=12
+        Returns:
+            Number of players stored
+        """
+
+        inputs = await self._load_projection_inputs(player_ids)
+        if inputs.empty:
+            logger.warning("No players to project")
+            return 0
+        logger.info(f"Projecting career arcs for {len(inputs)} players")
+
+        batch = await self._project_career_arc_batch(inputs, years_ahead)
+
+        generated_at = datetime.now()
+        rows = [
+            arc_record_to_row(int(player_id), batch.positions[i], record, generated_at)
+            for i, player_id in enumerate(inputs['mlb_player_id'])
+            for record in self.age_projector.arc_records(batch, i)
+        ]
+        await self._store_career_arcs(inputs['mlb_player_id'].astype(int).tolist(), rows, replace_all=not player_ids)
+
+        logger.info(f"Stored {len(rows)} projected seasons for {len(inputs)} players")
+        return len(inputs)
+
+    async def _project_career_arc_batch(self, inputs: pd.DataFrame, years_ahead: int):
+        """Career arcs for every row of _load_projection_inputs in one project_career_arcs call."""
+
+        # wOBA / wRC+ as _get_current_stats computes them, one league average per level
+        league_woba = {}
+        for level in inputs['highest_level'].dropna().unique():
+            league_woba[level] = (await self.metrics_calculator.calculate_league_averages(level))['woba']
+        inputs['woba'] = [
+            self.metrics_calculator.calculate_woba({
+                'plate_appearances': row.pa, 'at_bats': row.ab, 'hits': row.h,
+                'doubles': row.d, 'triples': row.t, 'home_runs': row.hr, 'walks': row.bb,
+                'hit_by_pitch': 0, 'sacrifice_flies': 0
+            })
+            for row in inputs.itertuples()
+        ]
+        inputs['wrc_plus'] = [
+            self.metrics_calculator.calculate_wrc_plus(woba, league_woba.get(level, 0))
+            for woba, level in zip(inputs['woba'], inputs['highest_level'])
+        ]
+
+        ml_wrc, ml_woba = await self._batch_ml_projections(inputs)
+
+        return self.age_projector.project_career_arcs(
+            ages=(18 + inputs['seasons']).to_numpy(),
+            positions=inputs['position'].fillna('SS').to_numpy(),
+            current_stats={
+                'wrc_plus': ml_wrc,
+                'woba': ml_woba,
+                'batting_avg': inputs['avg'].to_numpy(dtype=float),
+                'obp': inputs['obp'].to_numpy(dtype=float),
+                'slg': inputs['slg'].to_numpy(dtype=float),
+                'hr_rate': inputs['hr_rate'].to_numpy(dtype=float),
+                'sb_rate': inputs['sb_rate'].to_numpy(dtype=float),
+                'walk_rate': inputs['bb_rate'].to_numpy(dtype=float),
+                'strikeout_rate': inputs['k_rate'].to_numpy(dtype=float),
+                'war': ml_wrc / 20,
+            },
+            years_ahead=years_ahead
         )
 
-        return projections
+    async def _batch_ml_projections(self, inputs: pd.DataFrame):
+        """wRC+ and wOBA inputs for the arcs: model predictions where possible, else the fallback."""
+
+        # Same numbers _get_fallback_projections gives one player
+        wrc = np.round(inputs['wrc_plus'].to_numpy(dtype=float) * 1.1)
+        woba = np.round(inputs['woba'].to_numpy(dtype=float) * 1.1, 3)
+
+        if not (self.wrc_model or self.woba_model):
+            return wrc, woba
+
+        features = await self.feature_engineer.create_training_dataset(inputs['mlb_player_id'].tolist())
+        if features.empty:
+            return wrc, woba
+        # Line feature rows up with inputs; players without features keep the fallback
+        features = features.drop_duplicates('player_id').set_index('player_id')
+        player_ids = inputs['mlb_player_id'].to_numpy()
+        rows = np.flatnonzero(np.isin(player_ids, features.index))
+        features = features.loc[player_ids[rows]].reset_index()
+
+        for model, target, digits in ((self.wrc_model, wrc, 0), (self.woba_model, woba, 3)):
+            if not model:
+                continue
+            try:
+                target[rows] = np.round(self._predict_batch(model, features), digits)
+            except Exception as e:
+                logger.error(f"Batch prediction failed, keeping fallback values: {str(e)}")
+
+        return wrc, woba
+
+    async def _store_career_arcs(self, player_ids: List[int], rows: List[Dict], replace_all: bool = False):
+        """Replace the stored arcs of these players (or the whole table) with new rows."""
+
+        insert = text(f"""
+            INSERT INTO career_arc_projections ({', '.join(CAREER_ARC_COLUMNS)})
+            VALUES ({', '.join(':' + column for column in CAREER_ARC_COLUMNS)})
+        """)
+
+        async with engine.begin() as conn:
+            await conn.execute(text(CAREER_ARC_TABLE_SQL))
+            if replace_all:
+                await conn.execute(text("DELETE FROM career_arc_projections"))
+            else:
+                await conn.execute(
+                    text("DELETE FROM career_arc_projections WHERE mlb_player_id IN :player_ids")
+                    .bindparams(bindparam("player_ids", expanding=True)),
+                    {"player_ids": player_ids}
+                )
+            for start in range(0, len(rows), WRITE_BATCH_SIZE):
+                await conn.execute(insert, rows[start:start + WRITE_BATCH_SIZE])
 
     async def _get_similar_players(self, player_id: int, current_stats: Dict) -> List[Dict]:
         """Find 5 most similar MLB players."""
@@ -457,30 +724,28 @@ class ProjectionAPI:
     async def batch_project_players(
         self,
         player_ids: List[int],
-        simplified: bool = True
+        simplified: bool = True,
+        concurrency: int = 8
     ) -> List[Dict]:
-        """Generate projections for multiple players."""
-
-        projections = []
-
-        for i, player_id in enumerate(player_ids):
-            if i % 10 == 0:
-                logger.info(f"Processing player {i}/{len(player_ids)}")
-
-            try:
-                if simplified:
-                    # Get just key metrics
-                    proj = await self.get_simplified_projection(player_id)
-                else:
-                    proj = await self.get_full_projection(player_id)
-
-                projections.append(proj)
-
-            except Exception as e:
-                logger.error(f"Error projecting player {player_id}: {str(e)}")
-                continue
-
-        return projections
+        """Generate projections for multiple players, `concurrency` at a time, in input order."""
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def project(i: int, player_id: int) -> Optional[Dict]:
+            async with semaphore:
+                if i % 10 == 0:
+                    logger.info(f"Processing player {i}/{len(player_ids)}")
+                try:
+                    if simplified:
+                        # Get just key metrics
+                        return await self.get_simplified_projection(player_id)
+                    return await self.get_full_projection(player_id)
+                except Exception as e:
+                    logger.error(f"Error projecting player {player_id}: {str(e)}")
+                    return None
+
+        results = await asyncio.gather(*(project(i, pid) for i, pid in enumerate(player_ids)))
+        return [projection for projection in results if projection is not None]
 
     async def get_simplified_projection(self, player_id: int) -> Dict:
         """Get simplified projection with just key metrics."""
@@ -553,5 +818,24 @@ async def demo_api():
     print(f"\nOverall Confidence: {projection['confidence']:.1%}")
 
 
+async def precompute(player_ids: Optional[List[int]]):
+    """Precompute and store career arcs."""
+
+    api = ProjectionAPI()
+    await api.initialize()
+    count = await api.precompute_career_arcs(player_ids)
+    print(f"Stored career arcs for {count} players")
+
+
 if __name__ == "__main__":
-    asyncio.run(demo_api())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Player projections")
+    parser.add_argument('--precompute', action='store_true',
+                        help='Precompute career arcs into career_arc_projections')
+    parser.add_argument('--players', type=int, nargs='+',
+                        help='Only these MLB player ids (with --precompute)')
+    args = parser.parse_args()
+
+    if args.precompute:
+        asyncio.run(precompute(args.players))
+    else:
+        asyncio.run(demo_api())
\ No newline at end of file
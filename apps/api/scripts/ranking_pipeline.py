@@ -0,0 +1,431 @@
+"""
+Cached Ranking Pipeline
+
+Models each prospect ranking version as a stage with declared inputs and
+caches every stage's output as Parquet, keyed by a hash of those inputs:
+
+- upstream stages (by their own cache keys)
+- source tables (row count, highest id / updated_at, and write counters)
+- model files (content hashes)
+- stage parameters and a manual code version
+
+A stage is only recomputed when one of its inputs changed, and upstream
+outputs are only loaded when a downstream stage actually has to run. So
+running v7 after a FanGraphs refresh reloads the grades and recomputes v7,
+but reuses the cached V6 output instead of re-querying game logs and
+refitting the barrel and projection models.
+
+Usage:
+  python ranking_pipeline.py v7
+  python ranking_pipeline.py v7 --status
+  python ranking_pipeline.py v6 --force v6
+  python ranking_pipeline.py v4 --output prospect_rankings_v4.csv
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.db.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+API_DIR = os.path.dirname(SCRIPTS_DIR)
+DEFAULT_CACHE_DIR = os.path.join(SCRIPTS_DIR, '.ranking_cache')
+
+StageFunction = Callable[[Dict[str, pd.DataFrame], Dict[str, Any]], Awaitable[pd.DataFrame]]
+
+
+@dataclass
+class Stage:
+    """One cacheable ranking step."""
+
+    name: str
+    run: StageFunction
+    inputs: Sequence[str] = ()    # upstream stage names
+    tables: Sequence[str] = ()    # source tables read directly
+    files: Sequence[str] = ()     # model files / artifacts read directly
+    params: Dict[str, Any] = field(default_factory=dict)
+    version: str = '1'            # bump when the stage's logic changes
+
+
+async def table_fingerprints(tables: Iterable[str]) -> Dict[str, Any]:
+    """
+    Cheap per-table fingerprints for cache keys.
+
+    Each fingerprint combines the row count, MAX(id) and MAX(updated_at)
+    where the table has those columns, and the insert/update/delete counters
+    from pg_stat_user_tables. No table is read row by row. The counters
+    catch updates to tables whose writers do not maintain updated_at. The
+    count and maxima are transactional, so a fresh insert or delete changes
+    the key even before the statistics collector catches up.
+    """
+    tables = sorted(set(tables))
+    if not tables:
+        return {}
+    for table in tables:
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+
+    async with engine.connect() as conn:
+        columns = {
+            (row.table_name, row.column_name)
+            for row in await conn.execute(text("""
+                SELECT table_name, column_name
+                FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND column_name IN ('id', 'updated_at')
+                  AND table_name = ANY(:tables)
+            """), {'tables': tables})
+        }
+        counters = {
+            row.relname: [row.n_tup_ins, row.n_tup_upd, row.n_tup_del]
+            for row in await conn.execute(text("""
+                SELECT relname, n_tup_ins, n_tup_upd, n_tup_del
+                FROM pg_stat_user_tables
+                WHERE relname = ANY(:tables)
+            """), {'tables': tables})
+        }
+
+        fingerprints = {}
+        for table in tables:
+            maxima = [
+                f"MAX({column})" for column in ('id', 'updated_at') if (table, column) in columns
+            ]
+            row = (await conn.execute(
+                text(f"SELECT {', '.join(['COUNT(*)'] + maxima)} FROM {table}")
+            )).one()
+            fingerprints[table] = [str(value) for value in row] + [counters.get(table)]
+
+    return fingerprints
+
+
+def file_fingerprint(path: str) -> Optional[str]:
+    """Content hash of a file (None if missing)."""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RankingPipeline:
+    """Resolves stages, computes input-hash cache keys and reuses cached outputs."""
+
+    def __init__(self, stages: Iterable[Stage], cache_dir: str = DEFAULT_CACHE_DIR):
+        self.stages = {stage.name: stage for stage in stages}
+        self.cache_dir = cache_dir
+        self._keys: Dict[str, str] = {}
+        self._outputs: Dict[tuple, pd.DataFrame] = {}
+        self._table_fingerprints: Dict[str, Any] = {}
+        self.computed: List[str] = []
+
+        for stage in self.stages.values():
+            for upstream in stage.inputs:
+                if upstream not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{upstream}'")
+
+    def _stage(self, name: str) -> Stage:
+        if name not in self.stages:
+            raise ValueError(f"Unknown ranking stage: {name}")
+        return self.stages[name]
+
+    def _dependencies(self, name: str) -> List[str]:
+        """Stage and all its upstream stages, upstream first."""
+        ordered: List[str] = []
+
+        def visit(stage_name: str, path: tuple):
+            if stage_name in path:
+                raise ValueError(f"Cycle in ranking stages: {' -> '.join(path + (stage_name,))}")
+            if stage_name in ordered:
+                return
+            for upstream in self._stage(stage_name).inputs:
+                visit(upstream, path + (stage_name,))
+            ordered.append(stage_name)
+
+        visit(name, ())
+        return ordered
+
+    async def _fingerprint_tables(self, names: Iterable[str]):
+        missing = {
+            table
+            for name in names
+            for table in self._stage(name).tables
+            if table not in self._table_fingerprints
+        }
+        if missing:
+            self._table_fingerprints.update(await table_fingerprints(missing))
+
+    async def cache_key(self, name: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Hash of everything the stage output depends on."""
+        if params is None and name in self._keys:
+            return self._keys[name]
+
+        await self._fingerprint_tables(self._dependencies(name))
+
+        stage = self._stage(name)
+        files = {path: file_fingerprint(path) for path in stage.files}
+        missing = [path for path, digest in files.items() if digest is None]
+        if missing:
+            # Keying on a missing model would let a retrained one hit stale outputs
+            raise FileNotFoundError(f"[{name}] model file(s) not found: {', '.join(missing)}")
+
+        payload = {
+            'stage': stage.name,
+            'version': stage.version,
+            'params': {**stage.params, **(params or {})},
+            'inputs': {upstream: await self.cache_key(upstream) for upstream in stage.inputs},
+            'tables': {table: self._table_fingerprints[table] for table in stage.tables},
+            'files': files,
+        }
+        key = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()[:20]
+
+        if params is None:
+            self._keys[name] = key
+        return key
+
+    def _path(self, name: str, key: str) -> str:
+        return os.path.join(self.cache_dir, name, f'{key}.parquet')
+
+    async def status(self, name: str) -> List[Dict[str, Any]]:
+        """Cache key and hit/miss for a stage and its upstream stages."""
+        rows = []
+        for stage_name in self._dependencies(name):
+            key = await self.cache_key(stage_name)
+            rows.append({
+                'stage': stage_name,
+                'key': key,
+                'cached': os.path.exists(self._path(stage_name, key)),
+            })
+        return rows
+
+    async def run(
+        self,
+        name: str,
+        params: Optional[Dict[str, Any]] = None,
+        force: Sequence[str] = ()
+    ) -> pd.DataFrame:
+        """
+        Get a stage's output, recomputing only stages whose inputs changed.
+
+        Args:
+            name: Stage to produce
+            params: Parameter overrides for this stage (part of its cache key)
+            force: Stage names to recompute (with their downstream stages) even if cached
+
+        Returns:
+            The stage output DataFrame
+        """
+        key = await self.cache_key(name, params)
+        memo_key = (name, key)
+
+        # Forcing a stage also recomputes everything downstream of it
+        reuse = name in self.computed or not any(
+            stage_name in force for stage_name in self._dependencies(name)
+        )
+        if memo_key in self._outputs and reuse:
+            return self._outputs[memo_key]
+
+        path = self._path(name, key)
+        if os.path.exists(path) and reuse:
+            logger.info(f"[{name}] cache hit ({key})")
+            df = pd.read_parquet(path)
+        else:
+            stage = self._stage(name)
+            inputs = {
+                upstream: await self.run(upstream, force=force)
+                for upstream in stage.inputs
+            }
+
+            logger.info(f"[{name}] computing ({key})")
+            start = time.perf_counter()
+            df = await stage.run(inputs, {**stage.params, **(params or {})})
+            self._write(name, key, df)
+            self.computed.append(name)
+            logger.info(f"[{name}] computed {len(df)} rows in {time.perf_counter() - start:.1f}s")
+
+        self._outputs[memo_key] = df
+        return df
+
+    def _write(self, name: str, key: str, df: pd.DataFrame):
+        """Write a stage output atomically and record it in the stage manifest."""
+        directory = os.path.join(self.cache_dir, name)
+        os.makedirs(directory, exist_ok=True)
+
+        path = self._path(name, key)
+        tmp_path = f'{path}.tmp'
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+        with open(os.path.join(directory, 'latest.json'), 'w') as f:
+            json.dump({'key': key, 'rows': len(df), 'written_at': datetime.now().isoformat()}, f)
+
+
+# ---------------------------------------------------------------------------
+# Ranking stages
+#
+# Stage functions import their ranking scripts lazily so those scripts can
+# import this module without a circular import.
+# ---------------------------------------------------------------------------
+
+def model_file(filename: str) -> str:
+    """
+    Path of an untracked model artifact, independent of the working directory.
+
+    The training scripts have always been run from apps/api, so that copy
+    wins. Copies next to the scripts or in the current directory are used
+    when it is missing, so existing setups keep their model.
+    """
+    candidates = [
+        os.path.join(API_DIR, filename),
+        os.path.join(SCRIPTS_DIR, filename),
+        os.path.abspath(filename),
+    ]
+    for path in candidates:
+        if os.path.exists(path):
+            if path != candidates[0]:
+                logger.warning(f"Using {path}; move it to {candidates[0]}")
+            return path
+    return candidates[0]
+
+
+# Written by train_age_aware_mlb_predictor.py into apps/api
+MLB_PREDICTOR_FILE = model_file('age_aware_mlb_predictor.pkl')
+
+
+async def _run_v4(inputs, params):
+    from scripts.generate_prospect_rankings_v4 import UnifiedProspectRankingSystem
+    return await UnifiedProspectRankingSystem().generate_unified_rankings()
+
+
+async def _run_v5(inputs, params):
+    from scripts.generate_prospect_rankings_v5 import build_v5_rankings
+    return await build_v5_rankings()
+
+
+async def _run_v6(inputs, params):
+    from scripts.generate_prospect_rankings_v6 import build_v6_rankings
+    return await build_v6_rankings()
+
+
+async def _run_fangraphs_grades(inputs, params):
+    from scripts.generate_prospect_rankings_v7 import query_fangraphs_grades
+    return await query_fangraphs_grades()
+
+
+async def _run_mlb_graduates(inputs, params):
+    from scripts.generate_prospect_rankings_v7 import query_mlb_graduates
+    return await query_mlb_graduates()
+
+
+async def _run_v7(inputs, params):
+    from scripts.generate_prospect_rankings_v7 import compute_v7_rankings
+    return compute_v7_rankings(
+        inputs['v6'],
+        inputs['fangraphs_grades'],
+        set(inputs['mlb_graduates']['mlb_player_id'].astype(str)),
+        **params
+    )
+
+
+RANKING_STAGES = [
+    Stage(
+        name='v4',
+        run=_run_v4,
+        tables=('milb_game_logs', 'mlb_game_logs', 'milb_statcast_metrics_imputed', 'prospects'),
+    ),
+    Stage(
+        name='v5',
+        run=_run_v5,
+        tables=('milb_game_logs', 'mlb_game_logs', 'milb_statcast_metrics_imputed', 'prospects'),
+        files=(MLB_PREDICTOR_FILE,),
+    ),
+    Stage(
+        name='v6',
+        run=_run_v6,
+        tables=('milb_game_logs', 'mlb_game_logs', 'milb_statcast_metrics_imputed', 'prospects'),
+        files=(MLB_PREDICTOR_FILE,),
+    ),
+    Stage(
+        name='fangraphs_grades',
+        run=_run_fangraphs_grades,
+        tables=('fangraphs_prospect_grades', 'prospects', 'mlb_game_logs'),
+    ),
+    Stage(
+        name='mlb_graduates',
+        run=_run_mlb_graduates,
+        tables=('mlb_game_logs',),
+    ),
+    Stage(
+        name='v7',
+        run=_run_v7,
+        inputs=('v6', 'fangraphs_grades', 'mlb_graduates'),
+        params={'fg_weight': 0.50, 'v4_weight': 0.40, 'v5_weight': 0.10, 'redistribute_missing': True},
+    ),
+]
+
+_pipeline: Optional[RankingPipeline] = None
+
+
+def get_ranking_pipeline(cache_dir: str = DEFAULT_CACHE_DIR) -> RankingPipeline:
+    """Shared pipeline so one process fingerprints each source table once."""
+    global _pipeline
+    if _pipeline is None or _pipeline.cache_dir != cache_dir:
+        _pipeline = RankingPipeline(RANKING_STAGES, cache_dir=cache_dir)
+    return _pipeline
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='Run the cached prospect ranking pipeline')
+    parser.add_argument('stage', help=f"Stage to produce ({', '.join(s.name for s in RANKING_STAGES)})")
+    parser.add_argument('--force', action='append', default=[], help='Recompute this stage (repeatable)')
+    parser.add_argument('--status', action='store_true', help='Show cache status without running')
+    parser.add_argument('--output', help='Write the stage output to this CSV file')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='Parquet cache directory')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+
+    pipeline = get_ranking_pipeline(args.cache_dir)
+
+    print('=' * 80)
+    print(f'RANKING PIPELINE: {args.stage}')
+    print('=' * 80)
+
+    if args.status:
+        for row in await pipeline.status(args.stage):
+            state = 'cached' if row['cached'] else 'stale'
+            print(f"  {row['stage']:<18} {row['key']}  {state}")
+        return
+
+    start = time.perf_counter()
+    df = await pipeline.run(args.stage, force=args.force)
+
+    print(f'\n{args.stage}: {len(df)} rows in {time.perf_counter() - start:.1f}s')
+    print(f"Recomputed: {', '.join(pipeline.computed) or 'nothing (all cached)'}")
+
+    if args.output:
+        df.to_csv(args.output, index=False)
+        print(f'Exported to {args.output}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
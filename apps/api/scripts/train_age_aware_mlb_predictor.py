@@ -4,6 +4,7 @@ import numpy as np
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_absolute_error, r2_score
+import os
 import pickle
 
 print('AGE-AWARE MLB PERFORMANCE PREDICTOR')
@@ -151,10 +152,14 @@ model_data = {
     'level_encoding': level_encoding
 }
 
-with open('age_aware_mlb_predictor.pkl', 'wb') as f:
+# Saved in apps/api, where the ranking pipeline looks for it first
+predictor_file = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'age_aware_mlb_predictor.pkl'
+)
+with open(predictor_file, 'wb') as f:
     pickle.dump(model_data, f)
 
-print(f'   Saved to age_aware_mlb_predictor.pkl')
+print(f'   Saved to {predictor_file}')
 
 # Sample predictions
 print('\n' + '=' * 80)
@@ -0,0 +1,112 @@
+"""
+Tests for the columnar feature store.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from app.ml.feature_store import (
+    FeatureSchemaError,
+    FeatureStore,
+    FeatureStoreError,
+    align_features,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FeatureStore(root=str(tmp_path))
+    store.register_schema("v1.0", ["age", "scout_fv", "milb_ops"])
+    return store
+
+
+class TestFeatureSchemaRegistry:
+    """Test cases for schema registration."""
+
+    def test_register_is_idempotent(self, store):
+        schema = store.register_schema("v1.0", ["age", "scout_fv", "milb_ops"])
+        assert schema.feature_names == ("age", "scout_fv", "milb_ops")
+
+    def test_conflicting_layout_rejected(self, store):
+        with pytest.raises(FeatureSchemaError):
+            store.register_schema("v1.0", ["scout_fv", "age", "milb_ops"])
+
+    def test_schema_persisted(self, store, tmp_path):
+        reopened = FeatureStore(root=str(tmp_path))
+        assert reopened.get_schema("v1.0").fingerprint == store.get_schema("v1.0").fingerprint
+        assert reopened.registry.list_versions() == ["v1.0"]
+
+    def test_ensure_schema_uses_sorted_names(self, tmp_path):
+        store = FeatureStore(root=str(tmp_path))
+        schema = store.ensure_schema("v2.0", {1: {"b": 1.0, "a": 2.0}, 2: {"c": None}})
+        assert schema.feature_names == ("a", "b", "c")
+
+
+class TestFeaturePartition:
+    """Test cases for partition reads and appends."""
+
+    def test_matrix_aligned_to_model_order(self, store):
+        store.write_partition("v1.0", 2024, {
+            2: {"age": 21, "scout_fv": 55, "milb_ops": None},
+            1: {"age": 19, "scout_fv": 60, "milb_ops": 0.850},
+        })
+
+        ids, X = store.read_matrix("v1.0", 2024, ["milb_ops", "unknown", "age"])
+
+        assert ids.tolist() == [1, 2]
+        np.testing.assert_allclose(X, [[0.85, 0.0, 19.0], [0.0, 0.0, 21.0]], rtol=1e-6)
+
+    def test_matrix_subset_in_requested_order(self, store):
+        store.write_partition("v1.0", 2024, {1: {"age": 19}, 2: {"age": 21}, 3: {"age": 23}})
+
+        ids, X = store.read_matrix("v1.0", 2024, ["age"], prospect_ids=[3, 99, 1])
+
+        assert ids.tolist() == [3, 1]
+        assert X[:, 0].tolist() == [23.0, 19.0]
+
+    def test_point_lookup(self, store):
+        store.write_partition("v1.0", 2024, {7: {"age": 20, "scout_fv": 50}})
+
+        features = store.lookup("v1.0", 2024, 7)
+
+        assert features["age"] == 20.0
+        assert features["milb_ops"] is None
+        assert store.lookup("v1.0", 2024, 8) is None
+
+    def test_append_supersedes_older_rows(self, store):
+        store.write_partition("v1.0", 2024, {1: {"age": 19}, 2: {"age": 21}})
+        first = store.open("v1.0", 2024)
+
+        store.append("v1.0", 2024, {2: {"age": 22}, 3: {"age": 18}})
+        partition = store.open("v1.0", 2024)
+
+        assert partition is not first
+        assert len(partition.part_paths) == 2
+        ids, X = partition.matrix(["age"])
+        assert dict(zip(ids.tolist(), X[:, 0].tolist())) == {1: 19.0, 2: 22.0, 3: 18.0}
+
+    def test_compact_keeps_latest_rows(self, store):
+        store.write_partition("v1.0", 2024, {1: {"age": 19}, 2: {"age": 21}})
+        store.append("v1.0", 2024, {2: {"age": 22}})
+
+        store.compact("v1.0", 2024)
+
+        partition = store.open("v1.0", 2024)
+        assert len(partition.part_paths) == 1
+        assert partition.lookup(2)["age"] == 22.0
+        assert store.years("v1.0") == [2024]
+
+    def test_unknown_features_dropped(self, store):
+        store.append("v1.0", 2025, {1: {"age": 19, "not_in_schema": 5}})
+        assert "not_in_schema" not in store.lookup("v1.0", 2025, 1)
+
+    def test_missing_partition(self, store):
+        with pytest.raises(FeatureStoreError):
+            store.open("v1.0", 2019)
+
+
+def test_align_features_handles_bad_values():
+    vector = align_features({"a": "1.5", "b": None, "c": "n/a"}, ["a", "b", "c", "d"])
+    assert vector.tolist() == [1.5, 0.0, 0.0, 0.0]
@@ -173,6 +173,18 @@ Success probability: {{ success_probability | format_probability }}."""
         with pytest.raises(Exception):
             template_engine.render_outlook("nonexistent_template.j2", {})
 
+    def test_precompile_caches_templates(self, template_engine, sample_template, sample_context):
+        """Test that precompiled templates are reused for rendering."""
+        assert template_engine.precompile() == 1
+
+        template_engine.env.get_template = MagicMock(side_effect=AssertionError("not cached"))
+        result = template_engine.render_outlook(sample_template, sample_context)
+        assert "John Doe" in result
+
+        template_engine.clear_compiled()
+        with pytest.raises(Exception):
+            template_engine.render_outlook(sample_template, sample_context)
+
     def test_custom_filters_integration(self, template_engine, temp_template_dir):
         """Test that custom filters work in template rendering."""
         # Create template using custom filters
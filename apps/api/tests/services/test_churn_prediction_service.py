@@ -6,8 +6,10 @@ Test suite for ChurnPredictionService.
 """
 
 import pytest
-from unittest.mock import AsyncMock
-from app.services.churn_prediction_service import ChurnPredictionService
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from app.services.churn_prediction_service import ChurnPredictionService, score_churn_risk
 
 
 @pytest.fixture
@@ -61,3 +63,55 @@ class TestGetAtRiskUsers:
 
         assert isinstance(high_risk, list)
         assert isinstance(medium_risk, list)
+
+
+def make_result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+class TestBulkEngagementUpdate:
+    """Test suite for score_churn_risk and update_all_engagement_metrics."""
+
+    def test_vectorized_score_matches_scalar(self):
+        """Test that array scoring matches scoring one user at a time."""
+        days = [0, 10, 45]
+        logins = [30, 5, 0]
+        features = [12, 3, 0]
+
+        scores = score_churn_risk(days, logins, features)
+
+        assert scores.tolist() == [float(score_churn_risk(d, l, f)) for d, l, f in zip(days, logins, features)]
+        assert scores[0] == 0
+        assert scores[2] == 75
+
+    @pytest.mark.asyncio
+    async def test_update_all_scores_every_user_in_one_upsert(self, mock_db, churn_service):
+        """Test that metrics for all users are written with a single statement."""
+        now = datetime(2025, 6, 30)
+        users = [
+            SimpleNamespace(id=1, email="a@example.com", full_name="A", updated_at=now - timedelta(days=90)),
+            SimpleNamespace(id=2, email="b@example.com", full_name="B", updated_at=now - timedelta(days=90)),
+            SimpleNamespace(id=3, email="c@example.com", full_name="C", updated_at=now - timedelta(days=5)),
+        ]
+        mock_db.execute = AsyncMock(side_effect=[
+            make_result(users),
+            make_result([(1, now - timedelta(days=1))]),
+            make_result([(1, 20, 8)]),
+            MagicMock(),
+        ])
+
+        summary = await churn_service.update_all_engagement_metrics(risk_threshold=60, now=now)
+
+        assert mock_db.execute.await_count == 4
+        params = mock_db.execute.await_args_list[3].args[1]
+        assert params["user_ids"] == [1, 2, 3]
+        assert params["login_frequency"] == [20, 0, 0]
+        assert params["last_logins"][2] == now - timedelta(days=5)
+        mock_db.commit.assert_awaited_once()
+
+        # User 2 never logged in; user 3 was active recently but has no events
+        assert [u["user_id"] for u in summary["at_risk_users"]] == [2]
+        assert summary["at_risk_users"][0]["churn_risk_score"] == 75
+        assert summary["users_updated"] == 3
@@ -507,4 +507,117 @@ class TestDiscoveryService:
 
         # Should return empty list, not error
         assert isinstance(sleepers, list)
-        assert len(sleepers) == 0
\ No newline at end of file
+        assert len(sleepers) == 0
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def one(self):
+        return self.rows[0]
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return self
+
+
+class FakeSession:
+    """Answers discovery queries in order: version, dataset, prospects by id."""
+
+    def __init__(self, version, dataset_rows, prospects):
+        self.version = version
+        self.dataset_rows = dataset_rows
+        self.prospects = prospects
+        self.statements = []
+
+    async def execute(self, query):
+        sql = str(query)
+        self.statements.append(sql)
+        if "count(" in sql:
+            return FakeResult([self.version])
+        if "LEFT OUTER JOIN ml_predictions" in sql:
+            return FakeResult(self.dataset_rows)
+        return FakeResult(self.prospects)
+
+
+def discovery_rows():
+    created = datetime(2025, 5, 1)
+    return [
+        (1, "SS", "Deep Organization", "A+", 19, 2027, "success_rating", 0.85, 0.92, "v1", created),
+        (1, "SS", "Deep Organization", "A+", 19, 2027, "career_war", 3.2, 0.88, "v1", created),
+        (1, "SS", "Deep Organization", "A+", 19, 2027, "success_rating", 0.40, 0.50, "v0", created - timedelta(days=30)),
+        (2, "OF", "Average Organization", "AA", 22, 2025, "success_rating", 0.65, 0.72, "v1", created),
+        (3, "1B", "Rays", "A", 26, 2025, "success_rating", 0.75, 0.81, "v1", created),
+        (4, "C", None, "AA", None, None, None, None, None, None, None),
+    ]
+
+
+class TestDiscoveryDataset:
+    """Test suite for the vectorized discovery analytics."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        from app.services.discovery_service import discovery_cache
+        discovery_cache.clear()
+        yield
+        discovery_cache.clear()
+
+    def test_score_sleepers_matches_per_prospect_rules(self):
+        """Consensus gap, factors and score follow the per-prospect formulas."""
+        from app.services.discovery_service import DiscoveryDataset, score_sleepers
+
+        dataset = DiscoveryDataset.from_rows(discovery_rows())
+        scored = score_sleepers(dataset, confidence_threshold=0.8, consensus_ranking_gap=0)
+
+        # Prospect 2 never reaches 0.8; prospect 4 has no predictions
+        assert list(scored.index) == [1, 3]
+
+        sleeper = scored.loc[1]
+        # Latest predictions only: mean(0.92, 0.88)
+        assert sleeper["ml_confidence"] == pytest.approx(0.90)
+        # 30 * 1.8 * 1.2 (SS) * 1.3 (age 19) * 1.1 (ETA 2027)
+        assert sleeper["consensus_gap"] == 92
+        assert sleeper["sleeper_score"] == 100
+        assert not sleeper["low_level"]
+
+        # 30 * 1.62 * 0.8 (1B) * 0.7 (age 26) = 27.2
+        veteran = scored.loc[3]
+        assert veteran["consensus_gap"] == 27
+        # 0.81 * 40 + 13.5 + 3 factors * 5 + 10 success bonus
+        assert veteran["sleeper_score"] == pytest.approx(32.4 + 13.5 + 15 + 10)
+
+    def test_organization_and_position_summaries(self):
+        """Group summaries are computed from the same dataset."""
+        from app.services.discovery_service import DiscoveryDataset
+
+        dataset = DiscoveryDataset.from_rows(discovery_rows())
+
+        pipelines = DiscoveryService._analyze_organizational_pipelines(dataset, limit=10)
+        supply = DiscoveryService._analyze_position_supply(dataset)
+
+        assert {org["organization"] for org in pipelines} == {"Deep Organization", "Average Organization", "Rays"}
+        assert all(org["prospect_count"] == 1 for org in pipelines)
+        assert supply["C"] == {"prospect_count": 1, "avg_age": None, "avg_eta": None}
+        assert supply["SS"]["avg_age"] == 19.0
+
+    @pytest.mark.asyncio
+    async def test_sleepers_cached_until_data_changes(self):
+        """One dataset query per data version; results reused across calls."""
+        prospect = Prospect(id=1, mlb_id="sleeper001", name="Sleeper Prospect", position="SS")
+        session = FakeSession((5, datetime(2025, 5, 1), 4, datetime(2025, 5, 1)), discovery_rows(), [prospect])
+
+        first = await DiscoveryService.get_sleeper_prospects(session, 0.8, 40, 10)
+        second = await DiscoveryService.get_sleeper_prospects(session, 0.8, 40, 10)
+
+        assert [s.prospect.name for s in first] == ["Sleeper Prospect"]
+        assert second[0].undervaluation_factors == first[0].undervaluation_factors
+        assert "Young age with development upside" in first[0].undervaluation_factors
+        assert first[0].ml_predictions["predictions"]["success_rating"]["value"] == 0.85
+        assert isinstance(first[0].market_analysis["ml_confidence_level"], float)
+        assert sum("LEFT OUTER JOIN" in sql for sql in session.statements) == 1
+
+        session.version = (6, datetime(2025, 5, 2), 4, datetime(2025, 5, 1))
+        await DiscoveryService.get_sleeper_prospects(session, 0.8, 40, 10)
+        assert sum("LEFT OUTER JOIN" in sql for sql in session.statements) == 2
@@ -0,0 +1,225 @@
+"""
+Test suite for the batched email digest pipeline.
+
+@module test_email_digest_pipeline
+@since 1.0.0
+"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.email_delivery import (
+    BatchEmailSender,
+    BatchResponse,
+    EmailMessage,
+    StubEmailProvider,
+)
+from app.services.email_digest_pipeline import DigestPipeline
+
+
+def make_recipients(count):
+    return [
+        {
+            "user_id": user_id,
+            "user_name": f"User {user_id}",
+            "user_email": f"user{user_id}@example.com",
+            "preferences": {},
+        }
+        for user_id in range(1, count + 1)
+    ]
+
+
+async def batches_of(messages, size):
+    for start in range(0, len(messages), size):
+        yield messages[start:start + size]
+
+
+class ScriptedProvider:
+    """Replays queued responses (or raises queued errors) and records batch sizes and keys."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.batches = []
+        self.keys = []
+
+    async def send_batch(self, messages, idempotency_key=None):
+        self.batches.append(len(messages))
+        self.keys.append(idempotency_key)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def close(self):
+        return None
+
+
+class TestBatchEmailSender:
+    """Test suite for bounded-concurrency batch sending."""
+
+    @pytest.mark.asyncio
+    async def test_retries_after_rate_limit(self):
+        """A 429 waits out Retry-After and retries without losing the batch."""
+        provider = ScriptedProvider(
+            BatchResponse(429, {"retry-after": "0.01"}),
+            BatchResponse(200, {"ratelimit-remaining": "5", "ratelimit-reset": "1"}),
+        )
+        messages = [EmailMessage(i, f"u{i}@example.com", "s", "<p>") for i in range(3)]
+
+        report = await BatchEmailSender(provider, concurrency=1).deliver(batches_of(messages, 3))
+
+        assert report.sent_user_ids == [0, 1, 2]
+        assert report.throttled == 1
+        assert provider.batches == [3, 3]
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self):
+        """A 4xx other than 429 marks the batch failed after one request."""
+        provider = ScriptedProvider(BatchResponse(422))
+        messages = [EmailMessage(1, "u1@example.com", "s", "<p>")]
+
+        report = await BatchEmailSender(provider).deliver(batches_of(messages, 1))
+
+        assert report.failed_user_ids == [1]
+        assert report.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_stub_provider_limit_respected(self):
+        """Every email is delivered even when concurrency exceeds the provider limit."""
+        provider = StubEmailProvider(latency=0.0, requests_per_window=2, window=0.05)
+        messages = [EmailMessage(i, f"u{i}@example.com", "s", "<p>") for i in range(50)]
+
+        report = await BatchEmailSender(provider, concurrency=6).deliver(batches_of(messages, 5))
+
+        assert sorted(report.sent_user_ids) == list(range(50))
+        assert len(provider.delivered) == 50
+
+
+    @pytest.mark.asyncio
+    async def test_retries_reuse_the_batch_idempotency_key(self, monkeypatch):
+        """A retry after a lost response carries the same key as the first attempt."""
+        monkeypatch.setattr("app.services.email_delivery.asyncio.sleep", AsyncMock())
+        provider = ScriptedProvider(
+            httpx.ReadTimeout("response lost"),
+            BatchResponse(503),
+            BatchResponse(200),
+            BatchResponse(200),
+        )
+        messages = [EmailMessage(i, f"u{i}@example.com", "s", "<p>") for i in range(4)]
+
+        report = await BatchEmailSender(provider, concurrency=1).deliver(batches_of(messages, 2))
+
+        assert report.sent_user_ids == [0, 1, 2, 3]
+        first, retry, accepted, second_batch = provider.keys
+        assert first and first == retry == accepted
+        assert second_batch and second_batch != first
+
+    @pytest.mark.asyncio
+    async def test_stub_provider_drops_repeated_key(self):
+        """A batch resent with its key is accepted once and delivered once."""
+        provider = StubEmailProvider(latency=0.0, requests_per_window=10)
+        messages = [EmailMessage(1, "u1@example.com", "s", "<p>")]
+
+        for _ in range(2):
+            response = await provider.send_batch(messages, idempotency_key="batch-1")
+            assert response.ok
+
+        assert len(provider.delivered) == 1
+
+
+class TestDigestPipeline:
+    """Test suite for the prefetch/render/send pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_deliver_renders_and_batches(self):
+        """Recipients are rendered in-process and sent in provider-sized batches."""
+        provider = StubEmailProvider(latency=0.0, requests_per_window=100)
+        pipeline = DigestPipeline(
+            db=None, provider=provider, dry_run=True,
+            batch_size=4, concurrency=2, render_workers=0
+        )
+
+        report = await pipeline.deliver(make_recipients(10))
+
+        assert sorted(report.sent_user_ids) == list(range(1, 11))
+        assert report.requests == 3
+        first = next(m for m in provider.delivered if m.user_id == 1)
+        assert first.to_email == "user1@example.com"
+        assert "User 1" in first.html
+        assert "unsubscribe" in first.html.lower()
+
+    @pytest.mark.asyncio
+    async def test_run_prefetches_once_and_marks_sent_in_bulk(self):
+        """One recipient query, one last_sent update for all delivered users."""
+        mock_db = AsyncMock(spec=AsyncSession)
+        rows = [
+            SimpleNamespace(id=1, email="a@example.com", full_name="A", preferences={}),
+            SimpleNamespace(id=2, email="b@example.com", full_name=None, preferences=None),
+        ]
+        recipients_result = MagicMock()
+        recipients_result.all.return_value = rows
+        mock_db.execute = AsyncMock(side_effect=[recipients_result, MagicMock()])
+        mock_db.commit = AsyncMock()
+
+        pipeline = DigestPipeline(
+            db=mock_db, provider=StubEmailProvider(latency=0.0),
+            dry_run=False, render_workers=0
+        )
+        report = await pipeline.run("weekly")
+
+        assert sorted(report.sent_user_ids) == [1, 2]
+        assert mock_db.execute.await_count == 2
+        mock_db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_marks_each_batch_as_it_is_accepted(self):
+        """last_sent is saved per accepted batch, before later batches go out."""
+        mock_db = AsyncMock(spec=AsyncSession)
+        recipients_result = MagicMock()
+        recipients_result.all.return_value = [
+            SimpleNamespace(id=i, email=f"u{i}@example.com", full_name="U", preferences={})
+            for i in range(1, 6)
+        ]
+        mock_db.execute = AsyncMock(return_value=recipients_result)
+        mock_db.commit = AsyncMock()
+
+        marked = []
+        sends = []
+
+        class RecordingProvider(ScriptedProvider):
+            async def send_batch(self, messages, idempotency_key=None):
+                # What had been committed when this batch went out
+                sends.append(list(marked))
+                return BatchResponse(200)
+
+        pipeline = DigestPipeline(
+            db=mock_db, provider=RecordingProvider(), dry_run=False,
+            batch_size=2, concurrency=1, render_workers=0
+        )
+        pipeline.service.mark_sent = AsyncMock(side_effect=lambda ids: marked.append(list(ids)))
+
+        report = await pipeline.run("weekly")
+
+        assert sorted(report.sent_user_ids) == [1, 2, 3, 4, 5]
+        assert marked == [[1, 2], [3, 4], [5]]
+        assert sends == [[], [[1, 2]], [[1, 2], [3, 4]]]
+
+    @pytest.mark.asyncio
+    async def test_dry_run_leaves_last_sent(self):
+        """Dry runs never touch last_sent."""
+        mock_db = AsyncMock(spec=AsyncSession)
+        recipients_result = MagicMock()
+        recipients_result.all.return_value = [
+            SimpleNamespace(id=1, email="a@example.com", full_name="A", preferences={})
+        ]
+        mock_db.execute = AsyncMock(return_value=recipients_result)
+        mock_db.commit = AsyncMock()
+
+        report = await DigestPipeline(db=mock_db, dry_run=True, render_workers=0).run("daily")
+
+        assert report.sent_user_ids == [1]
+        assert mock_db.execute.await_count == 1
+        mock_db.commit.assert_not_awaited()
@@ -0,0 +1,156 @@
+"""
+Tests for batched narrative generation.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.narrative_generation_service import NarrativeGenerationService
+
+
+def make_prospect(prospect_id):
+    return SimpleNamespace(
+        id=prospect_id,
+        name=f"Prospect {prospect_id}",
+        age=21,
+        position="SS",
+        organization="Yankees",
+        level="Double-A",
+        eta_year=2026
+    )
+
+
+def make_prediction():
+    return SimpleNamespace(
+        success_probability=0.75,
+        confidence_level=0.85,
+        model_version="v1.0",
+        feature_importance={'hitting_ability': 0.3, 'power_potential': 0.2}
+    )
+
+
+class TestBatchOutlooks:
+    """Test cases for the batch outlook pipeline."""
+
+    @pytest.fixture
+    def service(self):
+        service = NarrativeGenerationService()
+        service.cache_manager = MagicMock()
+        service.cache_manager.get_many_narratives = AsyncMock()
+        service.cache_manager.cache_many_narratives = AsyncMock()
+        service.template_engine = MagicMock()
+        service.template_engine.render_outlook.return_value = "Rendered outlook"
+        return service
+
+    @pytest.mark.asyncio
+    async def test_renders_only_cache_misses(self, service):
+        service.cache_manager.get_many_narratives.return_value = ["Cached outlook", None]
+
+        results = await service.generate_batch_outlooks(
+            [make_prospect(1), make_prospect(2)],
+            [make_prediction(), make_prediction()]
+        )
+
+        assert results == ["Cached outlook", "Rendered outlook."]
+        assert service.template_engine.render_outlook.call_count == 1
+        service.cache_manager.get_many_narratives.assert_awaited_once()
+
+        entries = service.cache_manager.cache_many_narratives.await_args.args[0]
+        assert entries == [(2, "v1.0", None, "Rendered outlook.")]
+
+    @pytest.mark.asyncio
+    async def test_failed_render_is_not_cached(self, service):
+        service.cache_manager.get_many_narratives.return_value = [None, None]
+        service.template_engine.render_outlook.side_effect = [
+            "Success outlook",
+            Exception("Template error")
+        ]
+
+        results = await service.generate_batch_outlooks(
+            [make_prospect(1), make_prospect(2)],
+            [make_prediction(), make_prediction()]
+        )
+
+        assert results[0] == "Success outlook."
+        assert results[1] == "Unable to generate outlook for Prospect 2"
+
+        entries = service.cache_manager.cache_many_narratives.await_args.args[0]
+        assert [entry[0] for entry in entries] == [1]
+
+    @pytest.mark.asyncio
+    async def test_user_id_scopes_cache_keys(self, service):
+        service.cache_manager.get_many_narratives.return_value = [None]
+
+        await service.generate_batch_outlooks(
+            [make_prospect(1)], [make_prediction()], user_id=42
+        )
+
+        requests = service.cache_manager.get_many_narratives.await_args.args[0]
+        assert requests == [(1, "v1.0", 42)]
+
+    @pytest.mark.asyncio
+    async def test_mismatched_lists(self, service):
+        with pytest.raises(ValueError, match="must have same length"):
+            await service.generate_batch_outlooks([make_prospect(1)], [])
+
+
+class TestCachedOutlooks:
+    """Test cases for reading cached outlooks the way the endpoints do."""
+
+    @pytest.fixture
+    def service(self):
+        service = NarrativeGenerationService()
+        service.cache_manager = MagicMock()
+        service.cache_manager.get_many_narratives = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_prewarmed_default(self, service):
+        service.cache_manager.get_many_narratives.return_value = [
+            "Personal outlook", "Default outlook",
+            None, "Default outlook 2",
+            None, None
+        ]
+
+        results = await service.get_cached_outlooks(
+            [1, 2, 3], {1: "v2.3", 2: "v2.3"}, user_id=42
+        )
+
+        assert results == ["Personal outlook", "Default outlook 2", None]
+        service.cache_manager.get_many_narratives.assert_awaited_once()
+        requests = service.cache_manager.get_many_narratives.await_args.args[0]
+        assert requests == [
+            (1, "v2.3", 42), (1, "v2.3", None),
+            (2, "v2.3", 42), (2, "v2.3", None),
+            (3, "v1.0", 42), (3, "v1.0", None)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reads_the_keys_the_prewarm_writes(self, service):
+        """Pre-warm caches (id, model version, None); readers must ask for the same"""
+        service.cache_manager.cache_many_narratives = AsyncMock()
+        service.template_engine = MagicMock()
+        service.template_engine.render_outlook.return_value = "Rendered outlook"
+        service.cache_manager.get_many_narratives.return_value = [None]
+        prediction = make_prediction()
+        prediction.model_version = "v2.3"
+
+        await service.generate_batch_outlooks([make_prospect(7)], [prediction])
+        written = service.cache_manager.cache_many_narratives.await_args.args[0]
+
+        service.cache_manager.get_many_narratives.return_value = [None, None]
+        await service.get_cached_outlooks([7], {7: "v2.3"}, user_id=42)
+        requests = service.cache_manager.get_many_narratives.await_args.args[0]
+
+        assert written[0][:3] in requests
+
+    @pytest.mark.asyncio
+    async def test_latest_model_versions_defaults_missing(self, service):
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock(all=lambda: [(1, "v2.3")]))
+
+        versions = await service.latest_model_versions(db, [1, 2])
+
+        assert versions == {1: "v2.3", 2: "v1.0"}
+        db.execute.assert_awaited_once()
@@ -0,0 +1,128 @@
+"""Tests for the peer cohort distribution store."""
+
+import pytest
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.services.peer_cohort_service import PeerCohortStore, extract_stat_values
+
+
+def make_stat(stat_id, prospect_id, days_ago=0, season=2024, **values):
+    """Build a lightweight stand-in for a ProspectStats row."""
+    fields = {
+        "id": stat_id,
+        "prospect_id": prospect_id,
+        "date_recorded": date(2024, 9, 1) - timedelta(days=days_ago),
+        "season": season,
+        "updated_at": datetime(2024, 9, 1) - timedelta(days=days_ago),
+    }
+    fields.update(values)
+    return SimpleNamespace(**fields)
+
+
+def row(stat, position="SS", age=21, level="AA"):
+    return (stat, position, age, level, datetime(2024, 1, 1))
+
+
+@pytest.fixture
+def store():
+    """Store loaded with one target prospect and a small peer group."""
+    store = PeerCohortStore()
+    rows = [
+        # Target prospect (id=1): two observations, latest is .300
+        row(make_stat(1, 1, days_ago=30, batting_avg=0.250, era=None)),
+        row(make_stat(2, 1, days_ago=0, batting_avg=0.300)),
+        # Peers at ages 20-22
+        row(make_stat(3, 2, batting_avg=0.220), age=20),
+        row(make_stat(4, 3, batting_avg=0.260), age=21),
+        row(make_stat(5, 4, batting_avg=0.280), age=22),
+        row(make_stat(6, 5, batting_avg=0.320), age=22),
+        # Outside the cohort: wrong age, position or level
+        row(make_stat(7, 6, batting_avg=0.400), age=24),
+        row(make_stat(8, 7, batting_avg=0.400), position="C"),
+        row(make_stat(9, 8, batting_avg=0.400), level="AAA"),
+    ]
+    store.load_rows(rows)
+    return store
+
+
+class TestPeerCohortStore:
+    """Test suite for cohort distributions and percentile lookups."""
+
+    def test_percentile_excludes_own_observations(self, store):
+        percentile = store.percentile(
+            "batting_avg", 0.300, "SS", 21, "AA", exclude_prospect_id=1
+        )
+        # 3 of 4 peers (.220, .260, .280) are below .300
+        assert percentile == pytest.approx(75.0)
+
+    def test_lower_is_better_metric(self):
+        store = PeerCohortStore()
+        store.load_rows([
+            row(make_stat(1, 1, era=2.50), position="SP"),
+            row(make_stat(2, 2, era=3.00), position="SP"),
+            row(make_stat(3, 3, era=4.00), position="SP"),
+            row(make_stat(4, 4, era=5.00), position="SP"),
+        ])
+
+        percentile = store.percentile("era", 2.50, "SP", 21, "AA", exclude_prospect_id=1)
+        assert percentile == pytest.approx(100.0)
+
+    def test_compare_to_peers_matches_full_scan(self, store):
+        comparison = store.compare_to_peers(1)
+
+        assert comparison["comparison_group"]["peer_count"] == 4
+        assert comparison["comparison_group"]["age_range"] == "20-22"
+
+        batting = comparison["percentiles"]["batting_avg"]
+        peers = [0.220, 0.260, 0.280, 0.320]
+        assert batting["value"] == pytest.approx(0.300)
+        assert batting["percentile"] == 75.0
+        assert batting["peer_average"] == pytest.approx(np.mean(peers))
+        assert batting["peer_median"] == pytest.approx(np.median(peers))
+        assert batting["rating"] == "above_average"
+
+    def test_incremental_update_replaces_values(self, store):
+        # Peer 5 (.320) is revised down to .200
+        store.load_rows([row(make_stat(6, 5, batting_avg=0.200), age=22)])
+
+        percentile = store.percentile(
+            "batting_avg", 0.300, "SS", 21, "AA", exclude_prospect_id=1
+        )
+        assert percentile == pytest.approx(100.0)
+        assert store.peer_row_count("SS", 21, "AA", exclude_prospect_id=1) == 4
+
+    def test_remove_observation(self, store):
+        store.remove_observation(3)
+
+        values = store.peer_values("batting_avg", "SS", 21, "AA", exclude_prospect_id=1)
+        assert list(values) == pytest.approx([0.260, 0.280, 0.320])
+
+    def test_prospect_series_is_chronological(self, store):
+        series = store.get_prospect_series(1)
+
+        assert [o.stat_id for o in series] == [1, 2]
+        assert store.latest_observation(1).stat_id == 2
+
+    def test_season_filter(self, store):
+        store.load_rows([row(make_stat(10, 9, season=2023, batting_avg=0.100))])
+
+        assert store.peer_row_count("SS", 21, "AA", season=2023) == 1
+        assert store.compare_to_peers(1, season=2023) is None
+
+    def test_extract_stat_values_derives_ops_and_rates(self):
+        stat = make_stat(
+            1, 1, on_base_pct=0.350, slugging_pct=0.450, strikeouts_per_nine=9.5
+        )
+        values = extract_stat_values(stat)
+
+        assert values["ops"] == pytest.approx(0.800)
+        assert values["k_per_9"] == pytest.approx(9.5)
+
+    def test_extract_stat_values_skips_partial_ops(self):
+        values = extract_stat_values(make_stat(1, 1, on_base_pct=0.350))
+
+        assert values["on_base_pct"] == pytest.approx(0.350)
+        assert "ops" not in values
@@ -0,0 +1,64 @@
+"""
+Tests for the prospect comparison feature vectors.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+from app.db.models import MLPrediction, Prospect, ProspectStats
+from app.services.prospect_comparisons_service import ProspectComparisonsService
+
+
+def prospect():
+    return Prospect(mlb_id="CMP001", name="Comp Player", position="SS", organization="Team", level="AA", age=21)
+
+
+class TestExtractFeatures:
+    """Test suite for building comparison features from the ORM models."""
+
+    def test_hitting_rates_per_100_plate_appearances(self):
+        """K% and BB% are derived from counting stats."""
+        stats = ProspectStats(
+            date_recorded=date(2024, 5, 1), season=2024,
+            at_bats=90, walks=10, strikeouts=25,
+            batting_avg=0.280, on_base_pct=0.350, slugging_pct=0.450, wrc_plus=120
+        )
+
+        features = ProspectComparisonsService._extract_features(prospect(), stats, None, None)
+
+        assert features[6] == pytest.approx(25.0)
+        assert features[7] == pytest.approx(10.0)
+
+    def test_pitching_rates_and_prediction_value(self):
+        """Pitching features use the stored per-nine columns and prediction_value."""
+        stats = ProspectStats(
+            date_recorded=date(2024, 5, 1), season=2024,
+            era=3.10, whip=1.05, strikeouts_per_nine=11.2, walks_per_nine=2.4
+        )
+        prediction = MLPrediction(prediction_type="success_rating", prediction_value=0.72)
+
+        features = ProspectComparisonsService._extract_features(prospect(), stats, None, prediction)
+
+        assert list(features[8:12]) == pytest.approx([3.10, 1.05, 11.2, 2.4])
+        assert features[-1] == pytest.approx(0.72)
+
+    def test_formatted_pitching_stats(self):
+        """The display stats read the same per-nine columns."""
+        stats = ProspectStats(
+            date_recorded=date(2024, 5, 1), season=2024,
+            era=3.10, whip=1.05, strikeouts_per_nine=11.2, walks_per_nine=2.4
+        )
+
+        formatted = ProspectComparisonsService._format_comparison_stats(stats)
+
+        assert formatted["pitching"]["k_9"] == 11.2
+        assert formatted["pitching"]["bb_9"] == 2.4
+
+
+def test_predictions_order_by_generated_at():
+    """generated_at is a synonym for the created_at column."""
+    query = select(MLPrediction.id).order_by(MLPrediction.generated_at.desc())
+
+    assert "ORDER BY ml_predictions.created_at DESC" in str(query)
@@ -0,0 +1,141 @@
+"""
+Tests for the streaming prospect export.
+"""
+
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pyarrow.parquet as pq
+import pytest
+
+from app.services.export_service import ExportService
+from app.services.prospect_export_stream import ProspectExportStream
+
+
+def make_row(prospect_id, age, position="SS", ml=None, overall=None, batting_avg=None, era=None):
+    has_stats = batting_avg is not None or era is not None
+    return SimpleNamespace(
+        id=prospect_id,
+        name=f"Player {prospect_id}",
+        position=position,
+        organization="SEA",
+        level="AA",
+        age=age,
+        eta_year=None,
+        stats_id=prospect_id if has_stats else None,
+        batting_avg=batting_avg,
+        on_base_pct=None,
+        slugging_pct=None,
+        wrc_plus=None,
+        era=era,
+        whip=None,
+        strikeouts_per_nine=None,
+        overall=overall,
+        future_value=overall,
+        prediction_value=ml,
+        confidence_score=0.9 if ml is not None else None,
+    )
+
+
+ROWS = [
+    make_row(1, 24),
+    make_row(2, 19, ml=0.8),
+    make_row(3, 21, position="SP", era=2.0),
+    make_row(4, 20, overall=60, batting_avg=0.300),
+]
+
+
+class FakeStreamResult:
+    def __init__(self, rows, size):
+        self.rows = rows
+        self.size = size
+
+    async def partitions(self):
+        for start in range(0, len(self.rows), self.size):
+            yield self.rows[start:start + self.size]
+
+
+class FakeSession:
+    """Streams every row for the ranking pass; execute returns all rows."""
+
+    def __init__(self, rows, partition_size=2):
+        self.rows = rows
+        self.partition_size = partition_size
+        self.streamed = 0
+        self.executed = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def stream(self, query):
+        self.streamed += 1
+        return FakeStreamResult(self.rows, self.partition_size)
+
+    async def execute(self, query):
+        self.executed += 1
+        result = MagicMock()
+        result.all.return_value = self.rows
+        return result
+
+
+async def collect(async_iter):
+    return [item async for item in async_iter]
+
+
+@pytest.mark.asyncio
+async def test_batches_ranked_and_bounded():
+    session = FakeSession(ROWS)
+    stream = ProspectExportStream(session_factory=lambda: session, batch_size=3)
+
+    batches = await collect(stream.batches())
+
+    assert [len(batch) for batch in batches] == [3, 1]
+    rows = [row for batch in batches for row in batch]
+    assert [row["name"] for row in rows] == ["Player 2", "Player 4", "Player 3", "Player 1"]
+    assert [row["dynasty_rank"] for row in rows] == [1, 2, 3, 4]
+    assert rows[0]["confidence_level"] == "High"
+    assert rows[1]["overall_grade"] == 60 and rows[1]["batting_avg"] == 0.300
+    assert rows[2]["era"] == 2.0 and "batting_avg" not in rows[2]
+    assert session.streamed == 1 and session.executed == 2
+
+
+@pytest.mark.asyncio
+async def test_empty_pool_streams_header_and_footer():
+    stream = ProspectExportStream(session_factory=lambda: FakeSession([]))
+
+    chunks = await collect(ExportService.stream_csv(stream.batches()))
+
+    assert chunks[0].startswith("Dynasty Rank,Name")
+    assert chunks[-1].startswith("\n# Generated on")
+
+
+@pytest.mark.asyncio
+async def test_stream_csv_matches_generate_csv():
+    stream = ProspectExportStream(session_factory=lambda: FakeSession(ROWS), batch_size=2)
+    rows = [row for batch in await collect(stream.batches()) for row in batch]
+
+    async def batches():
+        yield rows[:2]
+        yield rows[2:]
+
+    streamed = "".join(await collect(ExportService.stream_csv(batches())))
+
+    # Only the footer timestamp may differ
+    assert streamed.split("\n# Generated")[0] == ExportService.generate_csv(rows).split("\n# Generated")[0]
+
+
+@pytest.mark.asyncio
+async def test_stream_parquet_round_trip():
+    stream = ProspectExportStream(session_factory=lambda: FakeSession(ROWS), batch_size=2)
+
+    chunks = await collect(ExportService.stream_parquet(stream.batches()))
+    table = pq.read_table(io.BytesIO(b"".join(chunks)))
+
+    assert table.num_rows == 4
+    assert pq.ParquetFile(io.BytesIO(b"".join(chunks))).num_row_groups == 2
+    assert table.column("dynasty_rank").to_pylist() == [1, 2, 3, 4]
+    assert table.column("era").to_pylist()[2] == 2.0
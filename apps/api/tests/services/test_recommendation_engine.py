@@ -0,0 +1,138 @@
+"""
+Unit tests for the vectorized recommendation engine.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.recommendation_engine import (
+    RecommendationEngine,
+    build_snapshot,
+    fit_scores,
+    needs_vector,
+    roster_key,
+    top_k,
+)
+
+YEAR = 2025
+
+# (id, name, position, organization, eta_year, age, future_value, ml_score)
+ROWS = [
+    (1, "Catcher A", "C", "NYY", 2026, 21, 60, 0.8),
+    (2, "Catcher B", "C", "BOS", 2030, 19, 45, None),
+    (3, "Shortstop", "SS", "LAD", 2025, 22, 70, 0.9),
+    (4, "First Base", "1B", None, None, 25, None, 0.2),
+    (5, "Reliever", "RP", "SEA", 2026, 24, 40, 0.1),
+    (6, "Utility", "UT", "TEX", 2027, 23, 50, 0.5),
+]
+
+
+def scalar_fit(row, weaknesses, future_holes, eta_range):
+    """Reference per-prospect fit score."""
+    _, _, position, _, eta, _, fv, _ = row
+    score = 30.0 if position in weaknesses else 0.0
+    for hole in future_holes:
+        if hole["position"] == position:
+            urgency = max(0.5, 1.5 - ((hole["year"] - YEAR) * 0.2))
+            score += {"high": 15, "medium": 10, "low": 5}.get(hole["severity"], 0) * urgency
+    if eta:
+        if eta_range[0] <= eta <= eta_range[1]:
+            score += 20.0
+        elif eta_range[0] - 1 <= eta <= eta_range[1] + 1:
+            score += 10.0
+    if position in ["SS", "CF", "SP", "C"]:
+        score += 10.0
+    if fv is not None:
+        score += {80: 10, 70: 7, 60: 5, 55: 3, 50: 0, 45: -3, 40: -5}.get(fv, 0)
+    return min(100.0, max(0.0, score))
+
+
+def make_db(rows=ROWS):
+    result = MagicMock()
+    result.all.return_value = rows
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def test_fit_scores_match_scalar_reference():
+    weaknesses = ["C", "RP"]
+    future_holes = [{"position": "SS", "year": 2027, "severity": "high"}]
+    eta_range = (2025, 2026)
+
+    snapshot = build_snapshot(ROWS, current_year=YEAR)
+    scores = fit_scores(snapshot, needs_vector(weaknesses, future_holes, YEAR), eta_range)
+
+    expected = [scalar_fit(row, weaknesses, future_holes, eta_range) for row in ROWS]
+    np.testing.assert_allclose(scores, expected, rtol=1e-6)
+
+
+def test_top_k_respects_mask_and_order():
+    keys = np.array([5.0, 9.0, 1.0, 7.0, 3.0])
+
+    assert top_k(keys, 2).tolist() == [1, 3]
+    assert top_k(keys, 10, mask=keys < 6).tolist() == [0, 4, 2]
+    assert top_k(keys, 0).tolist() == []
+
+
+def test_roster_key_ignores_order():
+    holes = [{"position": "SS", "year": 2027, "severity": "high"}, {"position": "C", "year": 2026, "severity": "low"}]
+
+    assert roster_key(["C", "SS"], holes, "rebuilding") == roster_key(["SS", "C"], holes[::-1], "rebuilding")
+    assert roster_key(["C"], holes, "rebuilding") != roster_key(["C"], holes, "competing")
+
+
+@pytest.mark.asyncio
+async def test_recommend_scores_full_pool_and_caches():
+    engine = RecommendationEngine()
+    db = make_db()
+
+    first = await engine.recommend(db, "league1", ["C"], [], (2025, 2027), limit=2)
+    second = await engine.recommend(db, "league1", ["C"], [], (2025, 2027), limit=2)
+
+    assert [record.id for record, _ in first] == [1, 3]
+    assert second is first
+    assert db.execute.await_count == 1
+    assert engine.get_metrics()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_changed_roster_recomputes():
+    engine = RecommendationEngine()
+    db = make_db()
+
+    await engine.recommend(db, "league1", ["C"], [], (2025, 2027), limit=3)
+    changed = await engine.recommend(db, "league1", ["RP"], [], (2025, 2027), limit=3)
+
+    assert changed[0][0].id == 5
+    assert engine.get_metrics()["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reload_drops_results():
+    engine = RecommendationEngine(snapshot_ttl=0)
+    db = make_db()
+
+    await engine.recommend(db, "league1", ["C"], [], (2025, 2027), limit=2)
+    await engine.recommend(db, "league1", ["C"], [], (2025, 2027), limit=2)
+
+    assert db.execute.await_count == 2
+    assert engine.get_metrics()["snapshot_version"] == 2
+
+
+@pytest.mark.asyncio
+async def test_buy_low_limited_to_need_positions():
+    engine = RecommendationEngine()
+
+    candidates = await engine.buy_low(make_db(), "league1", ["RP", "C"], (2025, 2026))
+
+    # Catchers only reach 45 (need + one signal), below the threshold
+    assert [(record.id, score) for record, score, _ in candidates] == [(5, 80)]
+    assert candidates[0][2] == [
+        "Recent performance concerns",
+        "Age-related discount",
+        "Timeline matches team window",
+        "Fills RP need",
+    ]
@@ -0,0 +1,108 @@
+"""
+Tests for the in-process reference-data cache.
+"""
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.services.reference_data import (
+    Level,
+    ReferenceData,
+    level_rank,
+    organization_code,
+    parse_level,
+    standardize_organization,
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    with Session(engine) as session:
+        session.execute(text(
+            "CREATE TABLE prospects (id INTEGER PRIMARY KEY, mlb_player_id TEXT, name TEXT, "
+            "position TEXT, organization TEXT, level TEXT, updated_at TEXT)"
+        ))
+        session.execute(text(
+            "CREATE TABLE milb_league_factors (season INTEGER, level TEXT, lg_avg REAL, lg_obp REAL, "
+            "lg_slg REAL, lg_ops REAL, lg_iso REAL, lg_hr_rate REAL, lg_bb_rate REAL, lg_so_rate REAL, "
+            "updated_at TEXT)"
+        ))
+        session.execute(text(
+            "INSERT INTO prospects VALUES "
+            "(1, '680001', 'Ann Able', 'SS', 'Baltimore Orioles', 'Double-A', '2025-01-01'), "
+            "(2, '', 'Bo Blank', 'SP', 'Cubs', 'A+', '2025-01-01'), "
+            "(3, '680003', 'Cy Cole', 'CF', NULL, NULL, '2025-01-01')"
+        ))
+        session.execute(text(
+            "INSERT INTO milb_league_factors VALUES "
+            "(2024, 'AA', 0.25, 0.33, 0.40, 0.73, 0.15, 0.03, 0.09, 0.22, '2025-01-01')"
+        ))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+class TestVocabularies:
+    """Test suite for the static level and organization codes."""
+
+    def test_level_aliases_share_a_rank(self):
+        """Names, aliases and sportIds resolve to one ordered level."""
+        assert parse_level("Double-A") is parse_level("aa") is parse_level(12) is Level.AA
+        assert level_rank("High-A") > level_rank("Low-A") > level_rank("Rookie") > level_rank("DSL")
+        assert level_rank("Winter") == -1
+
+    def test_organizations(self):
+        """Aliases map to canonical names; unknown names pass through."""
+        assert standardize_organization(" nyy ") == "New York Yankees"
+        assert standardize_organization("Sugar Land") == "Sugar Land"
+        assert standardize_organization("") == "Unknown"
+        assert organization_code("NYY") == organization_code("New York Yankees") >= 0
+
+
+class TestReferenceData:
+    """Test suite for loading and refreshing snapshots."""
+
+    def test_lookups_without_database(self, db):
+        """A loaded snapshot answers id and factor lookups from memory."""
+        snapshot = ReferenceData(refresh_seconds=0).refresh_sync(db)
+        db.close()
+
+        assert snapshot.prospect_id_for(680001) == 1
+        assert snapshot.mlb_id_for(2) is None
+        assert snapshot.prospect_ids_for([680003, 5, 680001]).tolist() == [3, -1, 1]
+        assert snapshot.prospect_for_mlb_id(680001) == {
+            "id": 1, "mlb_player_id": 680001, "name": "Ann Able", "position": "SS",
+            "organization": "Baltimore Orioles", "level": "AA",
+        }
+        assert snapshot.prospect(2)["organization"] == "Cubs"
+        assert snapshot.league_factors(2024, "Double-A")["lg_avg"] == pytest.approx(0.25)
+        # milb_park_factors does not exist in this database
+        assert snapshot.park_factors(1, 2024, "AA") is None
+
+    def test_snapshot_is_immutable(self, db):
+        snapshot = ReferenceData().refresh_sync(db)
+
+        with pytest.raises(ValueError):
+            snapshot.prospect_ids[0] = 99
+        with pytest.raises(AttributeError):
+            snapshot.version = "other"
+
+    def test_reloads_only_when_data_changes(self, db):
+        """An unchanged fingerprint keeps the snapshot; a change swaps it."""
+        cache = ReferenceData(refresh_seconds=0)
+        first = cache.refresh_sync(db)
+        assert cache.refresh_sync(db) is first
+
+        db.execute(text(
+            "INSERT INTO prospects VALUES (4, '680004', 'Di Dale', 'C', 'NYY', 'AAA', '2025-02-01')"
+        ))
+        db.commit()
+        second = cache.refresh_sync(db)
+
+        assert second is not first
+        assert second.prospect_id_for(680004) == 4
+        assert first.prospect_id_for(680004) is None
+        assert isinstance(second.prospect_ids, np.ndarray)
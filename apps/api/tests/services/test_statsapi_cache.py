@@ -0,0 +1,128 @@
+"""
+Tests for the on-disk statsapi response cache.
+"""
+
+import json
+
+import pytest
+
+from app.services.statsapi_cache import StatsAPICache, is_immutable, normalize_url
+
+BASE = "https://statsapi.mlb.com/api/v1"
+
+
+class FakeResponse:
+    def __init__(self, status, body=b"", headers=None):
+        self.status = status
+        self._body = body
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self._body
+
+
+class FakeSession:
+    """Replays queued responses and records the request headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None):
+        self.requests.append((url, headers or {}))
+        return self.responses.pop(0)
+
+
+def body(payload):
+    return json.dumps(payload).encode()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return StatsAPICache(path=str(tmp_path / "statsapi.db"), max_age=0, enabled=True)
+
+
+def test_normalize_url_sorts_params():
+    assert normalize_url(f"{BASE}/people/1/stats?season=2024&group=hitting,pitching") == \
+        normalize_url("https://StatsAPI.mlb.com/api/v1/people/1/stats/", {"group": "hitting,pitching", "season": 2024})
+
+
+def test_immutable_rules():
+    assert is_immutable(f"{BASE}/game/1/feed/live", {"gameData": {"status": {"abstractGameState": "Final"}}})
+    assert not is_immutable(f"{BASE}/game/1/feed/live", {"gameData": {"status": {"abstractGameState": "Live"}}})
+    assert is_immutable(f"{BASE}/teams?season=2019", {})
+    assert not is_immutable(f"{BASE}/teams", {})
+
+
+@pytest.mark.asyncio
+async def test_final_game_served_without_network(cache):
+    url = f"{BASE}/game/1/feed/live"
+    payload = {"gameData": {"status": {"abstractGameState": "Final"}}}
+    session = FakeSession(FakeResponse(200, body(payload)))
+
+    first = await cache.get(session, url)
+    second = await cache.get(session, url)
+
+    assert first.json() == second.json() == payload
+    assert second.from_cache
+    assert len(session.requests) == 1
+    assert cache.report()["hits"] == 1
+    assert cache.report()["bytes_saved"] == len(body(payload))
+
+
+@pytest.mark.asyncio
+async def test_mutable_resource_revalidates(cache):
+    url = f"{BASE}/teams/1/roster"
+    payload = {"roster": [1, 2]}
+    session = FakeSession(
+        FakeResponse(200, body(payload), {"ETag": '"abc"', "Last-Modified": "Mon, 01 Sep 2025 00:00:00 GMT"}),
+        FakeResponse(304),
+    )
+    throttled = []
+
+    async def throttle():
+        throttled.append(1)
+
+    await cache.get(session, url, before_request=throttle)
+    revalidated = await cache.get(session, url, before_request=throttle)
+
+    assert revalidated.json() == payload
+    assert session.requests[1][1] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 01 Sep 2025 00:00:00 GMT",
+    }
+    assert len(throttled) == 2
+    assert cache.report()["revalidated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_not_cached(cache):
+    url = f"{BASE}/people/1"
+    session = FakeSession(FakeResponse(500, b"oops"), FakeResponse(200, body({"people": []})))
+
+    failed = await cache.get(session, url, immutable=True)
+    ok = await cache.get(session, url, immutable=True)
+
+    assert failed.status == 500
+    assert ok.json() == {"people": []}
+    assert cache.report()["not_cached"] == 1
+    assert cache.report()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_shared_between_instances(cache, tmp_path):
+    url = f"{BASE}/game/9/playByPlay"
+    await cache.get(FakeSession(FakeResponse(200, body({"allPlays": []}))), url, immutable=True)
+
+    other = StatsAPICache(path=cache.path, max_age=0, enabled=True)
+    session = FakeSession()
+    response = await other.get(session, url)
+
+    assert response.json() == {"allPlays": []}
+    assert session.requests == []
@@ -0,0 +1,63 @@
+"""
+Tests for the benchmark harness and synthetic data generator.
+"""
+
+from benchmarks.harness import BenchmarkResult, compare_reports, summarize
+from benchmarks.synthetic import SyntheticConfig, dataset_counts, generate, populate
+
+
+def report(**results):
+    return {"results": {name: result.to_dict() for name, result in results.items()}}
+
+
+class TestSyntheticData:
+    """Test suite for the seeded generator."""
+
+    def test_same_seed_same_rows(self):
+        """A seed always produces the same dataset; another seed does not."""
+        config = SyntheticConfig(prospects=50, games_per_prospect=4, mentions_per_player=5)
+
+        first = generate(config)
+        assert first == generate(config)
+        assert generate(SyntheticConfig(prospects=50, seed=7))["prospects"] != first["prospects"]
+
+    def test_populates_sqlite(self, tmp_path):
+        """Rows satisfy the model constraints and land in every benchmark table."""
+        url = f"sqlite:///{tmp_path / 'bench.db'}"
+        config = SyntheticConfig(prospects=40, games_per_prospect=4, mentions_per_player=5)
+
+        counts = populate(url, config)
+        # Re-seeding replaces rather than appends
+        populate(url, config)
+
+        assert dataset_counts(url) == counts
+        assert counts["prospects"] == 40
+        assert all(count > 0 for count in counts.values())
+
+
+class TestHarness:
+    """Test suite for result summaries and baseline comparison."""
+
+    def test_summarize_percentiles_and_throughput(self):
+        """Latencies are reported in ms and throughput per item."""
+        result = summarize("op", "micro", [0.001] * 19 + [0.1], items=200, peak_rss_mb=12.34)
+
+        assert result.p50_ms == 1.0
+        assert result.p95_ms > 1.0
+        assert result.throughput == round(200 / 0.119, 2)
+        assert result.peak_rss_mb == 12.3
+
+    def test_compare_flags_regressions(self):
+        """Slower latency, lower throughput and new failures regress; noise does not."""
+        baseline = report(
+            fast=BenchmarkResult("fast", "micro", p50_ms=10.0, p95_ms=12.0, throughput=100.0, peak_rss_mb=100.0),
+            broken=BenchmarkResult("broken", "e2e", p50_ms=5.0, p95_ms=6.0, throughput=10.0, peak_rss_mb=100.0),
+        )
+        current = report(
+            fast=BenchmarkResult("fast", "micro", p50_ms=10.5, p95_ms=15.0, throughput=80.0, peak_rss_mb=110.0),
+            broken=BenchmarkResult("broken", "e2e", error="RuntimeError: boom"),
+        )
+
+        regressed = {(c.benchmark, c.metric) for c in compare_reports(baseline, current) if c.regressed}
+
+        assert regressed == {("fast", "p95_ms"), ("fast", "throughput"), ("broken", "error")}
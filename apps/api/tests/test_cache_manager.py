@@ -0,0 +1,287 @@
+import asyncio
+import fnmatch
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from app.core import cache_codec
+from app.core.cache_codec import FORMAT_JSON, decode_payload, encode_payload
+from app.core.cache_manager import CacheManager
+from app.core.metrics import histogram_registry
+
+
+class FakePipeline:
+    """Non-transactional pipeline that applies commands on execute."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.commands.append((self.redis._key(key), ttl, value))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        for key, ttl, value in self.commands:
+            self.redis.data[key] = value
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio commands the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+        self.pipelines = []
+        self.keys = AsyncMock(side_effect=AssertionError("KEYS must not be used"))
+
+    @staticmethod
+    def _key(key):
+        return key.encode() if isinstance(key, str) else key
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.data.get(self._key(key))
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(self._key(key)) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        self.round_trips += 1
+        self.data[self._key(key)] = value
+
+    async def incr(self, key):
+        self.round_trips += 1
+        key = self._key(key)
+        self.data[key] = str(int(self.data.get(key, b"0")) + 1).encode()
+        return int(self.data[key])
+
+    def pipeline(self, transaction=True):
+        assert transaction is False
+        pipe = FakePipeline(self)
+        self.pipelines.append(pipe)
+        return pipe
+
+    async def scan_iter(self, match=None, count=None):
+        for key in list(self.data):
+            if fnmatch.fnmatchcase(key.decode(), match):
+                yield key
+
+    async def unlink(self, *keys):
+        self.round_trips += 1
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+
+class TestCacheCodec:
+    """Tests for the cache payload codec"""
+
+    def test_round_trip(self):
+        value = {"prospect_id": 1, "success_probability": 0.75, "tags": ["a", "b"]}
+
+        encoded = encode_payload(value)
+
+        assert encoded.startswith(FORMAT_JSON)
+        assert decode_payload(encoded) == value
+
+    def test_decodes_legacy_json(self):
+        legacy = json.dumps({"narrative": "Legacy outlook"}).encode("utf-8")
+        assert decode_payload(legacy) == {"narrative": "Legacy outlook"}
+
+    def test_serializes_datetimes_and_numpy(self):
+        value = {"when": datetime(2024, 5, 1, 12, 0), "score": np.float64(0.5), 7: "int key"}
+
+        decoded = decode_payload(encode_payload(value))
+
+        assert decoded["when"].startswith("2024-05-01T12:00")
+        assert decoded["score"] == 0.5
+        assert decoded["7"] == "int key"
+
+    def test_large_payload_compressed(self, monkeypatch):
+        pytest.importorskip("zstandard")
+        monkeypatch.setattr(cache_codec.settings, "CACHE_COMPRESSION_MIN_BYTES", 64)
+        value = {"features": ["repeated feature value"] * 100}
+
+        encoded = encode_payload(value)
+
+        assert encoded.startswith(cache_codec.FORMAT_JSON_ZSTD)
+        assert len(encoded) < len(json.dumps(value))
+        assert decode_payload(encoded) == value
+
+
+class TestCacheManagerMultiKey:
+    """Tests for MGET/pipeline based multi-key cache access"""
+
+    def setup_method(self):
+        histogram_registry.reset()
+        self.redis = FakeRedis()
+        self.manager = CacheManager()
+        self.manager.redis_client = self.redis
+
+    @pytest.mark.asyncio
+    async def test_get_many_predictions_single_round_trip(self):
+        await self.manager.set_many_predictions(
+            {1: {"success_probability": 0.6}, 3: {"success_probability": 0.4}}, "v1.0"
+        )
+        self.redis.round_trips = 0
+
+        results = await self.manager.get_many_predictions([1, 2, 3], "v1.0")
+
+        assert self.redis.round_trips == 1
+        assert set(results) == {1, 3}
+        assert results[3]["success_probability"] == 0.4
+        assert self.manager._metrics["hits"] == 2
+        assert self.manager._metrics["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_legacy_unstamped_entry_is_a_hit(self):
+        self.redis.data[b"prediction:1:v1.0"] = json.dumps({"success_probability": 0.5}).encode()
+
+        assert await self.manager.get_cached_prediction(1, "v1.0") == {"success_probability": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_undecodable_entry_is_a_miss(self):
+        self.redis.data[b"features:5"] = b"\x01{not json"
+
+        assert await self.manager.get_many_features([5]) == {}
+        assert self.manager._metrics["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_many_predictions_pipelined(self):
+        await self.manager.set_many_predictions(
+            {1: {"success_probability": 0.6}, 2: {"success_probability": 0.7}},
+            "v1.0",
+            ttl=120
+        )
+
+        pipe, = self.redis.pipelines
+        assert [(key, ttl) for key, ttl, _ in pipe.commands] == [
+            (b"prediction:1:v1.0", 120),
+            (b"prediction:2:v1.0", 120),
+        ]
+        assert await self.manager.get_cached_prediction(2, "v1.0") == {"success_probability": 0.7}
+        assert self.manager._metrics["sets"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_many_features_accepts_string_keys(self):
+        await self.manager.cache_prospect_features("stats_history:9", {"batting_avg": 0.3})
+
+        results = await self.manager.get_many_features(["stats_history:9"])
+
+        assert results == {"stats_history:9": {"batting_avg": 0.3}}
+
+    @pytest.mark.asyncio
+    async def test_backend_error_returns_empty(self):
+        self.manager.redis_client = AsyncMock()
+        self.manager.redis_client.mget.side_effect = ConnectionError("down")
+
+        assert await self.manager.get_many_predictions([1], "v1.0") == {}
+        assert self.manager._metrics["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_latency_histograms_in_metrics(self):
+        await self.manager.get_cached_prediction(1, "v1.0")
+        await self.manager.get_many_predictions([1, 2], "v1.0")
+        await self.manager.get_many_predictions([3, 4], "v1.0")
+
+        latency = (await self.manager.get_metrics())["latency"]
+        assert latency["get_prediction"]["count"] == 1
+        assert latency["get_many_predictions"]["count"] == 2
+        assert "p95_ms" in latency["get_many_predictions"]
+
+    @pytest.mark.asyncio
+    async def test_narratives_round_trip(self):
+        await self.manager.cache_many_narratives(
+            [(1, "v1.0", None, "First"), (2, "v1.0", 7, "Second")], ttl=60
+        )
+
+        results = await self.manager.get_many_narratives(
+            [(1, "v1.0", None), (2, "v1.0", 7), (3, "v1.0", None)]
+        )
+
+        assert results == ["First", "Second", None]
+        assert b"narrative:2:v1.0:v1.0:7" in self.redis.data
+
+
+class TestGenerationInvalidation:
+    """Tests for generation-counter cache invalidation"""
+
+    def setup_method(self):
+        self.redis = FakeRedis()
+        self.manager = CacheManager()
+        self.manager.redis_client = self.redis
+
+    @pytest.mark.asyncio
+    async def test_prospect_invalidation_is_single_incr(self):
+        await self.manager.set_many_predictions({1: {"p": 1}, 2: {"p": 2}}, "v1.0")
+        self.redis.round_trips = 0
+
+        await self.manager.invalidate_prospect_predictions(1)
+
+        assert self.redis.round_trips == 1
+        results = await self.manager.get_many_predictions([1, 2], "v1.0")
+        assert set(results) == {2}
+        assert self.manager._metrics["stale"] == 1
+
+    @pytest.mark.asyncio
+    async def test_all_and_model_invalidation(self):
+        await self.manager.cache_prediction(1, "v1.0", {"p": 1})
+        await self.manager.cache_prediction(1, "v2.0", {"p": 2})
+
+        await self.manager.invalidate_model_predictions("v1.0")
+        assert await self.manager.get_cached_prediction(1, "v1.0") is None
+        assert await self.manager.get_cached_prediction(1, "v2.0") == {"p": 2}
+
+        await self.manager.invalidate_all_predictions()
+        assert await self.manager.get_cached_prediction(1, "v2.0") is None
+
+    @pytest.mark.asyncio
+    async def test_rewrite_after_invalidation_is_valid(self):
+        await self.manager.cache_prediction(1, "v1.0", {"p": 1})
+        await self.manager.invalidate_prospect_predictions(1)
+
+        assert await self.manager.get_cached_prediction(1, "v1.0") is None
+        await self.manager.cache_prediction(1, "v1.0", {"p": 2})
+        assert await self.manager.get_cached_prediction(1, "v1.0") == {"p": 2}
+
+    @pytest.mark.asyncio
+    async def test_invalidation_seen_by_other_process(self):
+        other = CacheManager()
+        other.redis_client = self.redis
+        await self.manager.cache_narrative(1, "v1.0", None, "Outlook")
+
+        await other.invalidate_prospect_narratives(1)
+
+        assert await self.manager.get_cached_narrative(1, "v1.0") is None
+
+    @pytest.mark.asyncio
+    async def test_legacy_entry_invalidated(self):
+        self.redis.data[b"narrative:1:v1.0:v1.0:default"] = json.dumps(
+            {"narrative": "Legacy"}
+        ).encode()
+        assert await self.manager.get_cached_narrative(1, "v1.0") == "Legacy"
+
+        await self.manager.invalidate_template_caches("v1.0")
+
+        assert await self.manager.get_cached_narrative(1, "v1.0") is None
+
+    @pytest.mark.asyncio
+    async def test_purge_uses_scan_and_unlink(self):
+        await self.manager.set_many_predictions({i: {"p": i} for i in range(5)}, "v1.0")
+        await self.manager.cache_prospect_features(1, {"f": 1})
+
+        await self.manager.invalidate_all_predictions(purge=True)
+        await asyncio.gather(*self.manager._background_tasks)
+
+        assert not [key for key in self.redis.data if key.startswith(b"prediction:")]
+        assert b"features:1" in self.redis.data
+        self.redis.keys.assert_not_called()
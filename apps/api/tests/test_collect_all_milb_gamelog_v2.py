@@ -0,0 +1,116 @@
+"""
+Tests for the incremental MiLB game log sync.
+"""
+
+import logging
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+import scripts.collect_all_milb_gamelog_v2 as gamelogs
+from scripts.collect_all_milb_gamelog_v2 import EnhancedMiLBCollector, Watermark
+
+
+def collector(lookback_days=14):
+    # A past season keeps the window end fixed at Dec 31
+    return EnhancedMiLBCollector(
+        season=2023, levels=["AAA", "AA"], incremental=True, lookback_days=lookback_days
+    )
+
+
+class TestPlanIncremental:
+    """Test suite for selecting which game logs to request."""
+
+    def test_due_only_when_team_played_after_watermark(self):
+        """A player is due only once their team has a newer finished game."""
+        watermarks = {
+            (1, "AAA", "hitting"): Watermark(date(2023, 8, 1), 100),
+            (2, "AAA", "hitting"): Watermark(date(2023, 8, 5), 200),
+            (3, "AA", "pitching"): Watermark(date(2023, 8, 5), 300),
+        }
+        team_game_dates = {100: date(2023, 8, 3), 200: date(2023, 8, 5)}
+
+        plan = collector().plan_incremental(watermarks, team_game_dates, set())
+
+        assert plan == {1: [("AAA", "hitting", date(2023, 8, 1))]}
+
+    def test_moved_player_checked_at_every_level(self):
+        """A promoted player gets the new levels with no watermark."""
+        watermarks = {(1, "AA", "hitting"): Watermark(date(2023, 8, 1), 100)}
+
+        plan = collector().plan_incremental(watermarks, {}, {1, 99})
+
+        assert plan == {1: [("AA", "hitting", date(2023, 8, 1)), ("AAA", "hitting", None)]}
+
+
+class TestSyncWindow:
+    """Test suite for the schedule window."""
+
+    def test_starts_day_after_oldest_watermark(self, caplog):
+        """A recent watermark sets the window start without a warning."""
+        watermarks = {
+            (1, "AAA", "hitting"): Watermark(date(2023, 12, 25), 100),
+            (2, "AAA", "hitting"): Watermark(date(2023, 12, 28), 200),
+        }
+
+        with caplog.at_level(logging.WARNING, logger=gamelogs.logger.name):
+            window = collector().sync_window(watermarks)
+
+        assert window == (date(2023, 12, 26), date(2023, 12, 31))
+        assert not caplog.records
+
+    def test_capped_window_logs_warning(self, caplog):
+        """A watermark older than the lookback is clamped and reported."""
+        watermarks = {(1, "AAA", "hitting"): Watermark(date(2023, 9, 1), 100)}
+
+        with caplog.at_level(logging.WARNING, logger=gamelogs.logger.name):
+            window = collector(lookback_days=7).sync_window(watermarks)
+
+        assert window == (date(2023, 12, 24), date(2023, 12, 31))
+        assert "2023-09-01" in caplog.text
+
+
+class FakeConnection:
+    """Reports one inserted row per new game and none for stored ones."""
+
+    def __init__(self, stored):
+        self.stored = stored
+
+    async def execute(self, query, record):
+        inserted = record["game_pk"] not in self.stored
+        self.stored.add(record["game_pk"])
+        return SimpleNamespace(rowcount=int(inserted))
+
+
+class FakeEngine:
+    def __init__(self, stored):
+        self.connection = FakeConnection(stored)
+
+    def begin(self):
+        engine = self
+
+        class Transaction:
+            async def __aenter__(self):
+                return engine.connection
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return Transaction()
+
+
+class TestSaveGameLogs:
+    """Test suite for counting saved game logs."""
+
+    @pytest.mark.asyncio
+    async def test_counts_only_inserted_rows(self, monkeypatch):
+        """Games already stored are skipped and not reported as appended."""
+        monkeypatch.setattr(gamelogs, "engine", FakeEngine({1}))
+        sync = collector()
+        monkeypatch.setattr(sync, "prepare_hitting_record", lambda player_id, log, level: {"game_pk": log["game_pk"]})
+
+        saved = await sync.save_game_logs(7, [{"game_pk": 1}, {"game_pk": 2}], "AAA", "hitting")
+
+        assert saved == 1
+        assert sync.stats["hitting_games"] == 1
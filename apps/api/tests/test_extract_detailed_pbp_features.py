@@ -0,0 +1,110 @@
+"""
+Tests for the play-by-play feature extraction pipeline.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pyarrow.parquet as pq
+import pytest
+
+import scripts.extract_detailed_pbp_features as pbp
+from scripts.extract_detailed_pbp_features import DetailedPBPFeatureExtractor, FeatureWriter
+
+
+def game_row(game_pk, prospect_id, mlb_player_id):
+    return SimpleNamespace(
+        game_pk=game_pk, prospect_id=prospect_id, name=f"Prospect {prospect_id}",
+        mlb_player_id=mlb_player_id, position="SS",
+        game_date="2024-05-01", season=2024, level="AA"
+    )
+
+
+def pbp_body(*batter_ids):
+    """A playByPlay payload with one home run per batter."""
+    plays = [
+        {"matchup": {"batter": {"id": batter_id}}, "result": {"event": "Home Run", "rbi": 1}}
+        for batter_id in batter_ids
+    ]
+    return json.dumps({"allPlays": plays}).encode()
+
+
+class StubExtractor(DetailedPBPFeatureExtractor):
+    """Serves canned payloads instead of calling statsapi."""
+
+    def __init__(self, bodies):
+        super().__init__(request_delay=0)
+        self.bodies = bodies
+        self.fetched = []
+
+    async def fetch_pbp_body(self, game_pk):
+        self.fetched.append(game_pk)
+        return self.bodies.get(game_pk)
+
+
+class TestGamesToProcess:
+    """Test suite for building the game list."""
+
+    def test_each_game_and_prospect_listed_once(self):
+        """Hitting and pitching logs for one game collapse into one target."""
+        rows = [
+            game_row(1, 10, 100), game_row(1, 10, 100), game_row(1, 11, 101),
+            game_row(2, 10, 100),
+        ]
+        db = SimpleNamespace(execute=lambda query, params: iter(rows))
+
+        games = DetailedPBPFeatureExtractor().get_games_to_process(db, [2024])
+
+        assert sorted(games) == [1, 2]
+        assert [prospect["prospect_id"] for prospect, _ in games[1]] == [10, 11]
+        assert [prospect["prospect_id"] for prospect, _ in games[2]] == [10]
+
+
+class TestRunPipeline:
+    """Test suite for the fetch/parse/write pipeline."""
+
+    @staticmethod
+    def games():
+        db = SimpleNamespace(execute=lambda query, params: iter([
+            game_row(1, 10, 100), game_row(1, 11, 101), game_row(2, 10, 100), game_row(3, 10, 100),
+        ]))
+        return DetailedPBPFeatureExtractor().get_games_to_process(db, [2024])
+
+    @pytest.mark.asyncio
+    async def test_writes_parquet_once_per_game(self, tmp_path):
+        """Every fetched game is parsed once per prospect; missing feeds are counted."""
+        output = tmp_path / "pbp.parquet"
+        extractor = StubExtractor({1: pbp_body(100, 101), 2: pbp_body(100)})
+        writer = FeatureWriter(str(output))
+
+        stats = await extractor.run_pipeline(self.games(), writer, fetchers=2, workers=1)
+        writer.close()
+
+        assert sorted(extractor.fetched) == [1, 2, 3]
+        assert stats["games_parsed"] == 2
+        assert stats["games_missing"] == 1
+        assert stats["rows_written"] == 3
+
+        table = pq.read_table(output).to_pylist()
+        assert sorted((row["game_pk"], row["prospect_id"]) for row in table) == [(1, 10), (1, 11), (2, 10)]
+        assert all(row["home_runs"] == 1 for row in table)
+
+    @pytest.mark.asyncio
+    async def test_writer_failure_stops_the_pipeline(self, tmp_path, monkeypatch):
+        """A failing stage raises instead of leaving the others blocked on the queues."""
+        # Write after every game so the writer fails while games are still queued
+        monkeypatch.setattr(pbp, "WRITE_BATCH_SIZE", 1)
+
+        class FailingWriter(FeatureWriter):
+            def write(self, rows):
+                raise OSError("disk full")
+
+        extractor = StubExtractor({1: pbp_body(100, 101), 2: pbp_body(100), 3: pbp_body(100)})
+        writer = FailingWriter(str(tmp_path / "pbp.csv"))
+
+        with pytest.raises(OSError, match="disk full"):
+            await asyncio.wait_for(
+                extractor.run_pipeline(self.games(), writer, fetchers=1, workers=1, queue_size=1),
+                timeout=30
+            )
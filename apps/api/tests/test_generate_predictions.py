@@ -0,0 +1,54 @@
+"""
+Tests for bulk prediction scoring.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("xgboost")
+
+import scripts.generate_predictions as gp
+from app.ml.feature_store import FeatureStore
+
+
+class StubModel:
+    """Scores each row by its first feature so rows can be told apart."""
+
+    def predict_proba(self, X):
+        high = (X[:, 0] > 20).astype(float)
+        return np.column_stack([high, 1 - high])
+
+
+class StubDB:
+    def __init__(self, prospect_ids):
+        self.prospect_ids = prospect_ids
+
+    def execute(self, query, params=None):
+        rows = [(pid,) for pid in self.prospect_ids]
+        return SimpleNamespace(fetchall=lambda: rows)
+
+
+def test_store_source_only_scores_existing_prospects(tmp_path, monkeypatch):
+    """Feature store rows for deleted prospects are dropped, like the db join."""
+    store = FeatureStore(root=str(tmp_path))
+    store.register_schema("v1.0", ["age", "scout_fv"])
+    store.append("v1.0", 2024, {
+        1: {"age": 19, "scout_fv": 50},
+        2: {"age": 24, "scout_fv": 45},
+        3: {"age": 21, "scout_fv": 55},
+    })
+    encoder = SimpleNamespace(classes_=np.array(["Solid", "Star"]))
+    monkeypatch.setattr(gp, "FeatureStore", lambda: store)
+    monkeypatch.setattr(gp, "load_model", lambda tag: (StubModel(), encoder, ["age", "scout_fv"]))
+
+    scored = gp.generate_predictions(
+        [("v1.0", "latest")], StubDB([1, 3, 99]), as_of_year=2024, dry_run=True, feature_version="v1.0"
+    )
+
+    prospect_ids, tiers, predicted_fv, _ = scored["v1.0"]
+    assert list(prospect_ids) == [1, 3]
+    assert list(tiers) == ["Star", "Solid"]
+    assert list(predicted_fv) == [60, 50]
@@ -136,6 +136,18 @@ async def test_scouting_grades_creation(async_session):
     assert grades.overall == 55
 
 
+def test_scouting_grades_overall_grade_synonym():
+    """overall_grade reads, writes and queries the overall column."""
+    grades = ScoutingGrades(source="Fangraphs", overall=55)
+    assert grades.overall_grade == 55
+
+    grades.overall_grade = 60
+    assert grades.overall == 60
+
+    query = select(ScoutingGrades.id).where(ScoutingGrades.overall_grade >= 50)
+    assert "scouting_grades.overall >=" in str(query)
+
+
 @pytest.mark.asyncio
 async def test_ml_prediction_creation(async_session):
     """Test creating ML predictions."""
@@ -0,0 +1,179 @@
+"""
+Tests for the authenticated-principal cache.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.principal_cache import Principal, PrincipalCache
+
+
+class FakePipeline:
+    """Non-transactional pipeline that applies commands on execute."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, value))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        for key, value in self.commands:
+            self.redis.data[key] = value.encode() if isinstance(value, str) else value
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio commands the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.data.get(key)
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        assert transaction is False
+        return FakePipeline(self)
+
+
+def make_user(**overrides):
+    fields = dict(
+        id=7,
+        email="fan@example.com",
+        subscription_tier="free",
+        is_active=True,
+        is_admin=False,
+        fantrax_connected=False,
+        onboarding_completed=True,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def make_db(user):
+    """Async session whose every query returns ``user``."""
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = user
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis_client):
+    return PrincipalCache(local_ttl=30, redis_ttl=300, max_entries=2, redis_client=redis_client)
+
+
+@pytest.mark.asyncio
+async def test_second_lookup_served_locally(cache):
+    db = make_db(make_user())
+
+    first = await cache.get("fan@example.com", db)
+    second = await cache.get("fan@example.com", db)
+
+    assert first == second == Principal.from_user(make_user())
+    assert db.execute.await_count == 1
+    assert cache.get_metrics()["local_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_other_process_reads_from_redis(cache, redis_client):
+    await cache.get("fan@example.com", make_db(make_user(subscription_tier="premium")))
+
+    other = PrincipalCache(redis_client=redis_client)
+    db = make_db(None)
+    principal = await other.get("fan@example.com", db)
+
+    assert principal.is_premium
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_by_user_id_clears_both_layers(cache, redis_client):
+    await cache.get("fan@example.com", make_db(make_user()))
+
+    # A second process only knows the user id (e.g. a Stripe webhook)
+    await PrincipalCache(redis_client=redis_client).invalidate(user_id=7)
+    assert redis_client.data == {}
+
+    await cache.invalidate(user_id=7)
+    db = make_db(make_user(subscription_tier="premium"))
+    principal = await cache.get("fan@example.com", db)
+
+    assert principal.subscription_tier == "premium"
+    assert db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_local_entry_expires(redis_client):
+    cache = PrincipalCache(local_ttl=0, redis_client=redis_client)
+    await cache.get("fan@example.com", make_db(make_user()))
+    redis_client.data.clear()
+
+    db = make_db(make_user(is_active=False))
+    principal = await cache.get("fan@example.com", db)
+
+    assert principal.is_active is False
+    assert db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_oldest(cache):
+    for user_id in (1, 2, 3):
+        await cache.get(f"u{user_id}@example.com", make_db(make_user(id=user_id, email=f"u{user_id}@example.com")))
+
+    assert cache.get_metrics()["local_entries"] == 2
+    assert cache._get_local("u1@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_user_not_cached(cache, redis_client):
+    db = make_db(None)
+
+    assert await cache.get("ghost@example.com", db) is None
+    assert await cache.get("ghost@example.com", db) is None
+    assert db.execute.await_count == 2
+    assert redis_client.data == {}
+
+
+@pytest.mark.asyncio
+async def test_works_without_redis():
+    cache = PrincipalCache(redis_client=None)
+    cache._redis_resolved = True
+    db = make_db(make_user())
+
+    await cache.get("fan@example.com", db)
+    await cache.get("fan@example.com", db)
+    await cache.invalidate(user_id=7)
+    await cache.get("fan@example.com", db)
+
+    assert db.execute.await_count == 2
+
+
+def test_principal_round_trip():
+    principal = Principal.from_user(make_user(subscription_tier=None, is_admin=True))
+
+    assert principal.subscription_tier == "free"
+    assert Principal.from_dict({**principal.to_dict(), "unknown": 1}) == principal
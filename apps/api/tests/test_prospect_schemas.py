@@ -0,0 +1,41 @@
+"""
+Tests for the prospect validation schemas.
+"""
+
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.prospect_schemas import (
+    HittingStatsValidationSchema,
+    PitchingStatsValidationSchema,
+    ProspectStatsValidationSchema,
+)
+
+
+def test_stats_schema_parses_date_field():
+    """The field named ``date`` still validates as a date."""
+    stats = ProspectStatsValidationSchema(date="2024-05-01", season=2024, at_bats=10, hits=3)
+
+    assert stats.date == date(2024, 5, 1)
+
+
+def test_hitting_consistency_checked():
+    """The hitting root validator rejects hits above at-bats."""
+    with pytest.raises(ValidationError, match="Hits cannot exceed at-bats"):
+        HittingStatsValidationSchema(at_bats=10, hits=12)
+
+
+def test_pitching_consistency_checked():
+    """The pitching root validator rejects an ERA that does not match the inputs."""
+    with pytest.raises(ValidationError, match="inconsistent"):
+        PitchingStatsValidationSchema(innings_pitched=9.0, earned_runs=1, era=5.0)
+
+
+def test_field_errors_skip_consistency_check():
+    """A field-level failure is reported without running the root validator."""
+    with pytest.raises(ValidationError) as exc_info:
+        HittingStatsValidationSchema(at_bats=-1, hits=5)
+
+    assert "Hits cannot exceed" not in str(exc_info.value)
@@ -142,4 +142,179 @@ class TestRateLimitingAsync:
 
             # Register should still work (separate limit)
             register_response = await client.post("/api/v1/auth/register", json=register_data)
-            assert register_response.status_code in [201, 409]  # Should not be rate limited
\ No newline at end of file
+            assert register_response.status_code in [201, 409]  # Should not be rate limited
+
+@pytest.mark.asyncio
+class TestPredictionRateLimiter:
+    """Tests for the sliding-window ML prediction rate limiter"""
+
+    async def test_limit_enforced_per_user(self):
+        from fastapi import HTTPException
+        from app.core.rate_limiting import InMemoryRateLimitBackend, RateLimiter
+
+        limiter = RateLimiter(
+            requests_per_minute=3,
+            identifier="test",
+            backend=InMemoryRateLimitBackend()
+        )
+
+        for _ in range(3):
+            await limiter.check_rate_limit(user_id=1)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.check_rate_limit(user_id=1)
+        assert exc_info.value.status_code == 429
+        assert "Retry-After" in exc_info.value.headers
+
+        # Other users are unaffected
+        await limiter.check_rate_limit(user_id=2)
+
+    async def test_tier_limits(self):
+        from fastapi import HTTPException
+        from app.core.rate_limiting import InMemoryRateLimitBackend, RateLimiter
+
+        limiter = RateLimiter(
+            requests_per_minute=2,
+            identifier="test",
+            tier_limits={"free": 2, "premium": 5},
+            backend=InMemoryRateLimitBackend()
+        )
+
+        for _ in range(5):
+            await limiter.check_rate_limit(user_id=1, tier="premium")
+        with pytest.raises(HTTPException):
+            await limiter.check_rate_limit(user_id=1, tier="premium")
+
+        for _ in range(2):
+            await limiter.check_rate_limit(user_id=2, tier="free")
+        with pytest.raises(HTTPException):
+            await limiter.check_rate_limit(user_id=2, tier="free")
+
+    async def test_limiters_share_backend_counters(self):
+        """Two workers sharing a backend never admit more than the limit"""
+        from fastapi import HTTPException
+        from app.core.rate_limiting import InMemoryRateLimitBackend, RateLimiter
+
+        backend = InMemoryRateLimitBackend()
+        workers = [
+            RateLimiter(
+                requests_per_minute=100,
+                identifier="shared",
+                backend=backend,
+                window_seconds=3600
+            )
+            for _ in range(2)
+        ]
+
+        admitted = 0
+        for i in range(300):
+            try:
+                await workers[i % 2].check_rate_limit(user_id=1)
+                admitted += 1
+            except HTTPException:
+                pass
+
+        assert admitted == 100
+
+    async def test_workers_do_not_hoard_tokens(self):
+        """With default settings every token stays available to any worker"""
+        from fastapi import HTTPException
+        from app.core.rate_limiting import InMemoryRateLimitBackend, RateLimiter
+
+        backend = InMemoryRateLimitBackend()
+        workers = [
+            RateLimiter(
+                requests_per_minute=100,
+                identifier="shared",
+                backend=backend,
+                window_seconds=3600
+            )
+            for _ in range(3)
+        ]
+
+        # One request per worker, then the user sticks to a single worker
+        for worker in workers:
+            await worker.check_rate_limit(user_id=1)
+        for _ in range(97):
+            await workers[0].check_rate_limit(user_id=1)
+
+        for worker in workers:
+            with pytest.raises(HTTPException) as exc_info:
+                await worker.check_rate_limit(user_id=1)
+            assert exc_info.value.status_code == 429
+
+    async def test_lease_fast_path_skips_backend(self):
+        from app.core.rate_limiting import InMemoryRateLimitBackend, RateLimiter
+
+        class CountingBackend(InMemoryRateLimitBackend):
+            calls = 0
+
+            async def acquire(self, *args, **kwargs):
+                CountingBackend.calls += 1
+                return await super().acquire(*args, **kwargs)
+
+        limiter = RateLimiter(
+            requests_per_minute=1000,
+            identifier="lease",
+            backend=CountingBackend(),
+            max_lease=20,
+            lease_fraction=0.1
+        )
+
+        for _ in range(20):
+            await limiter.check_rate_limit(user_id=1)
+
+        # First call leases 20 tokens; the remaining 19 are served locally
+        assert CountingBackend.calls == 1
+
+    async def test_prediction_lease_settings_cut_backend_calls(self):
+        """The production lease settings save round trips without over-admitting"""
+        from fastapi import HTTPException
+        from app.core.config import settings
+        from app.core.rate_limiting import InMemoryRateLimitBackend, RateLimiter, default_tier_limits
+
+        class CountingBackend(InMemoryRateLimitBackend):
+            calls = 0
+
+            async def acquire(self, *args, **kwargs):
+                CountingBackend.calls += 1
+                return await super().acquire(*args, **kwargs)
+
+        backend = CountingBackend()
+        workers = [
+            RateLimiter(
+                requests_per_minute=settings.ML_RATE_LIMIT_FREE,
+                identifier="ml_predictions",
+                tier_limits=default_tier_limits(),
+                backend=backend,
+                window_seconds=3600,
+                max_lease=settings.ML_RATE_LIMIT_MAX_LEASE,
+                lease_fraction=settings.ML_RATE_LIMIT_LEASE_FRACTION
+            )
+            for _ in range(2)
+        ]
+        limit = settings.ML_RATE_LIMIT_PREMIUM
+
+        admitted = 0
+        for i in range(limit + 10):
+            try:
+                await workers[i % 2].check_rate_limit(user_id=1, tier="premium")
+                admitted += 1
+            except HTTPException:
+                pass
+
+        assert admitted == limit
+        # Leases of up to ML_RATE_LIMIT_MAX_LEASE tokens replace most round trips
+        assert CountingBackend.calls < limit
+
+    async def test_idle_counters_expire(self):
+        from app.core.rate_limiting import InMemoryRateLimitBackend
+
+        backend = InMemoryRateLimitBackend(sweep_interval=0)
+        await backend.acquire("user:1", limit=10, window_seconds=1)
+        assert len(backend) == 1
+
+        # Force expiry of every counter
+        backend._counters = {k: (c, 0) for k, (c, _) in backend._counters.items()}
+        await backend.acquire("user:2", limit=10, window_seconds=1)
+        assert len(backend) == 1
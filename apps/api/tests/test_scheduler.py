@@ -0,0 +1,34 @@
+"""
+Tests for background job registration.
+"""
+
+import sys
+import types
+from unittest.mock import MagicMock
+
+from app.core import scheduler as scheduler_module
+
+JOB_SCHEDULERS = (
+    "schedule_email_digests",
+    "schedule_analytics_aggregation",
+    "schedule_churn_prediction",
+    "schedule_narrative_prewarm",
+)
+
+
+def test_start_scheduler_registers_every_job(monkeypatch):
+    """Every schedule_* function exported by app.jobs is registered before start."""
+    registered = []
+    jobs = types.ModuleType("app.jobs")
+    for name in JOB_SCHEDULERS:
+        setattr(jobs, name, lambda scheduler, name=name: registered.append((name, scheduler)))
+    monkeypatch.setitem(sys.modules, "app.jobs", jobs)
+
+    scheduler = MagicMock()
+    scheduler.get_jobs.return_value = []
+    monkeypatch.setattr(scheduler_module, "get_scheduler", lambda: scheduler)
+
+    scheduler_module.start_scheduler()
+
+    assert registered == [(name, scheduler) for name in JOB_SCHEDULERS]
+    scheduler.start.assert_called_once()
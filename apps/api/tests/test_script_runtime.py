@@ -0,0 +1,131 @@
+"""
+Tests for the batch script database runtime.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.db.script_runtime import ScriptRuntime, execute_many, run_sharded
+
+
+@pytest.fixture
+def runtime(tmp_path):
+    path = tmp_path / "script.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    with sync_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE pitches (player_id INTEGER, pitch INTEGER)"))
+    yield ScriptRuntime(
+        database_url=f"sqlite+aiosqlite:///{path}",
+        sync_session_factory=sessionmaker(bind=sync_engine),
+        threads=2,
+    )
+    sync_engine.dispose()
+
+
+async def count_pitches(runtime):
+    async with runtime.session() as session:
+        return (await session.execute(text("SELECT COUNT(*) FROM pitches"))).scalar()
+
+
+class TestScriptRuntime:
+    """Test suite for the async session scope and blocking-work helpers."""
+
+    @pytest.mark.asyncio
+    async def test_session_commits_batches_and_rolls_back(self, runtime):
+        """execute_many inserts every row; an error discards the whole transaction."""
+        insert = text("INSERT INTO pitches VALUES (:player_id, :pitch)")
+        rows = [{"player_id": 1, "pitch": n} for n in range(25)]
+
+        async with runtime:
+            async with runtime.session() as session:
+                assert await execute_many(session, insert, rows, batch_size=10) == 25
+
+            with pytest.raises(RuntimeError):
+                async with runtime.session() as session:
+                    await execute_many(session, insert, rows)
+                    raise RuntimeError("boom")
+
+            assert await count_pitches(runtime) == 25
+
+    @pytest.mark.asyncio
+    async def test_sync_work_runs_off_the_loop(self, runtime):
+        """Sync-ORM callables get their own session on a worker thread."""
+        loop_thread = threading.get_ident()
+
+        def insert(session, player_id):
+            session.execute(text("INSERT INTO pitches VALUES (:p, 1)"), {"p": player_id})
+            return threading.get_ident()
+
+        def insert_then_fail(session):
+            insert(session, 2)
+            raise ValueError("bad row")
+
+        async with runtime:
+            assert await runtime.run_in_sync_session(insert, 1) != loop_thread
+            with pytest.raises(ValueError):
+                await runtime.run_in_sync_session(insert_then_fail)
+
+            assert await count_pitches(runtime) == 1
+
+
+class TestRunSharded:
+    """Test suite for the sharded worker runner."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_order_and_failures_kept(self):
+        async def worker(item):
+            await asyncio.sleep(0.001 * (item % 3))
+            if item == 4:
+                raise ValueError("four")
+            return item * 10
+
+        results = await run_sharded(range(8), worker, shards=3)
+
+        assert results[:4] == [0, 10, 20, 30]
+        assert isinstance(results[4], ValueError)
+        assert results[5:] == [50, 60, 70]
+
+    @pytest.mark.asyncio
+    async def test_same_key_never_runs_concurrently(self):
+        """Items sharing a key run one at a time while other keys overlap."""
+        active = {}
+        overlaps = []
+        peak = 0
+
+        async def worker(item):
+            nonlocal peak
+            player = item["player"]
+            if active.get(player):
+                overlaps.append(player)
+            active[player] = True
+            peak = max(peak, sum(active.values()))
+            await asyncio.sleep(0.001)
+            active[player] = False
+
+        items = [{"player": player} for player in (101, 102, 101, 103, 102, 101)]
+        await run_sharded(items, worker, shards=3, key=lambda item: item["player"])
+
+        assert overlaps == []
+        assert peak > 1
+
+    @pytest.mark.asyncio
+    async def test_free_workers_pull_remaining_items(self):
+        """A blocked item does not hold up the items queued behind it."""
+        fast_done = asyncio.Event()
+        finished = []
+
+        async def worker(item):
+            if item == "slow":
+                await fast_done.wait()
+            finished.append(item)
+            if len(finished) == 6:
+                fast_done.set()
+
+        items = ["slow", 1, 2, 3, 4, 5, 6]
+        await asyncio.wait_for(run_sharded(items, worker, shards=2), timeout=5)
+
+        assert finished[-1] == "slow"
@@ -0,0 +1,104 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.metrics import histogram_registry
+from app.core.rate_limiter import setup_rate_limiter
+from app.core.request_timing import (
+    STAGE_AUTH,
+    TimedJSONResponse,
+    get_stage_metrics,
+    timed_stage,
+)
+from app.middleware.security_middleware import SecurityMiddleware
+
+
+def build_app(max_request_size: int = 1024) -> FastAPI:
+    app = FastAPI(default_response_class=TimedJSONResponse)
+    app.add_middleware(SecurityMiddleware, max_request_size=max_request_size)
+    setup_rate_limiter(app)
+
+    @app.get("/items")
+    async def items():
+        with timed_stage(STAGE_AUTH):
+            pass
+        return {"items": [1, 2, 3]}
+
+    @app.post("/upload")
+    async def upload():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.post("/api/v1/auth/login")
+    async def login():
+        return TimedJSONResponse(status_code=401, content={"detail": "Invalid"})
+
+    return app
+
+
+class TestSecurityMiddleware:
+    """Tests for the composed pure-ASGI security middleware"""
+
+    def setup_method(self):
+        histogram_registry.reset()
+        self.client = TestClient(build_app())
+
+    def test_security_headers_added(self):
+        response = self.client.get("/items")
+
+        assert response.status_code == 200
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert response.headers["X-XSS-Protection"] == "1; mode=block"
+        assert "max-age=31536000" in response.headers["Strict-Transport-Security"]
+        assert response.headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
+        assert response.headers["Content-Security-Policy"] == "default-src 'self'"
+
+    def test_server_timing_header_reports_stages(self):
+        response = self.client.get("/items")
+
+        server_timing = response.headers["Server-Timing"]
+        for stage in ("rate_limit", "auth", "handler", "serialization", "total"):
+            assert f"{stage};dur=" in server_timing
+
+    def test_request_too_large_rejected(self):
+        response = self.client.post("/upload", content=b"x" * 2048)
+
+        assert response.status_code == 413
+        assert response.json()["detail"] == "Request too large"
+        assert response.headers["X-Frame-Options"] == "DENY"
+
+    def test_small_request_allowed(self):
+        response = self.client.post("/upload", content=b"x" * 10)
+        assert response.status_code == 200
+
+    def test_streaming_response_passes_through(self):
+        response = self.client.get("/stream")
+
+        assert response.status_code == 200
+        assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+    def test_failed_auth_logged(self, caplog):
+        with caplog.at_level("WARNING", logger="security"):
+            response = self.client.post("/api/v1/auth/login")
+
+        assert response.status_code == 401
+        assert any("Failed auth attempt: 401" in r.message for r in caplog.records)
+
+    def test_stage_histograms_recorded(self):
+        for _ in range(5):
+            self.client.get("/items")
+
+        metrics = get_stage_metrics()
+        assert metrics["http.stage.handler"]["count"] == 5
+        assert metrics["http.stage.total"]["count"] == 5
+        assert metrics["http.stage.auth"]["count"] == 5
+        assert metrics["http.stage.total"]["p95_ms"] >= 0